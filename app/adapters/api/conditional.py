@@ -0,0 +1,75 @@
+"""
+Conditional GET helpers (ETag / If-None-Match).
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+CACHE_CONTROL = "no-cache"
+
+
+def build_etag(*parts: object) -> str:
+    """
+    Build a strong ETag from the given parts.
+
+    Args:
+        *parts (object): Values identifying the representation, such as the
+            resource name, its version and the query parameters.
+
+    Returns:
+        str: A quoted strong ETag.
+    """
+    raw = "|".join("" if part is None else str(part) for part in parts)
+    digest = hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's `If-None-Match` header matches the ETag.
+
+    Args:
+        request (Request): The incoming request.
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        bool: True if the client already holds the current representation.
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    if "*" in candidates:
+        return True
+    # If-None-Match uses the weak comparison function (RFC 9110, 13.1.2).
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Build an empty `304 Not Modified` response for the given ETag.
+
+    Args:
+        etag (str): The current ETag of the resource.
+
+    Returns:
+        Response: The 304 response.
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """
+    Attach the ETag and revalidation headers to a response.
+
+    Args:
+        response (Response): The response to decorate.
+        etag (str): The current ETag of the resource.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
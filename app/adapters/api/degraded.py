@@ -0,0 +1,38 @@
+"""
+Responses served from snapshots while the database is unavailable.
+"""
+
+from typing import Optional
+
+from adapters.api.responses import FastJSONResponse
+from core.common.snapshot import Snapshot
+from core.exceptions.custom_exceptions import DatabaseUnavailableError
+
+STALE_WARNING = '110 - "Response is Stale"'
+
+
+def snapshot_response(
+    snapshot: Optional[Snapshot], error: DatabaseUnavailableError
+) -> FastJSONResponse:
+    """
+    Answer with the last known-good value, marked as stale.
+
+    `Age` gives the seconds since the value was read from the database and
+    `Warning` marks the response as stale; neither is sent normally.
+
+    Args:
+        snapshot (Optional[Snapshot]): The last value read, if any.
+        error (DatabaseUnavailableError): Why the database was not read.
+
+    Returns:
+        FastJSONResponse: The snapshot's value.
+
+    Raises:
+        DatabaseUnavailableError: If there is no snapshot to serve.
+    """
+    if snapshot is None:
+        raise error
+    response = FastJSONResponse(snapshot.value)
+    response.headers["Age"] = str(int(snapshot.age()))
+    response.headers["Warning"] = STALE_WARNING
+    return response
@@ -1,15 +1,74 @@
 """ Dependencies file for database
 """
 
+import threading
+from typing import Optional
+
+from adapters.database.slow_query import SlowQueryDetector, configure_slow_query_log
 from config import settings
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 # --- SQL ---
 SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Bound to the engine when it is created, on first use rather than at import,
+# so a worker starts without loading the database driver. Objects keep their
+# values after a commit: writes return what `RETURNING` gave them, without
+# another SELECT to reload it.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False)
+_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+slow_query_detector = SlowQueryDetector(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+)
+
+
+def get_engine() -> Engine:
+    """
+    Return the application's engine, creating it on the first call.
+
+    Returns:
+        Engine: The engine for `settings.DATABASE_URL`, which `SessionLocal`
+        is bound to.
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                engine = create_engine(
+                    SQLALCHEMY_DATABASE_URL,
+                    pool_size=settings.DB_POOL_SIZE,
+                    max_overflow=settings.DB_MAX_OVERFLOW,
+                    connect_args={
+                        "connect_timeout": settings.DB_CONNECT_TIMEOUT_SECONDS
+                    },
+                )
+                SessionLocal.configure(bind=engine)
+                if settings.SLOW_QUERY_LOG_ENABLED:
+                    configure_slow_query_log(
+                        settings.SLOW_QUERY_LOG_PATH,
+                        settings.SLOW_QUERY_LOG_MAX_BYTES,
+                        settings.SLOW_QUERY_LOG_BACKUP_COUNT,
+                    )
+                    slow_query_detector.install(engine)
+                _engine = engine
+    return _engine
+
+
+def dispose_engine() -> None:
+    """
+    Forget the engine's pooled connections without closing them.
+
+    Called in a worker process right after fork: the connections belong to
+    the parent, so the worker drops its copies and opens its own.
+    """
+    if _engine is not None:
+        _engine.dispose(close=False)
+
 
 """
 Base class for all models in the database.
@@ -20,6 +79,7 @@ def get_db():
     """
     Method for db instance
     """
+    get_engine()
     database = SessionLocal()
     try:
         yield database
@@ -5,12 +5,17 @@ Auth endpoints.
 from core.auth.schemas import LoginRequest, LoginResponse
 from core.auth.services import AuthService
 from dependencies.auth_service import get_auth_service
+from dependencies.rate_limit import LOGIN_RATE_LIMIT, rate_limit
 from fastapi import APIRouter, Depends, HTTPException, status
 
 router = APIRouter()
 
 
-@router.post("/login", response_model=LoginResponse)
+@router.post(
+    "/login",
+    response_model=LoginResponse,
+    dependencies=[Depends(rate_limit(LOGIN_RATE_LIMIT))],
+)
 def login(
     login_request: LoginRequest, auth_service: AuthService = Depends(get_auth_service)
 ):
@@ -0,0 +1,30 @@
+"""
+Diagnostics endpoints.
+"""
+
+from typing import Any
+
+from adapters.api.dependencies import slow_query_detector
+from config import settings
+from dependencies.verify_permission import verify_permission
+from fastapi import APIRouter, Depends
+
+router = APIRouter()
+
+
+@router.get(
+    "/slow-queries",
+    response_model=list[dict[str, Any]],
+    dependencies=[Depends(verify_permission("manage_users"))],
+)
+def get_slow_queries():
+    """
+    Report the statement fingerprints with the most slow time in this worker.
+
+    Empty unless the slow-query log is enabled (`SLOW_QUERY_LOG_ENABLED`).
+
+    Returns:
+        list[dict[str, Any]]: Count, total and maximum duration and latest
+        caller per fingerprint, slowest first.
+    """
+    return [vars(stats) for stats in slow_query_detector.top(settings.SLOW_QUERY_TOP_N)]
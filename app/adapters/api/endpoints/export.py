@@ -0,0 +1,119 @@
+"""
+Export API endpoints.
+
+Exports stream from a server-side cursor while the response is being sent;
+the request's database session stays open until the last chunk, because
+FastAPI closes `yield` dependencies only after the response completes.
+"""
+
+from typing import Iterator, Optional
+from uuid import UUID
+
+from core.common.threadpool import iterate_in_threadpool
+from core.export.schemas import ExportFormat
+from core.export.services import ExportService
+from dependencies.export_service import get_export_service
+from dependencies.verify_permission import verify_permission
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
+
+router = APIRouter()
+
+FORMAT_QUERY = Query(ExportFormat.NDJSON, alias="format", description="Output format")
+GZIP_QUERY = Query(False, description="Compress the stream with gzip on the fly")
+
+
+def _export_response(
+    name: str, chunks: Iterator[bytes], export_format: ExportFormat, gzip: bool
+) -> StreamingResponse:
+    """
+    Wrap an export stream in a downloadable response.
+
+    Args:
+        name (str): The base name of the downloaded file.
+        chunks (Iterator[bytes]): The encoded export.
+        export_format (ExportFormat): The output format.
+        gzip (bool): Whether the chunks are gzip-compressed.
+
+    Returns:
+        StreamingResponse: The streaming response.
+    """
+    headers = {
+        "Content-Disposition": f'attachment; filename="{name}.{export_format.value}"'
+    }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    # Iterated without the threadpool's maximum wait: a refusal after the
+    # headers are sent would truncate the download.
+    return StreamingResponse(
+        iterate_in_threadpool(chunks),
+        media_type=export_format.media_type,
+        headers=headers,
+    )
+
+
+@router.get("/sessions", dependencies=[Depends(verify_permission("view_event"))])
+def export_sessions(
+    export_format: ExportFormat = FORMAT_QUERY,
+    gzip: bool = GZIP_QUERY,
+    export_service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Export every active session with its speakers.
+
+    Args:
+        export_format (ExportFormat): `ndjson` or `csv`.
+        gzip (bool): Compress the stream with gzip.
+        export_service (ExportService): The export service dependency.
+
+    Returns:
+        StreamingResponse: The streamed export.
+    """
+    chunks = export_service.export_sessions(export_format, compress=gzip)
+    return _export_response("sessions", chunks, export_format, gzip)
+
+
+@router.get("/attendees", dependencies=[Depends(verify_permission("manage_users"))])
+def export_attendees(
+    session_id: Optional[UUID] = Query(None, description="Only this session"),
+    export_format: ExportFormat = FORMAT_QUERY,
+    gzip: bool = GZIP_QUERY,
+    export_service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Export the attendee rosters.
+
+    Args:
+        session_id (Optional[UUID]): Restrict the roster to one session.
+        export_format (ExportFormat): `ndjson` or `csv`.
+        gzip (bool): Compress the stream with gzip.
+        export_service (ExportService): The export service dependency.
+
+    Returns:
+        StreamingResponse: The streamed export.
+    """
+    chunks = export_service.export_attendees(
+        export_format, compress=gzip, session_id=session_id
+    )
+    return _export_response("attendees", chunks, export_format, gzip)
+
+
+@router.get("/users", dependencies=[Depends(verify_permission("manage_users"))])
+def export_users(
+    export_format: ExportFormat = FORMAT_QUERY,
+    gzip: bool = GZIP_QUERY,
+    export_service: ExportService = Depends(get_export_service),
+) -> StreamingResponse:
+    """
+    Export the users, without credentials.
+
+    Args:
+        export_format (ExportFormat): `ndjson` or `csv`.
+        gzip (bool): Compress the stream with gzip.
+        export_service (ExportService): The export service dependency.
+
+    Returns:
+        StreamingResponse: The streamed export.
+    """
+    chunks = export_service.export_users(export_format, compress=gzip)
+    return _export_response("users", chunks, export_format, gzip)
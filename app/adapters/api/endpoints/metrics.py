@@ -0,0 +1,21 @@
+"""
+Metrics endpoint.
+"""
+
+from core.common.metrics import CONTENT_TYPE, registry
+from fastapi import APIRouter, Response
+
+router = APIRouter()
+
+
+@router.get("", include_in_schema=False)
+async def metrics() -> Response:
+    """
+    Expose the application metrics in the Prometheus text format.
+
+    Rendered on the event loop, which can read the threadpool statistics.
+
+    Returns:
+        Response: The metrics.
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
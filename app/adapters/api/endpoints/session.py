@@ -2,7 +2,16 @@
 Session API endpoints.
 """
 
+from adapters.api.conditional import (
+    build_etag,
+    is_not_modified,
+    not_modified_response,
+    set_etag,
+)
+from adapters.api.degraded import snapshot_response
+from adapters.api.responses import FastJSONResponse
 from core.common.pagination import PaginatedResponse, PaginationParams
+from core.exceptions.custom_exceptions import DatabaseUnavailableError
 from core.session.schemas import (
     SessionCreate,
     SessionDetail,
@@ -12,28 +21,75 @@ from core.session.schemas import (
     SpeakerOut,
 )
 from core.session.services import SessionService
+from dependencies.rate_limit import SESSION_READ_RATE_LIMIT, rate_limit
 from dependencies.session_service import get_session_service
-from fastapi import APIRouter, Depends, HTTPException, status
+from dependencies.verify_permission import verify_permission
+from fastapi import APIRouter, Depends, Request, status
 
 router = APIRouter()
 
 
-@router.get("/speakers", response_model=PaginatedResponse[SpeakerOut])
+@router.get(
+    "/speakers",
+    response_model=PaginatedResponse[SpeakerOut],
+    dependencies=[Depends(rate_limit(SESSION_READ_RATE_LIMIT))],
+)
 def list_speakers(
+    request: Request,
     session_service: SessionService = Depends(get_session_service),
     pagination: PaginationParams = Depends(),
 ):
     """
     List all speakers with pagination.
 
+    Answers `304 Not Modified` when `If-None-Match` matches the current ETag.
+    While the database is unavailable, serves the page as last read, if any.
+
     Args:
+        request (Request): The incoming request.
         session_service (SessionService): The session service dependency.
         pagination (PaginationParams): Pagination parameters.
 
     Returns:
         PaginatedResponse[SpeakerOut]: A paginated list of speakers.
     """
-    return session_service.list_speakers(params=pagination)
+    try:
+        version = session_service.get_speakers_version()
+        etag = build_etag(
+            "speakers",
+            version,
+            pagination.page,
+            pagination.limit,
+            pagination.search,
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        response = FastJSONResponse(
+            session_service.list_speakers(params=pagination, version=version)
+        )
+    except DatabaseUnavailableError as error:
+        return snapshot_response(session_service.speakers_snapshot(pagination), error)
+    set_etag(response, etag)
+    return response
+
+
+@router.get(
+    "/cache/stats",
+    response_model=dict[str, float],
+    dependencies=[Depends(verify_permission("manage_users"))],
+)
+def get_cache_stats(session_service: SessionService = Depends(get_session_service)):
+    """
+    Report hit ratio and memory usage of the session read cache.
+
+    Args:
+        session_service (SessionService): The session service dependency.
+
+    Returns:
+        dict[str, float]: The statistics of this worker's cache.
+    """
+    return session_service.cache_stats()
 
 
 @router.post("/", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
@@ -51,32 +107,53 @@ def create_session(
     Returns:
         SessionOut: The created session.
     """
-    return session_service.create_session(session_data)
+    return FastJSONResponse(
+        session_service.create_session(session_data),
+        status_code=status.HTTP_201_CREATED,
+    )
 
 
-@router.get("/{session_id}", response_model=SessionDetail)
+@router.get(
+    "/{session_id}",
+    response_model=SessionDetail,
+    dependencies=[Depends(rate_limit(SESSION_READ_RATE_LIMIT))],
+)
 def get_session(
-    session_id: str, session_service: SessionService = Depends(get_session_service)
+    session_id: str,
+    request: Request,
+    session_service: SessionService = Depends(get_session_service),
 ):
     """
     Retrieve a session by its ID.
 
+    Answers `304 Not Modified` when `If-None-Match` matches the current ETag.
+    While the database is unavailable, serves the session as last read, if any.
+
     Args:
         session_id (str): The ID of the session to retrieve.
+        request (Request): The incoming request.
         session_service (SessionService): The session service dependency.
 
     Raises:
-        HTTPException: If the session is not found.
+        ValueError: If the session is not found.
 
     Returns:
         SessionDetail: The details of the session.
     """
-    session = session_service.get_session(session_id)
-    if not session:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND, detail="Session not found"
-        )
-    return session
+    try:
+        version = session_service.get_session_version(session_id)
+        if version is None:
+            raise ValueError(f"Session with ID {session_id} not found.")
+        etag = build_etag("session", session_id, version)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        session = session_service.get_session(session_id, version=version)
+    except DatabaseUnavailableError as error:
+        return snapshot_response(session_service.session_snapshot(session_id), error)
+    response = FastJSONResponse(session)
+    set_etag(response, etag)
+    return response
 
 
 @router.put("/{session_id}", response_model=SessionOut)
@@ -96,7 +173,7 @@ def update_session(
     Returns:
         SessionOut: The updated session.
     """
-    return session_service.update_session(session_id, session_data)
+    return FastJSONResponse(session_service.update_session(session_id, session_data))
 
 
 @router.delete("/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -113,19 +190,46 @@ def delete_session(
     session_service.delete_session(session_id)
 
 
-@router.get("/", response_model=PaginatedResponse[SessionListOut])
+@router.get(
+    "/",
+    response_model=PaginatedResponse[SessionListOut],
+    dependencies=[Depends(rate_limit(SESSION_READ_RATE_LIMIT))],
+)
 def list_sessions(
+    request: Request,
     session_service: SessionService = Depends(get_session_service),
     pagination: PaginationParams = Depends(),
 ):
     """
     List all sessions with pagination.
 
+    Answers `304 Not Modified` when `If-None-Match` matches the current ETag.
+    While the database is unavailable, serves the page as last read, if any.
+
     Args:
+        request (Request): The incoming request.
         session_service (SessionService): The session service dependency.
         pagination (PaginationParams): Pagination parameters.
 
     Returns:
         PaginatedResponse[SessionListOut]: A paginated list of sessions.
     """
-    return session_service.list_sessions(params=pagination)
+    try:
+        version = session_service.get_sessions_version()
+        etag = build_etag(
+            "sessions",
+            version,
+            pagination.page,
+            pagination.limit,
+            pagination.search,
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        response = FastJSONResponse(
+            session_service.list_sessions(params=pagination, version=version)
+        )
+    except DatabaseUnavailableError as error:
+        return snapshot_response(session_service.sessions_snapshot(pagination), error)
+    set_etag(response, etag)
+    return response
@@ -0,0 +1,22 @@
+"""
+Response classes.
+"""
+
+from typing import Any
+
+from core.common.serialization import to_json
+from fastapi.responses import JSONResponse
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response serialized once, with orjson.
+
+    Returning it from an endpoint bypasses FastAPI's `response_model` handling,
+    which would validate the already validated model again and serialize it
+    twice (to Python objects, then to JSON). Keep `response_model` on the route
+    for the OpenAPI schema.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,21 @@
+import json
+
+from adapters.api.responses import FastJSONResponse
+from benchmarks.response_serialization import build_page, response_model_body
+
+
+class TestFastJSONResponse:
+    """
+    Tests for the single-pass JSON response.
+    """
+
+    def test_body_matches_response_model_pipeline(self):
+        """
+        Test that the body decodes to the same document FastAPI would produce.
+        """
+        page = build_page(5)
+
+        fast_body = FastJSONResponse(page).body
+
+        assert json.loads(fast_body) == json.loads(response_model_body(page))
+        assert b'"start_time":"2024-11-30T09:00:00Z"' in fast_body
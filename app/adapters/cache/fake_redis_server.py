@@ -0,0 +1,248 @@
+"""
+Local stand-in for a Redis-protocol server.
+
+Implements the subset of commands used by `RedisCacheBackend` (strings with
+expiry, SCAN, pub/sub) and, for `RedisRateLimitBackend`, EVALSHA and EVAL of
+the token-bucket script, emulated in Python since the server runs no Lua. The
+shared cache tier and rate limits can be exercised in tests and local
+development without a real Redis.
+
+Usage:
+    python -m adapters.cache.fake_redis_server --port 6379
+"""
+
+import argparse
+import fnmatch
+import socketserver
+import threading
+import time
+from typing import Optional
+
+from adapters.cache.redis_backend import TOKEN_BUCKET_SCRIPT, TOKEN_BUCKET_SHA
+from core.common.rate_limit import take_token
+
+
+class FakeRedisState:
+    """
+    Keyspace and channel subscriptions shared by all client connections.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.values: dict[bytes, tuple[bytes, Optional[float]]] = {}
+        self.subscribers: dict[bytes, set["_Handler"]] = {}
+
+    def get(self, key: bytes) -> Optional[bytes]:
+        """Return a live value, dropping it if expired."""
+        item = self.values.get(key)
+        if item is None:
+            return None
+        value, expires_at = item
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self.values[key]
+            return None
+        return value
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Serves one client connection."""
+
+    server: "FakeRedisServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.write_lock = threading.Lock()
+        self.channels: set[bytes] = set()
+
+    def handle(self) -> None:
+        try:
+            while True:
+                command = self._read_command()
+                if command is None:
+                    return
+                self._dispatch(command)
+        except (ConnectionError, OSError):
+            return
+        finally:
+            state = self.server.state
+            with state.lock:
+                for channel in self.channels:
+                    state.subscribers.get(channel, set()).discard(self)
+
+    def push(self, data: bytes) -> None:
+        """Write raw RESP data to the client."""
+        with self.write_lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def _read_command(self) -> Optional[list[bytes]]:
+        line = self.rfile.readline()
+        if not line:
+            return None
+        count = int(line[1:-2])
+        args = []
+        for _ in range(count):
+            length = int(self.rfile.readline()[1:-2])
+            args.append(self.rfile.read(length + 2)[:-2])
+        return args
+
+    def _dispatch(self, args: list[bytes]) -> None:
+        name = args[0].upper().decode("utf-8")
+        handler = getattr(self, f"_cmd_{name.lower()}", None)
+        if handler is None:
+            self.push(_error(f"ERR unknown command '{name}'"))
+            return
+        with self.server.state.lock:
+            reply = handler(args[1:])
+        if reply is not None:
+            self.push(reply)
+
+    def _cmd_ping(self, args: list[bytes]) -> bytes:
+        return _bulk(args[0]) if args else b"+PONG\r\n"
+
+    def _cmd_auth(self, args: list[bytes]) -> bytes:
+        return b"+OK\r\n"
+
+    def _cmd_select(self, args: list[bytes]) -> bytes:
+        return b"+OK\r\n"
+
+    def _cmd_get(self, args: list[bytes]) -> bytes:
+        return _bulk(self.server.state.get(args[0]))
+
+    def _cmd_set(self, args: list[bytes]) -> bytes:
+        key, value, options = args[0], args[1], [arg.upper() for arg in args[2:]]
+        expires_at = None
+        if b"PX" in options:
+            ttl = int(args[2 + options.index(b"PX") + 1]) / 1000
+            expires_at = time.monotonic() + ttl
+        elif b"EX" in options:
+            expires_at = time.monotonic() + int(args[2 + options.index(b"EX") + 1])
+        self.server.state.values[key] = (value, expires_at)
+        return b"+OK\r\n"
+
+    def _cmd_del(self, args: list[bytes]) -> bytes:
+        values = self.server.state.values
+        removed = sum(1 for key in args if values.pop(key, None) is not None)
+        return b":%d\r\n" % removed
+
+    def _cmd_scan(self, args: list[bytes]) -> bytes:
+        options = [arg.upper() for arg in args]
+        pattern = args[options.index(b"MATCH") + 1] if b"MATCH" in options else b"*"
+        state = self.server.state
+        keys = [
+            key
+            for key in list(state.values)
+            if state.get(key) is not None
+            and fnmatch.fnmatchcase(key.decode("utf-8"), pattern.decode("utf-8"))
+        ]
+        return b"*2\r\n" + _bulk(b"0") + _array(keys)
+
+    def _cmd_evalsha(self, args: list[bytes]) -> bytes:
+        if args[0].decode("utf-8") != TOKEN_BUCKET_SHA:
+            return _error("NOSCRIPT No matching script.")
+        return self._token_bucket(args[2], *(float(arg) for arg in args[3:6]))
+
+    def _cmd_eval(self, args: list[bytes]) -> bytes:
+        if args[0].decode("utf-8") != TOKEN_BUCKET_SCRIPT:
+            return _error("ERR only the token-bucket script is emulated")
+        return self._token_bucket(args[2], *(float(arg) for arg in args[3:6]))
+
+    def _token_bucket(
+        self, key: bytes, rate: float, burst: float, cost: float
+    ) -> bytes:
+        """Emulate `TOKEN_BUCKET_SCRIPT`, storing the bucket as a string."""
+        state, now = self.server.state, time.monotonic()
+        bucket = state.get(key)
+        if bucket is None:
+            tokens, wait = take_token(burst, 0.0, rate, burst, cost)
+        else:
+            stored, updated = (float(part) for part in bucket.split())
+            tokens, wait = take_token(stored, now - updated, rate, burst, cost)
+        state.values[key] = (b"%r %r" % (tokens, now), now + burst / rate)
+        return _bulk(repr(wait).encode("utf-8"))
+
+    def _cmd_publish(self, args: list[bytes]) -> bytes:
+        channel, message = args
+        receivers = list(self.server.state.subscribers.get(channel, set()))
+        payload = _array([b"message", channel, message])
+        for receiver in receivers:
+            try:
+                receiver.push(payload)
+            except OSError:
+                pass
+        return b":%d\r\n" % len(receivers)
+
+    def _cmd_subscribe(self, args: list[bytes]) -> None:
+        for channel in args:
+            self.server.state.subscribers.setdefault(channel, set()).add(self)
+            self.channels.add(channel)
+            self.push(
+                b"*3\r\n"
+                + _bulk(b"subscribe")
+                + _bulk(channel)
+                + b":%d\r\n" % len(self.channels)
+            )
+
+
+def _bulk(value: Optional[bytes]) -> bytes:
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+def _array(values: list[bytes]) -> bytes:
+    return b"*%d\r\n" % len(values) + b"".join(_bulk(value) for value in values)
+
+
+def _error(message: str) -> bytes:
+    return f"-{message}\r\n".encode("utf-8")
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    """
+    Threaded fake Redis server.
+
+    Bind to port 0 to get a free port, then read it from `server_address`.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), _Handler)
+        self.state = FakeRedisState()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The `redis://` URL of this server."""
+        host, port = self.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        """Serve in a background thread that checks for `stop` every 50 ms."""
+        self._thread = threading.Thread(
+            target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the socket."""
+        self.shutdown()
+        self.server_close()
+
+
+def main() -> None:
+    """Run the fake server in the foreground."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    options = parser.parse_args()
+    server = FakeRedisServer(options.host, options.port)
+    print(f"Fake Redis server listening on {server.url}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
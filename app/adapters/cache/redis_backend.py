@@ -0,0 +1,441 @@
+"""
+Redis-protocol cache and rate-limit backends.
+
+Speaks RESP directly over a socket, so it works against Redis, Valkey, KeyDB or
+the local stand-in in `adapters.cache.fake_redis_server` without extra packages.
+"""
+
+import hashlib
+import logging
+import queue
+import re
+import socket
+import threading
+import time
+from typing import Callable, Optional, Sequence, Union
+from urllib.parse import unquote, urlparse
+
+from core.common.cache_backend import CacheBackend
+from core.common.rate_limit import InMemoryRateLimitBackend, RateLimitBackend
+
+logger = logging.getLogger(__name__)
+
+Reply = Union[None, int, bytes, str, list]
+_GLOB_SPECIAL = re.compile(r"([*?\[\]\\])")
+
+# Atomic token bucket, the same computation as `core.common.rate_limit.take_token`,
+# timed by the server's clock so that every worker agrees. A bucket expires once
+# it would be full again. Returns the wait as a string: Lua numbers become
+# integers in replies.
+TOKEN_BUCKET_SCRIPT = """
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local cost = tonumber(ARGV[3])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated')
+local tokens = burst
+if bucket[1] then
+  local elapsed = math.max(0, now - tonumber(bucket[2]))
+  tokens = math.min(burst, tonumber(bucket[1]) + elapsed * rate)
+end
+local wait = 0
+if tokens >= cost then
+  tokens = tokens - cost
+else
+  wait = (cost - tokens) / rate
+end
+redis.call('HSET', KEYS[1], 'tokens', tostring(tokens), 'updated', tostring(now))
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000))
+return tostring(wait)
+"""
+TOKEN_BUCKET_SHA = hashlib.sha1(TOKEN_BUCKET_SCRIPT.encode("utf-8")).hexdigest()
+
+
+class RedisError(Exception):
+    """
+    Error reply returned by the server.
+    """
+
+
+class RedisConnection:
+    """
+    A single blocking RESP connection.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float],
+        password: Optional[str] = None,
+        db: int = 0,
+    ):
+        """
+        Open the connection, authenticating and selecting the database if needed.
+
+        Args:
+            host (str): Server host.
+            port (int): Server port.
+            timeout (Optional[float]): Socket timeout in seconds, None to block.
+            password (Optional[str]): Password for `AUTH`.
+            db (int): Database number for `SELECT`.
+        """
+        self._sock = socket.create_connection((host, port), timeout=timeout)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+        if password:
+            self.execute("AUTH", password)
+        if db:
+            self.execute("SELECT", str(db))
+
+    def execute(self, *args: Union[str, bytes]) -> Reply:
+        """
+        Send a command and read its reply.
+
+        Args:
+            *args (Union[str, bytes]): The command and its arguments.
+
+        Returns:
+            Reply: The decoded reply.
+        """
+        self.send(*args)
+        return self.read_reply()
+
+    def send(self, *args: Union[str, bytes]) -> None:
+        """
+        Send a command without reading the reply.
+
+        Args:
+            *args (Union[str, bytes]): The command and its arguments.
+        """
+        parts = [b"*%d\r\n" % len(args)]
+        for arg in args:
+            data = arg.encode("utf-8") if isinstance(arg, str) else arg
+            parts.append(b"$%d\r\n%s\r\n" % (len(data), data))
+        self._sock.sendall(b"".join(parts))
+
+    def read_reply(self) -> Reply:
+        """
+        Read and decode one reply.
+
+        Returns:
+            Reply: The decoded reply.
+
+        Raises:
+            RedisError: If the server returned an error.
+            ConnectionError: If the server closed the connection.
+        """
+        line = self._reader.readline()
+        if not line:
+            raise ConnectionError("Connection closed by server")
+        prefix, body = line[:1], line[1:-2]
+        if prefix == b"+":
+            return body.decode("utf-8")
+        if prefix == b"-":
+            raise RedisError(body.decode("utf-8"))
+        if prefix == b":":
+            return int(body)
+        if prefix == b"$":
+            length = int(body)
+            if length == -1:
+                return None
+            data = self._reader.read(length + 2)
+            return data[:-2]
+        if prefix == b"*":
+            length = int(body)
+            if length == -1:
+                return None
+            return [self.read_reply() for _ in range(length)]
+        raise RedisError(f"Unexpected reply: {line!r}")
+
+    def settimeout(self, timeout: Optional[float]) -> None:
+        """
+        Change the socket timeout.
+
+        Args:
+            timeout (Optional[float]): Timeout in seconds, None to block.
+        """
+        self._sock.settimeout(timeout)
+
+    def close(self) -> None:
+        """
+        Close the connection.
+        """
+        try:
+            # Shutdown first: it wakes up a thread blocked reading this socket,
+            # which otherwise holds the reader's lock and makes close() hang.
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+        self._reader.close()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    `CacheBackend` backed by a Redis-protocol server.
+
+    Commands go through a small thread-safe connection pool; each subscription
+    gets its own connection and daemon thread, reconnecting with backoff.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str = "",
+        socket_timeout: float = 0.5,
+        pool_size: int = 16,
+        failure_cooldown: float = 5.0,
+    ):
+        """
+        Initialize the backend. Connections are opened lazily.
+
+        Args:
+            url (str): Server URL, e.g. `redis://:password@localhost:6379/0`.
+            key_prefix (str): Prefix added to every key, to share one server.
+            socket_timeout (float): Timeout for regular commands, in seconds.
+            pool_size (int): Maximum number of idle pooled connections.
+            failure_cooldown (float): Seconds during which commands fail fast
+                after a connection failure, instead of reconnecting every call.
+        """
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.key_prefix = key_prefix
+        self.socket_timeout = socket_timeout
+        self._pool: "queue.LifoQueue[RedisConnection]" = queue.LifoQueue(pool_size)
+        self._subscriptions: list[tuple[threading.Event, list]] = []
+        self._closed = False
+        self.failure_cooldown = failure_cooldown
+        self._down_until = 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._execute("GET", self.key_prefix + key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._execute(
+            "SET",
+            self.key_prefix + key,
+            value,
+            "PX",
+            str(max(1, int(ttl_seconds * 1000))),
+        )
+
+    def delete(self, *keys: str) -> None:
+        if keys:
+            self._execute("DEL", *(self.key_prefix + key for key in keys))
+
+    def delete_prefix(self, prefix: str) -> None:
+        pattern = _GLOB_SPECIAL.sub(r"\\\1", self.key_prefix + prefix) + "*"
+        cursor = "0"
+        while True:
+            cursor_reply, keys = self._execute(
+                "SCAN", cursor, "MATCH", pattern, "COUNT", "500"
+            )
+            if keys:
+                self._execute("DEL", *keys)
+            cursor = cursor_reply.decode("utf-8")
+            if cursor == "0":
+                return
+
+    def publish(self, channel: str, message: str) -> None:
+        self._execute("PUBLISH", channel, message)
+
+    def eval_script(
+        self, script: str, keys: Sequence[str], args: Sequence[str]
+    ) -> Reply:
+        """
+        Run a Lua script on the server, by its SHA1 once the server knows it.
+
+        Args:
+            script (str): The script's source.
+            keys (Sequence[str]): The keys it accesses, already prefixed.
+            args (Sequence[str]): Its other arguments.
+
+        Returns:
+            Reply: The script's reply.
+
+        Raises:
+            RedisError: If the server rejects the script.
+            ConnectionError: If the server is unreachable or marked down.
+        """
+        arguments = (str(len(keys)), *keys, *args)
+        sha = hashlib.sha1(script.encode("utf-8")).hexdigest()
+        try:
+            return self._execute("EVALSHA", sha, *arguments)
+        except RedisError as exc:
+            if not str(exc).startswith("NOSCRIPT"):
+                raise
+        return self._execute("EVAL", script, *arguments)
+
+    def subscribe(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]] = None,
+    ) -> None:
+        stop = threading.Event()
+        holder: list = []
+        self._subscriptions.append((stop, holder))
+        thread = threading.Thread(
+            target=self._listen,
+            args=(channel, callback, on_reset, stop, holder),
+            name=f"cache-subscriber-{channel}",
+            daemon=True,
+        )
+        thread.start()
+
+    def close(self) -> None:
+        self._closed = True
+        for stop, holder in self._subscriptions:
+            stop.set()
+            for connection in holder:
+                connection.close()
+        self._subscriptions.clear()
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _connect(self, timeout: Optional[float]) -> RedisConnection:
+        """Open a new connection."""
+        return RedisConnection(
+            self.host, self.port, timeout, password=self.password, db=self.db
+        )
+
+    def _execute(self, *args: Union[str, bytes]) -> Reply:
+        """Run one command on a pooled connection."""
+        if time.monotonic() < self._down_until:
+            raise ConnectionError("Cache server marked down after a recent failure")
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            try:
+                connection = self._connect(self.socket_timeout)
+            except OSError:
+                self._down_until = time.monotonic() + self.failure_cooldown
+                raise
+        try:
+            reply = connection.execute(*args)
+        except RedisError:
+            self._release(connection)
+            raise
+        except Exception:
+            connection.close()
+            self._down_until = time.monotonic() + self.failure_cooldown
+            raise
+        self._release(connection)
+        return reply
+
+    def _release(self, connection: RedisConnection) -> None:
+        """Return a healthy connection to the pool."""
+        if self._closed:
+            connection.close()
+            return
+        try:
+            self._pool.put_nowait(connection)
+        except queue.Full:
+            connection.close()
+
+    def _listen(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]],
+        stop: threading.Event,
+        holder: list,
+    ) -> None:
+        """Subscriber loop: receive messages and reconnect on failure."""
+        backoff = 0.1
+        first = True
+        while not stop.is_set():
+            connection = None
+            try:
+                connection = self._connect(timeout=None)
+                holder[:] = [connection]
+                connection.execute("SUBSCRIBE", channel)
+                if not first and on_reset is not None:
+                    on_reset()
+                first = False
+                backoff = 0.1
+                while not stop.is_set():
+                    reply = connection.read_reply()
+                    if isinstance(reply, list) and reply[:1] == [b"message"]:
+                        self._dispatch(callback, reply[2].decode("utf-8"))
+            except Exception as exc:  # pylint: disable=broad-except
+                if stop.is_set():
+                    return
+                logger.warning("Cache subscription to %s lost: %s", channel, exc)
+                if on_reset is not None:
+                    on_reset()
+                time.sleep(backoff)
+                backoff = min(backoff * 2, 5.0)
+            finally:
+                if connection is not None:
+                    connection.close()
+
+    @staticmethod
+    def _dispatch(callback: Callable[[str], None], message: str) -> None:
+        """Deliver a message without letting a failing callback kill the loop."""
+        try:
+            callback(message)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Cache subscription callback failed")
+
+
+class RedisRateLimitBackend(RateLimitBackend):
+    """
+    `RateLimitBackend` keeping the buckets of every worker on a Redis-protocol server.
+
+    Each check runs `TOKEN_BUCKET_SCRIPT` atomically on the server. While the
+    server is unreachable, buckets fall back to a per-worker in-memory backend,
+    so limits stay enforced, only per worker.
+    """
+
+    blocking = True
+
+    def __init__(
+        self,
+        url: str,
+        key_prefix: str = "",
+        fallback: Optional[RateLimitBackend] = None,
+    ):
+        """
+        Initialize the backend. Connections are opened lazily.
+
+        Args:
+            url (str): Server URL, e.g. `redis://:password@localhost:6379/0`.
+            key_prefix (str): Prefix added to every key, to share one server.
+            fallback (Optional[RateLimitBackend]): The backend used while the
+                server is unreachable; in-memory by default.
+        """
+        self.redis = RedisCacheBackend(url, key_prefix=key_prefix)
+        self.fallback = fallback or InMemoryRateLimitBackend()
+        self._degraded = False
+
+    def take(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        try:
+            reply = self.redis.eval_script(
+                TOKEN_BUCKET_SCRIPT,
+                (self.redis.key_prefix + key,),
+                (repr(rate), str(burst), repr(cost)),
+            )
+        except (ConnectionError, OSError) as exc:
+            if not self._degraded:
+                self._degraded = True
+                logger.warning(
+                    "Rate limit server unavailable, limiting locally: %s", exc
+                )
+            return self.fallback.take(key, rate, burst, cost)
+        if self._degraded:
+            self._degraded = False
+            logger.info("Rate limit server available again")
+        return float(reply)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self.redis.close()
@@ -0,0 +1,145 @@
+import time
+
+import pytest
+from adapters.cache.fake_redis_server import FakeRedisServer
+from adapters.cache.redis_backend import RedisCacheBackend, RedisRateLimitBackend
+from core.common.cache import ResponseCache, decode_text
+
+
+def wait_for(condition, timeout: float = 2.0) -> bool:
+    """
+    Poll `condition` until it is true or the timeout expires.
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestRedisCacheBackend:
+    """
+    Tests for the Redis-protocol backend against the local fake server.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Start a fake server and connect a backend to it.
+        """
+        self.server = FakeRedisServer().start()
+        self.backend = RedisCacheBackend(self.server.url, key_prefix="test:")
+        yield
+        self.backend.close()
+        self.server.stop()
+
+    def test_get_set_delete(self):
+        """
+        Test basic string commands and key prefixing.
+        """
+        self.backend.set("a", b"1", ttl_seconds=10)
+        assert self.backend.get("a") == b"1"
+        assert self.server.state.get(b"test:a") == b"1"
+
+        self.backend.delete("a")
+        assert self.backend.get("a") is None
+
+    def test_expiry_and_delete_prefix(self):
+        """
+        Test that values expire and prefix deletion only removes matching keys.
+        """
+        self.backend.set("short", b"x", ttl_seconds=0.01)
+        self.backend.set("sessions:1", b"1", ttl_seconds=10)
+        self.backend.set("sessions:2", b"2", ttl_seconds=10)
+        self.backend.set("speakers:1", b"3", ttl_seconds=10)
+        time.sleep(0.02)
+        assert self.backend.get("short") is None
+
+        self.backend.delete_prefix("sessions:")
+        assert self.backend.get("sessions:1") is None
+        assert self.backend.get("sessions:2") is None
+        assert self.backend.get("speakers:1") == b"3"
+
+    def test_two_level_cache_across_workers(self):
+        """
+        Test that a second worker reads from the shared tier and receives invalidations.
+        """
+        other_backend = RedisCacheBackend(self.server.url, key_prefix="test:")
+        worker_a = ResponseCache()
+        worker_b = ResponseCache()
+        worker_a.attach_shared(self.backend, "invalidation")
+        worker_b.attach_shared(other_backend, "invalidation")
+        assert wait_for(
+            lambda: len(self.server.state.subscribers.get(b"invalidation", ())) == 2
+        )
+
+        try:
+            assert worker_a.get_or_load("k", lambda: "v1", decode=decode_text) == "v1"
+            assert (
+                worker_b.get_or_load("k", lambda: "unused", decode=decode_text) == "v1"
+            )
+            assert worker_b.stats()["shared_hits"] == 1
+
+            worker_a.invalidate_prefix("k")
+            assert wait_for(lambda: worker_b.stats()["entries"] == 0)
+            assert worker_b.get_or_load("k", lambda: "v2", decode=decode_text) == "v2"
+        finally:
+            other_backend.close()
+
+    def test_unreachable_server_degrades_to_local(self):
+        """
+        Test that a dead shared tier does not break lookups.
+        """
+        cache = ResponseCache()
+        dead_backend = RedisCacheBackend("redis://127.0.0.1:1/0")
+        cache.attach_shared(dead_backend, "invalidation")
+
+        try:
+            started = time.monotonic()
+            for _ in range(5):
+                assert cache.get_or_load("k", lambda: "v", decode=decode_text) == "v"
+                cache.invalidate("k")
+            assert cache.stats()["shared_errors"] >= 2
+            assert time.monotonic() - started < 1.0
+        finally:
+            cache.detach_shared()
+
+
+class TestRedisRateLimitBackend:
+    """
+    Tests for the shared token buckets against the local fake server.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Start a fake server and connect two workers' backends to it.
+        """
+        self.server = FakeRedisServer().start()
+        self.worker_a = RedisRateLimitBackend(self.server.url, key_prefix="test:")
+        self.worker_b = RedisRateLimitBackend(self.server.url, key_prefix="test:")
+        yield
+        self.worker_a.close()
+        self.worker_b.close()
+        self.server.stop()
+
+    def test_workers_share_one_bucket(self):
+        """
+        Test that tokens taken by one worker are missing for the other.
+        """
+        assert self.worker_a.take("login:ip:a", rate=0.1, burst=2) == 0
+        assert self.worker_b.take("login:ip:a", rate=0.1, burst=2) == 0
+        assert self.worker_a.take("login:ip:a", rate=0.1, burst=2) > 9
+        assert self.worker_b.take("login:ip:b", rate=0.1, burst=2) == 0
+
+    def test_unreachable_server_limits_locally(self):
+        """
+        Test that buckets fall back to the worker's memory while the server is down.
+        """
+        dead_backend = RedisRateLimitBackend("redis://127.0.0.1:1/0")
+        try:
+            assert dead_backend.take("login:ip:a", rate=0.1, burst=1) == 0
+            assert dead_backend.take("login:ip:a", rate=0.1, burst=1) > 0
+        finally:
+            dead_backend.close()
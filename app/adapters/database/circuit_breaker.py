@@ -0,0 +1,115 @@
+"""
+Circuit breaker around the repositories' database access.
+"""
+
+import functools
+import math
+import threading
+from typing import Callable, TypeVar
+
+from config import settings
+from core.common.circuit_breaker import CLOSED, OPEN, CircuitBreaker, CircuitOpenError
+from core.common.metrics import GaugeFunction
+from core.exceptions.custom_exceptions import DatabaseUnavailableError
+from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+C = TypeVar("C", bound=type)
+
+# Postgres cancelled the statement (e.g. a statement timeout): the server
+# answered, so it is not down.
+QUERY_CANCELED = "57014"
+
+
+def is_connection_failure(exc: BaseException) -> bool:
+    """
+    Tell whether an exception shows the database is unreachable.
+
+    Args:
+        exc (BaseException): The exception raised by a database call.
+
+    Returns:
+        bool: True for failures to connect, lost connections and pool
+        timeouts; False for errors the database itself reported.
+    """
+    if isinstance(exc, PoolTimeoutError):
+        return True
+    if not isinstance(exc, DBAPIError):
+        return False
+    if exc.connection_invalidated:
+        return True
+    return (
+        isinstance(exc, (OperationalError, InterfaceError))
+        and getattr(exc.orig, "pgcode", None) != QUERY_CANCELED
+    )
+
+
+database_breaker = CircuitBreaker(
+    "database",
+    failure_threshold=settings.DB_CIRCUIT_FAILURE_THRESHOLD,
+    reset_timeout=settings.DB_CIRCUIT_RESET_SECONDS,
+    is_failure=is_connection_failure,
+)
+GaugeFunction(
+    "database_circuit_open",
+    "1 while the database circuit breaker refuses calls, 0.5 while it probes.",
+    lambda: {CLOSED: 0.0, OPEN: 1.0}.get(database_breaker.state, 0.5),
+)
+
+_local = threading.local()
+
+
+def guarded(method: Callable) -> Callable:
+    """
+    Run a repository method through `database_breaker`.
+
+    Calls nested in a guarded method are not guarded again, so a half-open
+    probe is not refused by its own circuit.
+
+    Args:
+        method (Callable): The repository method.
+
+    Returns:
+        Callable: The guarded method.
+
+    Raises:
+        DatabaseUnavailableError: If the circuit is open or the database
+        cannot be reached.
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        if getattr(_local, "inside", False):
+            return method(*args, **kwargs)
+        _local.inside = True
+        try:
+            with database_breaker.guard():
+                return method(*args, **kwargs)
+        except CircuitOpenError as exc:
+            raise DatabaseUnavailableError(math.ceil(exc.retry_after) or 1) from exc
+        except Exception as exc:
+            if is_connection_failure(exc):
+                raise DatabaseUnavailableError(
+                    math.ceil(database_breaker.reset_timeout)
+                ) from exc
+            raise
+        finally:
+            _local.inside = False
+
+    return wrapper
+
+
+def guard_repository(cls: C) -> C:
+    """
+    Class decorator guarding every public method of a repository.
+
+    Args:
+        cls (C): The repository class.
+
+    Returns:
+        C: The same class, with its public methods guarded.
+    """
+    for name, attribute in list(vars(cls).items()):
+        if callable(attribute) and not name.startswith("_"):
+            setattr(cls, name, guarded(attribute))
+    return cls
@@ -1,3 +1,4 @@
+from adapters.database.models.collection_version_model import CollectionVersion
 from adapters.database.models.permission_model import Permission
 from adapters.database.models.role_model import Role
 from adapters.database.models.role_permission_model import RolePermission
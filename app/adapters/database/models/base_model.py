@@ -2,13 +2,83 @@
 Base model
 """
 
+import os
+import threading
+import time
 import uuid
 from datetime import datetime, timezone
 
 from adapters.database import Base
+from config import settings
 from sqlalchemy import Column, DateTime, String
 from sqlalchemy.dialects.postgresql import UUID
 
+# Bits of a UUIDv7 after its 48-bit millisecond timestamp: 4 of version, 12 of
+# `rand_a`, 2 of variant and 62 of `rand_b`; the 74 random ones form `_tail`.
+_TAIL_BITS = 74
+_TAIL_MASK = (1 << _TAIL_BITS) - 1
+_uuid7_lock = threading.Lock()
+_last_ms = 0
+_last_tail = 0
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID, version 7 of RFC 9562.
+
+    The first 48 bits are the Unix time in milliseconds, so keys generated
+    later sort later and inserts append to the right edge of the primary key's
+    B-tree instead of landing on random pages. The remaining 74 bits are
+    random, drawn with their top bit clear; within one millisecond, or if the
+    clock steps back, the previous value is incremented instead, so the UUIDs
+    one process generates are strictly increasing.
+
+    Returns:
+        uuid.UUID: The UUID.
+    """
+    global _last_ms, _last_tail
+    with _uuid7_lock:
+        now_ms = time.time_ns() // 1_000_000
+        if now_ms > _last_ms:
+            _last_ms = now_ms
+            _last_tail = int.from_bytes(os.urandom(10), "big") >> 7
+        else:
+            _last_tail += 1
+            if _last_tail > _TAIL_MASK:
+                _last_ms += 1
+                _last_tail = 0
+        unix_ms, tail = _last_ms, _last_tail
+    rand_a = tail >> 62
+    rand_b = tail & ((1 << 62) - 1)
+    value = (
+        (unix_ms & ((1 << 48) - 1)) << 80
+        | 0x7 << 76
+        | rand_a << 64
+        | 0b10 << 62
+        | rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+def new_id() -> uuid.UUID:
+    """
+    Generate a primary key of the version set by `DB_ID_VERSION`.
+
+    Both versions fit the same `UUID` columns, so ids generated before a
+    switch stay valid; only the order of new keys changes.
+
+    Returns:
+        uuid.UUID: The id.
+
+    Raises:
+        ValueError: If `DB_ID_VERSION` is neither 4 nor 7.
+    """
+    if settings.DB_ID_VERSION == 7:
+        return uuid7()
+    if settings.DB_ID_VERSION == 4:
+        return uuid.uuid4()
+    raise ValueError(f"Unsupported DB_ID_VERSION: {settings.DB_ID_VERSION}")
+
 
 class BaseModel(Base):
     """
@@ -17,10 +87,11 @@ class BaseModel(Base):
     This class defines common attributes such as `id`, `created_at`, `updated_at`,
     `created_by`, `updated_by`, `deleted_at`, and `deleted_by` that can be inherited
     by other models in the database. It automatically handles the generation of UUIDs
-    and timestamps for creation, updates, and deletions."""
+    (time-ordered by default, see `new_id`) and timestamps for creation, updates,
+    and deletions."""
 
     __abstract__ = True
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=new_id)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc))
     created_by = Column(String)
     updated_at = Column(
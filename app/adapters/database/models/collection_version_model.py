@@ -0,0 +1,29 @@
+"""
+CollectionVersion model definition.
+"""
+
+from adapters.database import Base
+from sqlalchemy import BigInteger, Column, SmallInteger, String
+
+
+class CollectionVersion(Base):
+    """
+    Per-collection version counter, bumped by database triggers on every write.
+
+    Each collection's counter is split over several shard rows, and a writing
+    transaction only bumps the shard picked by its transaction id, so writers
+    do not all wait on one row lock until the first commits. The version is the
+    sum of the shards.
+
+    Attributes:
+        name (str): The collection name, e.g. `sessions` or `speakers`.
+        shard (int): The shard number.
+        version (int): Incremented by each statement writing to the collection
+            in a transaction mapped to this shard.
+    """
+
+    __tablename__ = "collection_version"
+
+    name = Column(String, primary_key=True)
+    shard = Column(SmallInteger, primary_key=True, server_default="0")
+    version = Column(BigInteger, nullable=False, server_default="0")
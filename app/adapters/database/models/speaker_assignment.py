@@ -24,6 +24,7 @@ class SpeakerAssignment(BaseModel):
         UUID(as_uuid=True),
         ForeignKey("scheduled_sessions.id", ondelete="CASCADE"),
         nullable=False,
+        index=True,
     )
     speaker_id = Column(
         UUID(as_uuid=True), ForeignKey("speaker.id", ondelete="CASCADE"), nullable=False
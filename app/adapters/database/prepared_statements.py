@@ -0,0 +1,113 @@
+"""
+Server-side prepared statements for the hottest repository queries.
+
+A `PreparedQuery` wraps a select. The first time a pooled connection runs it,
+the select is sent once as `PREPARE <name> AS ...`; every later run on that
+connection is an `EXECUTE <name>(...)`, which skips parsing and, once Postgres
+settles on a generic plan, planning. Prepared statements outlive transactions
+but not connections, so the names prepared are kept in the connection's
+`info`, which SQLAlchemy empties whenever the connection is recycled or
+invalidated.
+
+PgBouncer in transaction mode hands each transaction any server connection,
+where the statement may not be prepared: set
+`DB_PREPARED_STATEMENTS_ENABLED=false` behind it, and the same selects run as
+ordinary statements.
+"""
+
+import re
+from functools import cached_property
+from typing import Any
+
+from config import settings
+from sqlalchemy import bindparam, column, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.engine import Result
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import Executable, Select
+from sqlalchemy.sql.expression import ColumnClause
+
+# Key of the set of statement names prepared on a connection, in its `info`.
+PREPARED_KEY = "prepared_statements"
+# Renders bound parameters as `$1`, `$2`, ..., as `PREPARE` expects.
+_DIALECT = postgresql.dialect(paramstyle="numeric_dollar")
+_NAME = re.compile(r"^[a-z_][a-z0-9_]*$")
+
+
+class PreparedQuery:
+    """
+    A select run as a server-side prepared statement, where enabled.
+
+    Its parameters are `bindparam`s, passed by name to `execute`; literal
+    values in the select become parameters with fixed values.
+    """
+
+    def __init__(self, name: str, statement: Select):
+        """
+        Declare a prepared query. Nothing is compiled until it first runs.
+
+        Args:
+            name (str): The statement name, unique among prepared queries.
+            statement (Select): The select, ORM or Core.
+
+        Raises:
+            ValueError: If the name is not a lowercase SQL identifier.
+        """
+        if not _NAME.match(name):
+            raise ValueError(f"Invalid prepared statement name: {name}")
+        self.name = name
+        self.statement = statement
+
+    @cached_property
+    def _compiled(self) -> tuple[str, list[str], dict[str, Any], Executable]:
+        """The `PREPARE` body, its parameter names and defaults, and the
+        `EXECUTE` statement mapped back to the select's entities."""
+        compiled = self.statement.compile(dialect=_DIALECT)
+        names = list(compiled.positiontup)
+        arguments = ", ".join(f":{name}" for name in names)
+        execute = (
+            text(
+                f"EXECUTE {self.name}({arguments})" if names else f"EXECUTE {self.name}"
+            )
+            .bindparams(
+                *(bindparam(name, type_=compiled.binds[name].type) for name in names)
+            )
+            .columns(
+                *(
+                    selected
+                    if isinstance(selected, ColumnClause)
+                    else column(f"column_{position}", selected.type)
+                    for position, selected in enumerate(self.statement.selected_columns)
+                )
+            )
+        )
+        if any(
+            description.get("entity") is not None
+            and description["expr"] is description["entity"]
+            for description in self.statement.column_descriptions
+        ):
+            # Rows hold ORM entities, loaded into the session as usual.
+            execute = self.statement.from_statement(execute)
+        return compiled.string, names, dict(compiled.params), execute
+
+    def execute(self, session: Session, **params: Any) -> Result:
+        """
+        Run the query in a session, preparing it on the connection if needed.
+
+        Args:
+            session (Session): The database session.
+            **params (Any): The value of each parameter.
+
+        Returns:
+            Result: The rows, as the select itself would return them.
+        """
+        if not settings.DB_PREPARED_STATEMENTS_ENABLED:
+            return session.execute(self.statement, params)
+        sql, names, defaults, execute = self._compiled
+        connection = session.connection()
+        prepared = connection.info.setdefault(PREPARED_KEY, set())
+        if self.name not in prepared:
+            connection.exec_driver_sql(f"PREPARE {self.name} AS {sql}")
+            prepared.add(self.name)
+        values = {**defaults, **params}
+        return session.execute(execute, {name: values[name] for name in names})
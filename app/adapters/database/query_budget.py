@@ -0,0 +1,192 @@
+"""
+Pytest plugin declaring SQL query budgets and catching N+1 patterns.
+
+Enable it from `conftest.py` with `pytest_plugins = ["adapters.database.query_budget"]`,
+then wrap the code under test, typically one request::
+
+    def test_list_sessions(self, query_budget):
+        with query_budget(max_queries=5):
+            self.client.get("/api/v1/session/")
+
+The block fails the test if it runs more statements than its budget, or if a
+statement runs more than `max_repeats` times with only its parameters changing,
+the signature of an N+1. The failure lists every statement shape with its count
+and the application code that issued it.
+"""
+
+import traceback
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import pytest
+from adapters.database.sql_fingerprint import fingerprint
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+CALL_SITE_DEPTH = 3
+# Frames never reported as call sites: this plugin and the ASGI middleware.
+IGNORED_PATHS = (Path(__file__).resolve(), APP_ROOT / "core" / "middleware")
+# Statements the test fixtures add around a session's commits, the routes'
+# statement timeouts, and the preparation of a statement once per connection,
+# never counted.
+IGNORED_STATEMENTS = (
+    "SAVEPOINT ",
+    "RELEASE SAVEPOINT ",
+    "ROLLBACK TO SAVEPOINT ",
+    "SET LOCAL statement_timeout ",
+    "PREPARE ",
+)
+
+
+@dataclass
+class RecordedStatement:
+    """
+    A statement run while recording.
+
+    Attributes:
+        statement (str): The SQL sent to the database.
+        fingerprint (str): The statement without parameters or literals.
+        call_site (tuple[str, ...]): The innermost application frames that ran
+            it, as `path:line in function`.
+    """
+
+    statement: str
+    fingerprint: str
+    call_site: tuple[str, ...]
+
+
+class QueryRecorder:
+    """
+    Context manager recording the SQL statements run by every engine.
+
+    Statements from all threads are recorded, so requests served by the test
+    client's worker threads are included.
+    """
+
+    def __init__(self):
+        """Initialize an empty recorder."""
+        self.statements: list[RecordedStatement] = []
+
+    def __enter__(self) -> "QueryRecorder":
+        """Start recording."""
+        event.listen(Engine, "before_cursor_execute", self._record)
+        return self
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Stop recording."""
+        event.remove(Engine, "before_cursor_execute", self._record)
+
+    def _record(self, conn, cursor, statement, parameters, context, executemany):
+        """Record a statement with its fingerprint and call site."""
+        if statement.startswith(IGNORED_STATEMENTS):
+            return
+        self.statements.append(
+            RecordedStatement(statement, fingerprint(statement), _call_site())
+        )
+
+    @property
+    def count(self) -> int:
+        """The number of statements recorded."""
+        return len(self.statements)
+
+    def repeated(self, max_repeats: int) -> dict[str, int]:
+        """
+        Return the fingerprints recorded more than `max_repeats` times.
+
+        Args:
+            max_repeats (int): The number of runs allowed per fingerprint.
+
+        Returns:
+            dict[str, int]: Run count per offending fingerprint.
+        """
+        counts = Counter(statement.fingerprint for statement in self.statements)
+        return {shape: runs for shape, runs in counts.items() if runs > max_repeats}
+
+    def report(self) -> str:
+        """
+        Describe the statements recorded, grouped by fingerprint.
+
+        Returns:
+            str: One paragraph per fingerprint with its count and call sites.
+        """
+        counts = Counter(statement.fingerprint for statement in self.statements)
+        lines = []
+        for shape, runs in counts.most_common():
+            lines.append(f"{runs} x {shape}")
+            sites = Counter(
+                statement.call_site
+                for statement in self.statements
+                if statement.fingerprint == shape
+            )
+            for site, site_runs in sites.most_common():
+                lines.append(f"    {site_runs} x from:")
+                lines.extend(f"        {frame}" for frame in site or ("<unknown>",))
+        return "\n".join(lines)
+
+
+class QueryBudget(QueryRecorder):
+    """
+    Recorder failing the test when its block exceeds a query budget.
+    """
+
+    def __init__(self, max_queries: Optional[int] = None, max_repeats: int = 1):
+        """
+        Initialize the budget.
+
+        Args:
+            max_queries (Optional[int]): The statements allowed, or None for no limit.
+            max_repeats (int): The runs allowed per statement fingerprint; more
+                are reported as a suspected N+1.
+        """
+        super().__init__()
+        self.max_queries = max_queries
+        self.max_repeats = max_repeats
+
+    def __exit__(self, exc_type, exc_value, exc_traceback) -> None:
+        """Stop recording and check the budget, unless the block failed."""
+        super().__exit__(exc_type, exc_value, exc_traceback)
+        if exc_type is not None:
+            return
+        problems = []
+        if self.max_queries is not None and self.count > self.max_queries:
+            problems.append(
+                f"{self.count} SQL statements, over the budget of {self.max_queries}."
+            )
+        for shape, runs in self.repeated(self.max_repeats).items():
+            problems.append(f"Suspected N+1: {runs} x {shape}")
+        if problems:
+            pytest.fail(
+                "\n".join(problems) + "\n\nStatements:\n" + self.report(),
+                pytrace=False,
+            )
+
+
+@pytest.fixture
+def query_budget() -> type[QueryBudget]:
+    """
+    Provide `QueryBudget`, to be used as `with query_budget(max_queries=...)`.
+
+    Returns:
+        type[QueryBudget]: The budget context manager.
+    """
+    return QueryBudget
+
+
+def _call_site() -> tuple[str, ...]:
+    """Return the innermost application frames of the current stack."""
+    frames = []
+    for frame in reversed(traceback.extract_stack()[:-2]):
+        path = Path(frame.filename)
+        if (
+            "site-packages" in path.parts
+            or not path.is_relative_to(APP_ROOT)
+            or any(path.is_relative_to(ignored) for ignored in IGNORED_PATHS)
+        ):
+            continue
+        frames.append(f"{path.relative_to(APP_ROOT)}:{frame.lineno} in {frame.name}")
+        if len(frames) == CALL_SITE_DEPTH:
+            break
+    return tuple(frames)
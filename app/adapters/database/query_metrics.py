@@ -0,0 +1,42 @@
+"""
+SQL statement metrics, recorded through SQLAlchemy cursor events.
+"""
+
+import time
+
+from core.common.metrics import Counter, Histogram
+from core.middleware.metrics_middleware import current_request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+statements_total = Counter("db_statements_total", "SQL statements executed.")
+statement_duration = Histogram(
+    "db_statement_duration_seconds",
+    "Time to execute a SQL statement, excluding fetching its rows.",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Remember when the statement started."""
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    """Record the statement globally and on the current request."""
+    elapsed = time.perf_counter() - conn.info.pop("query_started", time.perf_counter())
+    statements_total.inc()
+    statement_duration.observe(elapsed)
+    stats = current_request.get()
+    if stats is not None:
+        stats.db_statements += 1
+        stats.db_seconds += elapsed
+
+
+def instrument_queries() -> None:
+    """
+    Record the statements of every engine. Safe to call more than once.
+    """
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,315 @@
+"""
+Export repository implementation.
+"""
+
+import queue
+import threading
+from datetime import datetime
+from itertools import groupby
+from typing import Any, Iterator, Optional, Sequence
+from uuid import UUID
+
+from adapters.database.models import (
+    ScheduledSession,
+    SessionAttendee,
+    Speaker,
+    SpeakerAssignment,
+    User,
+)
+from core.export.ports.export_repository import ExportRepository
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+
+class ExportRepositoryImpl(ExportRepository):
+    """Export repository implementation.
+
+    Queries select plain columns rather than ORM entities and run with
+    `yield_per`, which makes psycopg2 use a named (server-side) cursor. The
+    bulk attendance export uses `COPY` instead.
+    """
+
+    def __init__(self, db_session: Session):
+        """Initialize the repository with a database session.
+
+        Args:
+            db_session (Session): The database session.
+        """
+        self.db_session = db_session
+
+    def iter_sessions(self, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Stream the active sessions, each with the list of its speakers.
+
+        Sessions are joined to their speakers and ordered by ID, so the rows
+        of one session are consecutive and can be folded as they stream by.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per session.
+        """
+        query = (
+            select(
+                ScheduledSession.id,
+                ScheduledSession.title,
+                ScheduledSession.description,
+                ScheduledSession.start_time,
+                ScheduledSession.end_time,
+                ScheduledSession.capacity,
+                ScheduledSession.is_active,
+                Speaker.id.label("speaker_id"),
+                Speaker.name.label("speaker_name"),
+                Speaker.email.label("speaker_email"),
+                SpeakerAssignment.role.label("speaker_role"),
+            )
+            .outerjoin(
+                SpeakerAssignment, SpeakerAssignment.session_id == ScheduledSession.id
+            )
+            .outerjoin(Speaker, Speaker.id == SpeakerAssignment.speaker_id)
+            .where(ScheduledSession.deleted_at.is_(None))
+            .order_by(ScheduledSession.id)
+        )
+        rows = self._stream(query, batch_size)
+        for _, group in groupby(rows, key=lambda row: row.id):
+            group = list(group)
+            first = group[0]
+            yield {
+                "id": first.id,
+                "title": first.title,
+                "description": first.description,
+                "start_time": first.start_time,
+                "end_time": first.end_time,
+                "capacity": first.capacity,
+                "is_active": first.is_active,
+                "speakers": [
+                    {
+                        "id": row.speaker_id,
+                        "name": row.speaker_name,
+                        "email": row.speaker_email,
+                        "role": row.speaker_role,
+                    }
+                    for row in group
+                    if row.speaker_id is not None
+                ],
+            }
+
+    def iter_attendees(
+        self, batch_size: int, session_id: Optional[UUID] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream session attendance records.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+            session_id (Optional[UUID]): Restrict the roster to one session.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per attendance.
+        """
+        query = (
+            select(
+                SessionAttendee.session_id,
+                ScheduledSession.title.label("session_title"),
+                SessionAttendee.user_id,
+                User.email.label("user_email"),
+                SessionAttendee.attendance_time,
+            )
+            .join(ScheduledSession, ScheduledSession.id == SessionAttendee.session_id)
+            .join(User, User.id == SessionAttendee.user_id)
+            .where(
+                SessionAttendee.deleted_at.is_(None),
+                ScheduledSession.deleted_at.is_(None),
+            )
+            .order_by(SessionAttendee.session_id, SessionAttendee.id)
+        )
+        if session_id is not None:
+            query = query.where(SessionAttendee.session_id == session_id)
+        for row in self._stream(query, batch_size):
+            yield row._asdict()
+
+    def iter_users(self, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Stream the users, without credentials.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per user.
+        """
+        query = (
+            select(User.id, User.email, User.is_active, User.created_at)
+            .where(User.deleted_at.is_(None))
+            .order_by(User.id)
+        )
+        for row in self._stream(query, batch_size):
+            yield row._asdict()
+
+    def iter_attendance_csv(
+        self,
+        columns: Sequence[str],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        block_bytes: int = 8 * 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Stream attendance records joined with their session and user, as CSV.
+
+        The query runs under `COPY ... TO STDOUT`, so Postgres formats the rows
+        itself and no Python object is built per value. The copy runs in a
+        background thread and hands over blocks through a bounded queue, so the
+        caller can convert one block while the next is being read.
+
+        Args:
+            columns (Sequence[str]): The columns to read, from `ATTENDANCE_COLUMNS`.
+            since (Optional[datetime]): Only attendances at or after this time.
+            until (Optional[datetime]): Only attendances before this time.
+            block_bytes (int): Approximate size of each block.
+
+        Returns:
+            Iterator[bytes]: CSV blocks of whole rows, without a header.
+        """
+        expressions = {
+            "attendance_id": SessionAttendee.id,
+            "attendance_time": SessionAttendee.attendance_time,
+            "session_id": SessionAttendee.session_id,
+            "session_title": ScheduledSession.title,
+            "session_start_time": ScheduledSession.start_time,
+            "user_id": SessionAttendee.user_id,
+            "user_email": User.email,
+        }
+        query = (
+            select(*(expressions[column].label(column) for column in columns))
+            .select_from(SessionAttendee)
+            .join(ScheduledSession, ScheduledSession.id == SessionAttendee.session_id)
+            .join(User, User.id == SessionAttendee.user_id)
+            .where(
+                SessionAttendee.deleted_at.is_(None),
+                ScheduledSession.deleted_at.is_(None),
+            )
+            .order_by(SessionAttendee.attendance_time.asc().nulls_last())
+        )
+        if since is not None:
+            query = query.where(SessionAttendee.attendance_time >= since)
+        if until is not None:
+            query = query.where(SessionAttendee.attendance_time < until)
+
+        connection = self.db_session.connection()
+        compiled = query.compile(dialect=connection.dialect)
+        cursor = connection.connection.cursor()
+        try:
+            statement = cursor.mogrify(str(compiled), compiled.params).decode()
+            yield from _copy_blocks(
+                cursor, f"COPY ({statement}) TO STDOUT WITH (FORMAT csv)", block_bytes
+            )
+        finally:
+            cursor.close()
+
+    def _stream(self, query: Select, batch_size: int) -> Iterator[Row]:
+        """Execute a query on a server-side cursor and yield its rows.
+
+        The cursor is closed when the stream ends or is abandoned, e.g. when
+        the client disconnects.
+
+        Args:
+            query (Select): The query to run.
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[Row]: The result rows.
+        """
+        result = self.db_session.execute(query.execution_options(yield_per=batch_size))
+        try:
+            yield from result
+        finally:
+            result.close()
+
+
+class _CopyCancelled(Exception):
+    """Raised in the copy thread when the reader stopped early."""
+
+
+class _BlockSink:
+    """File-like target of `copy_expert` grouping rows into blocks.
+
+    libpq returns COPY data one row at a time, so every block ends on a row
+    boundary.
+    """
+
+    def __init__(
+        self, blocks: queue.Queue, block_bytes: int, cancelled: threading.Event
+    ):
+        """Initialize the sink.
+
+        Args:
+            blocks (queue.Queue): Queue receiving the blocks.
+            block_bytes (int): Approximate size of each block.
+            cancelled (threading.Event): Set when the reader stopped early.
+        """
+        self.blocks = blocks
+        self.block_bytes = block_bytes
+        self.cancelled = cancelled
+        self.rows: list[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        """Append a row, handing over a block once it is large enough."""
+        if self.cancelled.is_set():
+            raise _CopyCancelled()
+        self.rows.append(data)
+        self.size += len(data)
+        if self.size >= self.block_bytes:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        """Hand over the pending rows as a block."""
+        if self.rows:
+            self.blocks.put(b"".join(self.rows))
+            self.rows, self.size = [], 0
+
+
+def _copy_blocks(cursor: Any, statement: str, block_bytes: int) -> Iterator[bytes]:
+    """Run a `COPY ... TO STDOUT` in a background thread and yield its blocks.
+
+    Errors of the copy are raised in the caller. If the caller stops early the
+    copy is aborted, which leaves the transaction unusable: the session must
+    then be rolled back or closed.
+
+    Args:
+        cursor (Any): A psycopg2 cursor.
+        statement (str): The COPY statement.
+        block_bytes (int): Approximate size of each block.
+
+    Returns:
+        Iterator[bytes]: The copied data, in blocks of whole rows.
+    """
+    blocks: queue.Queue = queue.Queue(maxsize=4)
+    cancelled = threading.Event()
+    errors: list[BaseException] = []
+    done = object()
+
+    def copy():
+        try:
+            sink = _BlockSink(blocks, block_bytes, cancelled)
+            cursor.copy_expert(statement, sink)
+            sink.flush()
+        except BaseException as error:
+            errors.append(error)
+        finally:
+            blocks.put(done)
+
+    thread = threading.Thread(target=copy, name="export-copy", daemon=True)
+    thread.start()
+    try:
+        while (block := blocks.get()) is not done:
+            yield block
+    finally:
+        cancelled.set()
+        while thread.is_alive():
+            try:
+                blocks.get(timeout=0.1)
+            except queue.Empty:
+                pass
+        thread.join()
+    if errors and not isinstance(errors[0], _CopyCancelled):
+        raise errors[0]
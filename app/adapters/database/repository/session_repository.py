@@ -6,7 +6,23 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID
 
-from adapters.database.models import ScheduledSession, Speaker, SpeakerAssignment
+from adapters.database.circuit_breaker import guard_repository
+from adapters.database.models import (
+    CollectionVersion,
+    ScheduledSession,
+    Speaker,
+    SpeakerAssignment,
+)
+from adapters.database.prepared_statements import PreparedQuery
+from adapters.database.returning import update_returning
+from core.common.cache import ResponseCache
+from core.session.cache import (
+    SESSIONS_NAMESPACE,
+    SPEAKERS_NAMESPACE,
+    collection_prefix,
+    session_cache,
+    session_prefix,
+)
 from core.session.ports.session_repository import SessionRepository
 from core.session.schemas import (
     SessionCreate,
@@ -16,16 +32,85 @@ from core.session.schemas import (
     SessionUpdate,
     SpeakerOut,
 )
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.exc import NoResultFound
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
+
+# The session read paths, run as prepared statements where enabled.
+SESSION_WITH_SPEAKERS = PreparedQuery(
+    "session_with_speakers",
+    select(ScheduledSession, SpeakerAssignment.role, Speaker)
+    .outerjoin(ScheduledSession.speakers)
+    .outerjoin(SpeakerAssignment.speaker)
+    .where(
+        ScheduledSession.id == bindparam("session_id"),
+        ScheduledSession.deleted_at.is_(None),
+    ),
+)
+SESSION_COUNT = PreparedQuery(
+    "session_count",
+    select(func.count())
+    .select_from(ScheduledSession)
+    .where(ScheduledSession.deleted_at.is_(None)),
+)
+SESSION_PAGE = PreparedQuery(
+    "session_page",
+    select(ScheduledSession)
+    .where(ScheduledSession.deleted_at.is_(None))
+    .order_by(ScheduledSession.id)
+    .offset(bindparam("offset"))
+    .limit(bindparam("limit")),
+)
 
 
+def session_detail(
+    session: ScheduledSession,
+    assignments: Optional[list[tuple[str, Speaker]]] = None,
+) -> SessionDetail:
+    """Map a session and its speakers to its detail schema.
+
+    Args:
+        session (ScheduledSession): The session.
+        assignments (Optional[list[tuple[str, Speaker]]]): Its speakers, each
+            with its role; by default read from the session's loaded `speakers`.
+
+    Returns:
+        SessionDetail: The session details.
+    """
+    if assignments is None:
+        assignments = [
+            (assignment.role, assignment.speaker) for assignment in session.speakers
+        ]
+    speakers = [
+        SpeakerOut(
+            id=str(speaker.id),
+            name=speaker.name,
+            email=speaker.email,
+            role=role,
+            biography=speaker.biography,
+        )
+        for role, speaker in assignments
+    ]
+    session_dict = session.__dict__.copy()
+    session_dict.pop("speakers", None)
+    session_data = SessionDetail.model_validate(session_dict)
+    session_data.speakers = speakers
+    return session_data
+
+
+@guard_repository
 class SessionRepositoryImpl(SessionRepository):
     """Session repository implementation."""
 
-    def __init__(self, db_session: Session):
-        """Initialize the session repository with a database session."""
+    def __init__(self, db_session: Session, cache: ResponseCache = session_cache):
+        """Initialize the session repository with a database session.
+
+        Args:
+            db_session (Session): The database session.
+            cache (ResponseCache): The read cache invalidated by every write.
+        """
         self.db_session = db_session
+        self.cache = cache
 
     def create_session(self, session_data: SessionCreate) -> SessionOut:
         """Create a new session with the provided session data.
@@ -39,44 +124,21 @@ class SessionRepositoryImpl(SessionRepository):
         new_session = ScheduledSession(**session_data.model_dump(exclude={"speakers"}))
         self.db_session.add(new_session)
         self.db_session.commit()
+        self.cache.invalidate_prefix(collection_prefix(SESSIONS_NAMESPACE))
         self.db_session.refresh(new_session)
         return SessionOut.model_validate(new_session)
 
     def get_session_by_id(self, session_id: UUID) -> Optional[SessionDetail]:
         """Retrieve a session by its UUID, including its speakers."""
-        try:
-            session = (
-                self.db_session.query(ScheduledSession)
-                .options(
-                    joinedload(ScheduledSession.speakers).joinedload(
-                        SpeakerAssignment.speaker
-                    )
-                )
-                .filter(
-                    ScheduledSession.id == session_id,
-                    ScheduledSession.deleted_at.is_(None),
-                )
-                .one()
-            )
-
-            speakers = [
-                SpeakerOut(
-                    id=str(assignment.speaker.id),
-                    name=assignment.speaker.name,
-                    email=assignment.speaker.email,
-                    role=assignment.role,
-                    biography=assignment.speaker.biography,
-                )
-                for assignment in session.speakers
-            ]
-            session_dict = session.__dict__.copy()
-            session_dict.pop("speakers", None)
-            session_data = SessionDetail.model_validate(session_dict)
-            session_data.speakers = speakers
-
-            return session_data
-        except NoResultFound:
+        rows = SESSION_WITH_SPEAKERS.execute(
+            self.db_session, session_id=session_id
+        ).all()
+        if not rows:
             return None
+        return session_detail(
+            rows[0][0],
+            [(role, speaker) for _, role, speaker in rows if speaker is not None],
+        )
 
     def update_session(
         self, session_id: UUID, session_data: SessionUpdate
@@ -89,23 +151,19 @@ class SessionRepositoryImpl(SessionRepository):
 
         Returns:
             SessionOut: The updated session.
+
+        Raises:
+            NoResultFound: If the session does not exist or was deleted.
         """
-        session = (
-            self.db_session.query(ScheduledSession)
-            .filter(
-                ScheduledSession.id == session_id, ScheduledSession.deleted_at.is_(None)
-            )
-            .one_or_none()
+        session = update_returning(
+            self.db_session, ScheduledSession, session_id, **session_data
         )
 
         if not session:
             raise NoResultFound("Session not found")
 
-        for key, value in session_data.items():
-            setattr(session, key, value)
-
         self.db_session.commit()
-        self.db_session.refresh(session)
+        self._invalidate_session(session_id)
         return SessionOut.model_validate(session)
 
     def delete_session(self, session_id: UUID) -> None:
@@ -113,25 +171,27 @@ class SessionRepositoryImpl(SessionRepository):
 
         Args:
             session_id (UUID): The UUID of the session to delete.
+
+        Raises:
+            NoResultFound: If the session does not exist or was already deleted.
         """
-        session = (
-            self.db_session.query(ScheduledSession)
-            .filter(
-                ScheduledSession.id == session_id, ScheduledSession.deleted_at.is_(None)
-            )
-            .one_or_none()
+        deleted = update_returning(
+            self.db_session,
+            ScheduledSession,
+            session_id,
+            deleted_at=datetime.now(timezone.utc),
         )
 
-        if not session:
+        if not deleted:
             raise NoResultFound("Session not found")
 
-        session.deleted_at = datetime.now(timezone.utc)
         self.db_session.commit()
+        self._invalidate_session(session_id)
 
     def list_sessions(
         self, limit: int, offset: int
     ) -> tuple[int, list[SessionListOut]]:
-        """List sessions with pagination.
+        """List sessions with pagination, ordered by id.
 
         Args:
             limit (int): The maximum number of sessions to return.
@@ -140,11 +200,12 @@ class SessionRepositoryImpl(SessionRepository):
         Returns:
             tuple[int, list[SessionListOut]]: A tuple containing the total number of sessions and a list of sessions.
         """
-        query = self.db_session.query(ScheduledSession).filter(
-            ScheduledSession.deleted_at.is_(None)
+        total = SESSION_COUNT.execute(self.db_session).scalar()
+        sessions = (
+            SESSION_PAGE.execute(self.db_session, offset=offset, limit=limit)
+            .scalars()
+            .all()
         )
-        total = query.count()
-        sessions = query.offset(offset).limit(limit).all()
         return total, [session.__dict__.copy() for session in sessions]
 
     def assign_speaker_to_session(self, session_id: UUID, speaker_id: UUID) -> None:
@@ -154,18 +215,31 @@ class SessionRepositoryImpl(SessionRepository):
             session_id (UUID): The UUID of the session to assign the speaker to.
             speaker_id (UUID): The UUID of the speaker to assign to the session.
         """
-        speaker_assignment = SpeakerAssignment(
-            session_id=str(session_id),
-            speaker_id=str(speaker_id),
-            role="Presenter",
-        )
+        self.assign_speakers_to_session(session_id, [speaker_id])
 
-        self.db_session.add(speaker_assignment)
+    def assign_speakers_to_session(
+        self, session_id: UUID, speaker_ids: list[UUID]
+    ) -> None:
+        """Assign several speakers to a session, in a single insert and commit.
+
+        Args:
+            session_id (UUID): The UUID of the session to assign the speakers to.
+            speaker_ids (list[UUID]): The UUIDs of the speakers to assign.
+        """
+        self.db_session.add_all(
+            SpeakerAssignment(
+                session_id=str(session_id),
+                speaker_id=str(speaker_id),
+                role="Presenter",
+            )
+            for speaker_id in speaker_ids
+        )
         self.db_session.commit()
+        self.cache.invalidate_prefix(session_prefix(session_id))
 
     def list_speakers(self, limit: int, offset: int) -> tuple[int, list[SpeakerOut]]:
         """
-        List speakers with pagination.
+        List speakers with pagination, ordered by id.
 
         Args:
             limit (int): The maximum number of speakers to return.
@@ -176,7 +250,7 @@ class SessionRepositoryImpl(SessionRepository):
         """
         query = self.db_session.query(Speaker)
         total = query.count()
-        speakers = query.offset(offset).limit(limit).all()
+        speakers = query.order_by(Speaker.id).offset(offset).limit(limit).all()
         return total, speakers
 
     def get_speaker_by_id(self, speaker_id: UUID) -> Optional[SpeakerOut]:
@@ -199,3 +273,105 @@ class SessionRepositoryImpl(SessionRepository):
             )
 
         return None
+
+    def get_speakers_by_ids(self, speaker_ids: list[UUID]) -> list[SpeakerOut]:
+        """
+        Retrieve the speakers with the given IDs in one query, skipping unknown IDs.
+        """
+        speakers = (
+            self.db_session.query(Speaker).filter(Speaker.id.in_(speaker_ids)).all()
+        )
+        return [
+            SpeakerOut.model_validate(
+                {
+                    "id": str(speaker.id),
+                    "name": speaker.name,
+                    "email": speaker.email,
+                    "biography": speaker.biography,
+                }
+            )
+            for speaker in speakers
+        ]
+
+    def get_session_version(self, session_id: UUID) -> Optional[str]:
+        """
+        Return a cheap version marker for a session and its speakers.
+
+        The marker is built from timestamps only, so it is much cheaper than
+        loading and serializing the session with its speakers.
+
+        Args:
+            session_id (UUID): The UUID of the session.
+
+        Returns:
+            Optional[str]: The version marker, or None if the session does not exist.
+        """
+        row = (
+            self.db_session.query(
+                ScheduledSession.updated_at,
+                func.count(SpeakerAssignment.id),
+                func.max(SpeakerAssignment.updated_at),
+                func.max(Speaker.updated_at),
+            )
+            .outerjoin(
+                SpeakerAssignment, SpeakerAssignment.session_id == ScheduledSession.id
+            )
+            .outerjoin(Speaker, Speaker.id == SpeakerAssignment.speaker_id)
+            .filter(
+                ScheduledSession.id == session_id,
+                ScheduledSession.deleted_at.is_(None),
+            )
+            .group_by(ScheduledSession.id)
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return ":".join(str(value) for value in row)
+
+    def get_sessions_version(self) -> str:
+        """
+        Return the version counter of the sessions collection.
+
+        The counter is bumped by a database trigger on every write to
+        `scheduled_sessions`, so reading it sums a few rows found by primary key.
+
+        Returns:
+            str: The version marker.
+        """
+        return self._get_collection_version(SESSIONS_NAMESPACE)
+
+    def get_speakers_version(self) -> str:
+        """
+        Return the version counter of the speakers collection.
+
+        Returns:
+            str: The version marker.
+        """
+        return self._get_collection_version(SPEAKERS_NAMESPACE)
+
+    def _get_collection_version(self, name: str) -> str:
+        """
+        Read a collection version counter, the sum of its shards.
+
+        Args:
+            name (str): The collection name.
+
+        Returns:
+            str: The counter value, as a string.
+        """
+        version = (
+            self.db_session.query(func.sum(CollectionVersion.version))
+            .filter(CollectionVersion.name == name)
+            .scalar()
+        )
+        return str(version or 0)
+
+    def _invalidate_session(self, session_id: UUID) -> None:
+        """
+        Drop cached reads affected by a change to one session.
+
+        Args:
+            session_id (UUID): The UUID of the changed session.
+        """
+        self.cache.invalidate_prefix(session_prefix(session_id))
+        self.cache.invalidate_prefix(collection_prefix(SESSIONS_NAMESPACE))
@@ -6,13 +6,26 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
+from adapters.database.circuit_breaker import guard_repository
 from adapters.database.models.user_model import User
+from adapters.database.prepared_statements import PreparedQuery
+from adapters.database.returning import update_returning
 from core.auth.ports.repository import UserRepository
 from core.auth.schemas import UserCreate, UserOut, UserUpdate
 from core.exceptions.custom_exceptions import CustomAPIException
+from sqlalchemy import bindparam, select
 from sqlalchemy.orm import Session
 
+# Run by the authorizer on every authenticated request.
+USER_BY_ID = PreparedQuery(
+    "user_by_id",
+    select(User)
+    .where(User.id == bindparam("user_id"), User.deleted_at.is_(None))
+    .limit(1),
+)
 
+
+@guard_repository
 class SQLAlchemyUserRepository(UserRepository):
     """
     SQLAlchemy implementation of the UserRepository interface.
@@ -43,11 +56,7 @@ class SQLAlchemyUserRepository(UserRepository):
         Returns:
             Optional[User]: The user object if found, otherwise None.
         """
-        return (
-            self.data_base.query(User)
-            .filter(User.id == user_id, User.deleted_at.is_(None))
-            .first()
-        )
+        return USER_BY_ID.execute(self.data_base, user_id=user_id).scalars().first()
 
     def create_user(self, user_data: UserCreate) -> UserOut:
         """
@@ -75,30 +84,46 @@ class SQLAlchemyUserRepository(UserRepository):
 
         Returns:
             UserOut: The updated user object.
+
+        Raises:
+            CustomAPIException: If the user does not exist or was deleted.
         """
-        user = self.data_base.query(User).filter(User.id == user_id).first()
+        user = update_returning(
+            self.data_base, User, user_id, **user_data.model_dump(exclude_unset=True)
+        )
 
         if not user:
             raise CustomAPIException(detail="User not found", status_code=404)
 
-        for key, value in user_data.model_dump(exclude_unset=True).items():
-            setattr(user, key, value)
-
         self.data_base.commit()
-        self.data_base.refresh(user)
 
         return UserOut.model_validate(user)
 
     def delete_user(self, user_id: UUID) -> None:
-        user = self.data_base.query(User).filter(User.id == user_id).first()
-        user.deleted_at = (
-            datetime.utcnow()
-        )  # Marca el campo deleted_at con la fecha actual
+        """
+        Soft-delete a user by their ID.
+
+        Args:
+            user_id (UUID): The ID of the user to delete.
+
+        Raises:
+            CustomAPIException: If the user does not exist or was already deleted.
+        """
+        deleted = update_returning(
+            self.data_base,
+            User,
+            user_id,
+            deleted_at=datetime.utcnow(),  # Marca deleted_at con la fecha actual
+        )
+
+        if not deleted:
+            raise CustomAPIException(detail="User not found", status_code=404)
+
         self.data_base.commit()
 
     def list_users(self, limit: int, offset: int) -> tuple[int, list[User]]:
         """
-        List paginated users.
+        List paginated users, ordered by id.
 
         Args:
             limit (int): The number of users to retrieve.
@@ -109,5 +134,5 @@ class SQLAlchemyUserRepository(UserRepository):
         """
         query = self.data_base.query(User).filter(User.deleted_at.is_(None))
         total_items = query.count()
-        users = query.offset(offset).limit(limit).all()
+        users = query.order_by(User.id).offset(offset).limit(limit).all()
         return total_items, users
@@ -0,0 +1,49 @@
+"""
+Single-round-trip writes to soft-deleted tables.
+"""
+
+from typing import Any, Optional
+
+from adapters.database.models.base_model import BaseModel
+from sqlalchemy import update
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.util import identity_key
+
+
+def update_returning(
+    data_base: Session, model: type[BaseModel], object_id: Any, **values: Any
+) -> Optional[Row]:
+    """
+    Update a row that is not soft-deleted and return it, in one statement.
+
+    Runs `UPDATE ... WHERE id = :id AND deleted_at IS NULL RETURNING *`
+    instead of loading the object, changing it and reloading it after the
+    commit. Columns with an `onupdate` default are set as usual. If the
+    session already holds the object, it gets the returned values, so later
+    reads in the same session see the change.
+
+    Args:
+        data_base (Session): The database session; the caller commits.
+        model (type[BaseModel]): The mapped class of the table.
+        object_id (Any): The ID of the row.
+        **values (Any): The new column values.
+
+    Returns:
+        Optional[Row]: Every column of the updated row, or None if no live
+        row has that ID.
+    """
+    table = model.__table__
+    row = data_base.execute(
+        update(table)
+        .where(table.c.id == object_id, table.c.deleted_at.is_(None))
+        .values(**values)
+        .returning(*table.c)
+    ).one_or_none()
+    if row is not None:
+        loaded = data_base.identity_map.get(identity_key(model, row.id))
+        if loaded is not None:
+            for key, value in row._mapping.items():
+                set_committed_value(loaded, key, value)
+    return row
@@ -0,0 +1,278 @@
+"""
+Slow-query log: statements over a time threshold, with sampled query plans.
+"""
+
+import logging
+import random
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from decimal import Decimal
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from adapters.database.prepared_statements import PREPARED_KEY
+from adapters.database.sql_fingerprint import fingerprint
+from core.common.serialization import to_json
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+REPOSITORY_DIR = Path(__file__).resolve().parent / "repository"
+APP_ROOT = Path(__file__).resolve().parents[2]
+# Parameter types logged as they are; anything else is reduced to its type.
+_PLAIN_TYPES = (bool, int, float, Decimal, type(None))
+_MAX_FINGERPRINTS = 1000
+_EXECUTE = re.compile(r"\s*EXECUTE\s+([a-z_][a-z0-9_]*)", re.IGNORECASE)
+
+
+@dataclass
+class SlowStatementStats:
+    """
+    Aggregate of the slow runs of one statement fingerprint.
+
+    Attributes:
+        fingerprint (str): The statement without parameters or literals.
+        count (int): Number of slow runs.
+        total_ms (float): Their total duration.
+        max_ms (float): The longest one.
+        caller (Optional[str]): The code that issued the latest one.
+    """
+
+    fingerprint: str
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    caller: Optional[str] = None
+
+
+class SlowQueryDetector:
+    """
+    Logs the statements of an engine that run longer than a threshold.
+
+    Each slow statement is written as one JSON line with its fingerprint,
+    redacted parameters, duration and calling repository method. For a sample
+    of slow `SELECT` statements, and of `EXECUTE`s of the selects a
+    `PreparedQuery` prepared on the connection, the plan is captured with
+    `EXPLAIN (ANALYZE, BUFFERS)`, which runs the query a second time; other
+    statements are never explained, since ANALYZE would repeat their writes.
+    Slow runs are also aggregated per fingerprint for `top`.
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float,
+        explain_sample_rate: float = 0.0,
+        logger: Optional[logging.Logger] = None,
+        sample: Callable[[], float] = random.random,
+    ):
+        """
+        Initialize the detector.
+
+        Args:
+            threshold_ms (float): Statements taking at least this long are logged.
+            explain_sample_rate (float): Fraction of slow `SELECT` statements
+                whose plan is captured, from 0 to 1.
+            logger (Optional[logging.Logger]): Receives the JSON lines; the
+                `slow_queries` logger by default.
+            sample (Callable[[], float]): Returns a number in [0, 1), compared
+                with `explain_sample_rate`.
+        """
+        self.threshold_ms = threshold_ms
+        self.explain_sample_rate = explain_sample_rate
+        self.logger = logger or logging.getLogger("slow_queries")
+        self.sample = sample
+        self._stats: dict[str, SlowStatementStats] = {}
+        self._lock = threading.Lock()
+
+    def install(self, engine: Engine) -> None:
+        """
+        Start timing the statements of an engine.
+
+        Args:
+            engine (Engine): The engine.
+        """
+        if not event.contains(engine, "before_cursor_execute", self._before):
+            event.listen(engine, "before_cursor_execute", self._before)
+            event.listen(engine, "after_cursor_execute", self._after)
+
+    def uninstall(self, engine: Engine) -> None:
+        """
+        Stop timing the statements of an engine.
+
+        Args:
+            engine (Engine): The engine.
+        """
+        if event.contains(engine, "before_cursor_execute", self._before):
+            event.remove(engine, "before_cursor_execute", self._before)
+            event.remove(engine, "after_cursor_execute", self._after)
+
+    def top(self, limit: int) -> list[SlowStatementStats]:
+        """
+        Return the fingerprints with the most total slow time.
+
+        Args:
+            limit (int): Number of fingerprints to return.
+
+        Returns:
+            list[SlowStatementStats]: The fingerprints, slowest first.
+        """
+        with self._lock:
+            stats = [
+                SlowStatementStats(**vars(entry)) for entry in self._stats.values()
+            ]
+        return sorted(stats, key=lambda entry: entry.total_ms, reverse=True)[:limit]
+
+    def reset(self) -> None:
+        """Forget the aggregated statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        """Remember when the statement started."""
+        conn.info["slow_query_started"] = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        """Log the statement if it took longer than the threshold."""
+        started = conn.info.pop("slow_query_started", None)
+        if started is None:
+            return
+        duration_ms = (time.perf_counter() - started) * 1000
+        if duration_ms < self.threshold_ms:
+            return
+
+        shape = fingerprint(statement)
+        caller = _caller()
+        entry = {
+            "timestamp": datetime.now(timezone.utc),
+            "duration_ms": round(duration_ms, 3),
+            "fingerprint": shape,
+            "parameters": _redact(parameters, executemany),
+            "caller": caller,
+        }
+        if (
+            not executemany
+            and _is_read(conn, statement)
+            and self.sample() < self.explain_sample_rate
+        ):
+            entry["plan"] = self._explain(cursor, statement, parameters)
+        self.logger.warning(to_json(entry).decode())
+        self._aggregate(shape, duration_ms, caller)
+
+    def _explain(self, cursor, statement: str, parameters: Any) -> Any:
+        """
+        Capture the plan of a statement on the connection that ran it.
+
+        The plan runs inside a savepoint, so a failure, e.g. a statement
+        timeout, does not abort the caller's transaction.
+        """
+        explain_cursor = cursor.connection.cursor()
+        try:
+            explain_cursor.execute("SAVEPOINT slow_query_explain")
+            try:
+                explain_cursor.execute(
+                    f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}", parameters
+                )
+                plan = explain_cursor.fetchone()[0]
+            except Exception as exc:  # the plan is best effort
+                explain_cursor.execute("ROLLBACK TO SAVEPOINT slow_query_explain")
+                return {"error": str(exc)}
+            explain_cursor.execute("RELEASE SAVEPOINT slow_query_explain")
+            return plan
+        finally:
+            explain_cursor.close()
+
+    def _aggregate(self, shape: str, duration_ms: float, caller: Optional[str]):
+        """Add a slow run to the statistics of its fingerprint."""
+        with self._lock:
+            stats = self._stats.get(shape)
+            if stats is None:
+                if len(self._stats) >= _MAX_FINGERPRINTS:
+                    fastest = min(self._stats.values(), key=lambda item: item.total_ms)
+                    del self._stats[fastest.fingerprint]
+                stats = self._stats[shape] = SlowStatementStats(shape)
+            stats.count += 1
+            stats.total_ms += duration_ms
+            stats.max_ms = max(stats.max_ms, duration_ms)
+            stats.caller = caller
+
+
+def configure_slow_query_log(
+    path: str, max_bytes: int, backup_count: int
+) -> logging.Logger:
+    """
+    Send the `slow_queries` logger to a rotating file, one JSON object per line.
+
+    Args:
+        path (str): The log file.
+        max_bytes (int): Size at which the file is rotated.
+        backup_count (int): Number of rotated files kept.
+
+    Returns:
+        logging.Logger: The configured logger.
+    """
+    logger = logging.getLogger("slow_queries")
+    handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.WARNING)
+    logger.propagate = False
+    return logger
+
+
+def _is_read(conn, statement: str) -> bool:
+    """Whether a statement is a select, or the execution of a prepared one."""
+    if statement.lstrip()[:6].upper() == "SELECT":
+        return True
+    execute = _EXECUTE.match(statement)
+    # Only `PreparedQuery` names are recorded, and it only prepares selects.
+    return execute is not None and execute.group(1).lower() in conn.info.get(
+        PREPARED_KEY, ()
+    )
+
+
+def _redact(parameters: Any, executemany: bool) -> Any:
+    """Keep numbers, booleans and nulls; reduce other values to their type."""
+    if executemany:
+        return {"rows": len(parameters)}
+    if isinstance(parameters, dict):
+        return {name: _redact_value(value) for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [_redact_value(value) for value in parameters]
+    return _redact_value(parameters)
+
+
+def _redact_value(value: Any) -> Any:
+    """Redact a single parameter."""
+    if isinstance(value, _PLAIN_TYPES):
+        return value
+    return f"<{type(value).__name__}>"
+
+
+def _caller() -> Optional[str]:
+    """
+    Return the repository method running the statement.
+
+    Falls back to the innermost application frame when the statement does not
+    come from a repository, e.g. from a dependency.
+    """
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        path = Path(frame.f_code.co_filename)
+        if path.is_relative_to(REPOSITORY_DIR):
+            owner = frame.f_locals.get("self")
+            prefix = type(owner).__name__ if owner is not None else path.stem
+            return f"{prefix}.{frame.f_code.co_name}"
+        if (
+            fallback is None
+            and path.is_relative_to(APP_ROOT)
+            and "site-packages" not in path.parts
+            and path != Path(__file__).resolve()
+        ):
+            fallback = f"{path.relative_to(APP_ROOT)}:{frame.f_code.co_name}"
+        frame = frame.f_back
+    return fallback
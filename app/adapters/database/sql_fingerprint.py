@@ -0,0 +1,40 @@
+"""
+Normalization of SQL statements into fingerprints.
+
+Two statements share a fingerprint when they differ only in their parameters or
+literals, e.g. the same lazy load run for every row of a page.
+"""
+
+import re
+
+_PATTERNS = [
+    # Comments.
+    (re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL), " "),
+    # String literals, including escaped quotes.
+    (re.compile(r"'(?:[^']|'')*'"), "?"),
+    # Bind parameters: pyformat, format, numeric and named styles.
+    (re.compile(r"%\([^)]+\)s|%s|\$\d+|(?<!:):\w+"), "?"),
+    # Numeric literals that are not part of an identifier.
+    (re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])"), "?"),
+    # Casts of parameters, e.g. `?::UUID`.
+    (re.compile(r"\?::\w+(?:\[\])?"), "?"),
+    (re.compile(r"\s+"), " "),
+    # Lists of values, e.g. expanded IN clauses and multi-row VALUES.
+    (re.compile(r"\(\s*\?(?:\s*,\s*\?)*\s*\)"), "(...)"),
+    (re.compile(r"\(\.\.\.\)(?:\s*,\s*\(\.\.\.\))+"), "(...)"),
+]
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Reduce a SQL statement to its shape, without parameters or literals.
+
+    Args:
+        statement (str): The SQL statement.
+
+    Returns:
+        str: The normalized statement.
+    """
+    for pattern, replacement in _PATTERNS:
+        statement = pattern.sub(replacement, statement)
+    return statement.strip()
@@ -0,0 +1,124 @@
+"""
+Per-route SQL statement timeouts.
+
+A route's `statement_timeout(ms)` dependency records its budget in the
+request's context; every transaction a session begins while serving the
+request then starts with `SET LOCAL statement_timeout`, so the setting never
+outlives the transaction nor leaks to the next user of the pooled connection.
+Postgres cancels a statement over budget, and `statement_timeout_handler`
+answers the request with a `503` and code `STATEMENT_TIMEOUT`.
+
+The dependency is async and does not open the session itself: declared on a
+router, it runs before the routes' own dependencies, and a request a rate
+limit refuses must not take a threadpool thread on its way there.
+"""
+
+from contextvars import ContextVar
+from typing import Callable, Optional
+
+from adapters.database.circuit_breaker import QUERY_CANCELED
+from config import settings
+from core.common.metrics import Counter
+from core.exceptions.custom_exceptions import StatementTimeoutError
+from core.middleware.error_middleware import service_unavailable_handler
+from fastapi import Request
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from starlette.responses import JSONResponse
+
+# Key of a budget, in milliseconds, in `Session.info`; it overrides the route's.
+STATEMENT_TIMEOUT_KEY = "statement_timeout_ms"
+# The budget of the route being served, copied into its threadpool calls.
+_route_timeout: ContextVar[Optional[int]] = ContextVar(
+    "route_statement_timeout_ms", default=None
+)
+
+statement_timeouts_total = Counter(
+    "db_statement_timeouts_total",
+    "Requests cancelled by their route's statement timeout.",
+    ("route",),
+)
+
+
+def _set_local_timeout(connection, timeout_ms: int) -> None:
+    """Set the statement timeout of the connection's current transaction."""
+    connection.execute(text(f"SET LOCAL statement_timeout = {int(timeout_ms)}"))
+
+
+def _after_begin(session: Session, transaction, connection) -> None:
+    """Apply the session's or the route's budget, if any, to the transaction."""
+    timeout_ms = session.info.get(STATEMENT_TIMEOUT_KEY, _route_timeout.get())
+    if timeout_ms:
+        _set_local_timeout(connection, timeout_ms)
+
+
+def install_statement_timeouts() -> None:
+    """
+    Apply statement timeouts to the transactions of every session. Safe to
+    call more than once.
+    """
+    if not event.contains(Session, "after_begin", _after_begin):
+        event.listen(Session, "after_begin", _after_begin)
+
+
+def statement_timeout(timeout_ms: int) -> Callable:
+    """
+    Dependency function bounding the time of each SQL statement of a route.
+
+    Args:
+        timeout_ms (int): The most milliseconds a statement may run.
+
+    Returns:
+        Callable: A dependency function to be used in routes or routers.
+    """
+
+    async def _statement_timeout() -> None:
+        """
+        Inner function recording the budget for the request, on the event loop.
+
+        Router dependencies run before the route's, so no session of the
+        request has begun a transaction yet.
+        """
+        if settings.DB_STATEMENT_TIMEOUTS_ENABLED:
+            _route_timeout.set(timeout_ms)
+
+    return _statement_timeout
+
+
+def is_statement_timeout(exc: BaseException) -> bool:
+    """
+    Tell whether a database error is a statement cancelled by Postgres.
+
+    Args:
+        exc (BaseException): The exception raised by a database call.
+
+    Returns:
+        bool: True if the statement was cancelled.
+    """
+    return (
+        isinstance(exc, OperationalError)
+        and getattr(exc.orig, "pgcode", None) == QUERY_CANCELED
+    )
+
+
+async def statement_timeout_handler(
+    request: Request, exc: OperationalError
+) -> JSONResponse:
+    """
+    Turn a cancelled statement into a 503 response with code `STATEMENT_TIMEOUT`.
+
+    Other operational errors are re-raised, for the error middleware's 500.
+
+    Args:
+        request (Request): The failed request.
+        exc (OperationalError): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    if not is_statement_timeout(exc):
+        raise exc
+    route = request.scope.get("route")
+    statement_timeouts_total.labels(getattr(route, "path", "unmatched")).inc()
+    return await service_unavailable_handler(request, StatementTimeoutError())
@@ -0,0 +1,244 @@
+"""
+Test databases cloned from a migrated and seeded template.
+
+Migrating and seeding a database is the slow part of starting the test suite,
+so it is done once, into a template database named after a fingerprint of the
+migrations and the seed script. Each test process then copies the template
+with `CREATE DATABASE ... TEMPLATE`, a file-level copy that takes milliseconds::
+
+    databases = TemplateDatabases(settings.DATABASE_URL)
+    databases.ensure_template(seed_data)
+    url = databases.clone("test_db_gw0_1a2b")
+    ...
+    databases.drop("test_db_gw0_1a2b")
+
+The template is only rebuilt when a migration or the seed script changes.
+Processes starting together, such as pytest-xdist workers, build it under a
+Postgres advisory lock: one of them migrates while the others wait, then they
+all clone the result.
+"""
+
+import hashlib
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.engine import Connection, make_url
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import NullPool
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+ALEMBIC_ROOT = APP_ROOT / "alembic"
+FINGERPRINT_SOURCES = (ALEMBIC_ROOT, APP_ROOT / "seed_data.py")
+MAINTENANCE_DATABASE = "postgres"
+# SQLSTATE raised while another session is connected to the template.
+OBJECT_IN_USE = "55006"
+CLONE_ATTEMPTS = 50
+CLONE_RETRY_SECONDS = 0.1
+
+
+class TemplateDatabases:
+    """
+    Creates and drops test databases copied from a shared template.
+
+    Attributes:
+        url (str): A URL of the Postgres server; its database name is ignored.
+        prefix (str): The prefix of the template's name.
+    """
+
+    def __init__(self, url: str, prefix: str = "test_db"):
+        """
+        Initialize the manager.
+
+        Args:
+            url (str): A URL of the Postgres server; its database name is ignored.
+            prefix (str): The prefix of the template's name.
+        """
+        self.url = url
+        self.prefix = prefix
+        self._template_name: Optional[str] = None
+
+    @property
+    def template_name(self) -> str:
+        """The template's name: the prefix and a fingerprint of its sources."""
+        if self._template_name is None:
+            self._template_name = f"{self.prefix}_template_{fingerprint()}"
+        return self._template_name
+
+    def url_for(self, name: str) -> str:
+        """
+        Build the URL of a database on the same server.
+
+        Args:
+            name (str): The database name.
+
+        Returns:
+            str: The database URL, including its password.
+        """
+        return make_url(self.url).set(database=name).render_as_string(False)
+
+    def ensure_template(self, seed: Optional[Callable[[Session], None]] = None) -> str:
+        """
+        Build the template unless an up-to-date one exists.
+
+        The template is migrated and seeded under a temporary name and renamed
+        once complete, so an interrupted build is never cloned. Templates built
+        from other fingerprints are dropped.
+
+        Args:
+            seed (Optional[Callable[[Session], None]]): Loads the seed data
+                through a session.
+
+        Returns:
+            str: The template's name.
+        """
+        name = self.template_name
+        with self._admin() as connection:
+            connection.execute(select(func.pg_advisory_lock(func.hashtext(name))))
+            try:
+                existing = self._databases(connection, f"{self.prefix}_template_")
+                if name not in existing:
+                    for stale in existing:
+                        self._drop_stale(connection, stale)
+                    build = f"{name}_build"
+                    connection.exec_driver_sql(f"CREATE DATABASE {_quote(build)}")
+                    self._migrate(build, seed)
+                    connection.exec_driver_sql(
+                        f"ALTER DATABASE {_quote(build)} RENAME TO {_quote(name)}"
+                    )
+                    connection.exec_driver_sql(
+                        f"ALTER DATABASE {_quote(name)} IS_TEMPLATE true"
+                    )
+            finally:
+                connection.execute(select(func.pg_advisory_unlock(func.hashtext(name))))
+        return name
+
+    def clone(self, name: str) -> str:
+        """
+        Create a database as a copy of the template.
+
+        Postgres refuses to copy a database while another session is connected
+        to it, as happens when several processes clone at once, so the copy is
+        retried for a few seconds.
+
+        Args:
+            name (str): The new database's name.
+
+        Returns:
+            str: The new database's URL.
+
+        Raises:
+            OperationalError: If the template stays busy or does not exist.
+        """
+        statement = (
+            f"CREATE DATABASE {_quote(name)} TEMPLATE {_quote(self.template_name)}"
+        )
+        with self._admin() as connection:
+            for attempt in range(CLONE_ATTEMPTS):
+                try:
+                    connection.exec_driver_sql(statement)
+                    break
+                except OperationalError as error:
+                    busy = getattr(error.orig, "pgcode", None) == OBJECT_IN_USE
+                    if not busy or attempt == CLONE_ATTEMPTS - 1:
+                        raise
+                    time.sleep(CLONE_RETRY_SECONDS)
+        return self.url_for(name)
+
+    def drop(self, name: str) -> None:
+        """
+        Drop a database, disconnecting its remaining sessions.
+
+        Args:
+            name (str): The database's name.
+        """
+        with self._admin() as connection:
+            connection.exec_driver_sql(
+                f"DROP DATABASE IF EXISTS {_quote(name)} WITH (FORCE)"
+            )
+
+    def _admin(self) -> Connection:
+        """Connect to the maintenance database, outside of any transaction."""
+        engine = create_engine(
+            self.url_for(MAINTENANCE_DATABASE),
+            isolation_level="AUTOCOMMIT",
+            poolclass=NullPool,
+        )
+        return engine.connect()
+
+    def _migrate(self, name: str, seed: Optional[Callable[[Session], None]]) -> None:
+        """
+        Run the migrations and the seed in a database, then disconnect from it.
+
+        Args:
+            name (str): The database's name.
+            seed (Optional[Callable[[Session], None]]): Loads the seed data.
+        """
+        engine = create_engine(self.url_for(name), poolclass=NullPool)
+        try:
+            with engine.connect() as connection:
+                config = Config()
+                config.set_main_option("script_location", str(ALEMBIC_ROOT))
+                config.attributes["connection"] = connection
+                command.upgrade(config, "heads")
+                connection.commit()
+                if seed is not None:
+                    with Session(bind=connection) as session:
+                        seed(session)
+        finally:
+            engine.dispose()
+
+    @staticmethod
+    def _databases(connection: Connection, prefix: str) -> list[str]:
+        """List the databases whose name starts with a prefix."""
+        return list(
+            connection.execute(
+                text(
+                    "SELECT datname FROM pg_database "
+                    "WHERE starts_with(datname, :prefix)"
+                ),
+                {"prefix": prefix},
+            ).scalars()
+        )
+
+    @staticmethod
+    def _drop_stale(connection: Connection, name: str) -> None:
+        """
+        Drop an outdated template, unless it is being cloned right now.
+
+        Args:
+            connection (Connection): A maintenance connection.
+            name (str): The template's name.
+        """
+        try:
+            connection.exec_driver_sql(
+                f"ALTER DATABASE {_quote(name)} IS_TEMPLATE false"
+            )
+            connection.exec_driver_sql(f"DROP DATABASE {_quote(name)}")
+        except DBAPIError:
+            pass
+
+
+def fingerprint() -> str:
+    """
+    Hash the migrations and the seed script, naming the template they build.
+
+    Returns:
+        str: The first 12 hex digits of a SHA-256 over their paths and contents.
+    """
+    digest = hashlib.sha256()
+    for source in FINGERPRINT_SOURCES:
+        paths = sorted(source.rglob("*.py")) if source.is_dir() else [source]
+        for path in paths:
+            digest.update(str(path.relative_to(APP_ROOT)).encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()[:12]
+
+
+def _quote(name: str) -> str:
+    """Quote a database name as an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
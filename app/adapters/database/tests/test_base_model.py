@@ -0,0 +1,46 @@
+import time
+import uuid
+from unittest.mock import patch
+
+import pytest
+from adapters.database.models.base_model import new_id, uuid7
+
+
+class TestPrimaryKeys:
+    """
+    Tests for the primary key generators.
+    """
+
+    def test_uuid7_is_time_ordered_and_unique(self):
+        """
+        Test that UUIDv7s carry their millisecond and increase strictly.
+        """
+        before_ms = time.time_ns() // 1_000_000
+        ids = [uuid7() for _ in range(10_000)]
+
+        assert all(key.version == 7 and key.variant == uuid.RFC_4122 for key in ids)
+        assert ids == sorted(ids)
+        assert len(set(ids)) == len(ids)
+        assert before_ms <= ids[0].int >> 80 <= time.time_ns() // 1_000_000
+
+    def test_uuid7_increments_when_the_clock_steps_back(self):
+        """
+        Test that a clock going backwards does not break the order.
+        """
+        first = uuid7()
+        with patch("time.time_ns", return_value=0):
+            second = uuid7()
+
+        assert second > first
+        assert second.int >> 80 == first.int >> 80
+
+    def test_new_id_follows_the_configured_version(self):
+        """
+        Test that DB_ID_VERSION picks the generator.
+        """
+        with patch("config.settings.DB_ID_VERSION", 4):
+            assert new_id().version == 4
+        with patch("config.settings.DB_ID_VERSION", 7):
+            assert new_id().version == 7
+        with patch("config.settings.DB_ID_VERSION", 5), pytest.raises(ValueError):
+            new_id()
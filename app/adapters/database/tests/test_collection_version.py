@@ -0,0 +1,59 @@
+import uuid
+
+from adapters.database.repository.session_repository import SessionRepositoryImpl
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+SHARDS = 16
+INSERT_SPEAKER = text(
+    "INSERT INTO speaker (id, name, email, biography, created_at, updated_at) "
+    "VALUES (:id, 'Concurrent', :email, '', now(), now())"
+)
+
+
+def insert_speaker(connection) -> uuid.UUID:
+    speaker_id = uuid.uuid4()
+    connection.execute(
+        INSERT_SPEAKER, {"id": speaker_id, "email": f"{speaker_id}@example.com"}
+    )
+    return speaker_id
+
+
+class TestCollectionVersion:
+    """
+    Tests for the sharded collection version counters.
+    """
+
+    def test_concurrent_writers_do_not_wait_on_each_other(self, db_engine):
+        """
+        Test that a writer still in its transaction does not block another
+        writer of the same collection, and that both bumps count.
+        """
+        with Session(db_engine) as session:
+            before = int(SessionRepositoryImpl(session).get_speakers_version())
+
+        with db_engine.connect() as first, db_engine.connect() as second:
+            first.begin()
+            first_shard = first.execute(text("SELECT txid_current()")).scalar() % SHARDS
+            first_id = insert_speaker(first)
+            # A transaction id mapped to another shard, as almost all are.
+            while True:
+                second.begin()
+                second_shard = second.execute(text("SELECT txid_current()")).scalar()
+                if second_shard % SHARDS != first_shard:
+                    break
+                second.rollback()
+            second.execute(text("SET LOCAL lock_timeout = '2s'"))
+            second_id = insert_speaker(second)
+            second.commit()
+            first.commit()
+
+            with Session(db_engine) as session:
+                after = int(SessionRepositoryImpl(session).get_speakers_version())
+            with first.begin():
+                first.execute(
+                    text("DELETE FROM speaker WHERE id IN (:first, :second)"),
+                    {"first": first_id, "second": second_id},
+                )
+
+        assert after == before + 2
@@ -0,0 +1,80 @@
+from adapters.database.models import User
+from adapters.database.prepared_statements import PREPARED_KEY, PreparedQuery
+from config import settings
+from core.common.test_base import TestBase
+from sqlalchemy import bindparam, event, func, select, text
+from sqlalchemy.orm import Session
+
+USER_EMAIL = PreparedQuery(
+    "test_user_email",
+    select(User.email).where(User.id == bindparam("user_id")).limit(1),
+)
+USER_COUNT = PreparedQuery("test_user_count", select(func.count()).select_from(User))
+
+
+class TestPreparedQuery(TestBase):
+    """
+    Tests for queries run as server-side prepared statements.
+    """
+
+    def setup_method(self):
+        self.statements = []
+
+    def record(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement.split(" ")[0])
+
+    def run_query(self, data_base: Session, query: PreparedQuery, **params):
+        engine = data_base.get_bind().engine
+        event.listen(engine, "before_cursor_execute", self.record)
+        try:
+            return query.execute(data_base, **params).scalar()
+        finally:
+            event.remove(engine, "before_cursor_execute", self.record)
+
+    def test_prepared_once_per_connection(self, monkeypatch):
+        """
+        Test that a query is prepared on first use, then only executed.
+        """
+        user = self.db_session.query(User).first()
+        connection = self.db_session.connection()
+        connection.exec_driver_sql("DEALLOCATE ALL")
+        connection.info.pop(PREPARED_KEY, None)
+
+        assert self.run_query(self.db_session, USER_EMAIL, user_id=user.id) == (
+            user.email
+        )
+        assert self.run_query(self.db_session, USER_EMAIL, user_id=user.id) == (
+            user.email
+        )
+        assert self.run_query(self.db_session, USER_COUNT) > 0
+        assert self.statements == [
+            "PREPARE",
+            "EXECUTE",
+            "EXECUTE",
+            "PREPARE",
+            "EXECUTE",
+        ]
+
+        monkeypatch.setattr(settings, "DB_PREPARED_STATEMENTS_ENABLED", False)
+        self.statements.clear()
+        assert self.run_query(self.db_session, USER_EMAIL, user_id=user.id) == (
+            user.email
+        )
+        assert self.statements == ["SELECT"]
+
+    def test_recycled_connection_prepares_again(self):
+        """
+        Test that a new connection forgets the statements of the one it replaced.
+        """
+        with Session(bind=self.db_session.get_bind().engine) as data_base:
+            assert self.run_query(data_base, USER_COUNT) > 0
+            connection = data_base.connection()
+            assert "test_user_count" in connection.info[PREPARED_KEY]
+
+            connection.invalidate()
+            data_base.rollback()
+            assert PREPARED_KEY not in data_base.connection().info
+
+            assert self.run_query(data_base, USER_COUNT) > 0
+            names = data_base.scalars(text("SELECT name FROM pg_prepared_statements"))
+            assert "test_user_count" in list(names)
@@ -0,0 +1,46 @@
+import pytest
+from adapters.database.models import Speaker
+from adapters.database.query_budget import QueryBudget
+from adapters.database.sql_fingerprint import fingerprint
+from core.common.test_base import TestBase
+
+
+class TestQueryBudget(TestBase):
+    """
+    Tests for the query-budget pytest plugin.
+    """
+
+    def load_speakers_one_by_one(self, speaker_ids):
+        for speaker_id in speaker_ids:
+            self.db_session.query(Speaker).filter(Speaker.id == speaker_id).one()
+
+    def test_fingerprint_ignores_parameters(self):
+        """
+        Test that statements differing only in values share a fingerprint.
+        """
+        assert fingerprint(
+            "SELECT * FROM t WHERE id = %(id_1)s AND x IN (%(x_1_1)s, %(x_1_2)s)"
+        ) == fingerprint("SELECT *  FROM t WHERE id = 42 AND x IN ('a', 'b', 'c')")
+
+    def test_repeated_statement_is_reported_with_call_site(self):
+        """
+        Test that an N+1 fails the budget and names the code that issued it.
+        """
+        speaker_ids = [speaker.id for speaker in self.db_session.query(Speaker)]
+
+        with pytest.raises(pytest.fail.Exception) as failure:
+            with QueryBudget():
+                self.load_speakers_one_by_one(speaker_ids)
+
+        message = str(failure.value)
+        assert f"Suspected N+1: {len(speaker_ids)} x SELECT" in message
+        assert "in load_speakers_one_by_one" in message
+
+    def test_budget_within_limits_passes(self):
+        """
+        Test that a block within its budget records its statements.
+        """
+        with QueryBudget(max_queries=1) as budget:
+            self.db_session.query(Speaker).all()
+
+        assert budget.count == 1
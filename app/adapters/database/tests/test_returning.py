@@ -0,0 +1,71 @@
+import pytest
+from adapters.database.models import ScheduledSession, User
+from adapters.database.query_budget import QueryRecorder
+from adapters.database.repository.session_repository import SessionRepositoryImpl
+from adapters.database.repository.user_repository import SQLAlchemyUserRepository
+from core.auth.schemas import UserUpdate
+from core.common.test_base import TestBase
+from core.exceptions.custom_exceptions import CustomAPIException
+from sqlalchemy.exc import NoResultFound
+
+
+class TestSingleRoundTripWrites(TestBase):
+    """
+    Tests for repository updates and deletes run as one UPDATE ... RETURNING.
+    """
+
+    def record(self, write) -> list[str]:
+        with QueryRecorder() as recorder:
+            write()
+        return [statement.statement for statement in recorder.statements]
+
+    def test_session_update_and_delete_take_one_statement_each(self):
+        """
+        Test the statements of a session update, then of deleting it twice.
+        """
+        session = self.db_session.query(ScheduledSession).first()
+        repository = SessionRepositoryImpl(self.db_session)
+        updated = []
+
+        statements = self.record(
+            lambda: updated.append(
+                repository.update_session(session.id, {"title": "Renamed"})
+            )
+        )
+        assert len(statements) == 1
+        assert statements[0].startswith("UPDATE scheduled_sessions")
+        assert "RETURNING" in statements[0]
+        assert updated[0].title == "Renamed"
+        assert session.title == "Renamed"
+
+        assert len(self.record(lambda: repository.delete_session(session.id))) == 1
+        assert session.deleted_at is not None
+        with pytest.raises(NoResultFound):
+            repository.delete_session(session.id)
+        with pytest.raises(NoResultFound):
+            repository.update_session(session.id, {"title": "Gone"})
+
+    def test_user_update_and_delete_take_one_statement_each(self):
+        """
+        Test the statements of a user update and delete, and that deleted
+        users can no longer be changed.
+        """
+        user = self.db_session.query(User).first()
+        repository = SQLAlchemyUserRepository(self.db_session)
+        changes = UserUpdate(
+            email="renamed@example.com", password=user.password, is_active=False
+        )
+        updated = []
+
+        statements = self.record(
+            lambda: updated.append(repository.update_user(user.id, changes))
+        )
+        assert len(statements) == 1
+        assert updated[0].email == "renamed@example.com"
+        assert user.is_active is False
+
+        assert len(self.record(lambda: repository.delete_user(user.id))) == 1
+        with pytest.raises(CustomAPIException):
+            repository.update_user(user.id, changes)
+        with pytest.raises(CustomAPIException):
+            repository.delete_user(user.id)
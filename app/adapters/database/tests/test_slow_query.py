@@ -0,0 +1,112 @@
+import json
+import logging
+
+import pytest
+from adapters.database.models import Speaker
+from adapters.database.prepared_statements import PreparedQuery
+from adapters.database.repository.session_repository import SessionRepositoryImpl
+from adapters.database.slow_query import SlowQueryDetector
+from core.common.test_base import TestBase
+from httpx import Response
+from sqlalchemy import Float, bindparam, func, select
+
+
+class ListHandler(logging.Handler):
+    """
+    Logging handler keeping the formatted messages in a list.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestSlowQueryDetector(TestBase):
+    """
+    Tests for the slow-query log.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_token: str):
+        """
+        Log every statement of the test engine, always capturing plans.
+        """
+        self.headers = {"Authorization": f"Bearer {admin_token}"}
+        self.handler = ListHandler()
+        logger = logging.getLogger("test_slow_queries")
+        logger.addHandler(self.handler)
+        self.detector = SlowQueryDetector(
+            threshold_ms=0, explain_sample_rate=1, logger=logger, sample=lambda: 0.0
+        )
+        self.engine = self.db_session.get_bind().engine
+        self.detector.install(self.engine)
+        yield
+        self.detector.uninstall(self.engine)
+        logger.removeHandler(self.handler)
+
+    def entries(self):
+        return [json.loads(message) for message in self.handler.messages]
+
+    def test_select_is_logged_with_caller_plan_and_redacted_parameters(self):
+        """
+        Test the log line of a repository query.
+        """
+        SessionRepositoryImpl(self.db_session).get_speakers_by_ids(
+            [self.db_session.query(Speaker).first().id]
+        )
+
+        entry = self.entries()[-1]
+        assert entry["caller"] == "SessionRepositoryImpl.get_speakers_by_ids"
+        assert entry["fingerprint"].startswith("SELECT speaker.name")
+        assert entry["fingerprint"].endswith("WHERE speaker.id IN (...)")
+        assert set(entry["parameters"].values()) == {"<UUID>"}
+        assert entry["plan"][0]["Plan"]["Actual Loops"] >= 1
+        assert entry["duration_ms"] >= 0
+
+    def test_slow_prepared_select_is_explained(self):
+        """
+        Test that the `EXECUTE` of a prepared select gets its plan captured.
+        """
+        self.detector.threshold_ms = 50
+        sleep = PreparedQuery(
+            "slow_query_test_sleep",
+            select(func.pg_sleep(bindparam("seconds", type_=Float))),
+        )
+        sleep.execute(self.db_session, seconds=0.06)
+
+        entry = self.entries()[-1]
+        assert entry["fingerprint"].startswith("EXECUTE slow_query_test_sleep")
+        assert entry["duration_ms"] >= 50
+        assert entry["plan"][0]["Plan"]["Actual Loops"] == 1
+
+    def test_writes_are_not_explained_and_top_aggregates(self):
+        """
+        Test that writes are never re-run by EXPLAIN ANALYZE, and the ranking.
+        """
+        self.db_session.add(Speaker(name="Ada", email="ada@example.com"))
+        self.db_session.flush()
+        for _ in range(3):
+            self.db_session.query(Speaker).count()
+
+        insert = next(
+            entry
+            for entry in self.entries()
+            if entry["fingerprint"].startswith("INSERT")
+        )
+        assert "plan" not in insert
+        assert insert["parameters"]["email"] == "<str>"
+        counts = {stats.fingerprint: stats.count for stats in self.detector.top(10)}
+        assert 3 in counts.values()
+
+    def test_slow_queries_endpoint(self):
+        """
+        Test that the endpoint answers with the worker's ranking.
+        """
+        response: Response = self.client.get(
+            "/api/v1/diagnostics/slow-queries", headers=self.headers
+        )
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
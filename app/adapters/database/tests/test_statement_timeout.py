@@ -0,0 +1,70 @@
+from adapters.api.dependencies import get_db
+from adapters.database.statement_timeout import (
+    STATEMENT_TIMEOUT_KEY,
+    install_statement_timeouts,
+    statement_timeout,
+    statement_timeout_handler,
+    statement_timeouts_total,
+)
+from core.common.test_base import TestBase
+from core.middleware.error_middleware import register_exception_handlers
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from httpx import Response
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+
+def timeouts(route: str) -> float:
+    prefix = f'db_statement_timeouts_total{{route="{route}"}} '
+    for line in statement_timeouts_total.collect():
+        if line.startswith(prefix):
+            return float(line[len(prefix) :])
+    return 0.0
+
+
+class TestStatementTimeout(TestBase):
+    """
+    Tests for per-route statement timeouts.
+    """
+
+    def test_new_transaction_starts_with_the_budget(self):
+        """
+        Test that a session's budget is set locally in each transaction it begins.
+        """
+        install_statement_timeouts()
+        with Session(bind=self.db_session.get_bind().engine) as data_base:
+            data_base.info[STATEMENT_TIMEOUT_KEY] = 50
+            assert data_base.scalar(text("SHOW statement_timeout")) == "50ms"
+            data_base.commit()
+            assert data_base.scalar(text("SHOW statement_timeout")) == "50ms"
+            data_base.info.pop(STATEMENT_TIMEOUT_KEY)
+            data_base.commit()
+            assert data_base.scalar(text("SHOW statement_timeout")) == "0"
+
+    def test_statement_over_budget_is_cancelled_with_503(self):
+        """
+        Test the response and metric of a request cancelled by its budget.
+        """
+        app = FastAPI()
+        register_exception_handlers(app)
+        app.add_exception_handler(OperationalError, statement_timeout_handler)
+        app.dependency_overrides[get_db] = lambda: self.db_session
+
+        @app.get("/slow/{seconds}", dependencies=[Depends(statement_timeout(50))])
+        def slow(seconds: float, data_base: Session = Depends(get_db)):
+            data_base.execute(text("SELECT pg_sleep(:seconds)"), {"seconds": seconds})
+            return {"slept": seconds}
+
+        before = timeouts("/slow/{seconds}")
+        client = TestClient(app)
+
+        response: Response = client.get("/slow/0")
+        assert response.status_code == 200
+
+        response = client.get("/slow/2")
+        assert response.status_code == 503
+        assert response.json()["code"] == "STATEMENT_TIMEOUT"
+        assert response.headers["Retry-After"] == "1"
+        assert timeouts("/slow/{seconds}") == before + 1
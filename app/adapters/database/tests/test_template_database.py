@@ -0,0 +1,62 @@
+import os
+
+from adapters.database.models import User
+from adapters.database.template_database import TemplateDatabases, fingerprint
+from config import settings
+from conftest import SessionLocal
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import Session
+
+
+class TestTemplateDatabases:
+    """
+    Tests for the template test databases and the per-test rollback.
+    """
+
+    def test_clone_copies_the_seeded_template(self, db_engine):
+        """
+        Test that a clone holds the seed data and is gone once dropped.
+        """
+        databases = TemplateDatabases(settings.DATABASE_URL)
+        name = f"test_db_clone_{os.urandom(4).hex()}"
+
+        engine = create_engine(databases.clone(name))
+        try:
+            with Session(engine) as session:
+                admins = session.scalar(
+                    select(func.count())
+                    .select_from(User)
+                    .where(User.email == "admin@example.com")
+                )
+        finally:
+            engine.dispose()
+            databases.drop(name)
+
+        assert admins == 1
+        with db_engine.connect() as connection:
+            remaining = connection.execute(
+                text("SELECT count(*) FROM pg_database WHERE datname = :name"),
+                {"name": name},
+            ).scalar()
+        assert remaining == 0
+
+    def test_template_is_named_after_its_sources(self):
+        """
+        Test that the template name carries a stable fingerprint.
+        """
+        databases = TemplateDatabases(settings.DATABASE_URL, prefix="test_db")
+
+        assert databases.template_name == f"test_db_template_{fingerprint()}"
+        assert fingerprint() == fingerprint()
+        assert len(fingerprint()) == 12
+
+    def test_commit_inside_a_test_is_rolled_back(self, db_session):
+        """
+        Test that a test's commits stay inside its transaction.
+        """
+        email = f"{os.urandom(4).hex()}@example.com"
+        db_session.add(User(email=email, password="hashed"))
+        db_session.commit()
+
+        with SessionLocal() as other:
+            assert other.scalar(select(User).where(User.email == email)) is None
@@ -0,0 +1,62 @@
+"""
+In-memory repositories with the semantics of the SQLAlchemy ones, for tests and
+benchmarks that need no database.
+"""
+
+from datetime import datetime, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.exc import IntegrityError
+
+
+def utc_now() -> datetime:
+    """
+    Return the current time as stored in the database's `DateTime` columns.
+
+    Returns:
+        datetime: The current UTC time, without timezone.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def as_stored(value: Any) -> Any:
+    """
+    Convert an aware datetime to naive UTC, as a `DateTime` column stores it.
+
+    Args:
+        value (Any): A column value.
+
+    Returns:
+        Any: The value as read back from the database.
+    """
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+def as_uuid(value: Any) -> UUID:
+    """
+    Parse an identifier given as a UUID or its string form.
+
+    Args:
+        value (Any): The identifier.
+
+    Returns:
+        UUID: The identifier as a UUID.
+    """
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def integrity_error(table: str, reason: str) -> IntegrityError:
+    """
+    Build the error the database raises when a constraint is violated.
+
+    Args:
+        table (str): The table written to.
+        reason (str): The violated constraint.
+
+    Returns:
+        IntegrityError: The error.
+    """
+    return IntegrityError(f"INSERT INTO {table}", None, Exception(reason))
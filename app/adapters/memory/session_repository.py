@@ -0,0 +1,357 @@
+"""
+In-memory session repository, for tests and benchmarks without a database.
+"""
+
+import bisect
+import threading
+from typing import Any, Optional
+from uuid import UUID
+
+from adapters.database.models.base_model import new_id
+from adapters.memory import as_stored, as_uuid, integrity_error, utc_now
+from core.common.cache import ResponseCache
+from core.session.cache import (
+    SESSIONS_NAMESPACE,
+    SPEAKERS_NAMESPACE,
+    collection_prefix,
+    session_cache,
+    session_prefix,
+)
+from core.session.ports.session_repository import SessionRepository
+from core.session.schemas import (
+    SessionCreate,
+    SessionDetail,
+    SessionOut,
+    SpeakerOut,
+)
+from sqlalchemy.exc import NoResultFound
+
+
+class InMemorySessionRepository(SessionRepository):
+    """
+    Session repository keeping rows in dictionaries, with the semantics of
+    `SessionRepositoryImpl`: soft deletes, pages ordered by id, the same
+    version markers and the same cache invalidation.
+
+    Live session ids and speaker ids are kept sorted, so a page is a slice.
+    Every method holds one lock, so the repository can be shared by threads.
+    """
+
+    def __init__(self, cache: ResponseCache = session_cache):
+        """Initialize an empty repository.
+
+        Args:
+            cache (ResponseCache): The read cache invalidated by every write.
+        """
+        self.cache = cache
+        self._lock = threading.RLock()
+        self._sessions: dict[UUID, dict[str, Any]] = {}
+        self._live_session_ids: list[UUID] = []
+        self._speakers: dict[UUID, dict[str, Any]] = {}
+        self._speaker_ids: list[UUID] = []
+        self._speaker_emails: set[str] = set()
+        self._assignments: dict[UUID, list[dict[str, Any]]] = {}
+        self._versions = {SESSIONS_NAMESPACE: 0, SPEAKERS_NAMESPACE: 0}
+
+    def add_speaker(
+        self, name: str, email: str, biography: Optional[str] = None
+    ) -> SpeakerOut:
+        """Add a speaker; speakers are otherwise only created by seed data.
+
+        Args:
+            name (str): The speaker's name.
+            email (str): The speaker's email, unique among speakers.
+            biography (Optional[str]): The speaker's biography.
+
+        Returns:
+            SpeakerOut: The new speaker.
+
+        Raises:
+            IntegrityError: If another speaker has the same email.
+        """
+        with self._lock:
+            if email in self._speaker_emails:
+                raise integrity_error("speaker", "duplicate speaker email")
+            now = utc_now()
+            speaker = {
+                "id": new_id(),
+                "name": name,
+                "email": email,
+                "biography": biography,
+                "created_at": now,
+                "updated_at": now,
+                "deleted_at": None,
+            }
+            self._speakers[speaker["id"]] = speaker
+            self._speaker_emails.add(email)
+            bisect.insort(self._speaker_ids, speaker["id"])
+            self._versions[SPEAKERS_NAMESPACE] += 1
+            return _speaker_out(speaker)
+
+    def create_session(self, session_data: SessionCreate) -> SessionOut:
+        """Create a new session with the provided session data.
+
+        Args:
+            session_data (SessionCreate): The data required to create a new session.
+
+        Returns:
+            SessionOut: The created session.
+        """
+        now = utc_now()
+        session = {
+            key: as_stored(value)
+            for key, value in session_data.model_dump(exclude={"speakers"}).items()
+        }
+        session.update(
+            id=new_id(),
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+            deleted_at=None,
+        )
+        with self._lock:
+            self._sessions[session["id"]] = session
+            self._assignments[session["id"]] = []
+            bisect.insort(self._live_session_ids, session["id"])
+            self._versions[SESSIONS_NAMESPACE] += 1
+            result = SessionOut.model_validate(session)
+        self.cache.invalidate_prefix(collection_prefix(SESSIONS_NAMESPACE))
+        return result
+
+    def get_session_by_id(self, session_id: UUID) -> Optional[SessionDetail]:
+        """Retrieve a session by its UUID, including its speakers."""
+        with self._lock:
+            session = self._live_session(session_id)
+            if session is None:
+                return None
+            speakers = [
+                _speaker_out(
+                    self._speakers[assignment["speaker_id"]], assignment["role"]
+                )
+                for assignment in self._assignments[session["id"]]
+            ]
+            session_data = SessionDetail.model_validate(session)
+        session_data.speakers = speakers
+        return session_data
+
+    def update_session(
+        self, session_id: UUID, session_data: dict[str, Any]
+    ) -> SessionOut:
+        """Update an existing session with new data.
+
+        Args:
+            session_id (UUID): The UUID of the session to update.
+            session_data (dict[str, Any]): The columns to change.
+
+        Returns:
+            SessionOut: The updated session.
+
+        Raises:
+            NoResultFound: If the session does not exist or was deleted.
+        """
+        with self._lock:
+            session = self._live_session(session_id)
+            if session is None:
+                raise NoResultFound("Session not found")
+            session.update(
+                {key: as_stored(value) for key, value in session_data.items()},
+                updated_at=utc_now(),
+            )
+            self._versions[SESSIONS_NAMESPACE] += 1
+            result = SessionOut.model_validate(session)
+        self._invalidate_session(session_id)
+        return result
+
+    def delete_session(self, session_id: UUID) -> None:
+        """Soft-delete a session by its UUID.
+
+        Args:
+            session_id (UUID): The UUID of the session to delete.
+
+        Raises:
+            NoResultFound: If the session does not exist or was already deleted.
+        """
+        with self._lock:
+            session = self._live_session(session_id)
+            if session is None:
+                raise NoResultFound("Session not found")
+            session["deleted_at"] = session["updated_at"] = utc_now()
+            index = bisect.bisect_left(self._live_session_ids, session["id"])
+            del self._live_session_ids[index]
+            self._versions[SESSIONS_NAMESPACE] += 1
+        self._invalidate_session(session_id)
+
+    def list_sessions(self, limit: int, offset: int) -> tuple[int, list[dict]]:
+        """List live sessions ordered by id.
+
+        Args:
+            limit (int): The maximum number of sessions to return.
+            offset (int): The number of sessions to skip.
+
+        Returns:
+            tuple[int, list[dict]]: The number of live sessions and a page of their
+            columns.
+        """
+        with self._lock:
+            page = self._live_session_ids[offset : offset + limit]
+            return len(self._live_session_ids), [
+                dict(self._sessions[session_id]) for session_id in page
+            ]
+
+    def assign_speaker_to_session(self, session_id: UUID, speaker_id: UUID) -> None:
+        """Assign a speaker to a session.
+
+        Args:
+            session_id (UUID): The UUID of the session to assign the speaker to.
+            speaker_id (UUID): The UUID of the speaker to assign to the session.
+        """
+        self.assign_speakers_to_session(session_id, [speaker_id])
+
+    def assign_speakers_to_session(
+        self, session_id: UUID, speaker_ids: list[UUID]
+    ) -> None:
+        """Assign several speakers to a session, all or none.
+
+        Args:
+            session_id (UUID): The UUID of the session to assign the speakers to.
+            speaker_ids (list[UUID]): The UUIDs of the speakers to assign.
+
+        Raises:
+            IntegrityError: If the session or a speaker does not exist.
+        """
+        with self._lock:
+            session_key = as_uuid(session_id)
+            speaker_keys = [as_uuid(speaker_id) for speaker_id in speaker_ids]
+            if session_key not in self._sessions or any(
+                key not in self._speakers for key in speaker_keys
+            ):
+                raise integrity_error("speaker_assignment", "foreign key violation")
+            now = utc_now()
+            self._assignments[session_key].extend(
+                {
+                    "id": new_id(),
+                    "speaker_id": key,
+                    "role": "Presenter",
+                    "updated_at": now,
+                }
+                for key in speaker_keys
+            )
+        self.cache.invalidate_prefix(session_prefix(session_id))
+
+    def list_speakers(self, limit: int, offset: int) -> tuple[int, list[SpeakerOut]]:
+        """
+        List speakers ordered by id.
+
+        Args:
+            limit (int): The maximum number of speakers to return.
+            offset (int): The number of speakers to skip.
+
+        Returns:
+            tuple[int, list[SpeakerOut]]: The number of speakers and a page of them.
+        """
+        with self._lock:
+            page = self._speaker_ids[offset : offset + limit]
+            return len(self._speaker_ids), [
+                _speaker_out(self._speakers[speaker_id]) for speaker_id in page
+            ]
+
+    def get_speaker_by_id(self, speaker_id: UUID) -> Optional[SpeakerOut]:
+        """
+        Retrieve a speaker by its ID.
+        """
+        with self._lock:
+            speaker = self._speakers.get(as_uuid(speaker_id))
+            return _speaker_out(speaker) if speaker else None
+
+    def get_speakers_by_ids(self, speaker_ids: list[UUID]) -> list[SpeakerOut]:
+        """
+        Retrieve the speakers with the given IDs, skipping unknown IDs.
+        """
+        with self._lock:
+            keys = dict.fromkeys(as_uuid(speaker_id) for speaker_id in speaker_ids)
+            return [
+                _speaker_out(self._speakers[key])
+                for key in keys
+                if key in self._speakers
+            ]
+
+    def get_session_version(self, session_id: UUID) -> Optional[str]:
+        """
+        Return a version marker for a session and its speakers.
+
+        Built from the same values as the SQL repository's marker: the
+        session's update time, its number of assignments and the latest
+        update of an assignment and of an assigned speaker.
+
+        Args:
+            session_id (UUID): The UUID of the session.
+
+        Returns:
+            Optional[str]: The version marker, or None if the session does not exist.
+        """
+        with self._lock:
+            session = self._live_session(session_id)
+            if session is None:
+                return None
+            assignments = self._assignments[session["id"]]
+            row = (
+                session["updated_at"],
+                len(assignments),
+                max((item["updated_at"] for item in assignments), default=None),
+                max(
+                    (
+                        self._speakers[item["speaker_id"]]["updated_at"]
+                        for item in assignments
+                    ),
+                    default=None,
+                ),
+            )
+        return ":".join(str(value) for value in row)
+
+    def get_sessions_version(self) -> str:
+        """
+        Return the version counter of the sessions collection.
+
+        Returns:
+            str: The version marker.
+        """
+        with self._lock:
+            return str(self._versions[SESSIONS_NAMESPACE])
+
+    def get_speakers_version(self) -> str:
+        """
+        Return the version counter of the speakers collection.
+
+        Returns:
+            str: The version marker.
+        """
+        with self._lock:
+            return str(self._versions[SPEAKERS_NAMESPACE])
+
+    def _live_session(self, session_id: Any) -> Optional[dict[str, Any]]:
+        """Return the row of a session unless it does not exist or was deleted."""
+        session = self._sessions.get(as_uuid(session_id))
+        if session is None or session["deleted_at"] is not None:
+            return None
+        return session
+
+    def _invalidate_session(self, session_id: UUID) -> None:
+        """
+        Drop cached reads affected by a change to one session.
+
+        Args:
+            session_id (UUID): The UUID of the changed session.
+        """
+        self.cache.invalidate_prefix(session_prefix(session_id))
+        self.cache.invalidate_prefix(collection_prefix(SESSIONS_NAMESPACE))
+
+
+def _speaker_out(speaker: dict[str, Any], role: Optional[str] = None) -> SpeakerOut:
+    """Map a speaker row, and its role in a session if any, to its output schema."""
+    return SpeakerOut(
+        id=str(speaker["id"]),
+        name=speaker["name"],
+        email=speaker["email"],
+        role=role,
+        biography=speaker["biography"],
+    )
@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from adapters.database.models import Speaker
+from adapters.database.repository.session_repository import SessionRepositoryImpl
+from adapters.database.repository.user_repository import SQLAlchemyUserRepository
+from adapters.memory.session_repository import InMemorySessionRepository
+from adapters.memory.user_repository import InMemoryUserRepository
+from core.auth.schemas import UserCreate, UserUpdate
+from core.common.cache import ResponseCache
+from core.exceptions.custom_exceptions import CustomAPIException
+from core.session.schemas import SessionCreate, SpeakerOut
+from sqlalchemy.exc import IntegrityError, NoResultFound
+
+
+class TestRepositoryContract:
+    """
+    Contract shared by the SQLAlchemy and in-memory repositories; every test
+    runs against both.
+    """
+
+    @pytest.fixture(autouse=True, params=["sql", "memory"])
+    def setup(self, request, db_session):
+        """
+        Build the repositories under test.
+
+        Args:
+            request: The fixture request, naming the implementation.
+            db_session (Session): The database session of the SQL repositories.
+        """
+        cache = ResponseCache()
+        if request.param == "sql":
+            self.sessions = SessionRepositoryImpl(db_session, cache=cache)
+            self.users = SQLAlchemyUserRepository(db_session)
+
+            def add_speaker(name, email, biography=None):
+                speaker = Speaker(name=name, email=email, biography=biography)
+                db_session.add(speaker)
+                db_session.commit()
+                return SpeakerOut(
+                    id=str(speaker.id),
+                    name=speaker.name,
+                    email=speaker.email,
+                    biography=speaker.biography,
+                )
+
+            self.add_speaker = add_speaker
+        else:
+            self.sessions = InMemorySessionRepository(cache=cache)
+            self.users = InMemoryUserRepository()
+            self.add_speaker = self.sessions.add_speaker
+
+    def create_session(self, title="Contract talk"):
+        start = datetime(2030, 1, 1, 9, 0)
+        return self.sessions.create_session(
+            SessionCreate(
+                title=title,
+                description=None,
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+                capacity=50,
+            )
+        )
+
+    def create_user(self):
+        return self.users.create_user(
+            UserCreate(email=f"{uuid4().hex}@example.com", password="hashed")
+        )
+
+    def all_pages(self, list_page, limit=2):
+        total, rows = list_page(limit=limit, offset=0)
+        offset = limit
+        while offset < total:
+            rows += list_page(limit=limit, offset=offset)[1]
+            offset += limit
+        return total, rows
+
+    def test_session_detail_includes_assigned_speakers(self):
+        """
+        Test that assigned speakers appear in the detail and change its version.
+        """
+        session = self.create_session()
+        speakers = [
+            self.add_speaker(f"Speaker {index}", f"{uuid4().hex}@example.com")
+            for index in range(2)
+        ]
+        version = self.sessions.get_session_version(session.id)
+
+        self.sessions.assign_speakers_to_session(
+            session.id, [speaker.id for speaker in speakers]
+        )
+
+        detail = self.sessions.get_session_by_id(session.id)
+        assert detail.title == "Contract talk"
+        assert detail.start_time == datetime(2030, 1, 1, 9, 0)
+        assert detail.is_active is True
+        assert {(speaker.id, speaker.role) for speaker in detail.speakers} == {
+            (speaker.id, "Presenter") for speaker in speakers
+        }
+        assert self.sessions.get_session_version(session.id) != version
+
+    def test_unknown_speakers_are_skipped_or_rejected(self):
+        """
+        Test that unknown speakers are skipped on lookup and rejected on assignment.
+        """
+        session = self.create_session()
+        speaker = self.add_speaker("Known", f"{uuid4().hex}@example.com")
+
+        found = self.sessions.get_speakers_by_ids([speaker.id, str(uuid4())])
+
+        assert [item.id for item in found] == [speaker.id]
+        assert self.sessions.get_speaker_by_id(str(uuid4())) is None
+        with pytest.raises(IntegrityError):
+            self.sessions.assign_speakers_to_session(session.id, [str(uuid4())])
+
+    def test_update_session_changes_fields_and_collection_version(self):
+        """
+        Test updating a session, and updating one that does not exist.
+        """
+        session = self.create_session()
+        version = self.sessions.get_sessions_version()
+
+        updated = self.sessions.update_session(session.id, {"capacity": 75})
+
+        assert updated.capacity == 75
+        assert self.sessions.get_session_by_id(session.id).capacity == 75
+        assert self.sessions.get_sessions_version() != version
+        with pytest.raises(NoResultFound):
+            self.sessions.update_session(uuid4(), {"capacity": 1})
+
+    def test_deleted_session_is_hidden(self):
+        """
+        Test that a soft-deleted session disappears from reads and pages.
+        """
+        session = self.create_session()
+        total, _ = self.sessions.list_sessions(limit=1, offset=0)
+
+        self.sessions.delete_session(session.id)
+
+        assert self.sessions.get_session_by_id(session.id) is None
+        assert self.sessions.get_session_version(session.id) is None
+        remaining, rows = self.all_pages(self.sessions.list_sessions)
+        assert remaining == total - 1
+        assert session.id not in {row["id"] for row in rows}
+        with pytest.raises(NoResultFound):
+            self.sessions.delete_session(session.id)
+
+    def test_session_pages_are_ordered_by_id(self):
+        """
+        Test that walking every page returns each live session once, by id.
+        """
+        created = {self.create_session(f"Talk {index}").id for index in range(5)}
+
+        total, rows = self.all_pages(self.sessions.list_sessions)
+
+        ids = [row["id"] for row in rows]
+        assert len(ids) == total
+        assert ids == sorted(ids)
+        assert created <= set(ids)
+
+    def test_user_lifecycle(self):
+        """
+        Test creating, finding, updating and soft-deleting a user.
+        """
+        user = self.create_user()
+
+        assert self.users.get_by_email(user.email).id == user.id
+        assert self.users.get_user_by_id(str(user.id)).email == user.email
+
+        updated = self.users.update_user(
+            user.id, UserUpdate(email=user.email, password="rehashed", is_active=False)
+        )
+        assert updated.is_active is False
+
+        self.users.delete_user(user.id)
+        assert self.users.get_user_by_id(str(user.id)) is None
+        assert self.users.get_by_email(user.email).id == user.id
+
+    def test_user_email_is_unique(self):
+        """
+        Test that a second user cannot take an existing email.
+        """
+        user = self.create_user()
+
+        with pytest.raises(IntegrityError):
+            self.users.create_user(UserCreate(email=user.email, password="hashed"))
+
+    def test_unknown_user_is_not_found(self):
+        """
+        Test updating and deleting a user that does not exist.
+        """
+        with pytest.raises(CustomAPIException):
+            self.users.update_user(
+                uuid4(), UserUpdate(email=None, password=None, is_active=True)
+            )
+        with pytest.raises(CustomAPIException):
+            self.users.delete_user(uuid4())
+
+    def test_user_pages_skip_deleted_users_and_are_ordered_by_id(self):
+        """
+        Test that pages list live users once each, by id.
+        """
+        users = [self.create_user() for _ in range(4)]
+        self.users.delete_user(users[0].id)
+
+        total, rows = self.all_pages(self.users.list_users)
+
+        ids = [row.id for row in rows]
+        assert len(ids) == total
+        assert ids == sorted(ids)
+        assert users[0].id not in ids
+        assert {user.id for user in users[1:]} <= set(ids)
@@ -0,0 +1,161 @@
+"""
+In-memory user repository, for tests and benchmarks without a database.
+"""
+
+import bisect
+import threading
+from typing import Any, Optional
+from uuid import UUID
+
+from adapters.database.models.base_model import new_id
+from adapters.database.models.user_model import User
+from adapters.memory import as_uuid, integrity_error, utc_now
+from core.auth.ports.repository import UserRepository
+from core.auth.schemas import UserCreate, UserOut, UserUpdate
+from core.exceptions.custom_exceptions import CustomAPIException
+
+_NOT_NULL = ("email", "password")
+
+
+class InMemoryUserRepository(UserRepository):
+    """
+    User repository keeping rows in dictionaries, with the semantics of
+    `SQLAlchemyUserRepository`: soft deletes, pages ordered by id, emails
+    unique among all users including deleted ones, and lookups by email that
+    also find deleted users.
+
+    Users are indexed by id and by email, and live ids are kept sorted, so a
+    page is a slice. Every method holds one lock, so the repository can be
+    shared by threads.
+    """
+
+    def __init__(self):
+        """Initialize an empty repository."""
+        self._lock = threading.RLock()
+        self._users: dict[UUID, dict[str, Any]] = {}
+        self._ids_by_email: dict[str, UUID] = {}
+        self._live_ids: list[UUID] = []
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """
+        Retrieve a user by their email, deleted or not.
+
+        Args:
+            email (str): The user's email.
+
+        Returns:
+            Optional[User]: The user object if found, otherwise None.
+        """
+        with self._lock:
+            user_id = self._ids_by_email.get(email)
+            return User(**self._users[user_id]) if user_id else None
+
+    def get_user_by_id(self, user_id: str) -> Optional[User]:
+        """
+        Retrieve a user by their id, unless deleted.
+
+        Args:
+            user_id (str): The user's id.
+
+        Returns:
+            Optional[User]: The user object if found, otherwise None.
+        """
+        with self._lock:
+            user = self._users.get(as_uuid(user_id))
+            if user is None or user["deleted_at"] is not None:
+                return None
+            return User(**user)
+
+    def create_user(self, user_data: UserCreate) -> UserOut:
+        """
+        Create a new user.
+
+        Args:
+            user_data (UserCreate): The data for creating the new user.
+
+        Returns:
+            UserOut: The created user object.
+
+        Raises:
+            IntegrityError: If another user has the same email.
+        """
+        now = utc_now()
+        user = {
+            **user_data.model_dump(),
+            "id": new_id(),
+            "created_at": now,
+            "updated_at": now,
+            "deleted_at": None,
+        }
+        with self._lock:
+            if user["email"] in self._ids_by_email:
+                raise integrity_error('"user"', "duplicate user email")
+            self._users[user["id"]] = user
+            self._ids_by_email[user["email"]] = user["id"]
+            bisect.insort(self._live_ids, user["id"])
+            return UserOut.model_validate(user)
+
+    def update_user(self, user_id: UUID, user_data: UserUpdate) -> UserOut:
+        """
+        Update an existing user, deleted or not, with the fields that were set.
+
+        Args:
+            user_id (UUID): The ID of the user to update.
+            user_data (UserUpdate): The data for updating the user.
+
+        Returns:
+            UserOut: The updated user object.
+
+        Raises:
+            CustomAPIException: If the user does not exist.
+            IntegrityError: If the email is taken or a required field is set to None.
+        """
+        changes = user_data.model_dump(exclude_unset=True)
+        with self._lock:
+            user = self._users.get(as_uuid(user_id))
+            if user is None:
+                raise CustomAPIException(detail="User not found", status_code=404)
+            if any(changes.get(key, "") is None for key in _NOT_NULL):
+                raise integrity_error('"user"', "null value in a not-null column")
+            email = changes.get("email", user["email"])
+            if email != user["email"]:
+                if email in self._ids_by_email:
+                    raise integrity_error('"user"', "duplicate user email")
+                del self._ids_by_email[user["email"]]
+                self._ids_by_email[email] = user["id"]
+            user.update(changes, updated_at=utc_now())
+            return UserOut.model_validate(user)
+
+    def delete_user(self, user_id: UUID) -> None:
+        """
+        Soft-delete a user by their ID.
+
+        Args:
+            user_id (UUID): The ID of the user to delete.
+
+        Raises:
+            CustomAPIException: If the user does not exist.
+        """
+        with self._lock:
+            user = self._users.get(as_uuid(user_id))
+            if user is None:
+                raise CustomAPIException(detail="User not found", status_code=404)
+            if user["deleted_at"] is None:
+                index = bisect.bisect_left(self._live_ids, user["id"])
+                del self._live_ids[index]
+            user["deleted_at"] = user["updated_at"] = utc_now()
+
+    def list_users(self, limit: int, offset: int) -> tuple[int, list[User]]:
+        """
+        List live users ordered by id.
+
+        Args:
+            limit (int): The number of users to retrieve.
+            offset (int): The starting point for retrieval.
+
+        Returns:
+            tuple[int, list[User]]: The total count and list of users.
+        """
+        with self._lock:
+            page = self._live_ids[offset : offset + limit]
+            return len(self._live_ids), [User(**self._users[key]) for key in page]
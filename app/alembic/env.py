@@ -10,7 +10,11 @@ config = context.config
 import adapters.database.models
 from adapters.database.models.base_model import Base
 
-config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
+# A caller running migrations in-process (such as the test database manager)
+# passes its own connection; the configured URL is only used otherwise.
+external_connection = config.attributes.get("connection")
+if external_connection is None:
+    config.set_main_option("sqlalchemy.url", settings.DATABASE_URL)
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
@@ -58,6 +62,14 @@ def run_migrations_online() -> None:
     and associate a connection with the context.
 
     """
+    if external_connection is not None:
+        context.configure(
+            connection=external_connection, target_metadata=target_metadata
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,70 @@
+"""add collection version counters
+
+Revision ID: 3f1c9a2b7e10
+Revises: 7d58b669b76b
+Create Date: 2026-10-19 09:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f1c9a2b7e10'
+down_revision: Union[str, None] = '7d58b669b76b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COUNTED_TABLES = {
+    "scheduled_sessions": "sessions",
+    "speaker": "speakers",
+}
+
+
+def upgrade() -> None:
+    op.create_table('collection_version',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('version', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.execute(
+        "INSERT INTO collection_version (name, version) "
+        "VALUES ('sessions', 0), ('speakers', 0)"
+    )
+    # Statement-level triggers bump the counter on every write, whichever
+    # process or script performs it.
+    op.execute(
+        """
+        CREATE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE collection_version SET version = version + 1
+            WHERE name = TG_ARGV[0];
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table, name in COUNTED_TABLES.items():
+        op.execute(
+            f'CREATE TRIGGER {table}_bump_version '
+            f'AFTER INSERT OR UPDATE OR DELETE ON "{table}" '
+            f"FOR EACH STATEMENT EXECUTE FUNCTION bump_collection_version('{name}')"
+        )
+    op.create_index(
+        op.f('ix_speaker_assignment_session_id'),
+        'speaker_assignment',
+        ['session_id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        op.f('ix_speaker_assignment_session_id'), table_name='speaker_assignment'
+    )
+    for table in COUNTED_TABLES:
+        op.execute(f'DROP TRIGGER {table}_bump_version ON "{table}"')
+    op.execute("DROP FUNCTION bump_collection_version()")
+    op.drop_table('collection_version')
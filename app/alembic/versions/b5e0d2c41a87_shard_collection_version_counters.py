@@ -0,0 +1,72 @@
+"""shard collection version counters
+
+Revision ID: b5e0d2c41a87
+Revises: 3f1c9a2b7e10
+Create Date: 2026-10-19 12:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e0d2c41a87'
+down_revision: Union[str, None] = '3f1c9a2b7e10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows per collection counter; a version is the sum of its rows.
+SHARDS = 16
+
+
+def upgrade() -> None:
+    op.add_column(
+        'collection_version',
+        sa.Column('shard', sa.SmallInteger(), server_default='0', nullable=False),
+    )
+    op.drop_constraint('collection_version_pkey', 'collection_version')
+    op.create_primary_key('collection_version_pkey', 'collection_version', ['name', 'shard'])
+    op.execute(
+        "INSERT INTO collection_version (name, shard, version) "
+        "SELECT name, number, 0 FROM collection_version, "
+        f"generate_series(1, {SHARDS - 1}) AS number"
+    )
+    # Each transaction bumps the shard picked by its transaction id, so
+    # concurrent writers lock different rows until they commit instead of all
+    # queuing on one; a transaction keeps to a single shard per collection.
+    op.execute(
+        f"""
+        CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE collection_version SET version = version + 1
+            WHERE name = TG_ARGV[0] AND shard = txid_current() % {SHARDS};
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION bump_collection_version() RETURNS trigger AS $$
+        BEGIN
+            UPDATE collection_version SET version = version + 1
+            WHERE name = TG_ARGV[0];
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        "UPDATE collection_version AS total SET version = ("
+        "SELECT sum(version) FROM collection_version AS shard "
+        "WHERE shard.name = total.name) WHERE total.shard = 0"
+    )
+    op.execute("DELETE FROM collection_version WHERE shard <> 0")
+    op.drop_constraint('collection_version_pkey', 'collection_version')
+    op.create_primary_key('collection_version_pkey', 'collection_version', ['name'])
+    op.drop_column('collection_version', 'shard')
@@ -0,0 +1,177 @@
+"""
+Benchmark: per-request overhead of the error-handling middleware.
+
+Compares the former `BaseHTTPMiddleware` implementation, which wraps every
+request in an extra task and memory stream, with the pure ASGI
+`ErrorHandlingMiddleware` plus registered exception handlers. Requests are
+driven straight through the ASGI interface, without a server or network.
+
+Usage:
+    python -m benchmarks.error_middleware --iterations 5000
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from core.exceptions.custom_exceptions import CustomAPIException
+from core.middleware.error_middleware import (
+    ErrorHandlingMiddleware,
+    register_exception_handlers,
+)
+from fastapi import FastAPI, Request, status
+from fastapi.responses import PlainTextResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message
+
+
+class LegacyErrorHandlingMiddleware(BaseHTTPMiddleware):
+    """
+    The `BaseHTTPMiddleware` error handling this module benchmarks against.
+    """
+
+    async def dispatch(self, request: Request, call_next):
+        """Run the request, turning any exception into a JSON response."""
+        try:
+            return await call_next(request)
+        except CustomAPIException as exc:
+            return JSONResponse(
+                {"message": "Conctact admin site", "code": str(exc.status_code)},
+                status_code=exc.status_code,
+            )
+        except Exception:
+            return JSONResponse(
+                {
+                    "message": "An unexpected error occurred",
+                    "details": "Contact admin site",
+                },
+                status_code=status.HTTP_400_BAD_REQUEST,
+            )
+
+
+def build_app(legacy: bool = False) -> FastAPI:
+    """
+    Build an application with a fast route and two failing routes.
+
+    Args:
+        legacy (bool): Use the former `BaseHTTPMiddleware` error handling.
+
+    Returns:
+        FastAPI: The application.
+    """
+    app = FastAPI()
+    if legacy:
+        app.add_middleware(LegacyErrorHandlingMiddleware)
+    else:
+        app.add_middleware(ErrorHandlingMiddleware)
+        register_exception_handlers(app)
+
+    @app.get("/ping")
+    async def ping():
+        return PlainTextResponse("pong")
+
+    @app.get("/not-found")
+    async def not_found():
+        raise CustomAPIException(detail="Session not found", status_code=404)
+
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("boom")
+
+    return app
+
+
+async def call(app: ASGIApp, path: str, on_send=None) -> list[Message]:
+    """
+    Send a GET request through the ASGI interface.
+
+    Args:
+        app (ASGIApp): The application.
+        path (str): The request path.
+        on_send (Optional[Callable[[Message], None]]): Called with every
+            message sent by the application.
+
+    Returns:
+        list[Message]: The messages sent by the application.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+    }
+    messages: list[Message] = []
+    request_sent = False
+
+    async def receive() -> Message:
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.Event().wait()
+
+    async def send(message: Message) -> None:
+        messages.append(message)
+        if on_send is not None:
+            on_send(message)
+
+    await app(scope, receive, send)
+    return messages
+
+
+async def measure(app: ASGIApp, path: str, iterations: int) -> float:
+    """
+    Return the average wall time of a request in microseconds.
+
+    Args:
+        app (ASGIApp): The application.
+        path (str): The request path.
+        iterations (int): Number of measured requests.
+
+    Returns:
+        float: Microseconds per request.
+    """
+    for _ in range(min(iterations, 100)):
+        await call(app, path)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await call(app, path)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def run(iterations: int) -> None:
+    """Measure every route with both implementations and print the results."""
+    apps = {"BaseHTTPMiddleware": build_app(legacy=True), "pure ASGI": build_app()}
+    print(f"iterations: {iterations}")
+    for path in ("/ping", "/not-found", "/crash"):
+        timings = {
+            name: await measure(app, path, iterations) for name, app in apps.items()
+        }
+        before, after = timings.values()
+        print(
+            f"{path:<11} BaseHTTPMiddleware {before:7.1f} us, "
+            f"pure ASGI {after:7.1f} us ({(1 - after / before) * 100:5.1f} % less)"
+        )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5000)
+    options = parser.parse_args()
+    logging.disable(logging.ERROR)
+    asyncio.run(run(options.iterations))
+
+
+if __name__ == "__main__":
+    main()
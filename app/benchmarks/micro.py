@@ -0,0 +1,545 @@
+"""
+Microbenchmarks of services, schemas, auth primitives and middleware.
+
+Each benchmark times one operation in isolation, without a database or server:
+session mapping in `SessionService`, session creation on the in-memory
+repository, Pydantic validation of session schemas at
+several sizes, JWT creation and decoding, bcrypt verification at the configured
+cost, and the per-request overhead of `ErrorHandlingMiddleware`.
+
+Results are saved as JSON baselines; `compare` runs a Mann-Whitney U test on the
+samples of each benchmark and flags the ones that got significantly slower.
+
+Usage:
+    python -m benchmarks.micro run --save benchmarks/baselines/main.json
+    python -m benchmarks.micro run --filter schemas --baseline benchmarks/baselines/main.json
+    python -m benchmarks.micro compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import jwt
+from adapters.database.models import ScheduledSession, Speaker, SpeakerAssignment
+from adapters.database.repository.session_repository import session_detail
+from adapters.memory.session_repository import InMemorySessionRepository
+from benchmarks.error_middleware import call
+from config import settings
+from core.auth.services import AuthService, password_context
+from core.common.cache import ResponseCache
+from core.common.pagination import PaginatedResponse, PaginationParams
+from core.common.single_flight import SingleFlight
+from core.middleware.error_middleware import ErrorHandlingMiddleware
+from core.session.schemas import SessionCreate, SessionDetail, SessionListOut
+from core.session.services import SessionService
+from starlette.types import Receive, Scope, Send
+
+# A benchmark is a setup function returning the operation to time; operations
+# may be coroutine functions.
+Benchmark = Callable[[], Callable[[], Any]]
+BENCHMARKS: dict[str, Benchmark] = {}
+SIZES = (10, 100)
+SPEAKERS = (0, 10)
+
+
+@dataclass
+class Result:
+    """
+    Timings of one benchmark.
+
+    Attributes:
+        loops (int): Operations per sample.
+        samples (list[float]): Seconds per operation, one value per sample.
+    """
+
+    loops: int
+    samples: list[float] = field(default_factory=list)
+
+    @property
+    def median(self) -> float:
+        """The median time per operation, in seconds."""
+        return statistics.median(self.samples)
+
+
+@dataclass
+class Comparison:
+    """
+    How a benchmark changed between two runs.
+
+    Attributes:
+        name (str): The benchmark.
+        before (float): Median seconds per operation in the baseline.
+        after (float): Median seconds per operation in the new run.
+        change (float): Relative change of the median; positive is slower.
+        p_value (float): Two-sided Mann-Whitney U p-value of the samples.
+        verdict (str): `slower`, `faster` or `same`.
+    """
+
+    name: str
+    before: float
+    after: float
+    change: float
+    p_value: float
+    verdict: str
+
+
+def benchmark(name: str) -> Callable[[Benchmark], Benchmark]:
+    """
+    Register a benchmark setup function under a name.
+
+    Args:
+        name (str): The benchmark name, `<area>.<operation>[<parameters>]`.
+
+    Returns:
+        Callable[[Benchmark], Benchmark]: The decorator.
+    """
+
+    def register(setup: Benchmark) -> Benchmark:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def build_session(index: int, speakers: int) -> ScheduledSession:
+    """
+    Build a detached session with speaker assignments, as loaded from the database.
+
+    Args:
+        index (int): Distinguishes the session's title and times.
+        speakers (int): Number of speakers assigned.
+
+    Returns:
+        ScheduledSession: The session.
+    """
+    start = datetime(2024, 11, 30, 9, 0) + timedelta(hours=index)
+    session = ScheduledSession(
+        id=uuid.uuid4(),
+        title=f"Session {index}",
+        description="A talk about scaling conference software. " * 4,
+        start_time=start,
+        end_time=start + timedelta(minutes=45),
+        capacity=100 + index,
+        is_active=True,
+    )
+    session.speakers = [
+        SpeakerAssignment(
+            role="Presenter",
+            speaker=Speaker(
+                id=uuid.uuid4(),
+                name=f"Speaker {number}",
+                email=f"speaker{number}@example.com",
+                biography="Builds conference software.",
+            ),
+        )
+        for number in range(speakers)
+    ]
+    return session
+
+
+class _SessionRows:
+    """
+    Repository stand-in returning prebuilt rows, so only mapping is timed.
+    """
+
+    def __init__(self, sessions: list[ScheduledSession]):
+        self.sessions = sessions
+
+    def list_sessions(self, limit: int, offset: int):
+        return len(self.sessions) * 10, self.sessions[offset : offset + limit]
+
+    def get_session_by_id(self, session_id):
+        return session_detail(self.sessions[0])
+
+
+def _uncached_service(sessions: list[ScheduledSession]) -> SessionService:
+    """Build a session service reading prebuilt rows, with caching disabled."""
+    return SessionService(
+        _SessionRows(sessions),
+        cache=ResponseCache(enabled=False),
+        flight=SingleFlight(),
+    )
+
+
+def _session_page(size: int) -> dict[str, Any]:
+    """Build a page of sessions as decoded JSON."""
+    return {
+        "items": [
+            SessionListOut.model_validate(build_session(index, 0)).model_dump(
+                mode="json"
+            )
+            for index in range(size)
+        ],
+        "pagination": {
+            "total_items": size * 10,
+            "total_pages": 10,
+            "back": None,
+            "next": 2,
+        },
+    }
+
+
+for _size in SIZES:
+
+    @benchmark(f"session_service.list_sessions[{_size}]")
+    def _list_sessions(size: int = _size) -> Callable[[], Any]:
+        service = _uncached_service([build_session(index, 0) for index in range(size)])
+        params = PaginationParams(page=1, limit=size)
+        return lambda: service.list_sessions(params, version="1")
+
+    @benchmark(f"schemas.paginated_sessions.validate_python[{_size}]")
+    def _validate_page(size: int = _size) -> Callable[[], Any]:
+        page = _session_page(size)
+        return lambda: PaginatedResponse[SessionListOut].model_validate(page)
+
+    @benchmark(f"schemas.paginated_sessions.validate_json[{_size}]")
+    def _validate_page_json(size: int = _size) -> Callable[[], Any]:
+        page = json.dumps(_session_page(size))
+        return lambda: PaginatedResponse[SessionListOut].model_validate_json(page)
+
+
+for _speakers in SPEAKERS:
+
+    @benchmark(f"session_service.get_session[speakers={_speakers}]")
+    def _get_session(speakers: int = _speakers) -> Callable[[], Any]:
+        service = _uncached_service([build_session(0, speakers)])
+        session_id = str(uuid.uuid4())
+        return lambda: service.get_session(session_id, version="1")
+
+    @benchmark(f"schemas.session_detail.validate_python[speakers={_speakers}]")
+    def _validate_detail(speakers: int = _speakers) -> Callable[[], Any]:
+        detail = session_detail(build_session(0, speakers)).model_dump(mode="json")
+        return lambda: SessionDetail.model_validate(detail)
+
+
+@benchmark("session_service.create_session[speakers=3]")
+def _create_session() -> Callable[[], Any]:
+    repository = InMemorySessionRepository(cache=ResponseCache())
+    service = SessionService(repository, cache=repository.cache, flight=SingleFlight())
+    speakers = [
+        repository.add_speaker(f"Speaker {index}", f"speaker{index}@example.com").id
+        for index in range(3)
+    ]
+    start = datetime(2024, 11, 30, 9, 0)
+    data = SessionCreate(
+        title="Session",
+        description=None,
+        start_time=start,
+        end_time=start + timedelta(minutes=45),
+        capacity=100,
+        speakers=speakers,
+    )
+    return lambda: service.create_session(data)
+
+
+@benchmark("auth.create_access_token")
+def _create_access_token() -> Callable[[], Any]:
+    service = AuthService(user_repository=None)
+    data = {"user_id": str(uuid.uuid4())}
+    return lambda: service.create_access_token(data)
+
+
+@benchmark("auth.decode_access_token")
+def _decode_access_token() -> Callable[[], Any]:
+    token = AuthService(user_repository=None).create_access_token(
+        {"user_id": str(uuid.uuid4())}
+    )
+    return lambda: jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+
+@benchmark("auth.bcrypt_verify")
+def _bcrypt_verify() -> Callable[[], Any]:
+    context = password_context()
+    hashed = context.hash("admin123")
+    return lambda: context.verify("admin123", hashed)
+
+
+async def _pong(scope: Scope, receive: Receive, send: Send) -> None:
+    """Minimal ASGI application answering every request."""
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"pong"})
+
+
+@benchmark("middleware.bare_asgi_app")
+def _bare_app() -> Callable[[], Any]:
+    return lambda: call(_pong, "/ping")
+
+
+@benchmark("middleware.error_handling")
+def _error_handling() -> Callable[[], Any]:
+    app = ErrorHandlingMiddleware(_pong)
+    return lambda: call(app, "/ping")
+
+
+class Timer:
+    """
+    Runs an operation a number of times and returns the elapsed seconds.
+    """
+
+    def __init__(self, operation: Callable[[], Any], loop: asyncio.AbstractEventLoop):
+        """
+        Prepare to time an operation; it is called once here, as a warm-up.
+
+        Args:
+            operation (Callable[[], Any]): The operation; called for its result,
+                or awaited when it returns a coroutine.
+            loop (asyncio.AbstractEventLoop): Runs coroutine operations.
+        """
+        self.operation = operation
+        self.loop = loop
+        probe = operation()
+        self.is_async = asyncio.iscoroutine(probe)
+        if self.is_async:
+            loop.run_until_complete(probe)
+
+    def __call__(self, loops: int) -> float:
+        """Run the operation `loops` times; return the elapsed seconds."""
+        if self.is_async:
+            return self.loop.run_until_complete(self._time_async(loops))
+        operation = self.operation
+        start = time.perf_counter()
+        for _ in range(loops):
+            operation()
+        return time.perf_counter() - start
+
+    async def _time_async(self, loops: int) -> float:
+        """Await the operation `loops` times inside one event loop turn."""
+        operation = self.operation
+        start = time.perf_counter()
+        for _ in range(loops):
+            await operation()
+        return time.perf_counter() - start
+
+    def calibrate(self, min_time: float) -> int:
+        """
+        Return the smallest power of two of loops taking at least `min_time`.
+
+        Args:
+            min_time (float): Minimum duration of a sample, in seconds.
+
+        Returns:
+            int: Operations per sample.
+        """
+        loops = 1
+        while self(loops) < min_time:
+            loops *= 2
+        return loops
+
+
+def run(pattern: str = "", samples: int = 15, min_time: float = 0.05) -> dict[str, Any]:
+    """
+    Run the benchmarks whose name contains a pattern.
+
+    Samples are taken round-robin, one per benchmark per round, so a change in
+    machine load during the run spreads over all benchmarks instead of
+    shifting a few of them.
+
+    Args:
+        pattern (str): Substring of the benchmark names to run.
+        samples (int): Samples per benchmark.
+        min_time (float): Minimum duration of a sample, in seconds.
+
+    Returns:
+        dict[str, Any]: Machine and commit metadata, and the results per benchmark.
+    """
+    loop = asyncio.new_event_loop()
+    try:
+        timers = {
+            name: Timer(setup(), loop)
+            for name, setup in BENCHMARKS.items()
+            if pattern in name
+        }
+        results = {
+            name: Result(timer.calibrate(min_time)) for name, timer in timers.items()
+        }
+        for _ in range(samples):
+            for name, timer in timers.items():
+                result = results[name]
+                result.samples.append(timer(result.loops) / result.loops)
+    finally:
+        loop.close()
+    for name, result in results.items():
+        print(f"{name:<55} {_format(result.median)}", file=sys.stderr)
+    return {
+        "commit": _commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": {
+            name: {"loops": result.loops, "samples": result.samples}
+            for name, result in results.items()
+        },
+    }
+
+
+def mann_whitney_p_value(first: list[float], second: list[float]) -> float:
+    """
+    Return the two-sided p-value of the Mann-Whitney U test.
+
+    Uses the normal approximation with tie and continuity corrections, which
+    is accurate from about ten samples per side.
+
+    Args:
+        first (list[float]): The first samples.
+        second (list[float]): The second samples.
+
+    Returns:
+        float: The probability of a difference at least this large if both
+            samples came from the same distribution.
+    """
+    combined = sorted(
+        (value, group)
+        for group, values in enumerate((first, second))
+        for value in values
+    )
+    ranks = [0.0] * len(combined)
+    ties = 0.0
+    start = 0
+    while start < len(combined):
+        end = start
+        while end + 1 < len(combined) and combined[end + 1][0] == combined[start][0]:
+            end += 1
+        for index in range(start, end + 1):
+            ranks[index] = (start + end) / 2 + 1
+        count = end - start + 1
+        ties += count**3 - count
+        start = end + 1
+
+    n1, n2 = len(first), len(second)
+    total = n1 + n2
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    variance = n1 * n2 / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = max(abs(u - n1 * n2 / 2) - 0.5, 0) / math.sqrt(variance)
+    return math.erfc(z / math.sqrt(2))
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    alpha: float = 0.01,
+    threshold: float = 0.05,
+) -> list[Comparison]:
+    """
+    Compare the benchmarks present in two runs.
+
+    A benchmark is `slower` or `faster` only when its samples differ
+    significantly (p-value below `alpha`) and its median moved by more than
+    `threshold`; tiny but consistent shifts and noisy ones are `same`.
+
+    Args:
+        baseline (dict[str, Any]): The reference run, as returned by `run`.
+        current (dict[str, Any]): The run to check.
+        alpha (float): Significance level of the test.
+        threshold (float): Smallest relative change of the median reported.
+
+    Returns:
+        list[Comparison]: One comparison per benchmark in both runs.
+    """
+    comparisons = []
+    for name, result in current["results"].items():
+        reference = baseline["results"].get(name)
+        if reference is None:
+            continue
+        before = statistics.median(reference["samples"])
+        after = statistics.median(result["samples"])
+        change = after / before - 1
+        p_value = mann_whitney_p_value(reference["samples"], result["samples"])
+        verdict = "same"
+        if p_value < alpha and abs(change) > threshold:
+            verdict = "slower" if change > 0 else "faster"
+        comparisons.append(Comparison(name, before, after, change, p_value, verdict))
+    return comparisons
+
+
+def report(comparisons: list[Comparison]) -> str:
+    """
+    Render comparisons as a table.
+
+    Args:
+        comparisons (list[Comparison]): The comparisons.
+
+    Returns:
+        str: One line per benchmark.
+    """
+    return "\n".join(
+        f"{item.name:<55} {_format(item.before)} -> {_format(item.after)} "
+        f"{item.change:+7.1%}  p={item.p_value:.3f}  {item.verdict}"
+        for item in comparisons
+    )
+
+
+def _format(seconds: float) -> str:
+    """Format a duration with a readable unit."""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit:<2}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def _commit() -> Optional[str]:
+    """Return the commit being measured, if run from a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    """Run or compare the benchmarks; exit with status 1 on a regression."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    runner = commands.add_parser("run", help="Run the benchmarks.")
+    runner.add_argument("--filter", default="", help="Run names containing this.")
+    runner.add_argument("--samples", type=int, default=15)
+    runner.add_argument("--min-time", type=float, default=0.05)
+    runner.add_argument("--save", type=Path, help="Write the results here.")
+    runner.add_argument("--baseline", type=Path, help="Compare with these results.")
+    checker = commands.add_parser("compare", help="Compare two saved runs.")
+    checker.add_argument("before", type=Path)
+    checker.add_argument("after", type=Path)
+    for command in (runner, checker):
+        command.add_argument("--alpha", type=float, default=0.01)
+        command.add_argument("--threshold", type=float, default=0.05)
+    options = parser.parse_args()
+    logging.disable(logging.ERROR)
+
+    if options.command == "run":
+        current = run(options.filter, options.samples, options.min_time)
+        if options.save:
+            options.save.parent.mkdir(parents=True, exist_ok=True)
+            options.save.write_text(json.dumps(current, indent=2) + "\n")
+        if not options.baseline:
+            return
+        baseline = json.loads(options.baseline.read_text())
+    else:
+        baseline = json.loads(options.before.read_text())
+        current = json.loads(options.after.read_text())
+
+    comparisons = compare(baseline, current, options.alpha, options.threshold)
+    print(report(comparisons))
+    if any(item.verdict == "slower" for item in comparisons):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
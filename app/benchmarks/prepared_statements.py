@@ -0,0 +1,221 @@
+"""
+Prepared statement benchmark: the parse and plan time saved per request.
+
+Each hot repository query runs `--loops` times on one connection, as an
+ordinary statement and as a server-side prepared statement in turn. The report
+gives the median time per call of both and the saving, then the saving per
+request of the routes running them: reading a session runs the user lookup,
+the permission check and the session with its speakers; a page of sessions,
+the user lookup, the permission check, the count and the page. Times are
+medians over `--samples` samples.
+
+Needs a migrated and seeded database, `settings.DATABASE_URL` or `--url`.
+
+Usage:
+    python -m benchmarks.prepared_statements --loops 1000 --samples 5
+    python -m benchmarks.prepared_statements --json prepared.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from adapters.database.models import ScheduledSession, User
+from adapters.database.prepared_statements import PreparedQuery
+from adapters.database.repository.session_repository import (
+    SESSION_COUNT,
+    SESSION_PAGE,
+    SESSION_WITH_SPEAKERS,
+)
+from adapters.database.repository.user_repository import USER_BY_ID
+from config import settings
+from dependencies.verify_permission import PERMISSION_GRANTED
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+# The queries of each route, in the order a request runs them.
+REQUESTS = {
+    "GET /api/v1/session/{id}": (
+        "user_by_id",
+        "permission_granted",
+        "session_with_speakers",
+    ),
+    "GET /api/v1/session/": (
+        "user_by_id",
+        "permission_granted",
+        "session_count",
+        "session_page",
+    ),
+}
+
+
+def hot_queries(
+    user: User, session: ScheduledSession
+) -> dict[str, tuple[PreparedQuery, dict[str, Any]]]:
+    """
+    Return the hot queries with the parameters of a typical call.
+
+    Args:
+        user (User): The user looked up and checked.
+        session (ScheduledSession): The session read.
+
+    Returns:
+        dict[str, tuple[PreparedQuery, dict[str, Any]]]: Each query and its
+        parameters, by statement name.
+    """
+    return {
+        "user_by_id": (USER_BY_ID, {"user_id": user.id}),
+        "permission_granted": (
+            PERMISSION_GRANTED,
+            {"user_id": user.id, "permission_codename": "view_event"},
+        ),
+        "session_with_speakers": (SESSION_WITH_SPEAKERS, {"session_id": session.id}),
+        "session_count": (SESSION_COUNT, {}),
+        "session_page": (SESSION_PAGE, {"offset": 0, "limit": 10}),
+    }
+
+
+def time_modes(call: Callable[[], Any], loops: int, samples: int) -> dict[str, float]:
+    """
+    Time a call as an ordinary and as a prepared statement.
+
+    The modes alternate from sample to sample, so a drift in the server's
+    load affects both alike.
+
+    Args:
+        call (Callable[[], Any]): The call.
+        loops (int): Calls per sample.
+        samples (int): Samples taken per mode.
+
+    Returns:
+        dict[str, float]: The median seconds per call, `plain` and `prepared`.
+    """
+    times: dict[str, list[float]] = {"plain": [], "prepared": []}
+    enabled = settings.DB_PREPARED_STATEMENTS_ENABLED
+    try:
+        for _ in range(samples):
+            for mode in times:
+                settings.DB_PREPARED_STATEMENTS_ENABLED = mode == "prepared"
+                call()  # Prepares the statement, outside the timings.
+                start = time.perf_counter()
+                for _ in range(loops):
+                    call()
+                times[mode].append((time.perf_counter() - start) / loops)
+    finally:
+        settings.DB_PREPARED_STATEMENTS_ENABLED = enabled
+    return {mode: statistics.median(values) for mode, values in times.items()}
+
+
+def summarize(timings: dict[str, dict[str, float]]) -> dict[str, Any]:
+    """
+    Turn the timings of each query into savings per query and per request.
+
+    Args:
+        timings (dict[str, dict[str, float]]): The seconds per call of each
+            query, `plain` and `prepared`.
+
+    Returns:
+        dict[str, Any]: The report, in microseconds.
+    """
+
+    def us(seconds: float) -> float:
+        return round(seconds * 1_000_000, 1)
+
+    queries = {
+        name: {
+            "plain_us": us(times["plain"]),
+            "prepared_us": us(times["prepared"]),
+            "saved_us": us(times["plain"] - times["prepared"]),
+        }
+        for name, times in timings.items()
+    }
+    requests = {
+        route: {
+            "plain_us": round(sum(queries[name]["plain_us"] for name in names), 1),
+            "saved_us": round(sum(queries[name]["saved_us"] for name in names), 1),
+        }
+        for route, names in REQUESTS.items()
+    }
+    return {"queries": queries, "requests": requests}
+
+
+def run(url: str, loops: int = 1000, samples: int = 5) -> dict[str, Any]:
+    """
+    Time the hot queries, plain and prepared, on one connection.
+
+    Args:
+        url (str): The database URL.
+        loops (int): Calls per sample.
+        samples (int): Samples per query and mode.
+
+    Returns:
+        dict[str, Any]: The report.
+
+    Raises:
+        SystemExit: If the database has no user or session to query.
+    """
+    engine = create_engine(url, pool_size=1)
+    timings: dict[str, dict[str, float]] = {}
+    try:
+        with Session(engine) as data_base:
+            user = data_base.query(User).first()
+            session = data_base.query(ScheduledSession).first()
+            if user is None or session is None:
+                raise SystemExit("The database needs at least one user and session.")
+            for name, (query, params) in hot_queries(user, session).items():
+                timings[name] = time_modes(
+                    lambda query=query, params=params: query.execute(
+                        data_base, **params
+                    ).all(),
+                    loops,
+                    samples,
+                )
+    finally:
+        engine.dispose()
+    return summarize(timings)
+
+
+def report(summary: dict[str, Any]) -> str:
+    """
+    Format a run for the terminal.
+
+    Args:
+        summary (dict[str, Any]): The result of `run`.
+
+    Returns:
+        str: The report.
+    """
+    lines = [f"  {'query':<24} {'plain':>10} {'prepared':>10} {'saved':>10}"]
+    lines += [
+        f"  {name:<24} {times['plain_us']:>7.1f} us {times['prepared_us']:>7.1f} us"
+        f" {times['saved_us']:>7.1f} us"
+        for name, times in summary["queries"].items()
+    ]
+    lines.append("Saved per request")
+    lines += [
+        f"  {route:<32} {times['saved_us']:>7.1f} us of {times['plain_us']:.1f} us"
+        for route, times in summary["requests"].items()
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--loops", type=int, default=1000)
+    parser.add_argument("--samples", type=int, default=5)
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON.")
+    args = parser.parse_args()
+
+    summary = run(args.url, args.loops, args.samples)
+    print(report(summary))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""
+Benchmark: CPU time to turn a page of sessions into a JSON response body.
+
+Compares FastAPI's `response_model` pipeline (validate the returned model again,
+serialize it to Python objects, then `json.dumps`) with `FastJSONResponse`,
+which serializes the service's model once with orjson.
+
+Usage:
+    python -m benchmarks.response_serialization --page-size 100 --iterations 2000
+"""
+
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Callable
+
+from adapters.api.responses import FastJSONResponse
+from core.common.pagination import Paginated, PaginatedResponse
+from core.session.schemas import SessionListOut
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+
+def build_page(page_size: int) -> PaginatedResponse[SessionListOut]:
+    """
+    Build a page of sessions as `SessionService.list_sessions` returns it.
+
+    Args:
+        page_size (int): Number of sessions in the page.
+
+    Returns:
+        PaginatedResponse[SessionListOut]: The page.
+    """
+    start = datetime(2024, 11, 30, 9, 0, tzinfo=timezone.utc)
+    items = [
+        SessionListOut(
+            id=uuid.uuid4(),
+            title=f"Session {index}",
+            description="A talk about scaling conference software. " * 4,
+            start_time=start + timedelta(hours=index),
+            end_time=start + timedelta(hours=index, minutes=45),
+            capacity=100 + index,
+            is_active=True,
+        )
+        for index in range(page_size)
+    ]
+    return PaginatedResponse[SessionListOut](
+        items=items,
+        pagination=Paginated(
+            total_items=page_size * 10, total_pages=10, back=None, next=2
+        ),
+    )
+
+
+def response_model_body(page: PaginatedResponse[SessionListOut]) -> bytes:
+    """
+    Render `page` the way FastAPI does for an endpoint with `response_model`.
+
+    Args:
+        page (PaginatedResponse[SessionListOut]): The page returned by the service.
+
+    Returns:
+        bytes: The response body.
+    """
+    field = create_response_field(
+        name="Response_list_sessions", type_=PaginatedResponse[SessionListOut]
+    )
+    content = asyncio.run(serialize_response(field=field, response_content=page))
+    return JSONResponse(content).body
+
+
+def measure(render: Callable[[], bytes], iterations: int) -> float:
+    """
+    Return the average CPU time of `render` in microseconds.
+
+    Args:
+        render (Callable[[], bytes]): Produces one response body.
+        iterations (int): Number of measured calls.
+
+    Returns:
+        float: Microseconds of CPU time per call.
+    """
+    for _ in range(min(iterations, 50)):
+        render()
+    start = time.process_time()
+    for _ in range(iterations):
+        render()
+    return (time.process_time() - start) / iterations * 1_000_000
+
+
+def main() -> None:
+    """Run the benchmark and print the per-response CPU time of both pipelines."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=2000)
+    options = parser.parse_args()
+
+    page = build_page(options.page_size)
+    field = create_response_field(
+        name="Response_list_sessions", type_=PaginatedResponse[SessionListOut]
+    )
+
+    async def legacy_pipeline() -> bytes:
+        content = await serialize_response(field=field, response_content=page)
+        return JSONResponse(content).body
+
+    loop = asyncio.new_event_loop()
+    try:
+        legacy = measure(
+            lambda: loop.run_until_complete(legacy_pipeline()), options.iterations
+        )
+    finally:
+        loop.close()
+    fast = measure(lambda: FastJSONResponse(page).body, options.iterations)
+
+    print(f"page size: {options.page_size}, iterations: {options.iterations}")
+    print(f"response_model + JSONResponse: {legacy:9.1f} us/response")
+    print(f"FastJSONResponse:              {fast:9.1f} us/response")
+    print(f"CPU reduction:                 {(1 - fast / legacy) * 100:9.1f} %")
+
+
+if __name__ == "__main__":
+    main()
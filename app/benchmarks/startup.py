@@ -0,0 +1,246 @@
+"""
+Startup profile: where a worker's cold start goes.
+
+Each run starts a fresh interpreter, as a new uvicorn worker does, imports
+`fast_api.fast_api_app` and calls `create_app()`. The report gives the whole
+process time, the import and `create_app` times with `create_app`'s phases,
+the import time of each top-level package and the slowest modules, from
+`python -X importtime`. It also names any module that should only load on
+first use (`LAZY_MODULES`) but was imported at startup. Times are medians over
+the runs.
+
+Usage:
+    python -m benchmarks.startup --runs 5 --top 20
+    python -m benchmarks.startup --json startup.json
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+# Loaded on first use: the password hasher, the database driver and the
+# columnar export's pyarrow.
+LAZY_MODULES = ("passlib", "psycopg2", "pyarrow")
+_WORKER = f"""
+import json, sys, time
+start = time.perf_counter()
+from fast_api.fast_api_app import create_app
+imported = time.perf_counter()
+app = create_app()
+created = time.perf_counter()
+print(json.dumps({{
+    "import_s": imported - start,
+    "create_app_s": created - imported,
+    "phases": app.state.startup_phases,
+    "eager": sorted(name for name in {LAZY_MODULES!r} if name in sys.modules),
+}}))
+"""
+
+
+@dataclass
+class ImportTime:
+    """
+    One line of `python -X importtime` output.
+
+    Attributes:
+        module (str): The module imported.
+        self_us (int): Microseconds spent in the module itself.
+        cumulative_us (int): Microseconds including the modules it imported.
+    """
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_importtime(output: str) -> list[ImportTime]:
+    """
+    Parse the `-X importtime` lines of a process's standard error.
+
+    Args:
+        output (str): The standard error of the process.
+
+    Returns:
+        list[ImportTime]: One entry per imported module, in import order.
+    """
+    imports = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line[len("import time:") :].split("|")
+        if self_us.strip().startswith("self"):
+            continue
+        imports.append(ImportTime(module.strip(), int(self_us), int(cumulative_us)))
+    return imports
+
+
+def run_worker() -> dict[str, Any]:
+    """
+    Start one interpreter like a new worker, without import tracing.
+
+    Returns:
+        dict[str, Any]: The process, import and `create_app` seconds, the
+        phases and the lazy modules loaded eagerly.
+    """
+    start = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", _WORKER],
+        cwd=APP_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    process_s = time.perf_counter() - start
+    return {"process_s": process_s, **json.loads(completed.stdout.splitlines()[-1])}
+
+
+def trace_imports() -> list[ImportTime]:
+    """
+    Start one interpreter like a new worker under `-X importtime`.
+
+    Returns:
+        list[ImportTime]: The modules it imported.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _WORKER],
+        cwd=APP_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def summarize(
+    workers: list[dict[str, Any]], traces: list[list[ImportTime]], top: int
+) -> dict[str, Any]:
+    """
+    Reduce several runs to their medians.
+
+    Args:
+        workers (list[dict[str, Any]]): The results of `run_worker`.
+        traces (list[list[ImportTime]]): The results of `trace_imports`.
+        top (int): The number of slowest modules to keep.
+
+    Returns:
+        dict[str, Any]: The report.
+    """
+    packages: dict[str, list[int]] = defaultdict(list)
+    modules: dict[str, list[int]] = defaultdict(list)
+    for trace in traces:
+        totals: dict[str, int] = defaultdict(int)
+        for entry in trace:
+            totals[entry.module.split(".")[0]] += entry.self_us
+            modules[entry.module].append(entry.self_us)
+        for package, self_us in totals.items():
+            packages[package].append(self_us)
+
+    def median_ms(values: list[float], scale: float) -> float:
+        return round(statistics.median(values) * scale, 2)
+
+    phases = workers[0]["phases"]
+    return {
+        "runs": len(workers),
+        "process_ms": median_ms([run["process_s"] for run in workers], 1000),
+        "import_ms": median_ms([run["import_s"] for run in workers], 1000),
+        "create_app_ms": median_ms([run["create_app_s"] for run in workers], 1000),
+        "phases_ms": {
+            phase: median_ms([run["phases"][phase] for run in workers], 1000)
+            for phase in phases
+        },
+        "eager_lazy_modules": sorted(
+            {name for run in workers for name in run["eager"]}
+        ),
+        "packages_ms": dict(
+            sorted(
+                ((name, median_ms(times, 0.001)) for name, times in packages.items()),
+                key=lambda item: item[1],
+                reverse=True,
+            )[:top]
+        ),
+        "modules_ms": dict(
+            sorted(
+                ((name, median_ms(times, 0.001)) for name, times in modules.items()),
+                key=lambda item: item[1],
+                reverse=True,
+            )[:top]
+        ),
+    }
+
+
+def profile(runs: int = 5, top: int = 20) -> dict[str, Any]:
+    """
+    Profile the cold start of a worker.
+
+    Args:
+        runs (int): The number of interpreters started, with and without
+            import tracing each.
+        top (int): The number of packages and modules to report.
+
+    Returns:
+        dict[str, Any]: The report.
+    """
+    workers = [run_worker() for _ in range(runs)]
+    traces = [trace_imports() for _ in range(runs)]
+    return summarize(workers, traces, top)
+
+
+def report(summary: dict[str, Any]) -> str:
+    """
+    Format a profile for the terminal.
+
+    Args:
+        summary (dict[str, Any]): The result of `profile`.
+
+    Returns:
+        str: The report.
+    """
+    lines = [
+        f"Worker start, median of {summary['runs']} runs",
+        f"  process      {summary['process_ms']:9.1f} ms",
+        f"  import       {summary['import_ms']:9.1f} ms",
+        f"  create_app   {summary['create_app_ms']:9.1f} ms",
+    ]
+    lines += [
+        f"    {phase:<10} {ms:9.1f} ms" for phase, ms in summary["phases_ms"].items()
+    ]
+    if summary["eager_lazy_modules"]:
+        lines.append(
+            "  loaded at startup instead of on first use: "
+            + ", ".join(summary["eager_lazy_modules"])
+        )
+    lines.append("Import time by package (self time of its modules)")
+    lines += [
+        f"  {name:<40} {ms:9.1f} ms" for name, ms in summary["packages_ms"].items()
+    ]
+    lines.append("Slowest modules (self time)")
+    lines += [
+        f"  {name:<40} {ms:9.1f} ms" for name, ms in summary["modules_ms"].items()
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON.")
+    args = parser.parse_args()
+
+    summary = profile(args.runs, args.top)
+    print(report(summary))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
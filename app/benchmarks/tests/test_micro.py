@@ -0,0 +1,51 @@
+from benchmarks.micro import BENCHMARKS, compare, mann_whitney_p_value, run
+
+
+class TestMicroBenchmarks:
+    """
+    Tests for the microbenchmark suite and its regression check.
+    """
+
+    def test_every_benchmark_runs(self):
+        """
+        Test that each benchmark's setup returns a working operation.
+        """
+        report = run(samples=1, min_time=0)
+
+        assert set(report["results"]) == set(BENCHMARKS)
+        for result in report["results"].values():
+            assert result["loops"] == 1
+            assert result["samples"][0] > 0
+
+    def test_mann_whitney_separates_shifted_samples(self):
+        """
+        Test the p-value for identical, overlapping and disjoint samples.
+        """
+        baseline = [1.0 + index / 100 for index in range(15)]
+
+        assert mann_whitney_p_value(baseline, baseline) == 1.0
+        assert (
+            mann_whitney_p_value(baseline, [value + 0.01 for value in baseline]) > 0.5
+        )
+        assert mann_whitney_p_value(baseline, [value + 1 for value in baseline]) < 0.001
+
+    def test_compare_flags_only_significant_large_changes(self):
+        """
+        Test that a regression needs both significance and a large enough change.
+        """
+        samples = [1.0 + index / 1000 for index in range(15)]
+        baseline = {"results": {"steady": {"samples": samples}}}
+        baseline["results"]["slow"] = {"samples": samples}
+        baseline["results"]["fast"] = {"samples": samples}
+        current = {
+            "results": {
+                "steady": {"samples": [value * 1.02 for value in samples]},
+                "slow": {"samples": [value * 1.5 for value in samples]},
+                "fast": {"samples": [value * 0.5 for value in samples]},
+                "new": {"samples": samples},
+            }
+        }
+
+        verdicts = {item.name: item.verdict for item in compare(baseline, current)}
+
+        assert verdicts == {"steady": "same", "slow": "slower", "fast": "faster"}
@@ -0,0 +1,36 @@
+from benchmarks.prepared_statements import report, summarize
+
+
+class TestPreparedStatementsBenchmark:
+    """
+    Tests for the prepared statement benchmark's report.
+    """
+
+    def test_summarize_adds_up_savings_per_request(self):
+        """
+        Test the per-query savings and their sums over each route's queries.
+        """
+        timings = {
+            "user_by_id": {"plain": 0.0004, "prepared": 0.0003},
+            "permission_granted": {"plain": 0.0005, "prepared": 0.0002},
+            "session_with_speakers": {"plain": 0.001, "prepared": 0.0006},
+            "session_count": {"plain": 0.0002, "prepared": 0.0001},
+            "session_page": {"plain": 0.0004, "prepared": 0.0004},
+        }
+
+        summary = summarize(timings)
+
+        assert summary["queries"]["permission_granted"] == {
+            "plain_us": 500.0,
+            "prepared_us": 200.0,
+            "saved_us": 300.0,
+        }
+        assert summary["requests"]["GET /api/v1/session/{id}"] == {
+            "plain_us": 1900.0,
+            "saved_us": 800.0,
+        }
+        assert summary["requests"]["GET /api/v1/session/"] == {
+            "plain_us": 1500.0,
+            "saved_us": 500.0,
+        }
+        assert "800.0 us of 1900.0 us" in report(summary)
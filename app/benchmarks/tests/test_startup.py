@@ -0,0 +1,63 @@
+from benchmarks.startup import ImportTime, parse_importtime, run_worker, summarize
+
+IMPORTTIME_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   jwt.utils
+import time:       300 |        420 | jwt
+import time:      2000 |       2000 |     fastapi.openapi.models
+import time:       500 |       2500 |   fastapi.routing
+some other line on stderr
+"""
+
+
+class TestStartupProfile:
+    """
+    Tests for the worker startup profile.
+    """
+
+    def test_parse_importtime_skips_header_and_other_lines(self):
+        """
+        Test that each import line becomes one entry, in order.
+        """
+        imports = parse_importtime(IMPORTTIME_OUTPUT)
+
+        assert imports == [
+            ImportTime("jwt.utils", 120, 120),
+            ImportTime("jwt", 300, 420),
+            ImportTime("fastapi.openapi.models", 2000, 2000),
+            ImportTime("fastapi.routing", 500, 2500),
+        ]
+
+    def test_summarize_takes_medians_and_groups_packages(self):
+        """
+        Test the medians over runs and the per-package self times.
+        """
+        trace = parse_importtime(IMPORTTIME_OUTPUT)
+        workers = [
+            {
+                "process_s": seconds,
+                "import_s": seconds / 2,
+                "create_app_s": 0.01,
+                "phases": {"routers": 0.01},
+                "eager": [],
+            }
+            for seconds in (1.0, 3.0, 2.0)
+        ]
+
+        summary = summarize(workers, [trace, trace], top=1)
+
+        assert summary["process_ms"] == 2000
+        assert summary["import_ms"] == 1000
+        assert summary["phases_ms"] == {"routers": 10}
+        assert summary["packages_ms"] == {"fastapi": 2.5}
+        assert summary["modules_ms"] == {"fastapi.openapi.models": 2.0}
+
+    def test_worker_start_defers_lazy_modules(self):
+        """
+        Test that a new worker times its phases and leaves the lazy modules unloaded.
+        """
+        worker = run_worker()
+
+        assert worker["eager"] == []
+        assert set(worker["phases"]) == {"app", "middleware", "routers"}
+        assert worker["process_s"] > worker["import_s"] > 0
@@ -0,0 +1,34 @@
+from benchmarks.uuid_keys import report, summarize
+
+
+class TestUuidKeysBenchmark:
+    """
+    Tests for the UUID key benchmark's report.
+    """
+
+    def test_summarize_measures_the_whole_load_and_its_tail(self):
+        """
+        Test the throughputs, with a short last batch.
+        """
+        times = [0.1] * 19 + [0.05]
+
+        summary = summarize(times, batch=1000, rows=19_500)
+
+        assert summary == {"rows_per_second": 10_000, "tail_rows_per_second": 10_000}
+
+    def test_report_lists_each_version(self):
+        """
+        Test that the report shows throughputs and sizes in MB.
+        """
+        result = {
+            "rows_per_second": 100_000,
+            "tail_rows_per_second": 80_000,
+            "index_bytes": 2 * 2**20,
+            "table_bytes": 3 * 2**20,
+        }
+
+        text = report({"v4": result, "v7": result})
+
+        assert "v7" in text
+        assert "80,000" in text
+        assert "2.0 MB" in text
@@ -0,0 +1,192 @@
+"""
+UUID key benchmark: insert throughput and index size, UUIDv4 against UUIDv7.
+
+For each version, a scratch table shaped like `session_attendee` is filled
+with `--rows` rows (10M by default) by `COPY` in batches of `--batch` rows,
+each its own transaction, as a bulk load or a registration rush commits them.
+Only the database's time is measured, not generating the rows. The report
+gives the rows per second over the whole load and over its last tenth, where
+random keys have outgrown the cache and most inserts hit an uncached page,
+then the size of the primary key index and of the table.
+
+The scratch tables are `uuid_bench_v4` and `uuid_bench_v7`, dropped before
+and after the run. Needs a database the URL's user may create tables in,
+`settings.DATABASE_URL` or `--url`.
+
+Usage:
+    python -m benchmarks.uuid_keys --rows 10000000
+    python -m benchmarks.uuid_keys --rows 1000000 --json uuid_keys.json
+"""
+
+import argparse
+import io
+import json
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Callable
+
+from adapters.database.models.base_model import uuid7
+from config import settings
+from sqlalchemy import create_engine
+
+GENERATORS: dict[str, Callable[[], uuid.UUID]] = {"v4": uuid.uuid4, "v7": uuid7}
+
+_COLUMNS = "id, session_id, user_id, attended, created_at"
+
+
+def _batch(generate: Callable[[], uuid.UUID], size: int, row: str) -> io.StringIO:
+    """Build `size` rows in `COPY` text format, each with a new key."""
+    return io.StringIO("".join(f"{generate()}\t{row}" for _ in range(size)))
+
+
+def load(
+    connection, table: str, generate: Callable[[], uuid.UUID], rows: int, batch: int
+) -> list[float]:
+    """
+    Create a scratch table and fill it, one transaction per batch.
+
+    Args:
+        connection: A DBAPI connection.
+        table (str): The table's name.
+        generate (Callable[[], uuid.UUID]): The key generator.
+        rows (int): Rows inserted.
+        batch (int): Rows per batch.
+
+    Returns:
+        list[float]: The seconds each batch took, `COPY` and commit.
+    """
+    cursor = connection.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(
+        f"CREATE TABLE {table} (id uuid PRIMARY KEY, session_id uuid NOT NULL,"
+        " user_id uuid NOT NULL, attended boolean, created_at timestamp)"
+    )
+    connection.commit()
+    # Foreign keys of a typical row; only the primary key is indexed.
+    row = f"{uuid.uuid4()}\t{uuid.uuid4()}\tf\t2024-11-30 09:00:00\n"
+    times = []
+    for start in range(0, rows, batch):
+        buffer = _batch(generate, min(batch, rows - start), row)
+        began = time.perf_counter()
+        cursor.copy_expert(f"COPY {table} ({_COLUMNS}) FROM STDIN", buffer)
+        connection.commit()
+        times.append(time.perf_counter() - began)
+    return times
+
+
+def sizes(connection, table: str) -> dict[str, int]:
+    """
+    Return the sizes of a table and of its primary key index.
+
+    Args:
+        connection: A DBAPI connection.
+        table (str): The table's name.
+
+    Returns:
+        dict[str, int]: `index_bytes` and `table_bytes`.
+    """
+    cursor = connection.cursor()
+    cursor.execute(
+        "SELECT pg_relation_size(%s), pg_relation_size(%s)",
+        (f"{table}_pkey", table),
+    )
+    index_bytes, table_bytes = cursor.fetchone()
+    return {"index_bytes": index_bytes, "table_bytes": table_bytes}
+
+
+def summarize(times: list[float], batch: int, rows: int) -> dict[str, float]:
+    """
+    Turn the batch times of a load into throughputs.
+
+    Args:
+        times (list[float]): The seconds each batch took.
+        batch (int): Rows per batch; the last batch may be short.
+        rows (int): Rows inserted in all.
+
+    Returns:
+        dict[str, float]: `rows_per_second` over the whole load and
+        `tail_rows_per_second` over its last tenth of batches.
+    """
+    tail = times[-max(1, len(times) // 10) :]
+    tail_rows = rows - batch * (len(times) - len(tail))
+    return {
+        "rows_per_second": round(rows / sum(times)),
+        "tail_rows_per_second": round(tail_rows / sum(tail)),
+    }
+
+
+def run(url: str, rows: int = 10_000_000, batch: int = 10_000) -> dict[str, Any]:
+    """
+    Load a scratch table per UUID version and measure it.
+
+    Args:
+        url (str): The database URL.
+        rows (int): Rows per table.
+        batch (int): Rows per batch.
+
+    Returns:
+        dict[str, Any]: The report, by version.
+    """
+    engine = create_engine(url, pool_size=1)
+    summary: dict[str, Any] = {}
+    connection = engine.raw_connection()
+    try:
+        for version, generate in GENERATORS.items():
+            table = f"uuid_bench_{version}"
+            try:
+                times = load(connection, table, generate, rows, batch)
+                summary[version] = {
+                    **summarize(times, batch, rows),
+                    **sizes(connection, table),
+                }
+            finally:
+                connection.rollback()
+                connection.cursor().execute(f"DROP TABLE IF EXISTS {table}")
+                connection.commit()
+    finally:
+        connection.close()
+        engine.dispose()
+    return summary
+
+
+def report(summary: dict[str, Any]) -> str:
+    """
+    Format a run for the terminal.
+
+    Args:
+        summary (dict[str, Any]): The result of `run`.
+
+    Returns:
+        str: The report.
+    """
+    lines = [
+        f"  {'version':<8} {'rows/s':>10} {'last 10%':>10} {'index':>10} {'table':>10}"
+    ]
+    lines += [
+        f"  {version:<8} {result['rows_per_second']:>10,} "
+        f"{result['tail_rows_per_second']:>10,} "
+        f"{result['index_bytes'] / 2**20:>7.1f} MB "
+        f"{result['table_bytes'] / 2**20:>7.1f} MB"
+        for version, result in summary.items()
+    ]
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--url", default=settings.DATABASE_URL)
+    parser.add_argument("--rows", type=int, default=10_000_000)
+    parser.add_argument("--batch", type=int, default=10_000)
+    parser.add_argument("--json", type=Path, help="Also write the report as JSON.")
+    args = parser.parse_args()
+
+    summary = run(args.url, args.rows, args.batch)
+    print(report(summary))
+    if args.json:
+        args.json.write_text(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
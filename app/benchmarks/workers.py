@@ -0,0 +1,212 @@
+"""
+Benchmark: throughput and memory of `fast_api.serve` by number of workers.
+
+For each worker count, starts `python -m fast_api.serve` on a free port,
+drives it with a load-test scenario from `loadtest`, then reads each worker's
+memory from /proc: RSS, PSS (each shared page divided among the processes
+sharing it) and private memory. Workers fork from a preloaded application
+with a frozen collector, so most of their RSS is shared with the master and
+with each other: PSS and private memory show what a worker really adds.
+
+Needs Linux and a migrated, seeded database at `DATABASE_URL`.
+
+Usage:
+    python -m benchmarks.workers --workers 1 2 4 8 --duration 20 --concurrency 32
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+import httpx
+from loadtest.runner import LoadTest, run
+
+APP_ROOT = Path(__file__).resolve().parents[1]
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+
+def free_port() -> int:
+    """Return a TCP port nobody listens on right now."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def child_pids(pid: int) -> list[int]:
+    """
+    List the child processes of a process.
+
+    Args:
+        pid (int): The parent's process id.
+
+    Returns:
+        list[int]: The children's process ids.
+    """
+    children = []
+    for entry in Path("/proc").iterdir():
+        if not entry.name.isdigit():
+            continue
+        try:
+            stat = (entry / "stat").read_text()
+        except OSError:
+            continue
+        # The command name, in parentheses, may contain spaces.
+        fields = stat[stat.rindex(")") + 2 :].split()
+        if int(fields[1]) == pid:
+            children.append(int(entry.name))
+    return children
+
+
+def memory(pid: int) -> dict[str, int]:
+    """
+    Read a process's memory use.
+
+    Args:
+        pid (int): The process id.
+
+    Returns:
+        dict[str, int]: `rss`, `pss` and `private` (clean and dirty) bytes.
+    """
+    values = {}
+    for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines()[1:]:
+        name, value = line.split(":", 1)
+        values[name] = int(value.split()[0]) * 1024
+    return {
+        "rss": values["Rss"],
+        "pss": values["Pss"],
+        "private": values["Private_Clean"] + values["Private_Dirty"],
+    }
+
+
+def wait_until_serving(master: subprocess.Popen, url: str, workers: int) -> None:
+    """
+    Wait until every worker runs and the server answers.
+
+    Args:
+        master (subprocess.Popen): The master process.
+        url (str): The server's base URL.
+        workers (int): The number of workers expected.
+
+    Raises:
+        RuntimeError: If the server is not up within the startup timeout.
+    """
+    deadline = time.monotonic() + STARTUP_TIMEOUT_SECONDS
+    while time.monotonic() < deadline:
+        if master.poll() is not None:
+            raise RuntimeError(f"The server exited with status {master.returncode}")
+        if len(child_pids(master.pid)) == workers:
+            try:
+                if httpx.get(f"{url}/metrics").status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+        time.sleep(0.2)
+    raise RuntimeError("The server did not start in time")
+
+
+def measure(
+    workers: int, scenario: str, concurrency: int, duration: float
+) -> dict[str, Any]:
+    """
+    Serve with a number of workers, load it, and measure it.
+
+    Args:
+        workers (int): The number of workers.
+        scenario (str): The load-test scenario.
+        concurrency (int): The virtual users running at the same time.
+        duration (float): Seconds of load.
+
+    Returns:
+        dict[str, Any]: Throughput, error rate, p99 latency and the mean
+        memory of a worker, in MiB.
+    """
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    command = [sys.executable, "-m", "fast_api.serve", "--port", str(port)]
+    command += ["--workers", str(workers), "--log-level", "warning"]
+    # Every virtual user shares one address: rate limits would throttle the load.
+    env = {**os.environ, "RATE_LIMIT_ENABLED": "false"}
+    master = subprocess.Popen(command, cwd=APP_ROOT, env=env)
+    try:
+        wait_until_serving(master, url, workers)
+        load_test = LoadTest(scenario, concurrency=concurrency, duration=duration)
+        summary = asyncio.run(run(load_test, base_url=url))
+        usage = [memory(pid) for pid in child_pids(master.pid)]
+        master_usage = memory(master.pid)
+    finally:
+        master.send_signal(signal.SIGTERM)
+        master.wait()
+
+    def mean_mib(key: str) -> float:
+        return round(statistics.mean(item[key] for item in usage) / 2**20, 1)
+
+    return {
+        "workers": workers,
+        "throughput_rps": summary["throughput_rps"],
+        "error_rate": summary["error_rate"],
+        "p99_ms": summary["latency_ms"]["p99"],
+        "worker_rss_mib": mean_mib("rss"),
+        "worker_pss_mib": mean_mib("pss"),
+        "worker_private_mib": mean_mib("private"),
+        "master_rss_mib": round(master_usage["rss"] / 2**20, 1),
+        "total_pss_mib": round(
+            (sum(item["pss"] for item in usage) + master_usage["pss"]) / 2**20, 1
+        ),
+    }
+
+
+def report(results: list[dict[str, Any]]) -> str:
+    """
+    Format the measurements as a table.
+
+    Args:
+        results (list[dict[str, Any]]): The results of `measure`.
+
+    Returns:
+        str: The table.
+    """
+    lines = [
+        f"{'workers':>7} {'req/s':>9} {'errors':>7} {'p99 ms':>8} "
+        f"{'RSS/w':>7} {'PSS/w':>7} {'priv/w':>7} {'total PSS':>10}  (MiB)"
+    ]
+    for item in results:
+        lines.append(
+            f"{item['workers']:>7} {item['throughput_rps']:>9.1f} "
+            f"{item['error_rate']:>7.2%} {item['p99_ms']:>8.1f} "
+            f"{item['worker_rss_mib']:>7.1f} {item['worker_pss_mib']:>7.1f} "
+            f"{item['worker_private_mib']:>7.1f} {item['total_pss_mib']:>10.1f}"
+        )
+    lines.append(f"CPUs available: {len(os.sched_getaffinity(0))}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--scenario", default="browse")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=20.0)
+    parser.add_argument("--json", type=Path, help="Also write the results as JSON.")
+    args = parser.parse_args()
+
+    results = [
+        measure(workers, args.scenario, args.concurrency, args.duration)
+        for workers in args.workers
+    ]
+    print(report(results))
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
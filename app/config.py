@@ -27,10 +27,107 @@ class Settings:
     DB_PORT: str = os.getenv("DB_PORT", "")
     DB_NAME: str = os.getenv("DB_NAME", "")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "")
+    BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    # Worker processes of `python -m fast_api.serve`; 0 means one per CPU.
+    SERVE_WORKERS: int = int(os.getenv("SERVE_WORKERS", "0"))
+    SERVE_GRACEFUL_TIMEOUT: float = float(os.getenv("SERVE_GRACEFUL_TIMEOUT", "30"))
     DATABASE_URL: str = os.getenv(
         "DATABASE_URL",
         f"postgresql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_NAME}",
     )
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "5"))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+    DB_CONNECT_TIMEOUT_SECONDS: int = int(os.getenv("DB_CONNECT_TIMEOUT_SECONDS", "5"))
+    DB_CIRCUIT_FAILURE_THRESHOLD: int = int(
+        os.getenv("DB_CIRCUIT_FAILURE_THRESHOLD", "5")
+    )
+    DB_CIRCUIT_RESET_SECONDS: float = float(os.getenv("DB_CIRCUIT_RESET_SECONDS", "10"))
+    # Whether routes' statement timeouts (declared in create_app) apply.
+    DB_STATEMENT_TIMEOUTS_ENABLED: bool = (
+        os.getenv("DB_STATEMENT_TIMEOUTS_ENABLED", "true").lower() == "true"
+    )
+    # Run the hottest queries as server-side prepared statements; turn off
+    # behind PgBouncer in transaction mode.
+    DB_PREPARED_STATEMENTS_ENABLED: bool = (
+        os.getenv("DB_PREPARED_STATEMENTS_ENABLED", "true").lower() == "true"
+    )
+    # Seconds between the writes of a worker's metrics for the others to sum.
+    METRICS_FLUSH_SECONDS: float = float(os.getenv("METRICS_FLUSH_SECONDS", "5"))
+    # Version of the UUIDs generated as primary keys: 7 (time-ordered) or 4.
+    DB_ID_VERSION: int = int(os.getenv("DB_ID_VERSION", "7"))
+    # Last good session and speaker reads kept to serve while the database is down.
+    SNAPSHOT_MAX_ENTRIES: int = int(os.getenv("SNAPSHOT_MAX_ENTRIES", "1024"))
+    # Threads running sync endpoints; 0 means DB_POOL_SIZE + DB_MAX_OVERFLOW.
+    THREADPOOL_SIZE: int = int(os.getenv("THREADPOOL_SIZE", "0"))
+    # Seconds a call may wait for a thread before a 503; 0 means no limit.
+    THREADPOOL_MAX_WAIT_SECONDS: float = float(
+        os.getenv("THREADPOOL_MAX_WAIT_SECONDS", "0")
+    )
+    ADMISSION_CONTROL_ENABLED: bool = (
+        os.getenv("ADMISSION_CONTROL_ENABLED", "false").lower() == "true"
+    )
+    ADMISSION_TARGET_LATENCY_MS: float = float(
+        os.getenv("ADMISSION_TARGET_LATENCY_MS", "200")
+    )
+    ADMISSION_INTERVAL_MS: float = float(os.getenv("ADMISSION_INTERVAL_MS", "500"))
+    ADMISSION_MAX_IN_FLIGHT: int = int(os.getenv("ADMISSION_MAX_IN_FLIGHT", "100"))
+    ADMISSION_RETRY_AFTER_SECONDS: int = int(
+        os.getenv("ADMISSION_RETRY_AFTER_SECONDS", "1")
+    )
+    RATE_LIMIT_ENABLED: bool = os.getenv("RATE_LIMIT_ENABLED", "true").lower() == "true"
+    # `memory` (per worker) or `redis` (shared by every worker).
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory")
+    RATE_LIMIT_URL: str = os.getenv("RATE_LIMIT_URL", "redis://localhost:6379/0")
+    RATE_LIMIT_MAX_KEYS: int = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+    RATE_LIMIT_LOGIN_PER_MINUTE: float = float(
+        os.getenv("RATE_LIMIT_LOGIN_PER_MINUTE", "10")
+    )
+    RATE_LIMIT_LOGIN_BURST: int = int(os.getenv("RATE_LIMIT_LOGIN_BURST", "5"))
+    RATE_LIMIT_SESSION_READS_PER_SECOND: float = float(
+        os.getenv("RATE_LIMIT_SESSION_READS_PER_SECOND", "50")
+    )
+    RATE_LIMIT_SESSION_READS_BURST: int = int(
+        os.getenv("RATE_LIMIT_SESSION_READS_BURST", "200")
+    )
+    RESPONSE_CACHE_ENABLED: bool = (
+        os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    )
+    RESPONSE_CACHE_TTL_SECONDS: float = float(
+        os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30")
+    )
+    RESPONSE_CACHE_STALE_SECONDS: float = float(
+        os.getenv("RESPONSE_CACHE_STALE_SECONDS", "30")
+    )
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "1024")
+    )
+    RESPONSE_CACHE_MAX_ENTRY_BYTES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_ENTRY_BYTES", "262144")
+    )
+    RESPONSE_CACHE_MAX_BYTES: int = int(
+        os.getenv("RESPONSE_CACHE_MAX_BYTES", "67108864")
+    )
+    SHARED_CACHE_BACKEND: str = os.getenv("SHARED_CACHE_BACKEND", "none")
+    SHARED_CACHE_URL: str = os.getenv("SHARED_CACHE_URL", "redis://localhost:6379/0")
+    SHARED_CACHE_KEY_PREFIX: str = os.getenv("SHARED_CACHE_KEY_PREFIX", "conference:")
+    SHARED_CACHE_CHANNEL: str = os.getenv(
+        "SHARED_CACHE_CHANNEL", "conference:cache-invalidation"
+    )
+    SLOW_QUERY_LOG_ENABLED: bool = (
+        os.getenv("SLOW_QUERY_LOG_ENABLED", "false").lower() == "true"
+    )
+    SLOW_QUERY_THRESHOLD_MS: float = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = float(
+        os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", "0.1")
+    )
+    SLOW_QUERY_LOG_PATH: str = os.getenv("SLOW_QUERY_LOG_PATH", "slow_queries.log")
+    SLOW_QUERY_LOG_MAX_BYTES: int = int(
+        os.getenv("SLOW_QUERY_LOG_MAX_BYTES", "10485760")
+    )
+    SLOW_QUERY_LOG_BACKUP_COUNT: int = int(
+        os.getenv("SLOW_QUERY_LOG_BACKUP_COUNT", "5")
+    )
+    SLOW_QUERY_TOP_N: int = int(os.getenv("SLOW_QUERY_TOP_N", "20"))
 
 
 settings = Settings()
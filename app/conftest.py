@@ -1,28 +1,38 @@
 import atexit
 import os
-import subprocess
 from datetime import datetime, timedelta
 
 import jwt
 import pytest
 from adapters.api.dependencies import get_db
+from adapters.database.template_database import TemplateDatabases
 from config import settings
 from fast_api.fast_api_app import create_app
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy_utils import create_database, database_exists, drop_database
+
+pytest_plugins = ["adapters.database.query_budget"]
+
+# Hash passwords at bcrypt's minimum cost: the tests check behaviour, not cost.
+settings.BCRYPT_ROUNDS = 4
 
 app = create_app()
-TEST_DB_NAME = f"test_db_{os.urandom(8).hex()}"
-TEST_DATABASE_URL = f"postgresql://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{TEST_DB_NAME}"
-SessionLocal = sessionmaker(autocommit=False, autoflush=False)
+test_databases = TemplateDatabases(settings.DATABASE_URL)
+# One database per pytest-xdist worker, or per run without xdist.
+TEST_DB_NAME = (
+    f"test_db_{os.getenv('PYTEST_XDIST_WORKER', 'main')}_{os.urandom(4).hex()}"
+)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    expire_on_commit=False,
+    join_transaction_mode="create_savepoint",
+)
 
 
 def cleanup_database():
-    if database_exists(TEST_DATABASE_URL):
-        drop_database(TEST_DATABASE_URL)
-        print(f"Test database {TEST_DB_NAME} dropped.")
+    test_databases.drop(TEST_DB_NAME)
 
 
 atexit.register(cleanup_database)
@@ -31,47 +41,33 @@ atexit.register(cleanup_database)
 @pytest.fixture(scope="session", autouse=True)
 def db_engine():
     """
-    Creates a new database engine for tests, ensuring UTF-8 encoding.
-    The database engine is created only once before the tests are run.
+    Creates this process's test database as a copy of the migrated and seeded
+    template, building the template first if needed, and drops it at the end.
     """
-    if not database_exists(TEST_DATABASE_URL):
-        create_database(TEST_DATABASE_URL, encoding="utf8")
+    from seed_data import seed_data
 
+    test_databases.ensure_template(seed_data)
     engine = create_engine(
-        TEST_DATABASE_URL,
+        test_databases.clone(TEST_DB_NAME),
         connect_args={"options": "-c client_encoding=utf8"},
     )
 
     SessionLocal.configure(bind=engine)
 
-    execute_alembic_migrations()
-
     yield engine
 
     engine.dispose()
-    drop_database(TEST_DATABASE_URL)
-
-
-def execute_alembic_migrations():
-    print("Executing Alembic migrations...")
-    project_root = os.path.dirname(os.path.abspath(__file__))
-
-    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
-
-    command = ["alembic", "-c", "alembic.ini", "upgrade", "heads"]
-    try:
-        subprocess.check_output(command, stderr=subprocess.STDOUT, text=True, cwd=project_root)
-        print("Alembic migrations executed successfully.")
-    except subprocess.CalledProcessError as e:
-        print("Error executing Alembic migrations:")
-        print(e.output)
+    test_databases.drop(TEST_DB_NAME)
 
 
 @pytest.fixture(scope="function")
 def db_session(db_engine):
     """
     Creates a new database session for a test.
-    This fixture is executed before each test function.
+
+    The session runs inside a transaction that is rolled back after the test;
+    its commits only release a SAVEPOINT, so a test can commit, or fail on a
+    constraint, without affecting the next one.
     """
     connection = db_engine.connect()
     transaction = connection.begin()
@@ -89,25 +85,36 @@ def setup_override_get_db(db_session):
     app.dependency_overrides[get_db] = lambda: db_session
 
 
-@pytest.fixture
-def client():
+@pytest.fixture(scope="function", autouse=True)
+def clear_response_cache():
     """
-    Creates a test client for the FastAPI application.
+    Empties the session read cache so cached rows never outlive a test's rollback.
     """
-    with TestClient(app) as client:
-        yield client
+    from core.session.cache import session_cache, session_flight
 
+    session_cache.clear()
+    session_flight.reset_stats()
+    yield
+    session_cache.clear()
 
-@pytest.fixture(scope="session", autouse=True)
-def initialize_seed_data(db_engine):
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_rate_limits():
     """
-    Seeds the database with initial data for tests.
+    Empties the rate limit buckets so one test's requests never throttle another's.
     """
-    from seed_data import seed_data
+    from dependencies.rate_limit import rate_limit_backend
+
+    rate_limit_backend().clear()
+
 
-    with SessionLocal(bind=db_engine) as session:
-        seed_data(session)
-    print("Seed data loaded for tests.")
+@pytest.fixture
+def client():
+    """
+    Creates a test client for the FastAPI application.
+    """
+    with TestClient(app) as client:
+        yield client
 
 
 @pytest.fixture(scope="function")
@@ -130,3 +137,19 @@ def admin_token(db_session):
     token = jwt.encode(payload, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
 
     return token
+
+
+@pytest.fixture(scope="function", autouse=True)
+def reset_database_breaker():
+    """
+    Closes the database circuit and forgets the snapshots taken while it was closed.
+    """
+    from adapters.database.circuit_breaker import database_breaker
+    from core.auth.cache import auth_snapshots
+    from core.session.cache import session_snapshots
+
+    database_breaker.reset()
+    session_snapshots.clear()
+    auth_snapshots.clear()
+    yield
+    database_breaker.reset()
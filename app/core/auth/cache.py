@@ -0,0 +1,42 @@
+"""
+Snapshots of authentication and authorization checks.
+
+They let a user who was recently authorized keep reading cached data while
+the database is unavailable.
+"""
+
+from config import settings
+from core.common.cache import cache_key
+from core.common.snapshot import SnapshotStore
+
+USER_NAMESPACE = "user"
+PERMISSION_NAMESPACE = "permission"
+
+auth_snapshots = SnapshotStore(max_entries=settings.SNAPSHOT_MAX_ENTRIES)
+
+
+def user_key(user_id) -> str:
+    """
+    Return the snapshot key of a user.
+
+    Args:
+        user_id: The ID of the user.
+
+    Returns:
+        str: The snapshot key.
+    """
+    return cache_key(USER_NAMESPACE, user_id)
+
+
+def permission_key(user_id, permission_codename: str) -> str:
+    """
+    Return the snapshot key of a permission granted to a user.
+
+    Args:
+        user_id: The ID of the user.
+        permission_codename (str): The codename of the permission.
+
+    Returns:
+        str: The snapshot key.
+    """
+    return cache_key(PERMISSION_NAMESPACE, user_id, permission_codename)
@@ -3,13 +3,33 @@ Authentication service.
 """
 
 from datetime import datetime, timedelta
+from functools import cache
+from typing import TYPE_CHECKING
 
 import jwt
 from config import settings
 from core.auth.ports.repository import UserRepository
-from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+
+@cache
+def password_context() -> "CryptContext":
+    """
+    Return the bcrypt context that hashes and verifies passwords.
+
+    It is built, and passlib imported, on the first call rather than when a
+    worker starts.
+
+    Returns:
+        CryptContext: The context, at `settings.BCRYPT_ROUNDS`.
+    """
+    from passlib.context import CryptContext
+
+    return CryptContext(
+        schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS
+    )
 
 
 class AuthService:
@@ -64,4 +84,4 @@ class AuthService:
         Returns:
             bool: True if the password matches, False otherwise.
         """
-        return pwd_context.verify(plain_password, hashed_password)
+        return password_context().verify(plain_password, hashed_password)
@@ -0,0 +1,79 @@
+import anyio.to_thread
+import pytest
+from core.common.test_base import TestBase
+from dependencies.rate_limit import (
+    LOGIN_RATE_LIMIT,
+    SESSION_READ_RATE_LIMIT,
+    rate_limit_backend,
+)
+from httpx import Response
+
+
+class TestRateLimitAPI(TestBase):
+    """
+    Tests for the per-route rate limits.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_token: str, monkeypatch):
+        """
+        Setup for each test, with the buckets' clock stopped so none refills.
+
+        Args:
+            admin_token (str): The admin token for authentication.
+        """
+        self.headers = {"Authorization": f"Bearer {admin_token}"}
+        monkeypatch.setattr(rate_limit_backend(), "clock", lambda: 0.0)
+
+    def test_login_is_limited_per_address(self):
+        """
+        Test that logins past the burst get a 429 with `Retry-After`.
+        """
+        credentials = {"email": "nobody@example.com", "password": "wrong"}
+        for _ in range(LOGIN_RATE_LIMIT.burst):
+            response: Response = self.client.post(
+                "/api/v1/auth/login", json=credentials
+            )
+            assert response.status_code == 401
+
+        response = self.client.post("/api/v1/auth/login", json=credentials)
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["code"] == "RATE_LIMITED"
+
+    def test_refused_request_takes_no_thread(self, monkeypatch):
+        """
+        Test that a 429 borrows no threadpool thread, statement budget included.
+        """
+        credentials = {"email": "nobody@example.com", "password": "wrong"}
+        for _ in range(LOGIN_RATE_LIMIT.burst):
+            self.client.post("/api/v1/auth/login", json=credentials)
+        calls = []
+        run_sync = anyio.to_thread.run_sync
+
+        async def counting_run_sync(func, *args, **kwargs):
+            calls.append(func)
+            return await run_sync(func, *args, **kwargs)
+
+        monkeypatch.setattr(anyio.to_thread, "run_sync", counting_run_sync)
+
+        response: Response = self.client.post("/api/v1/auth/login", json=credentials)
+
+        assert response.status_code == 429
+        assert calls == []
+
+    def test_session_reads_are_limited_per_user(self):
+        """
+        Test that an authenticated reader has a bucket apart from anonymous ones.
+        """
+        for _ in range(SESSION_READ_RATE_LIMIT.burst):
+            self.client.get("/api/v1/session/speakers")
+
+        anonymous: Response = self.client.get("/api/v1/session/speakers")
+        authenticated: Response = self.client.get(
+            "/api/v1/session/speakers", headers=self.headers
+        )
+
+        assert anonymous.status_code == 429
+        assert authenticated.status_code == 200
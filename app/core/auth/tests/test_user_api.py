@@ -45,6 +45,17 @@ class TestUserAPI(TestBase):
             assert "email" in user
             assert "is_active" in user
 
+    def test_list_users_query_budget(self, query_budget):
+        """
+        Test the SQL statements of an authorized page of users.
+        """
+        with query_budget(max_queries=5):
+            self.client.get(
+                f"{self.base_url}/",
+                params={"page": 1, "limit": 10},
+                headers=self.headers,
+            )
+
     def test_retrieve_user(self):
         """
         Test retrieving a specific user by ID.
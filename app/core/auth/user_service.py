@@ -3,10 +3,10 @@ User service implementation.
 """
 
 from core.auth.ports.repository import UserRepository
+from core.auth.services import password_context
 from core.auth.schemas import UserCreate, UserDetail, UserOut, UserUpdate
 from core.common.pagination import Paginated, PaginatedResponse, PaginationParams
 from core.exceptions.custom_exceptions import CustomAPIException
-from passlib.hash import bcrypt
 
 
 class UserService:
@@ -45,7 +45,7 @@ class UserService:
         Returns:
             str: The hashed password.
         """
-        return bcrypt.hash(password)
+        return password_context().hash(password)
 
     def create_user(self, user_data: UserCreate) -> UserOut:
         """
@@ -0,0 +1,377 @@
+"""
+In-process LRU + TTL response cache, optionally backed by a shared tier.
+"""
+
+import json
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+from core.common.cache_backend import CacheBackend
+from core.common.serialization import to_json
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    """A cached value with its size and freshness deadlines."""
+
+    value: Any
+    size: int
+    fresh_until: float
+    stale_until: float
+    refreshing: bool = False
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Serialize a cached value; its length is also the entry's size.
+
+    Args:
+        value (Any): A Pydantic model or a string.
+
+    Returns:
+        bytes: The serialized value.
+    """
+    if isinstance(value, BaseModel):
+        return to_json(value)
+    return str(value).encode("utf-8")
+
+
+def decode_text(raw: bytes) -> str:
+    """
+    Deserialize a string value stored by `encode_value`.
+
+    Args:
+        raw (bytes): The serialized value.
+
+    Returns:
+        str: The string value.
+    """
+    return raw.decode("utf-8")
+
+
+def cache_key(namespace: str, *parts: Any, **params: Any) -> str:
+    """
+    Build a normalized cache key.
+
+    Keyword parameters are sorted and `None` values dropped, so the same query
+    always maps to the same key regardless of argument order.
+
+    Args:
+        namespace (str): The key namespace, used for prefix invalidation.
+        *parts (Any): Positional key components, such as a resource ID.
+        **params (Any): Query parameters.
+
+    Returns:
+        str: The cache key.
+    """
+    segments = [namespace, *(str(part).lower() for part in parts)]
+    query = "&".join(
+        f"{name}={value}" for name, value in sorted(params.items()) if value is not None
+    )
+    if query:
+        segments.append(query)
+    return ":".join(segments)
+
+
+class ResponseCache:
+    """
+    Thread-safe LRU cache with TTL, stale-while-revalidate and size caps.
+
+    Fresh entries are served directly. Once an entry expires it may still be
+    served for `stale_seconds` while exactly one caller reloads it; everybody
+    else keeps getting the stale value instead of piling onto the database.
+    Values larger than `max_entry_bytes` are never stored, so a single large
+    page cannot evict the rest of the cache.
+
+    With a shared `CacheBackend` attached, local misses are looked up in the
+    shared tier before calling the loader, loaded values are written through,
+    and invalidations are deleted there and broadcast to the other workers.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = 30.0,
+        stale_seconds: float = 30.0,
+        max_entry_bytes: int = 256 * 1024,
+        max_total_bytes: int = 64 * 1024 * 1024,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept.
+            ttl_seconds (float): How long an entry is fresh.
+            stale_seconds (float): How long an expired entry may still be served
+                while it is being revalidated.
+            max_entry_bytes (int): Entries larger than this are not cached.
+            max_total_bytes (int): Upper bound for the sum of entry sizes.
+            enabled (bool): When False every lookup goes straight to the loader.
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self.max_entry_bytes = max_entry_bytes
+        self.max_total_bytes = max_total_bytes
+        self.enabled = enabled
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._generation = 0
+        self._size_bytes = 0
+        self._hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._rejected = 0
+        self._shared_hits = 0
+        self._shared_errors = 0
+        self._shared: Optional[CacheBackend] = None
+        self._channel: Optional[str] = None
+        self._origin = uuid.uuid4().hex
+
+    def attach_shared(self, backend: CacheBackend, channel: str) -> None:
+        """
+        Use `backend` as the shared second level and listen for invalidations.
+
+        Args:
+            backend (CacheBackend): The shared backend.
+            channel (str): The pub/sub channel carrying invalidations.
+        """
+        self._shared = backend
+        self._channel = channel
+        backend.subscribe(channel, self._on_invalidation, on_reset=self._clear_local)
+
+    def detach_shared(self) -> None:
+        """
+        Stop using the shared tier and close it.
+        """
+        backend, self._shared, self._channel = self._shared, None, None
+        if backend is not None:
+            backend.close()
+
+    def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Optional[T]],
+        decode: Optional[Callable[[bytes], T]] = None,
+    ) -> Optional[T]:
+        """
+        Return the cached value for `key`, loading it on a miss.
+
+        `None` results are returned but never cached.
+
+        Args:
+            key (str): The cache key.
+            loader (Callable[[], Optional[T]]): Produces the value on a miss.
+            decode (Optional[Callable[[bytes], T]]): Rebuilds a value read from the
+                shared tier. Without it the entry is kept in-process only.
+
+        Returns:
+            Optional[T]: The cached or freshly loaded value.
+        """
+        if not self.enabled:
+            return loader()
+
+        now = self._clock()
+        stale_entry: Optional[_Entry] = None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if now < entry.fresh_until:
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return entry.value
+                if now < entry.stale_until:
+                    if entry.refreshing:
+                        self._stale_hits += 1
+                        return entry.value
+                    entry.refreshing = True
+                    stale_entry = entry
+            generation = self._generation
+
+        shared = self._shared if decode is not None else None
+        if shared is not None:
+            raw = self._shared_call(shared.get, key)
+            value = self._shared_call(decode, raw) if raw is not None else None
+            if value is not None:
+                with self._lock:
+                    self._shared_hits += 1
+                self._store(key, value, generation, len(raw))
+                return value
+
+        if stale_entry is None:
+            with self._lock:
+                self._misses += 1
+
+        try:
+            value = loader()
+        except Exception:
+            if stale_entry is None:
+                raise
+            # Serve the stale value rather than failing while it is still allowed.
+            with self._lock:
+                stale_entry.refreshing = False
+                self._stale_hits += 1
+            return stale_entry.value
+
+        if value is None:
+            with self._lock:
+                if stale_entry is not None and self._entries.get(key) is stale_entry:
+                    self._remove(key)
+            return None
+
+        # Encode once: the bytes are both the entry's size and the shared copy.
+        raw = encode_value(value)
+        if self._store(key, value, generation, len(raw)) and shared is not None:
+            self._shared_call(shared.set, key, raw, self.ttl_seconds)
+        return value
+
+    def invalidate(self, *keys: str) -> None:
+        """
+        Drop the given keys, locally and in the shared tier.
+
+        Args:
+            *keys (str): The keys to drop.
+        """
+        self._invalidate_local(keys=keys)
+        if self._shared is not None:
+            self._shared_call(self._shared.delete, *keys)
+            self._broadcast({"keys": list(keys)})
+
+    def invalidate_prefix(self, prefix: str) -> None:
+        """
+        Drop every key starting with `prefix`, locally and in the shared tier.
+
+        Args:
+            prefix (str): The key prefix, usually a namespace.
+        """
+        self._invalidate_local(prefix=prefix)
+        if self._shared is not None:
+            self._shared_call(self._shared.delete_prefix, prefix)
+            self._broadcast({"prefix": prefix})
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = self._stale_hits = self._misses = 0
+            self._evictions = self._rejected = 0
+            self._shared_hits = self._shared_errors = 0
+
+    def stats(self) -> dict[str, float]:
+        """
+        Return hit ratio and memory usage statistics.
+
+        Returns:
+            dict[str, float]: Counters, the hit ratio, the number of entries and
+            their serialized size in bytes.
+        """
+        with self._lock:
+            served = self._hits + self._stale_hits + self._shared_hits
+            lookups = served + self._misses
+            return {
+                "hits": self._hits,
+                "stale_hits": self._stale_hits,
+                "shared_hits": self._shared_hits,
+                "shared_errors": self._shared_errors,
+                "misses": self._misses,
+                "hit_ratio": served / lookups if lookups else 0.0,
+                "evictions": self._evictions,
+                "rejected_oversize": self._rejected,
+                "entries": len(self._entries),
+                "size_bytes": self._size_bytes,
+            }
+
+    def _store(self, key: str, value: Any, generation: int, size: int) -> bool:
+        """Insert a loaded value unless it was invalidated while loading."""
+        now = self._clock()
+        with self._lock:
+            if generation != self._generation:
+                # A write happened while loading: the value may already be outdated.
+                self._remove(key)
+                return False
+            if size > self.max_entry_bytes:
+                self._rejected += 1
+                self._remove(key)
+                return False
+            self._remove(key)
+            self._entries[key] = _Entry(
+                value=value,
+                size=size,
+                fresh_until=now + self.ttl_seconds,
+                stale_until=now + self.ttl_seconds + self.stale_seconds,
+            )
+            self._size_bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries
+                or self._size_bytes > self.max_total_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size_bytes -= evicted.size
+                self._evictions += 1
+        return True
+
+    def _invalidate_local(
+        self, keys: tuple[str, ...] = (), prefix: Optional[str] = None
+    ) -> None:
+        """Drop keys and/or a prefix from the in-process level only."""
+        with self._lock:
+            self._generation += 1
+            for key in keys:
+                self._remove(key)
+            if prefix is not None:
+                for key in [key for key in self._entries if key.startswith(prefix)]:
+                    self._remove(key)
+
+    def _clear_local(self) -> None:
+        """Drop every in-process entry, keeping the statistics."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._size_bytes = 0
+
+    def _broadcast(self, payload: dict) -> None:
+        """Tell the other workers to drop their in-process copies."""
+        message = json.dumps({"origin": self._origin, **payload})
+        self._shared_call(self._shared.publish, self._channel, message)
+
+    def _on_invalidation(self, message: str) -> None:
+        """Apply an invalidation broadcast by another worker."""
+        payload = json.loads(message)
+        if payload.get("origin") == self._origin:
+            return
+        self._invalidate_local(
+            keys=tuple(payload.get("keys", ())), prefix=payload.get("prefix")
+        )
+
+    def _shared_call(self, method: Callable[..., T], *args: Any) -> Optional[T]:
+        """Call the shared tier, degrading to in-process only on failure."""
+        try:
+            return method(*args)
+        except Exception as exc:  # pylint: disable=broad-except
+            with self._lock:
+                self._shared_errors += 1
+            logger.warning("Shared cache call %s failed: %s", method.__name__, exc)
+            return None
+
+    def _remove(self, key: str) -> None:
+        """Remove a key; the caller must hold the lock."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size_bytes -= entry.size
@@ -0,0 +1,153 @@
+"""
+Cache backend interface and in-process implementation.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Optional
+
+
+class CacheBackend(ABC):
+    """
+    Shared key/value store with pub/sub, used as the second cache level.
+
+    Values are opaque bytes; serialization is up to the caller.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Retrieve a value.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[bytes]: The stored value, or None if missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        """
+        Store a value with a time to live.
+
+        Args:
+            key (str): The key.
+            value (bytes): The value.
+            ttl_seconds (float): Seconds until the value expires.
+        """
+
+    @abstractmethod
+    def delete(self, *keys: str) -> None:
+        """
+        Delete keys.
+
+        Args:
+            *keys (str): The keys to delete.
+        """
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> None:
+        """
+        Delete every key starting with `prefix`.
+
+        Args:
+            prefix (str): The key prefix.
+        """
+
+    @abstractmethod
+    def publish(self, channel: str, message: str) -> None:
+        """
+        Publish a message to every subscriber of a channel.
+
+        Args:
+            channel (str): The channel name.
+            message (str): The message.
+        """
+
+    @abstractmethod
+    def subscribe(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """
+        Call `callback` for every message published on `channel`.
+
+        Args:
+            channel (str): The channel name.
+            callback (Callable[[str], None]): Receives each message.
+            on_reset (Optional[Callable[[], None]]): Called whenever messages may
+                have been missed, e.g. after a reconnect.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """
+        Release connections and stop subscriptions.
+        """
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Process-local `CacheBackend`, for single-worker setups and tests.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        """
+        Initialize the backend.
+
+        Args:
+            clock (Callable[[], float]): Monotonic clock, overridable in tests.
+        """
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._values: dict[str, tuple[bytes, float]] = {}
+        self._subscribers: dict[str, list[Callable[[str], None]]] = {}
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            item = self._values.get(key)
+            if item is None:
+                return None
+            value, expires_at = item
+            if self._clock() >= expires_at:
+                del self._values[key]
+                return None
+            return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (value, self._clock() + ttl_seconds)
+
+    def delete(self, *keys: str) -> None:
+        with self._lock:
+            for key in keys:
+                self._values.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> None:
+        with self._lock:
+            for key in [key for key in self._values if key.startswith(prefix)]:
+                del self._values[key]
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            callbacks = list(self._subscribers.get(channel, []))
+        for callback in callbacks:
+            callback(message)
+
+    def subscribe(
+        self,
+        channel: str,
+        callback: Callable[[str], None],
+        on_reset: Optional[Callable[[], None]] = None,
+    ) -> None:
+        with self._lock:
+            self._subscribers.setdefault(channel, []).append(callback)
+
+    def close(self) -> None:
+        with self._lock:
+            self._values.clear()
+            self._subscribers.clear()
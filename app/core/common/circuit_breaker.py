@@ -0,0 +1,135 @@
+"""
+Circuit breaker for calls to a dependency that may go down.
+
+Closed, calls go through and consecutive failures are counted. After
+`failure_threshold` of them the circuit opens: calls are refused at once for
+`reset_timeout` seconds instead of each waiting for its own timeout. Then it
+is half-open: a single call goes through as a probe while the others are
+still refused. The probe's success closes the circuit, its failure opens it
+again for another `reset_timeout`.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of calling through an open circuit.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        """
+        Initialize the error.
+
+        Args:
+            name (str): The circuit's name.
+            retry_after (float): Seconds until the next probe may go through.
+        """
+        super().__init__(f"Circuit {name} is open")
+        self.retry_after = retry_after
+
+
+class CircuitBreaker:
+    """
+    Thread-safe circuit breaker.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        reset_timeout: float = 10.0,
+        is_failure: Callable[[BaseException], bool] = lambda exc: True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize a closed circuit.
+
+        Args:
+            name (str): The circuit's name, for errors and metrics.
+            failure_threshold (int): Consecutive failures that open the circuit.
+            reset_timeout (float): Seconds the circuit stays open before a probe.
+            is_failure (Callable[[BaseException], bool]): Whether an exception
+                shows the dependency is down; others count as successes, since
+                the dependency answered.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.is_failure = is_failure
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        """`closed`, `open` or `half_open`."""
+        with self._lock:
+            if self._state == OPEN and self._probe_due():
+                return HALF_OPEN
+            return self._state
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        """
+        Run the enclosed call through the circuit.
+
+        Raises:
+            CircuitOpenError: If the circuit refuses the call.
+        """
+        probe = self._admit()
+        try:
+            yield
+        except BaseException as exc:
+            if self.is_failure(exc):
+                self._record_failure(probe)
+            else:
+                self._record_success(probe)
+            raise
+        self._record_success(probe)
+
+    def reset(self) -> None:
+        """Close the circuit and forget the failures."""
+        with self._lock:
+            self._state, self._failures, self._probing = CLOSED, 0, False
+
+    def _probe_due(self) -> bool:
+        """Whether an open circuit's timeout is over; call with the lock held."""
+        return self.clock() - self._opened_at >= self.reset_timeout
+
+    def _admit(self) -> bool:
+        """Let a call through or refuse it; return whether it is a probe."""
+        with self._lock:
+            if self._state == CLOSED:
+                return False
+            if self._state == OPEN and self._probe_due():
+                self._state = HALF_OPEN
+            if self._state == HALF_OPEN and not self._probing:
+                self._probing = True
+                return True
+            retry_after = self._opened_at + self.reset_timeout - self.clock()
+            raise CircuitOpenError(self.name, max(retry_after, 0.0))
+
+    def _record_success(self, probe: bool) -> None:
+        with self._lock:
+            self._failures = 0
+            if probe:
+                self._state, self._probing = CLOSED, False
+
+    def _record_failure(self, probe: bool) -> None:
+        with self._lock:
+            self._failures += 1
+            if probe or self._failures >= self.failure_threshold:
+                self._state, self._probing = OPEN, False
+                self._opened_at = self.clock()
@@ -0,0 +1,528 @@
+"""
+In-process metrics rendered in the Prometheus text exposition format.
+
+Every metric keeps one array of values per thread. A thread only ever writes its
+own array, so recording a value takes no lock and never waits for a scrape or
+for another request; a scrape sums the arrays of all threads. When a thread
+exits, as idle threadpool workers do, its array is folded into a base total and
+dropped, so the arrays kept never outnumber the live threads.
+
+Worker processes of `fast_api.serve` share their metrics through a directory:
+each writes its totals there now and then, and the one answering a scrape sums
+the files of all workers, so `/metrics` reports the whole server whichever
+worker accepts the scrape.
+"""
+
+import bisect
+import json
+import math
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Sequence
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _ThreadMarker:
+    """Object held only by a thread's local storage, freed when the thread exits."""
+
+    __slots__ = ("__weakref__",)
+
+
+class _ThreadShards:
+    """Per-thread arrays of values, summed on read."""
+
+    def __init__(self, size: int):
+        """
+        Initialize the shards.
+
+        Args:
+            size (int): Number of values per array.
+        """
+        self.size = size
+        self._local = threading.local()
+        self._shards: dict[int, list[float]] = {}
+        self._base = [0.0] * size
+        self._lock = threading.Lock()
+
+    def local(self) -> list[float]:
+        """Return the calling thread's array, creating it on first use."""
+        try:
+            return self._local.values
+        except AttributeError:
+            values = [0.0] * self.size
+            marker = _ThreadMarker()
+            with self._lock:
+                self._shards[id(marker)] = values
+            self._local.values = values
+            self._local.marker = marker
+            weakref.finalize(marker, self._retire, id(marker))
+            return values
+
+    def _retire(self, key: int) -> None:
+        """Fold the array of an exited thread into the base total."""
+        with self._lock:
+            values = self._shards.pop(key, None)
+            if values is not None:
+                self._base = [base + value for base, value in zip(self._base, values)]
+
+    def totals(self) -> list[float]:
+        """Return the element-wise sum of the base and every thread's array."""
+        with self._lock:
+            shards = [self._base, *self._shards.values()]
+        return [sum(column) for column in zip(*shards)]
+
+    def reset(self) -> None:
+        """Start again from zero, e.g. in a process forked after recording."""
+        with self._lock:
+            self._shards = {}
+            self._base = [0.0] * self.size
+            # Freed after the lock is released: it runs the `_retire` finalizers.
+            previous, self._local = self._local, threading.local()
+        del previous
+
+
+class Registry:
+    """
+    Collection of metrics rendered together.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._metrics: list["Metric"] = []
+        self.directory: Optional[Path] = None
+
+    def register(self, metric: "Metric") -> None:
+        """
+        Add a metric to the registry.
+
+        Args:
+            metric (Metric): The metric.
+
+        Raises:
+            ValueError: If a metric with the same name is already registered.
+        """
+        if any(existing.name == metric.name for existing in self._metrics):
+            raise ValueError(f"Metric {metric.name} is already registered.")
+        self._metrics.append(metric)
+
+    def render(self) -> str:
+        """
+        Render every metric in the Prometheus text format.
+
+        Once shared, the values are the sums over every process sharing the
+        directory: counters and histograms include exited processes, gauges
+        only live ones.
+
+        Returns:
+            str: The exposition text.
+        """
+        if self.directory is None:
+            samples = self.snapshot()
+        else:
+            self.write_snapshot()
+            samples = self._merge_shared()
+        return "".join(
+            f"{line}\n"
+            for metric in self._metrics
+            for line in metric.collect(samples.get(metric.name, {}))
+        )
+
+    def snapshot(self) -> dict[str, dict[tuple[str, ...], list[float]]]:
+        """
+        Return the totals of this process.
+
+        Returns:
+            dict[str, dict[tuple[str, ...], list[float]]]: The totals of each
+            label set, by metric name.
+        """
+        return {metric.name: metric.snapshot() for metric in self._metrics}
+
+    def reset(self) -> None:
+        """Set every metric back to zero, in a process forked after recording."""
+        for metric in self._metrics:
+            metric.reset()
+
+    def share(self, directory: str) -> None:
+        """
+        Share this process's metrics with the others writing to `directory`.
+
+        Args:
+            directory (str): A directory private to the processes of one server.
+        """
+        self.directory = Path(directory)
+        self.write_snapshot()
+
+    def write_snapshot(self) -> None:
+        """Write this process's totals to the shared directory, if any."""
+        if self.directory is None:
+            return
+        data = {
+            name: [[list(labels), totals] for labels, totals in children.items()]
+            for name, children in self.snapshot().items()
+        }
+        path = self.directory / f"{os.getpid()}.json"
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(data))
+        os.replace(temporary, path)
+
+    def _merge_shared(self) -> dict[str, dict[tuple[str, ...], list[float]]]:
+        """Sum the totals written by every process to the shared directory."""
+        gauges = {metric.name for metric in self._metrics if metric.kind == "gauge"}
+        merged: dict[str, dict[tuple[str, ...], list[float]]] = {}
+        for path in self.directory.glob("*.json"):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue  # Removed or replaced meanwhile.
+            alive = _is_alive(int(path.stem))
+            for name, children in data.items():
+                if name in gauges and not alive:
+                    continue
+                metric = merged.setdefault(name, {})
+                for labels, totals in children:
+                    current = metric.get(tuple(labels))
+                    metric[tuple(labels)] = (
+                        totals
+                        if current is None
+                        else [a + b for a, b in zip(current, totals)]
+                    )
+        return merged
+
+
+registry = Registry()
+
+
+def _is_alive(pid: int) -> bool:
+    """Return whether a process exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class Metric:
+    """
+    Base class of metrics, optionally split by labels.
+    """
+
+    kind = "untyped"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        registry: Optional[Registry] = registry,
+    ):
+        """
+        Initialize the metric and add it to a registry.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Sequence[str]): The label names, in order.
+            registry (Optional[Registry]): The registry, or None for none.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: dict[tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def labels(self, *labelvalues: str):
+        """
+        Return the child recording values for a set of label values.
+
+        Args:
+            *labelvalues (str): The label values, in the order of `labelnames`.
+
+        Returns:
+            The child, with the recording methods of the metric.
+
+        Raises:
+            ValueError: If the number of label values is wrong.
+        """
+        child = self._children.get(labelvalues)
+        if child is None:
+            if len(labelvalues) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}.")
+            with self._lock:
+                child = self._children.get(labelvalues)
+                if child is None:
+                    child = self._child(_ThreadShards(self._size()))
+                    self._children[labelvalues] = child
+        return child
+
+    def _child(self, shards: _ThreadShards):
+        """Create the child recording into `shards`."""
+        raise NotImplementedError
+
+    def _size(self) -> int:
+        """Return the number of values kept per label set."""
+        return 1
+
+    def snapshot(self) -> dict[tuple[str, ...], list[float]]:
+        """
+        Return the totals of each label set.
+
+        Returns:
+            dict[tuple[str, ...], list[float]]: The totals, by label values.
+        """
+        with self._lock:
+            children = list(self._children.items())
+        return {labelvalues: child.shards.totals() for labelvalues, child in children}
+
+    def reset(self) -> None:
+        """Set every label set back to zero."""
+        with self._lock:
+            for child in self._children.values():
+                child.shards.reset()
+
+    def collect(
+        self, samples: Optional[dict[tuple[str, ...], list[float]]] = None
+    ) -> Iterator[str]:
+        """
+        Yield the metric's exposition lines.
+
+        Args:
+            samples (Optional[dict[tuple[str, ...], list[float]]]): The totals
+                to render, by label values; by default this process's.
+
+        Returns:
+            Iterator[str]: The lines, without line breaks.
+        """
+        if samples is None:
+            samples = self.snapshot()
+        yield f"# HELP {self.name} {_escape_help(self.documentation)}"
+        yield f"# TYPE {self.name} {self.kind}"
+        for labelvalues, totals in sorted(samples.items()):
+            labels = dict(zip(self.labelnames, labelvalues))
+            yield from self._samples(labels, totals)
+
+    def _samples(self, labels: dict[str, str], totals: list[float]) -> Iterator[str]:
+        """Yield the sample lines of one label set."""
+        yield _sample(self.name, labels, totals[0])
+
+
+class _CounterChild:
+    """Counter values of one label set."""
+
+    __slots__ = ("shards",)
+
+    def __init__(self, shards: _ThreadShards):
+        self.shards = shards
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the value by `amount`."""
+        self.shards.local()[0] += amount
+
+
+class _GaugeChild(_CounterChild):
+    """Gauge values of one label set."""
+
+    __slots__ = ()
+
+    def dec(self, amount: float = 1) -> None:
+        """Decrease the value by `amount`."""
+        self.shards.local()[0] -= amount
+
+
+class Counter(Metric):
+    """
+    Monotonically increasing value, e.g. `requests.labels("GET").inc()`.
+    """
+
+    kind = "counter"
+
+    def _child(self, shards: _ThreadShards) -> _CounterChild:
+        """Create the child recording into `shards`."""
+        return _CounterChild(shards)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increase an unlabelled counter.
+
+        Args:
+            amount (float): The increment.
+        """
+        self.labels().inc(amount)
+
+
+class Gauge(Metric):
+    """
+    Value that goes up and down.
+    """
+
+    kind = "gauge"
+
+    def _child(self, shards: _ThreadShards) -> _GaugeChild:
+        """Create the child recording into `shards`."""
+        return _GaugeChild(shards)
+
+    def inc(self, amount: float = 1) -> None:
+        """
+        Increase an unlabelled gauge.
+
+        Args:
+            amount (float): The increment.
+        """
+        self.labels().inc(amount)
+
+    def dec(self, amount: float = 1) -> None:
+        """
+        Decrease an unlabelled gauge.
+
+        Args:
+            amount (float): The decrement.
+        """
+        self.labels().dec(amount)
+
+
+class GaugeFunction(Metric):
+    """
+    Gauge whose value is computed when the metrics are rendered.
+    """
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        function: Callable[[], float],
+        registry: Optional[Registry] = registry,
+    ):
+        """
+        Initialize the gauge.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            function (Callable[[], float]): Returns the current value.
+            registry (Optional[Registry]): The registry, or None for none.
+        """
+        super().__init__(name, documentation, registry=registry)
+        self.function = function
+
+    def snapshot(self) -> dict[tuple[str, ...], list[float]]:
+        """
+        Return the current value.
+
+        Returns:
+            dict[tuple[str, ...], list[float]]: The value, without labels.
+        """
+        return {(): [self.function()]}
+
+
+class Histogram(Metric):
+    """
+    Distribution of observed values in cumulative buckets.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        registry: Optional[Registry] = registry,
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            labelnames (Sequence[str]): The label names, in order.
+            buckets (Sequence[float]): The upper bounds of the buckets, ascending;
+                a `+Inf` bucket is always added.
+            registry (Optional[Registry]): The registry, or None for none.
+        """
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _size(self) -> int:
+        """Return one count per bucket, the `+Inf` count and the sum."""
+        return len(self.buckets) + 2
+
+    def _child(self, shards: _ThreadShards) -> "_HistogramChild":
+        """Create the child recording into `shards`."""
+        return _HistogramChild(shards, self.buckets)
+
+    def observe(self, value: float) -> None:
+        """
+        Record a value in an unlabelled histogram.
+
+        Args:
+            value (float): The observed value.
+        """
+        self.labels().observe(value)
+
+    def _samples(self, labels: dict[str, str], totals: list[float]) -> Iterator[str]:
+        """Yield the cumulative buckets, the sum and the count of one label set."""
+        count = 0.0
+        for bound, observed in zip(self.buckets + (math.inf,), totals):
+            count += observed
+            yield _sample(
+                f"{self.name}_bucket", {**labels, "le": _format(bound)}, count
+            )
+        yield _sample(f"{self.name}_sum", labels, totals[-1])
+        yield _sample(f"{self.name}_count", labels, count)
+
+
+class _HistogramChild:
+    """Histogram values of one label set."""
+
+    __slots__ = ("shards", "buckets")
+
+    def __init__(self, shards: _ThreadShards, buckets: tuple[float, ...]):
+        self.shards = shards
+        self.buckets = buckets
+
+    def observe(self, value: float) -> None:
+        """Count `value` in its bucket and add it to the sum."""
+        values = self.shards.local()
+        values[bisect.bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+
+def _sample(name: str, labels: dict[str, str], value: float) -> str:
+    """Format a sample line."""
+    if not labels:
+        return f"{name} {_format(value)}"
+    pairs = ",".join(
+        f'{label}="{_escape_label(str(text))}"' for label, text in labels.items()
+    )
+    return f"{name}{{{pairs}}} {_format(value)}"
+
+
+def _format(value: float) -> str:
+    """Format a sample value, writing whole numbers without a decimal point."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if math.isnan(value):
+        return "NaN"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape_label(text: str) -> str:
+    """Escape a label value."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _escape_help(text: str) -> str:
+    """Escape a help text."""
+    return text.replace("\\", "\\\\").replace("\n", "\\n")
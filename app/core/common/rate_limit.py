@@ -0,0 +1,130 @@
+"""
+Token-bucket rate limiting.
+
+Every key has a bucket holding up to `burst` tokens, refilled at `rate` tokens
+per second; a request takes one token or is refused. Buckets are stored by a
+`RateLimitBackend`: in-process for one worker, or a shared server so that
+several workers enforce one limit.
+"""
+
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """
+    The limit applied to a group of routes.
+
+    Attributes:
+        name (str): The policy name, part of every bucket key.
+        rate (float): Tokens added per second.
+        burst (int): The most tokens a bucket holds.
+        per (str): `user` to key buckets by authenticated user, falling back
+            to the client address, or `ip` to always use the client address.
+    """
+
+    name: str
+    rate: float
+    burst: int
+    per: str = "ip"
+
+
+def take_token(
+    tokens: float, elapsed: float, rate: float, burst: float, cost: float = 1.0
+) -> tuple[float, float]:
+    """
+    Refill a bucket for the time elapsed, then take tokens from it.
+
+    Args:
+        tokens (float): The tokens left at the last update.
+        elapsed (float): Seconds since the last update.
+        rate (float): Tokens added per second.
+        burst (float): The most tokens the bucket holds.
+        cost (float): The tokens the request needs.
+
+    Returns:
+        tuple[float, float]: The tokens left, and 0 if the request is allowed
+        or else the seconds until enough tokens are available.
+    """
+    tokens = min(burst, tokens + max(0.0, elapsed) * rate)
+    if tokens >= cost:
+        return tokens - cost, 0.0
+    return tokens, (cost - tokens) / rate
+
+
+class RateLimitBackend(ABC):
+    """
+    Storage of token buckets.
+    """
+
+    # Whether `take` may block on I/O, so callers on the event loop must run
+    # it in a thread.
+    blocking = False
+
+    @abstractmethod
+    def take(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        """
+        Take tokens from a bucket, creating it full if missing.
+
+        Args:
+            key (str): The bucket key.
+            rate (float): Tokens added per second.
+            burst (int): The most tokens the bucket holds.
+            cost (float): The tokens the request needs.
+
+        Returns:
+            float: 0 if the request is allowed, or else the seconds until it
+            would be.
+        """
+
+
+class InMemoryRateLimitBackend(RateLimitBackend):
+    """
+    Token buckets of one process, with a bounded number of keys.
+
+    Buckets are kept in least-recently-used order, so each update is O(1)
+    and the idlest key is evicted past `max_keys`. A bucket idle for
+    `burst / rate` seconds is full again, so evicting it loses nothing.
+    """
+
+    def __init__(
+        self, max_keys: int = 100_000, clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize an empty backend.
+
+        Args:
+            max_keys (int): The most buckets kept.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.max_keys = max_keys
+        self.clock = clock
+        self._buckets: "OrderedDict[str, tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rate: float, burst: int, cost: float = 1.0) -> float:
+        now = self.clock()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                tokens, wait = take_token(burst, 0.0, rate, burst, cost)
+            else:
+                tokens, wait = take_token(bucket[0], now - bucket[1], rate, burst, cost)
+                self._buckets.move_to_end(key)
+            self._buckets[key] = (tokens, now)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+    def clear(self) -> None:
+        """Forget every bucket."""
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self) -> int:
+        return len(self._buckets)
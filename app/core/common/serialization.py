@@ -0,0 +1,50 @@
+"""
+Fast JSON serialization for responses and cached values.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from pydantic import BaseModel
+
+# `Z` for UTC offsets, like Pydantic, so both encoders produce the same output.
+ORJSON_OPTIONS = orjson.OPT_UTC_Z
+
+
+def _default(value: Any) -> Any:
+    """
+    Convert values orjson does not handle natively.
+
+    Args:
+        value (Any): The value orjson could not serialize.
+
+    Returns:
+        Any: A serializable equivalent.
+
+    Raises:
+        TypeError: If the value has no JSON representation.
+    """
+    if isinstance(value, BaseModel):
+        return value.model_dump(by_alias=True)
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def to_json(value: Any) -> bytes:
+    """
+    Serialize a value to JSON in a single pass.
+
+    Pydantic models are dumped to Python objects and encoded by orjson, which
+    handles UUID, datetime, date and enum values natively.
+
+    Args:
+        value (Any): A Pydantic model or any JSON-compatible value.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    if isinstance(value, BaseModel):
+        value = value.model_dump(by_alias=True)
+    return orjson.dumps(value, default=_default, option=ORJSON_OPTIONS)
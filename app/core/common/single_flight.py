@@ -0,0 +1,111 @@
+"""
+Single-flight coalescing of concurrent identical loads.
+"""
+
+import threading
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call(Generic[T]):
+    """One in-flight load and the callers waiting for it."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.value: Optional[T] = None
+        self.error: Optional[BaseException] = None
+
+    def result(self) -> T:
+        """Return the loaded value or re-raise the loader's exception."""
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+
+class SingleFlight:
+    """
+    Lets concurrent callers asking for the same key share one load.
+
+    The first caller for a key (the leader) runs the loader; callers arriving
+    while it runs wait for it and receive the same value or exception. Once the
+    load finishes the key is forgotten, so the next caller starts a fresh load:
+    nothing is cached here.
+
+    Callers are sync endpoints running in the threadpool, and followers block
+    on the leader: while they wait, each keeps its threadpool thread and the
+    pooled database connection its request already used for the version query.
+    A burst of identical misses thus saves queries but not threads or
+    connections.
+    """
+
+    def __init__(self):
+        """
+        Initialize an empty set of flights.
+        """
+        self._lock = threading.Lock()
+        self._calls: dict[str, _Call] = {}
+        self._flights = 0
+        self._coalesced = 0
+
+    def do(self, key: str, loader: Callable[[], T]) -> T:
+        """
+        Run `loader`, or wait for the identical load already in flight.
+
+        Args:
+            key (str): Identifies the load; callers with equal keys share it.
+            loader (Callable[[], T]): Produces the value.
+
+        Returns:
+            T: The value produced by the leading call.
+        """
+        call, leader = self._join(key)
+        if leader:
+            self._run(key, call, loader)
+        else:
+            call.done.wait()
+        return call.result()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Return coalescing counters.
+
+        Returns:
+            dict[str, int]: Loads actually run (`flights`), callers that shared
+            another caller's load (`coalesced`) and loads running right now
+            (`in_flight`).
+        """
+        with self._lock:
+            return {
+                "flights": self._flights,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._calls),
+            }
+
+    def reset_stats(self) -> None:
+        """Reset the counters."""
+        with self._lock:
+            self._flights = self._coalesced = 0
+
+    def _join(self, key: str) -> tuple[_Call, bool]:
+        """Return the flight for `key` and whether the caller leads it."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                self._coalesced += 1
+                return call, False
+            call = self._calls[key] = _Call()
+            self._flights += 1
+            return call, True
+
+    def _run(self, key: str, call: _Call, loader: Callable[[], T]) -> None:
+        """Run the leading load and release everybody waiting for it."""
+        try:
+            call.value = loader()
+        except BaseException as exc:  # pylint: disable=broad-except
+            call.error = exc
+        finally:
+            with self._lock:
+                if self._calls.get(key) is call:
+                    del self._calls[key]
+                call.done.set()
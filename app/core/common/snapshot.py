@@ -0,0 +1,94 @@
+"""
+Last known-good values, served while their source is unavailable.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class Snapshot:
+    """
+    A value as it was last read.
+
+    Attributes:
+        value (Any): The value.
+        taken_at (float): When it was read, in seconds since the epoch.
+    """
+
+    value: Any
+    taken_at: float
+
+    def age(self) -> float:
+        """Return the seconds since the value was read."""
+        return max(0.0, time.time() - self.taken_at)
+
+
+class SnapshotStore:
+    """
+    Bounded, thread-safe store of the latest value per key.
+
+    Unlike the response cache, entries never expire: an old value is still
+    better than none while the source is down. Past `max_entries`, the least
+    recently read or written key is dropped.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize an empty store.
+
+        Args:
+            max_entries (int): The most keys kept.
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Snapshot]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, key: str, value: Any) -> None:
+        """
+        Record the latest value of a key.
+
+        Args:
+            key (str): The key.
+            value (Any): The value, kept by reference.
+        """
+        with self._lock:
+            self._entries[key] = Snapshot(value, time.time())
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str) -> Optional[Snapshot]:
+        """
+        Return the latest value of a key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            Optional[Snapshot]: The snapshot, or None if the key was never
+            recorded or was dropped.
+        """
+        with self._lock:
+            snapshot = self._entries.get(key)
+            if snapshot is not None:
+                self._entries.move_to_end(key)
+            return snapshot
+
+    def discard(self, key: str) -> None:
+        """
+        Forget a key, e.g. once its value is known to be outdated.
+
+        Args:
+            key (str): The key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Forget every key."""
+        with self._lock:
+            self._entries.clear()
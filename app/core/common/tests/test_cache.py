@@ -0,0 +1,95 @@
+from core.common.cache import ResponseCache, cache_key
+
+
+class FakeClock:
+    """
+    Manually advanced clock for cache expiry tests.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestResponseCache:
+    """
+    Tests for the in-process response cache.
+    """
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.cache = ResponseCache(
+            max_entries=2,
+            ttl_seconds=10,
+            stale_seconds=5,
+            max_entry_bytes=100,
+            clock=self.clock,
+        )
+
+    def test_cache_key_is_normalized(self):
+        """
+        Test that keyword order and None values do not change the key.
+        """
+        assert cache_key("sessions", page=1, limit=10, search=None) == cache_key(
+            "sessions", limit=10, page=1
+        )
+
+    def test_hit_and_expiry(self):
+        """
+        Test that fresh entries are served and expired ones are reloaded.
+        """
+        calls = []
+
+        def loader():
+            calls.append(1)
+            return "value"
+
+        assert self.cache.get_or_load("a", loader) == "value"
+        assert self.cache.get_or_load("a", loader) == "value"
+        assert len(calls) == 1
+
+        self.clock.now = 16
+        self.cache.get_or_load("a", loader)
+        assert len(calls) == 2
+        assert self.cache.stats()["hit_ratio"] == 1 / 3
+
+    def test_stale_while_revalidate(self):
+        """
+        Test that a single caller refreshes while others get the stale value.
+        """
+        self.cache.get_or_load("a", lambda: "old")
+        self.clock.now = 12
+
+        def refresh():
+            assert self.cache.get_or_load("a", lambda: "unused") == "old"
+            return "new"
+
+        assert self.cache.get_or_load("a", refresh) == "new"
+        assert self.cache.get_or_load("a", lambda: "unused") == "new"
+        assert self.cache.stats()["stale_hits"] == 1
+
+    def test_lru_eviction_and_entry_size_cap(self):
+        """
+        Test that the least recently used entry is evicted and oversize ones skipped.
+        """
+        self.cache.get_or_load("a", lambda: "a")
+        self.cache.get_or_load("b", lambda: "b")
+        self.cache.get_or_load("a", lambda: "a")
+        self.cache.get_or_load("c", lambda: "c")
+        self.cache.get_or_load("big", lambda: "x" * 101)
+
+        stats = self.cache.stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["rejected_oversize"] == 1
+        assert self.cache.get_or_load("b", lambda: "reloaded") == "reloaded"
+
+    def test_invalidate_prefix(self):
+        """
+        Test that prefix invalidation drops a whole namespace.
+        """
+        self.cache.get_or_load("sessions:1", lambda: "one")
+        self.cache.invalidate_prefix("sessions:")
+        assert self.cache.get_or_load("sessions:1", lambda: "two") == "two"
@@ -0,0 +1,84 @@
+import pytest
+from core.common.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class Down(Exception):
+    pass
+
+
+class TestCircuitBreaker:
+    """
+    Tests for the circuit breaker's state machine.
+    """
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(
+            "test",
+            failure_threshold=2,
+            reset_timeout=10.0,
+            is_failure=lambda exc: isinstance(exc, Down),
+            clock=self.clock,
+        )
+
+    def fail(self):
+        with pytest.raises(Down):
+            with self.breaker.guard():
+                raise Down()
+
+    def test_consecutive_failures_open_the_circuit(self):
+        """
+        Test that only consecutive failures count, and that open refuses calls.
+        """
+        self.fail()
+        with self.breaker.guard():
+            pass
+        with pytest.raises(ValueError):
+            with self.breaker.guard():
+                raise ValueError()
+        self.fail()
+        assert self.breaker.state == CLOSED
+
+        self.fail()
+        assert self.breaker.state == OPEN
+        self.clock.now = 4.0
+        with pytest.raises(CircuitOpenError) as error:
+            with self.breaker.guard():
+                pass
+        assert error.value.retry_after == 6.0
+
+    def test_half_open_lets_a_single_probe_through(self):
+        """
+        Test that one probe goes through, and that its outcome sets the state.
+        """
+        self.fail()
+        self.fail()
+        self.clock.now = 10.0
+        assert self.breaker.state == HALF_OPEN
+
+        with pytest.raises(Down):
+            with self.breaker.guard():
+                with pytest.raises(CircuitOpenError):
+                    with self.breaker.guard():
+                        pass
+                raise Down()
+        assert self.breaker.state == OPEN
+
+        self.clock.now = 20.0
+        with self.breaker.guard():
+            pass
+        assert self.breaker.state == CLOSED
@@ -0,0 +1,109 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from core.common.metrics import Counter, Gauge, GaugeFunction, Histogram, Registry
+
+
+class TestMetrics:
+    """
+    Tests for the thread-sharded metrics and their text rendering.
+    """
+
+    def setup_method(self):
+        self.registry = Registry()
+
+    def test_counter_sums_every_thread(self):
+        """
+        Test that increments from many threads are all counted.
+        """
+        counter = Counter("jobs_total", "Jobs run.", ("queue",), registry=self.registry)
+
+        def work(_):
+            for _ in range(1000):
+                counter.labels("exports").inc()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+
+        assert 'jobs_total{queue="exports"} 8000\n' in self.registry.render()
+
+    def test_exited_threads_are_folded_into_the_total(self):
+        """
+        Test that short-lived threads leave no arrays behind and lose no values.
+        """
+        histogram = Histogram(
+            "job_seconds", "Job time.", buckets=(1.0,), registry=self.registry
+        )
+
+        def work():
+            for _ in range(10):
+                histogram.observe(0.5)
+
+        for _ in range(200):
+            thread = threading.Thread(target=work)
+            thread.start()
+            thread.join()
+
+        shards = histogram.labels().shards
+        assert len(shards._shards) == 0
+        assert shards.totals() == [2000.0, 0.0, 1000.0]
+
+    def test_shared_directory_sums_processes(self, tmp_path):
+        """
+        Test that a shared registry adds the counters of every process and the
+        gauges of live ones only.
+        """
+        counter = Counter("jobs_total", "Jobs run.", registry=self.registry)
+        gauge = Gauge("jobs_running", "Jobs running.", registry=self.registry)
+        counter.inc(3)
+        gauge.inc(2)
+        self.registry.share(str(tmp_path))
+        dead_pid = 2**22 + 1  # Above the largest possible pid_max.
+        for pid in (os.getppid(), dead_pid):
+            (tmp_path / f"{pid}.json").write_text(
+                '{"jobs_total": [[[], [5.0]]], "jobs_running": [[[], [1.0]]]}'
+            )
+
+        text = self.registry.render()
+
+        assert "jobs_total 13\n" in text
+        assert "jobs_running 3\n" in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        """
+        Test bucket boundaries, sum and count of a histogram.
+        """
+        histogram = Histogram(
+            "latency_seconds", "Latency.", buckets=(0.1, 1.0), registry=self.registry
+        )
+        for value in (0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        lines = self.registry.render().splitlines()
+
+        assert lines == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{le="0.1"} 1',
+            'latency_seconds_bucket{le="1"} 2',
+            'latency_seconds_bucket{le="+Inf"} 3',
+            "latency_seconds_sum 3.6",
+            "latency_seconds_count 3",
+        ]
+
+    def test_labels_are_escaped_and_checked(self):
+        """
+        Test label escaping and that a wrong number of labels is rejected.
+        """
+        counter = Counter("hits_total", "Hits.", ("path",), registry=self.registry)
+        counter.labels('/a"b\\').inc(2)
+        GaugeFunction("answer", "Answer.", lambda: 42, registry=self.registry)
+
+        text = self.registry.render()
+
+        assert 'hits_total{path="/a\\"b\\\\"} 2\n' in text
+        assert "answer 42\n" in text
+        with pytest.raises(ValueError):
+            counter.labels()
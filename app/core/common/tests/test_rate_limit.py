@@ -0,0 +1,44 @@
+from core.common.rate_limit import InMemoryRateLimitBackend
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestInMemoryRateLimit:
+    """
+    Tests for the in-process token buckets.
+    """
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.backend = InMemoryRateLimitBackend(max_keys=2, clock=self.clock)
+
+    def test_burst_then_refill(self):
+        """
+        Test that a bucket allows its burst, then one request per refilled token.
+        """
+        assert [self.backend.take("ip:a", rate=2, burst=3) for _ in range(3)] == [0] * 3
+        assert self.backend.take("ip:a", rate=2, burst=3) == 0.5
+
+        self.clock.now = 0.5
+        assert self.backend.take("ip:a", rate=2, burst=3) == 0
+        assert self.backend.take("ip:a", rate=2, burst=3) > 0
+
+    def test_least_recently_used_key_is_evicted(self):
+        """
+        Test that memory stays bounded by evicting the idlest bucket.
+        """
+        self.backend.take("ip:a", rate=1, burst=1)
+        self.backend.take("ip:b", rate=1, burst=1)
+        self.backend.take("ip:a", rate=1, burst=1)
+        self.backend.take("ip:c", rate=1, burst=1)
+
+        assert len(self.backend) == 2
+        # `a` kept its empty bucket; `b` was evicted and starts over full.
+        assert self.backend.take("ip:a", rate=1, burst=1) > 0
+        assert self.backend.take("ip:b", rate=1, burst=1) == 0
@@ -0,0 +1,69 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from core.common.single_flight import SingleFlight
+
+
+def wait_for(condition, timeout: float = 2.0) -> None:
+    """
+    Poll until `condition()` is true, failing the test after `timeout` seconds.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not reached in time"
+        time.sleep(0.005)
+
+
+class TestSingleFlight:
+    """
+    Tests for single-flight load coalescing.
+    """
+
+    def setup_method(self):
+        self.flight = SingleFlight()
+        self.release = threading.Event()
+        self.calls = 0
+
+    def loader(self) -> str:
+        self.calls += 1
+        self.release.wait(2)
+        return "session"
+
+    def test_threads_share_one_load(self):
+        """
+        Test that concurrent threadpool callers run the loader once.
+        """
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [
+                pool.submit(self.flight.do, "key", self.loader) for _ in range(8)
+            ]
+            wait_for(lambda: self.flight.stats()["coalesced"] == 7)
+            self.release.set()
+            results = [future.result(timeout=2) for future in futures]
+
+        assert results == ["session"] * 8
+        assert self.calls == 1
+        assert self.flight.stats() == {"flights": 1, "coalesced": 7, "in_flight": 0}
+
+    def test_errors_reach_every_waiter_and_are_not_kept(self):
+        """
+        Test that a failing load raises in every caller and the next call retries.
+        """
+
+        def failing_loader():
+            self.release.wait(2)
+            raise RuntimeError("database unavailable")
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [
+                pool.submit(self.flight.do, "key", failing_loader) for _ in range(3)
+            ]
+            wait_for(lambda: self.flight.stats()["coalesced"] == 2)
+            self.release.set()
+            for future in futures:
+                with pytest.raises(RuntimeError):
+                    future.result(timeout=2)
+
+        assert self.flight.do("key", lambda: "recovered") == "recovered"
@@ -0,0 +1,109 @@
+import asyncio
+import threading
+
+import anyio.to_thread
+import pytest
+from core.common.threadpool import (
+    ThreadpoolLimiter,
+    install_thread_limiter,
+    iterate_in_threadpool,
+    queue_wait,
+    rejections,
+)
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+def sample(metric, name: str) -> float:
+    """
+    Return the value of an unlabelled sample of a metric.
+    """
+    for line in metric.collect():
+        if line.startswith(f"{name} "):
+            return float(line.split()[1])
+    return 0.0
+
+
+class TestThreadpoolLimiter:
+    """
+    Tests for the bounded threadpool limiter.
+    """
+
+    def test_call_is_refused_after_the_maximum_wait(self):
+        """
+        Test that a call waiting longer than `max_wait` is refused with a 503.
+        """
+        release = threading.Event()
+        refused_before = sample(rejections, "threadpool_rejections_total")
+
+        async def scenario():
+            limiter = ThreadpoolLimiter(1, max_wait=0.05)
+            install_thread_limiter(limiter)
+            busy = asyncio.ensure_future(anyio.to_thread.run_sync(release.wait, 2))
+            await asyncio.sleep(0.01)
+            try:
+                with pytest.raises(ServiceUnavailableError) as error:
+                    await anyio.to_thread.run_sync(lambda: None)
+            finally:
+                release.set()
+                await busy
+            return limiter, error.value
+
+        limiter, error = run(scenario())
+
+        assert error.status_code == 503
+        assert error.code == "THREADPOOL_SATURATED"
+        assert error.retry_after == 1
+        assert sample(rejections, "threadpool_rejections_total") == refused_before + 1
+        assert limiter.borrowed_tokens == 0
+
+    def test_streaming_iteration_is_never_refused(self):
+        """
+        Test that a response body waits for a busy thread instead of failing.
+        """
+        release = threading.Event()
+
+        async def scenario():
+            limiter = ThreadpoolLimiter(1, max_wait=0.01)
+            install_thread_limiter(limiter)
+            busy = asyncio.ensure_future(anyio.to_thread.run_sync(release.wait, 2))
+            await asyncio.sleep(0.01)
+            asyncio.get_running_loop().call_later(0.1, release.set)
+            chunks = [chunk async for chunk in iterate_in_threadpool(iter("abc"))]
+            await busy
+            return limiter, chunks
+
+        limiter, chunks = run(scenario())
+
+        assert chunks == ["a", "b", "c"]
+        assert limiter.borrowed_tokens == 0
+
+    def test_call_without_maximum_wait_queues_and_is_timed(self):
+        """
+        Test that calls queue for a busy thread and their wait is observed.
+        """
+        observed_before = sample(queue_wait, "threadpool_queue_wait_seconds_count")
+
+        async def scenario():
+            limiter = ThreadpoolLimiter(1)
+            install_thread_limiter(limiter)
+            assert anyio.to_thread.current_default_thread_limiter() is limiter
+            idents = await asyncio.gather(
+                *(
+                    anyio.to_thread.run_sync(lambda: threading.get_ident())
+                    for _ in range(3)
+                )
+            )
+            return limiter, idents
+
+        limiter, idents = run(scenario())
+
+        assert len(idents) == 3
+        assert (
+            sample(queue_wait, "threadpool_queue_wait_seconds_count")
+            == observed_before + 3
+        )
+        assert limiter.statistics().tasks_waiting == 0
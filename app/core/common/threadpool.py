@@ -0,0 +1,195 @@
+"""
+Bounded threadpool for sync endpoints and dependencies.
+
+FastAPI runs every sync endpoint and dependency through
+`anyio.to_thread.run_sync`, which takes a token from anyio's default capacity
+limiter, 40 threads unless configured. When more calls arrive than there are
+tokens they queue without limit, and a request that waited long enough is
+useless to its client by the time it runs. `ThreadpoolLimiter` replaces the
+default limiter: it times how long each call waits for a thread and, with a
+maximum wait, refuses a call that could not get one in time with a 503.
+
+The 503 is only possible before the response starts: streaming bodies iterated
+with `iterate_in_threadpool` wait for threads as long as it takes.
+"""
+
+import logging
+import math
+import time
+from typing import AsyncIterator, Iterator, Optional, TypeVar
+
+import anyio
+import anyio.to_thread
+from core.common.metrics import Counter, Histogram
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+_DONE = object()
+
+queue_wait = Histogram(
+    "threadpool_queue_wait_seconds",
+    "Time a sync endpoint or dependency waited for a threadpool thread.",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+rejections = Counter(
+    "threadpool_rejections_total",
+    "Calls refused because no threadpool thread was free within the maximum wait.",
+)
+
+
+class ThreadpoolLimiter:
+    """
+    Capacity limiter measuring, and optionally bounding, the wait for a token.
+
+    anyio's `CapacityLimiter` cannot be subclassed, so this wraps one and
+    offers the part of its interface `anyio.to_thread` and the metrics use.
+    """
+
+    def __init__(self, total_tokens: int, max_wait: Optional[float] = None):
+        """
+        Initialize the limiter, from the event loop it limits.
+
+        Args:
+            total_tokens (int): The number of threads that may run at once.
+            max_wait (Optional[float]): Seconds a call may wait for a thread
+                before it is refused, or None to wait as long as it takes.
+        """
+        self._limiter = anyio.CapacityLimiter(total_tokens)
+        self.max_wait = max_wait
+        self.retry_after = max(1, math.ceil(max_wait or 0))
+
+    @property
+    def total_tokens(self) -> float:
+        """The number of threads that may run at once."""
+        return self._limiter.total_tokens
+
+    @total_tokens.setter
+    def total_tokens(self, value: float) -> None:
+        self._limiter.total_tokens = value
+
+    @property
+    def borrowed_tokens(self) -> int:
+        """The number of threads running."""
+        return self._limiter.borrowed_tokens
+
+    @property
+    def available_tokens(self) -> float:
+        """The number of threads free."""
+        return self._limiter.available_tokens
+
+    def statistics(self):
+        """Return the wrapped limiter's statistics, including the waiting tasks."""
+        return self._limiter.statistics()
+
+    async def __aenter__(self) -> None:
+        """
+        Take a token, waiting at most `max_wait` seconds for one.
+
+        Raises:
+            ServiceUnavailableError: If no token was free within `max_wait`.
+        """
+        await self._acquire(self.max_wait)
+
+    async def __aexit__(self, *exc_info) -> None:
+        """Give the token back."""
+        self._limiter.release()
+
+    def unbounded(self) -> "_UnboundedWait":
+        """
+        Return a view of the limiter that waits for a token as long as it takes.
+
+        Returns:
+            _UnboundedWait: The view, sharing the limiter's tokens.
+        """
+        return _UnboundedWait(self)
+
+    async def _acquire(self, max_wait: Optional[float]) -> None:
+        """Take a token, refusing the call after `max_wait` seconds if set."""
+        try:
+            self._limiter.acquire_nowait()
+        except anyio.WouldBlock:
+            pass
+        else:
+            queue_wait.observe(0.0)
+            return
+
+        started = time.perf_counter()
+        if max_wait is None:
+            await self._limiter.acquire()
+        else:
+            acquired = False
+            with anyio.move_on_after(max_wait):
+                await self._limiter.acquire()
+                acquired = True
+            if not acquired:
+                rejections.inc()
+                raise ServiceUnavailableError(
+                    "The server is busy, try again later.",
+                    code="THREADPOOL_SATURATED",
+                    retry_after=self.retry_after,
+                )
+        queue_wait.observe(time.perf_counter() - started)
+
+
+class _UnboundedWait:
+    """A `ThreadpoolLimiter` taking its tokens without a maximum wait."""
+
+    def __init__(self, limiter: ThreadpoolLimiter):
+        self.limiter = limiter
+
+    async def __aenter__(self) -> None:
+        await self.limiter._acquire(None)
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.limiter.__aexit__(*exc_info)
+
+
+async def iterate_in_threadpool(iterator: Iterator[T]) -> AsyncIterator[T]:
+    """
+    Iterate a blocking iterator in the threadpool, never refusing a step.
+
+    Starlette's own `iterate_in_threadpool`, which `StreamingResponse` uses for
+    sync iterators, goes through the default limiter and its maximum wait: once
+    the headers are sent, a refusal could only cut the body short.
+
+    Args:
+        iterator (Iterator[T]): The iterator, e.g. a response body.
+
+    Returns:
+        AsyncIterator[T]: Its items.
+    """
+    limiter = anyio.to_thread.current_default_thread_limiter()
+    if isinstance(limiter, ThreadpoolLimiter):
+        limiter = limiter.unbounded()
+    while True:
+        item = await anyio.to_thread.run_sync(next, iterator, _DONE, limiter=limiter)
+        if item is _DONE:
+            return
+        yield item
+
+
+def install_thread_limiter(limiter: ThreadpoolLimiter) -> None:
+    """
+    Make a limiter the default of `anyio.to_thread` in the running event loop.
+
+    anyio has no public way to replace the default limiter, only to resize it,
+    so this sets the run variable holding it in the asyncio backend; anyio is
+    pinned in `pyproject.toml` for that reason. Should a later anyio move it,
+    the default limiter is resized instead and waits are neither measured nor
+    bounded.
+
+    Args:
+        limiter (ThreadpoolLimiter): The limiter.
+    """
+    try:
+        from anyio._backends._asyncio import _default_thread_limiter
+    except ImportError:
+        logger.warning(
+            "Cannot replace anyio's default thread limiter; only resizing it."
+        )
+        current = anyio.to_thread.current_default_thread_limiter()
+        current.total_tokens = limiter.total_tokens
+        return
+    _default_thread_limiter.set(limiter)
@@ -43,3 +43,64 @@ class CustomAPIException(Exception):
         """Initialize the CustomAPIException"""
         self.status_code = status_code
         self.detail = detail
+
+
+class ServiceUnavailableError(Exception):
+    """
+    Custom exception for requests refused while the service is overloaded.
+
+    This exception is raised when a request is shed instead of being queued.
+    It includes a status code (503 Service Unavailable), an error code naming
+    the reason, a detailed error message and the seconds after which the client
+    may retry."""
+
+    def __init__(self, detail: str, code: str, retry_after: int = 1):
+        """Init the ServiceUnavailableError"""
+        self.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        self.detail = detail
+        self.code = code
+        self.retry_after = retry_after
+
+
+class TooManyRequestsError(Exception):
+    """
+    Custom exception for requests over a client's rate limit.
+
+    It includes a status code (429 Too Many Requests), a detailed error message
+    and the seconds after which the client may retry."""
+
+    def __init__(self, detail: str, retry_after: int = 1):
+        """Init the TooManyRequestsError"""
+        self.status_code = status.HTTP_429_TOO_MANY_REQUESTS
+        self.detail = detail
+        self.retry_after = retry_after
+
+
+class DatabaseUnavailableError(ServiceUnavailableError):
+    """
+    Custom exception for database calls refused or failed while it is down.
+
+    Reads with a snapshot fall back to it; anything else answers 503."""
+
+    def __init__(self, retry_after: int = 1):
+        """Init the DatabaseUnavailableError"""
+        super().__init__(
+            "The database is unavailable, try again later.",
+            code="DATABASE_UNAVAILABLE",
+            retry_after=retry_after,
+        )
+
+
+class StatementTimeoutError(ServiceUnavailableError):
+    """
+    Custom exception for requests whose SQL statement ran past its route's budget.
+
+    Postgres cancelled the statement; the request answers 503."""
+
+    def __init__(self, retry_after: int = 1):
+        """Init the StatementTimeoutError"""
+        super().__init__(
+            "The request took too long and was cancelled.",
+            code="STATEMENT_TIMEOUT",
+            retry_after=retry_after,
+        )
@@ -0,0 +1,195 @@
+"""
+Columnar (Arrow IPC / Parquet) writer for the attendance export.
+
+Needs the optional `pyarrow` dependency: `poetry install --with analytics`.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Sequence
+
+from core.export.schemas import ColumnarFormat, Partitioning
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - optional dependency
+    pa = pc = pacsv = pq = None
+
+PARTITION_COLUMN = "attendance_time"
+PARTITION_NAMES = {
+    Partitioning.DAY: "attendance_date",
+    Partitioning.MONTH: "attendance_month",
+}
+# Name Hive, Spark and pyarrow.dataset use for rows whose partition value is null.
+NULL_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+@dataclass
+class ColumnarExportResult:
+    """
+    Outcome of a columnar export.
+
+    Attributes:
+        rows (int): Number of rows written.
+        files (list[Path]): The files written, in order.
+    """
+
+    rows: int = 0
+    files: list[Path] = field(default_factory=list)
+
+
+def attendance_schema(columns: Sequence[str]) -> "pa.Schema":
+    """
+    Build the Arrow schema of the projected attendance columns.
+
+    Args:
+        columns (Sequence[str]): The projected columns, in order.
+
+    Returns:
+        pa.Schema: The schema.
+    """
+    types = {
+        "attendance_id": pa.string(),
+        "attendance_time": pa.timestamp("us"),
+        "session_id": pa.string(),
+        "session_title": pa.string(),
+        "session_start_time": pa.timestamp("us"),
+        "user_id": pa.string(),
+        "user_email": pa.string(),
+    }
+    return pa.schema([(column, types[column]) for column in columns])
+
+
+def write_attendance(
+    csv_blocks: Iterable[bytes],
+    output_dir: Path,
+    fetched: Sequence[str],
+    columns: Sequence[str],
+    file_format: ColumnarFormat,
+    partitioning: Partitioning,
+) -> ColumnarExportResult:
+    """
+    Write attendance CSV blocks to Arrow IPC or Parquet files.
+
+    Blocks must be ordered by attendance time, with unknown times last, as
+    returned by `ExportRepository.iter_attendance_csv`: each partition is then
+    one contiguous run and is written to a single file, Hive-style
+    (`attendance_date=2024-11-30/part-0.parquet`), readable directly with
+    `pyarrow.dataset` or pandas. Arrow IPC files are uncompressed so they can be
+    memory-mapped without copying.
+
+    Args:
+        csv_blocks (Iterable[bytes]): CSV blocks of whole rows, without a header.
+        output_dir (Path): Directory receiving the files; must be empty or missing.
+        fetched (Sequence[str]): The columns of the CSV blocks, in order; must
+            include `attendance_time` when partitioning.
+        columns (Sequence[str]): The columns to write, in order.
+        file_format (ColumnarFormat): Arrow IPC or Parquet.
+        partitioning (Partitioning): How rows are split into files by date.
+
+    Returns:
+        ColumnarExportResult: The number of rows and the files written.
+
+    Raises:
+        RuntimeError: If pyarrow is not installed.
+        FileExistsError: If `output_dir` is not empty.
+    """
+    if pa is None:
+        raise RuntimeError(
+            "The columnar export needs pyarrow: poetry install --with analytics"
+        )
+    output_dir = Path(output_dir)
+    if output_dir.exists() and any(output_dir.iterdir()):
+        raise FileExistsError(f"Output directory {output_dir} is not empty.")
+
+    schema = attendance_schema(columns)
+    # Blocks are parsed on the calling thread, while the repository reads the
+    # next one; pyarrow's own thread pool would only compete with it.
+    read_options = pacsv.ReadOptions(column_names=list(fetched), use_threads=False)
+    convert_options = pacsv.ConvertOptions(
+        column_types=attendance_schema(fetched), quoted_strings_can_be_null=False
+    )
+    result = ColumnarExportResult()
+    writer = None
+    current_key: Optional[str] = None
+    try:
+        for block in csv_blocks:
+            table = pacsv.read_csv(
+                pa.py_buffer(block),
+                read_options=read_options,
+                convert_options=convert_options,
+            )
+            if partitioning is Partitioning.NONE:
+                runs = [(None, 0, table.num_rows)]
+            else:
+                runs = _partition_runs(table[PARTITION_COLUMN], partitioning)
+            table = table.select(list(columns))
+            for key, start, length in runs:
+                if writer is None or key != current_key:
+                    if writer is not None:
+                        writer.close()
+                    path = _file_path(output_dir, file_format, partitioning, key)
+                    writer = _open_writer(path, schema, file_format)
+                    result.files.append(path)
+                    current_key = key
+                writer.write_table(table.slice(start, length))
+            result.rows += table.num_rows
+    finally:
+        if writer is not None:
+            writer.close()
+    return result
+
+
+def _partition_runs(
+    times: "pa.ChunkedArray", partitioning: Partitioning
+) -> Iterator[tuple[str, int, int]]:
+    """
+    Split sorted attendance times into `(partition key, start, length)` runs.
+
+    Times are truncated to their day or month and run-length encoded by Arrow,
+    so Python only sees one value per partition.
+    """
+    periods = pc.floor_temporal(times.combine_chunks(), unit=partitioning.value)
+    encoded = pc.run_end_encode(periods)
+    start = 0
+    for end, period in zip(encoded.run_ends.to_pylist(), encoded.values.to_pylist()):
+        yield _period_label(period, partitioning), start, end - start
+        start = end
+
+
+def _period_label(period: Optional[datetime], partitioning: Partitioning) -> str:
+    """Format a period as a partition value."""
+    if period is None:
+        return NULL_PARTITION
+    if partitioning is Partitioning.MONTH:
+        return period.strftime("%Y-%m")
+    return period.strftime("%Y-%m-%d")
+
+
+def _file_path(
+    output_dir: Path,
+    file_format: ColumnarFormat,
+    partitioning: Partitioning,
+    key: Optional[str],
+) -> Path:
+    """Return the file of a partition, creating its directory."""
+    if partitioning is Partitioning.NONE:
+        directory, name = output_dir, "attendance"
+    else:
+        directory, name = (
+            output_dir / f"{PARTITION_NAMES[partitioning]}={key}",
+            "part-0",
+        )
+    directory.mkdir(parents=True, exist_ok=True)
+    return directory / f"{name}.{file_format.value}"
+
+
+def _open_writer(path: Path, schema: "pa.Schema", file_format: ColumnarFormat):
+    """Open an Arrow IPC file writer or a Parquet writer."""
+    if file_format is ColumnarFormat.PARQUET:
+        return pq.ParquetWriter(path, schema, compression="zstd")
+    return pa.ipc.new_file(path, schema)
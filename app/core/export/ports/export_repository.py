@@ -0,0 +1,76 @@
+"""
+Export repository interface.
+"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Iterator, Optional, Sequence
+from uuid import UUID
+
+
+class ExportRepository(ABC):
+    """Export repository interface.
+
+    Every method streams rows from a server-side cursor, fetching `batch_size`
+    rows at a time, so memory use does not depend on the table size.
+    """
+
+    @abstractmethod
+    def iter_sessions(self, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Stream the active sessions, each with the list of its speakers.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per session.
+        """
+
+    @abstractmethod
+    def iter_attendees(
+        self, batch_size: int, session_id: Optional[UUID] = None
+    ) -> Iterator[dict[str, Any]]:
+        """Stream session attendance records.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+            session_id (Optional[UUID]): Restrict the roster to one session.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per attendance.
+        """
+
+    @abstractmethod
+    def iter_users(self, batch_size: int) -> Iterator[dict[str, Any]]:
+        """Stream the users, without credentials.
+
+        Args:
+            batch_size (int): Number of rows fetched per round trip.
+
+        Returns:
+            Iterator[dict[str, Any]]: One dictionary per user.
+        """
+
+    @abstractmethod
+    def iter_attendance_csv(
+        self,
+        columns: Sequence[str],
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        block_bytes: int = 8 * 1024 * 1024,
+    ) -> Iterator[bytes]:
+        """Stream attendance records joined with their session and user, as CSV.
+
+        Records are ordered by attendance time, with unknown times last. Each
+        block holds whole rows, without a header; null values are empty and
+        empty strings are quoted.
+
+        Args:
+            columns (Sequence[str]): The columns to read, from `ATTENDANCE_COLUMNS`.
+            since (Optional[datetime]): Only attendances at or after this time.
+            until (Optional[datetime]): Only attendances before this time.
+            block_bytes (int): Approximate size of each block.
+
+        Returns:
+            Iterator[bytes]: CSV blocks.
+        """
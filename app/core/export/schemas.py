@@ -0,0 +1,52 @@
+"""
+Export schemas.
+"""
+
+from enum import Enum
+
+
+class ExportFormat(str, Enum):
+    """
+    File formats supported by the streaming exports.
+    """
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+    @property
+    def media_type(self) -> str:
+        """The media type of the format."""
+        if self is ExportFormat.CSV:
+            return "text/csv; charset=utf-8"
+        return "application/x-ndjson"
+
+
+class ColumnarFormat(str, Enum):
+    """
+    File formats of the columnar attendance export.
+    """
+
+    ARROW = "arrow"
+    PARQUET = "parquet"
+
+
+class Partitioning(str, Enum):
+    """
+    How the columnar attendance export is split into files by attendance date.
+    """
+
+    NONE = "none"
+    DAY = "day"
+    MONTH = "month"
+
+
+# Columns of the columnar attendance export, in their default order.
+ATTENDANCE_COLUMNS = (
+    "attendance_id",
+    "attendance_time",
+    "session_id",
+    "session_title",
+    "session_start_time",
+    "user_id",
+    "user_email",
+)
@@ -0,0 +1,252 @@
+"""
+Export service implementation.
+"""
+
+import csv
+import io
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional, Sequence
+from uuid import UUID
+
+from core.common.serialization import to_json
+from core.export.ports.export_repository import ExportRepository
+from core.export.schemas import (
+    ATTENDANCE_COLUMNS,
+    ColumnarFormat,
+    ExportFormat,
+    Partitioning,
+)
+
+if TYPE_CHECKING:
+    from core.export.columnar import ColumnarExportResult
+
+SESSION_COLUMNS = [
+    "id",
+    "title",
+    "description",
+    "start_time",
+    "end_time",
+    "capacity",
+    "is_active",
+    "speakers",
+]
+ATTENDEE_COLUMNS = [
+    "session_id",
+    "session_title",
+    "user_id",
+    "user_email",
+    "attendance_time",
+]
+USER_COLUMNS = ["id", "email", "is_active", "created_at"]
+
+
+class ExportService:
+    """Export service implementation.
+
+    Exports are generators of byte chunks: rows are read from a server-side
+    cursor, encoded and sent as they arrive, so memory use stays constant
+    whatever the number of rows.
+    """
+
+    def __init__(
+        self,
+        export_repository: ExportRepository,
+        batch_size: int = 1000,
+        chunk_bytes: int = 64 * 1024,
+    ):
+        """Initialize the export service with an export repository.
+
+        Args:
+            export_repository (ExportRepository): The export repository.
+            batch_size (int): Rows fetched from the database per round trip.
+            chunk_bytes (int): Approximate size of each chunk handed to the
+                response; small rows are grouped to limit per-chunk overhead.
+        """
+        self.export_repository = export_repository
+        self.batch_size = batch_size
+        self.chunk_bytes = chunk_bytes
+
+    def export_sessions(
+        self, export_format: ExportFormat, compress: bool = False
+    ) -> Iterator[bytes]:
+        """Stream the active sessions with their speakers.
+
+        In CSV the speakers are flattened to `name <email>` entries separated
+        by semicolons.
+
+        Args:
+            export_format (ExportFormat): The output format.
+            compress (bool): Gzip the output on the fly.
+
+        Returns:
+            Iterator[bytes]: The encoded export, chunk by chunk.
+        """
+        rows = self.export_repository.iter_sessions(self.batch_size)
+        if export_format is ExportFormat.CSV:
+            rows = (_flatten_speakers(row) for row in rows)
+        return self._stream(rows, SESSION_COLUMNS, export_format, compress)
+
+    def export_attendees(
+        self,
+        export_format: ExportFormat,
+        compress: bool = False,
+        session_id: Optional[UUID] = None,
+    ) -> Iterator[bytes]:
+        """Stream the attendee roster of every session, or of one session.
+
+        Args:
+            export_format (ExportFormat): The output format.
+            compress (bool): Gzip the output on the fly.
+            session_id (Optional[UUID]): Restrict the roster to one session.
+
+        Returns:
+            Iterator[bytes]: The encoded export, chunk by chunk.
+        """
+        rows = self.export_repository.iter_attendees(
+            self.batch_size, session_id=session_id
+        )
+        return self._stream(rows, ATTENDEE_COLUMNS, export_format, compress)
+
+    def export_users(
+        self, export_format: ExportFormat, compress: bool = False
+    ) -> Iterator[bytes]:
+        """Stream the users.
+
+        Args:
+            export_format (ExportFormat): The output format.
+            compress (bool): Gzip the output on the fly.
+
+        Returns:
+            Iterator[bytes]: The encoded export, chunk by chunk.
+        """
+        rows = self.export_repository.iter_users(self.batch_size)
+        return self._stream(rows, USER_COLUMNS, export_format, compress)
+
+    def export_attendance_columnar(
+        self,
+        output_dir: Path,
+        file_format: ColumnarFormat = ColumnarFormat.PARQUET,
+        partitioning: Partitioning = Partitioning.NONE,
+        columns: Sequence[str] = ATTENDANCE_COLUMNS,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        block_bytes: int = 8 * 1024 * 1024,
+    ) -> "ColumnarExportResult":
+        """Write attendances joined with sessions and users to columnar files.
+
+        Only the requested columns are read from the database, plus the
+        attendance time when it is needed for partitioning. The columnar
+        writer, and pyarrow with it, is imported on the first call, so the
+        API workers never load it.
+
+        Args:
+            output_dir (Path): Directory receiving the files; must be empty.
+            file_format (ColumnarFormat): Arrow IPC or Parquet.
+            partitioning (Partitioning): Split files by attendance day or month.
+            columns (Sequence[str]): The columns to export, from `ATTENDANCE_COLUMNS`.
+            since (Optional[datetime]): Only attendances at or after this time.
+            until (Optional[datetime]): Only attendances before this time.
+            block_bytes (int): Bytes of CSV read from the database and converted
+                at a time.
+
+        Returns:
+            ColumnarExportResult: The number of rows and the files written.
+
+        Raises:
+            ValueError: If a column is unknown.
+        """
+        from core.export.columnar import PARTITION_COLUMN, write_attendance
+
+        unknown = [column for column in columns if column not in ATTENDANCE_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown attendance columns: {', '.join(unknown)}")
+        fetched = list(columns)
+        if partitioning is not Partitioning.NONE and PARTITION_COLUMN not in fetched:
+            fetched.append(PARTITION_COLUMN)
+
+        blocks = self.export_repository.iter_attendance_csv(
+            fetched, since=since, until=until, block_bytes=block_bytes
+        )
+        return write_attendance(
+            blocks, output_dir, fetched, columns, file_format, partitioning
+        )
+
+    def _stream(
+        self,
+        rows: Iterable[dict[str, Any]],
+        columns: list[str],
+        export_format: ExportFormat,
+        compress: bool,
+    ) -> Iterator[bytes]:
+        """Encode rows, group them into chunks and optionally gzip them.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): The rows to export.
+            columns (list[str]): The CSV columns, in order.
+            export_format (ExportFormat): The output format.
+            compress (bool): Gzip the output on the fly.
+
+        Returns:
+            Iterator[bytes]: The encoded export, chunk by chunk.
+        """
+        if export_format is ExportFormat.CSV:
+            lines = _csv_lines(rows, columns)
+        else:
+            lines = (to_json(row) + b"\n" for row in rows)
+        chunks = _group(lines, self.chunk_bytes)
+        return _gzip(chunks) if compress else chunks
+
+
+def _flatten_speakers(row: dict[str, Any]) -> dict[str, Any]:
+    """Replace the speakers list of a session row with a single CSV cell."""
+    speakers = "; ".join(
+        f"{speaker['name']} <{speaker['email']}>" for speaker in row["speakers"]
+    )
+    return {**row, "speakers": speakers}
+
+
+def _csv_value(value: Any) -> Any:
+    """Format a value for a CSV cell."""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_lines(rows: Iterable[dict[str, Any]], columns: list[str]) -> Iterator[bytes]:
+    """Encode rows as CSV lines, preceded by a header line."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([_csv_value(row.get(column)) for column in columns])
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+def _group(lines: Iterable[bytes], chunk_bytes: int) -> Iterator[bytes]:
+    """Concatenate small pieces into chunks of about `chunk_bytes`."""
+    pending: list[bytes] = []
+    size = 0
+    for line in lines:
+        pending.append(line)
+        size += len(line)
+        if size >= chunk_bytes:
+            yield b"".join(pending)
+            pending, size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a stream of chunks into a single gzip member."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,93 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from adapters.database.models import ScheduledSession, SessionAttendee, User
+from adapters.database.repository.export_repository import ExportRepositoryImpl
+from core.common.test_base import TestBase
+from core.export.schemas import ColumnarFormat, Partitioning
+from core.export.services import ExportService
+
+pa = pytest.importorskip("pyarrow")
+ds = pytest.importorskip("pyarrow.dataset")
+
+
+class TestColumnarExport(TestBase):
+    """
+    Tests for the Arrow IPC / Parquet attendance export.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, tmp_path):
+        """
+        Add attendances on two days, plus one without an attendance time.
+        """
+        self.output_dir = tmp_path / "attendance"
+        self.session = self.db_session.query(ScheduledSession).first()
+        self.user = self.db_session.query(User).first()
+        day = datetime(2024, 11, 30, 9, 0)
+        times = [day, day + timedelta(hours=2), day + timedelta(days=1), None]
+        for attendance_time in times:
+            self.db_session.add(
+                SessionAttendee(
+                    id=uuid4(),
+                    session_id=self.session.id,
+                    user_id=self.user.id,
+                    attendance_time=attendance_time,
+                )
+            )
+        self.db_session.flush()
+        # The model defaults the time to now(); clear it for the last row.
+        self.db_session.query(SessionAttendee).filter(
+            SessionAttendee.attendance_time > datetime(2024, 12, 2)
+        ).update({"attendance_time": None})
+        self.service = ExportService(ExportRepositoryImpl(self.db_session))
+
+    def test_parquet_partitioned_by_day_with_projection(self):
+        """
+        Test day partitions, the null partition and column projection.
+        """
+        result = self.service.export_attendance_columnar(
+            self.output_dir,
+            file_format=ColumnarFormat.PARQUET,
+            partitioning=Partitioning.DAY,
+            columns=["session_title", "user_email"],
+            block_bytes=64,
+        )
+
+        assert result.rows == 4
+        assert sorted(path.parent.name for path in result.files) == [
+            "attendance_date=2024-11-30",
+            "attendance_date=2024-12-01",
+            "attendance_date=__HIVE_DEFAULT_PARTITION__",
+        ]
+        table = ds.dataset(self.output_dir, format="parquet").to_table()
+        assert table.column_names == ["session_title", "user_email"]
+        assert table.column("user_email").to_pylist() == [self.user.email] * 4
+
+    def test_arrow_ipc_with_date_range(self):
+        """
+        Test an unpartitioned Arrow IPC file restricted to a date range.
+        """
+        result = self.service.export_attendance_columnar(
+            self.output_dir,
+            file_format=ColumnarFormat.ARROW,
+            since=datetime(2024, 11, 30),
+            until=datetime(2024, 12, 1),
+        )
+
+        assert [path.name for path in result.files] == ["attendance.arrow"]
+        with pa.memory_map(str(result.files[0])) as source:
+            table = pa.ipc.open_file(source).read_all()
+        assert table.num_rows == 2
+        assert table.schema.field("attendance_time").type == pa.timestamp("us")
+        assert set(table.column("session_id").to_pylist()) == {str(self.session.id)}
+
+    def test_unknown_column_is_rejected(self):
+        """
+        Test that projecting an unknown column fails before querying.
+        """
+        with pytest.raises(ValueError):
+            self.service.export_attendance_columnar(
+                self.output_dir, columns=["password"]
+            )
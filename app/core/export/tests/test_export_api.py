@@ -0,0 +1,110 @@
+import csv
+import io
+import itertools
+import json
+from uuid import uuid4
+
+import pytest
+from adapters.database.models import ScheduledSession, SessionAttendee, User
+from core.common.test_base import TestBase
+from core.export.ports.export_repository import ExportRepository
+from core.export.schemas import ExportFormat
+from core.export.services import ExportService
+from httpx import Response
+
+
+class EndlessRepository(ExportRepository):
+    """
+    Repository yielding users forever, to check that exports never buffer.
+    """
+
+    def iter_sessions(self, batch_size):
+        raise NotImplementedError
+
+    def iter_attendees(self, batch_size, session_id=None):
+        raise NotImplementedError
+
+    def iter_attendance_csv(self, columns, since=None, until=None, block_bytes=0):
+        raise NotImplementedError
+
+    def iter_users(self, batch_size):
+        for index in itertools.count():
+            yield {"id": index, "email": f"user{index}@example.com", "is_active": True}
+
+
+class TestExportAPI(TestBase):
+    """
+    Tests for the streaming export endpoints.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_token: str):
+        """
+        Setup for each test.
+
+        Args:
+            admin_token (str): The admin token for authentication.
+        """
+        self.base_url = "api/v1/export"
+        self.headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def test_export_sessions_ndjson(self):
+        """
+        Test that every active session is exported with its speakers.
+        """
+        response: Response = self.client.get(
+            f"{self.base_url}/sessions", headers=self.headers
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        active = (
+            self.db_session.query(ScheduledSession)
+            .filter(ScheduledSession.deleted_at.is_(None))
+            .count()
+        )
+        assert len(rows) == active
+        assert all(isinstance(row["speakers"], list) for row in rows)
+
+    def test_export_users_csv_without_passwords(self):
+        """
+        Test the CSV user export has a header row and no credentials.
+        """
+        response: Response = self.client.get(
+            f"{self.base_url}/users", params={"format": "csv"}, headers=self.headers
+        )
+        assert response.status_code == 200
+        reader = csv.DictReader(io.StringIO(response.text))
+        assert reader.fieldnames == ["id", "email", "is_active", "created_at"]
+        assert "admin@example.com" in [row["email"] for row in reader]
+
+    def test_export_attendees_gzip(self):
+        """
+        Test a gzip-compressed roster of a single session.
+        """
+        session = self.db_session.query(ScheduledSession).first()
+        user = self.db_session.query(User).first()
+        self.db_session.add(
+            SessionAttendee(id=uuid4(), session_id=session.id, user_id=user.id)
+        )
+        self.db_session.commit()
+
+        response: Response = self.client.get(
+            f"{self.base_url}/attendees",
+            params={"session_id": str(session.id), "gzip": True},
+            headers=self.headers,
+        )
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [row["user_email"] for row in rows] == [user.email]
+
+    def test_export_is_streamed(self):
+        """
+        Test that the first chunk is produced without reading every row.
+        """
+        service = ExportService(EndlessRepository(), chunk_bytes=1024)
+        chunks = service.export_users(ExportFormat.CSV)
+        first = next(chunks)
+        assert first.startswith(b"id,email,is_active,created_at\r\n")
+        assert 1024 <= len(first) < 2048
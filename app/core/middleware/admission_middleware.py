@@ -0,0 +1,220 @@
+"""
+Admission Middleware
+"""
+
+import math
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Sequence
+
+from core.common.metrics import Counter
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+from core.middleware.error_middleware import service_unavailable_handler
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+shed_total = Counter(
+    "admission_shed_total",
+    "Requests refused by admission control, by priority class.",
+    ("priority",),
+)
+
+
+class Priority(str, Enum):
+    """
+    Priority classes of requests, from always admitted to shed first.
+    """
+
+    CRITICAL = "critical"
+    NORMAL = "normal"
+    LOW = "low"
+
+
+@dataclass(frozen=True)
+class PriorityRule:
+    """
+    Priority class of the requests under a path prefix.
+
+    Attributes:
+        prefix (str): The path prefix, usually a router's.
+        priority (Priority): The class of the matching requests.
+        methods (Optional[frozenset[str]]): The HTTP methods matched, or None
+            for all of them.
+    """
+
+    prefix: str
+    priority: Priority
+    methods: Optional[frozenset[str]] = None
+
+    def matches(self, method: str, path: str) -> bool:
+        """Return whether a request falls under this rule."""
+        return path.startswith(self.prefix) and (
+            self.methods is None or method in self.methods
+        )
+
+
+class AdmissionController:
+    """
+    Decides which requests to admit from the in-flight count and latency.
+
+    As in CoDel, the signal is the lowest latency seen over an interval
+    rather than the mean: a few slow requests, such as exports, raise the
+    mean, but only a standing queue delays every request, including the
+    fastest. When the minimum of an interval exceeds the target the
+    controller is overloaded and sheds low-priority requests until an
+    interval's minimum falls back under it. Past the in-flight limit, normal
+    requests are shed too. Critical requests are always admitted.
+    """
+
+    def __init__(
+        self,
+        target_latency: float,
+        interval: float,
+        max_in_flight: int,
+        clock=time.monotonic,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            target_latency (float): Seconds the fastest request of an interval
+                may take before the server counts as overloaded.
+            interval (float): Seconds over which the minimum latency is taken.
+            max_in_flight (int): Requests served at once past which normal
+                requests are shed as well.
+            clock (Callable[[], float]): Monotonic clock, in seconds.
+        """
+        self.target_latency = target_latency
+        self.interval = interval
+        self.max_in_flight = max_in_flight
+        self.clock = clock
+        self.in_flight = 0
+        self.overloaded = False
+        self._interval_min = math.inf
+        self._interval_end = clock() + interval
+
+    def admit(self, priority: Priority) -> bool:
+        """
+        Decide whether to serve a request of a priority class.
+
+        Args:
+            priority (Priority): The class of the request.
+
+        Returns:
+            bool: True to serve it, False to shed it.
+        """
+        self._roll_interval()
+        if priority is Priority.CRITICAL:
+            return True
+        if self.in_flight >= self.max_in_flight:
+            return False
+        return not (self.overloaded and priority is Priority.LOW)
+
+    def observe(self, latency: float) -> None:
+        """
+        Record the latency of a request served.
+
+        Args:
+            latency (float): Seconds until its response started.
+        """
+        self._interval_min = min(self._interval_min, latency)
+        self._roll_interval()
+
+    def _roll_interval(self) -> None:
+        """Judge the interval that ended, if any, and start the next one."""
+        now = self.clock()
+        if now < self._interval_end:
+            return
+        if self._interval_min < math.inf:
+            self.overloaded = self._interval_min > self.target_latency
+        elif not self.in_flight:
+            # Nothing served and nothing running: no queue is left.
+            self.overloaded = False
+        self._interval_min = math.inf
+        self._interval_end = now + self.interval
+
+
+class AdmissionMiddleware:
+    """
+    Pure ASGI middleware shedding low-priority requests under overload.
+
+    Shed requests get a 503 with `Retry-After`, like any
+    `ServiceUnavailableError`, with code `OVERLOADED`.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        rules: Sequence[PriorityRule],
+        controller: AdmissionController,
+        retry_after: int = 1,
+    ):
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+            rules (Sequence[PriorityRule]): The priority rules; the first one
+                matching a request applies, and unmatched requests are normal.
+            controller (AdmissionController): The admission decisions.
+            retry_after (int): Seconds shed clients are told to wait.
+        """
+        self.app = app
+        self.rules = tuple(rules)
+        self.controller = controller
+        self.retry_after = retry_after
+
+    def priority(self, method: str, path: str) -> Priority:
+        """
+        Return the priority class of a request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+
+        Returns:
+            Priority: The class of the first matching rule, or normal.
+        """
+        for rule in self.rules:
+            if rule.matches(method, path):
+                return rule.priority
+        return Priority.NORMAL
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve the request if admitted, or answer 503 at once.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        priority = self.priority(scope["method"], scope["path"])
+        if not self.controller.admit(priority):
+            shed_total.labels(priority.value).inc()
+            error = ServiceUnavailableError(
+                "The server is overloaded, try again later.",
+                code="OVERLOADED",
+                retry_after=self.retry_after,
+            )
+            response = await service_unavailable_handler(Request(scope), error)
+            await response(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        observed = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal observed
+            if message["type"] == "http.response.start" and not observed:
+                observed = True
+                self.controller.observe(time.perf_counter() - started)
+            await send(message)
+
+        self.controller.in_flight += 1
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self.controller.in_flight -= 1
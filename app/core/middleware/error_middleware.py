@@ -7,52 +7,225 @@ import logging
 from core.exceptions.custom_exceptions import (
     CustomAPIException,
     IntegrityError,
+    ServiceUnavailableError,
+    TooManyRequestsError,
     ValidationError,
 )
-from fastapi import Request, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import FastAPI, Request, status
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+async def validation_error_handler(
+    request: Request, exc: ValidationError
+) -> JSONResponse:
     """
-    Middleware for centralized error handling in FastAPI.
+    Turn a `ValidationError` into a JSON error response.
 
-    This middleware catches and handles custom exceptions such as `ValidationError`, `IntegrityError`,
-    and `CustomAPIException`, as well as general exceptions. It returns appropriate JSON responses
-    with error messages and status codes."""
+    Args:
+        request (Request): The failed request.
+        exc (ValidationError): The exception raised.
 
-    async def dispatch(self, request: Request, call_next):
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.error("ValidationError %s: ", exc)
+    return JSONResponse(
+        {"message": "Validation error", "code": "ValidationError"},
+        status_code=exc.status_code,
+    )
+
+
+async def integrity_error_handler(
+    request: Request, exc: IntegrityError
+) -> JSONResponse:
+    """
+    Turn an `IntegrityError` into a JSON error response.
+
+    Args:
+        request (Request): The failed request.
+        exc (IntegrityError): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.error("IntegrityError: %s", exc)
+    return JSONResponse(
+        {"message": "Integrity error", "code": "INT001"},
+        status_code=exc.status_code,
+    )
+
+
+async def custom_api_exception_handler(
+    request: Request, exc: CustomAPIException
+) -> JSONResponse:
+    """
+    Turn a `CustomAPIException` into a JSON error response.
+
+    Args:
+        request (Request): The failed request.
+        exc (CustomAPIException): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.error("CustomAPIException: %s", exc)
+    return JSONResponse(
+        {"message": "Conctact admin site", "code": str(exc.status_code)},
+        status_code=exc.status_code,
+    )
+
+
+async def service_unavailable_handler(
+    request: Request, exc: ServiceUnavailableError
+) -> JSONResponse:
+    """
+    Turn a `ServiceUnavailableError` into a 503 response with `Retry-After`.
+
+    Args:
+        request (Request): The refused request.
+        exc (ServiceUnavailableError): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.warning("ServiceUnavailableError %s: %s", exc.code, exc.detail)
+    return JSONResponse(
+        {"message": exc.detail, "code": exc.code},
+        status_code=exc.status_code,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def too_many_requests_handler(
+    request: Request, exc: TooManyRequestsError
+) -> JSONResponse:
+    """
+    Turn a `TooManyRequestsError` into a 429 response with `Retry-After`.
+
+    Args:
+        request (Request): The refused request.
+        exc (TooManyRequestsError): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    return JSONResponse(
+        {"message": exc.detail, "code": "RATE_LIMITED"},
+        status_code=exc.status_code,
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
+async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
+    """
+    Turn a `ValueError`, which services raise for invalid input such as an
+    unknown speaker or a malformed id, into a 400 response.
+
+    Args:
+        request (Request): The failed request.
+        exc (ValueError): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.error("ValueError: %s", exc)
+    return JSONResponse(
+        {
+            "message": "An unexpected error occurred",
+            "details": "Contact admin site",
+        },
+        status_code=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+async def not_found_handler(request: Request, exc: Exception) -> JSONResponse:
+    """
+    Turn a repository's not-found error, e.g. writing to a deleted session,
+    into a 404 response.
+
+    Args:
+        request (Request): The failed request.
+        exc (Exception): The exception raised.
+
+    Returns:
+        JSONResponse: The error response.
+    """
+    logging.error("Not found: %s", exc)
+    return JSONResponse(
+        {"message": "Resource not found", "code": "NOT_FOUND"},
+        status_code=status.HTTP_404_NOT_FOUND,
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Register the handlers of the application's exceptions.
+
+    They run in Starlette's exception middleware, so a request that does not
+    fail pays nothing for them.
+
+    Args:
+        app (FastAPI): The application.
+    """
+    app.add_exception_handler(ValidationError, validation_error_handler)
+    app.add_exception_handler(IntegrityError, integrity_error_handler)
+    app.add_exception_handler(CustomAPIException, custom_api_exception_handler)
+    app.add_exception_handler(ServiceUnavailableError, service_unavailable_handler)
+    app.add_exception_handler(TooManyRequestsError, too_many_requests_handler)
+    app.add_exception_handler(ValueError, value_error_handler)
+
+
+class ErrorHandlingMiddleware:
+    """
+    Pure ASGI middleware turning unexpected exceptions into a JSON 500 response.
+
+    Known exceptions, including the `ValueError`s services raise for invalid
+    input, are handled by the handlers of `register_exception_handlers`.
+    Unlike a `BaseHTTPMiddleware`, this passes `receive` and `send` straight
+    through, so responses are neither wrapped in an extra task nor buffered, and
+    streaming responses reach the client chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp):
         """
-        Intercepts and processes the request, handling any exceptions.
+        Wrap an ASGI application.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
+        Run the request, answering with a JSON error if it fails before responding.
+
+        If the response has already started, the exception is re-raised: the
+        status line is gone, so the server can only abort the connection.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
         try:
-            response = await call_next(request)
-            return response
-        except ValidationError as exc:
-            logging.error("ValidationError %s: ", exc)
-            return JSONResponse(
-                {"message": "Validation error", "code": "ValidationError"},
-                status_code=exc.status_code,
-            )
-        except IntegrityError as exc:
-            logging.error("IntegrityError: %s", exc)
-            return JSONResponse(
-                {"message": "Integrity error", "code": "INT001"},
-                status_code=exc.status_code,
-            )
-        except CustomAPIException as exc:
-            logging.error("CustomAPIException: %s", exc)
-            return JSONResponse(
-                {"message": "Conctact admin site", "code": str(exc.status_code)},
-                status_code=exc.status_code,
-            )
+            await self.app(scope, receive, send_wrapper)
         except Exception as exc:
+            if response_started:
+                raise
             logging.error("Unexpected error: %s", exc)
-            return JSONResponse(
+            response = JSONResponse(
                 {
                     "message": "An unexpected error occurred",
                     "details": "Contact admin site",
                 },
-                status_code=status.HTTP_400_BAD_REQUEST,
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
+            await response(scope, receive, send)
@@ -0,0 +1,165 @@
+"""
+Metrics Middleware
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import anyio.to_thread
+from core.common.metrics import Counter, Gauge, GaugeFunction, Histogram
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+@dataclass
+class RequestStats:
+    """
+    Work done while serving one request.
+
+    Attributes:
+        db_statements (int): SQL statements executed.
+        db_seconds (float): Time spent executing them.
+    """
+
+    db_statements: int = 0
+    db_seconds: float = 0.0
+
+
+# Set for the duration of each request; worker threads running sync endpoints
+# and dependencies see the same object, since anyio copies the context.
+current_request: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request", default=None
+)
+
+requests_total = Counter(
+    "http_requests_total", "HTTP requests served.", ("method", "route", "status")
+)
+requests_in_flight = Gauge("http_requests_in_flight", "HTTP requests being served.")
+request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Time to serve an HTTP request, including streaming the body.",
+    ("method", "route"),
+)
+response_size = Histogram(
+    "http_response_size_bytes",
+    "Size of HTTP response bodies, before any compression by a proxy.",
+    ("method", "route"),
+    buckets=(100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000),
+)
+request_db_statements = Histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request.",
+    ("method", "route"),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+request_db_duration = Histogram(
+    "http_request_db_duration_seconds",
+    "Time spent executing SQL per HTTP request.",
+    ("method", "route"),
+)
+
+
+def _threadpool_statistic(name: str) -> Callable[[], float]:
+    """Read a statistic of the threadpool running sync endpoints."""
+
+    def read() -> float:
+        try:
+            limiter = anyio.to_thread.current_default_thread_limiter()
+        except RuntimeError:  # not rendered from the event loop
+            return float("nan")
+        return getattr(limiter.statistics(), name)
+
+    return read
+
+
+GaugeFunction(
+    "threadpool_threads_busy",
+    "Threadpool threads running sync endpoints or dependencies.",
+    _threadpool_statistic("borrowed_tokens"),
+)
+GaugeFunction(
+    "threadpool_threads_total",
+    "Size of the threadpool running sync endpoints and dependencies.",
+    _threadpool_statistic("total_tokens"),
+)
+GaugeFunction(
+    "threadpool_tasks_waiting",
+    "Calls waiting for a free threadpool thread.",
+    _threadpool_statistic("tasks_waiting"),
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording latency, size and SQL work per route.
+
+    Routes are labelled with their path template, e.g. `/api/v1/session/{session_id}`,
+    so the number of series stays bounded; unknown paths share one label.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Wrap an ASGI application.
+
+        Args:
+            app (ASGIApp): The wrapped application.
+        """
+        self.app = app
+        self._route_paths: dict[Callable, str] = {}
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Serve the request and record its metrics once the response is complete.
+        """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        body_bytes = 0
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, body_bytes
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                body_bytes += len(message.get("body", b""))
+            await send(message)
+
+        stats = RequestStats()
+        token = current_request.set(stats)
+        requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - started
+            requests_in_flight.dec()
+            current_request.reset(token)
+            method, route = scope["method"], self._route(scope)
+            requests_total.labels(method, route, str(status_code)).inc()
+            request_duration.labels(method, route).observe(elapsed)
+            response_size.labels(method, route).observe(body_bytes)
+            request_db_statements.labels(method, route).observe(stats.db_statements)
+            request_db_duration.labels(method, route).observe(stats.db_seconds)
+
+    def _route(self, scope: Scope) -> str:
+        """Return the path template of the route that served the request."""
+        endpoint = scope.get("endpoint")
+        if endpoint is None:
+            return UNMATCHED_ROUTE
+        path = self._route_paths.get(endpoint)
+        if path is None:
+            path = next(
+                (
+                    route.path
+                    for route in scope["app"].routes
+                    if getattr(route, "endpoint", None) is endpoint
+                ),
+                UNMATCHED_ROUTE,
+            )
+            self._route_paths[endpoint] = path
+        return path
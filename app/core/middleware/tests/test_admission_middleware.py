@@ -0,0 +1,97 @@
+import asyncio
+
+from benchmarks.error_middleware import call
+from core.middleware.admission_middleware import (
+    AdmissionController,
+    AdmissionMiddleware,
+    Priority,
+    PriorityRule,
+)
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+class TestAdmissionControl:
+    """
+    Tests for CoDel-style admission control and its middleware.
+    """
+
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.controller = AdmissionController(
+            target_latency=0.1, interval=1.0, max_in_flight=2, clock=self.clock
+        )
+
+    def test_standing_latency_sheds_low_priority_until_it_drains(self):
+        """
+        Test that only a slow fastest request triggers and ends shedding.
+        """
+        self.controller.observe(0.5)
+        self.controller.observe(0.05)
+        self.clock.now = 1.0
+        assert self.controller.admit(Priority.LOW)
+
+        self.controller.observe(0.3)
+        self.controller.observe(2.0)
+        self.clock.now = 2.0
+        assert not self.controller.admit(Priority.LOW)
+        assert self.controller.admit(Priority.NORMAL)
+        assert self.controller.admit(Priority.CRITICAL)
+
+        self.controller.observe(0.02)
+        self.clock.now = 3.0
+        assert self.controller.admit(Priority.LOW)
+
+    def test_in_flight_limit_sheds_all_but_critical(self):
+        """
+        Test that past the in-flight limit only critical requests get in.
+        """
+        self.controller.in_flight = 2
+
+        assert not self.controller.admit(Priority.LOW)
+        assert not self.controller.admit(Priority.NORMAL)
+        assert self.controller.admit(Priority.CRITICAL)
+
+    def test_shed_request_gets_503_with_retry_after(self):
+        """
+        Test the middleware's priority rules and its response to shed requests.
+        """
+        app = FastAPI()
+
+        @app.get("/api/v1/session/")
+        async def sessions():
+            return PlainTextResponse("sessions")
+
+        @app.get("/api/v1/auth/me")
+        async def me():
+            return PlainTextResponse("me")
+
+        rules = [
+            PriorityRule("/api/v1/auth", Priority.CRITICAL),
+            PriorityRule("/api/v1/session", Priority.LOW),
+        ]
+        app.add_middleware(
+            AdmissionMiddleware, rules=rules, controller=self.controller, retry_after=5
+        )
+        self.controller.overloaded = True
+
+        start, body = run(call(app, "/api/v1/session/"))
+        assert start["status"] == 503
+        assert (b"retry-after", b"5") in start["headers"]
+        assert b'"code":"OVERLOADED"' in body["body"]
+
+        start, body = run(call(app, "/api/v1/auth/me"))
+        assert start["status"] == 200
+        assert self.controller.in_flight == 0
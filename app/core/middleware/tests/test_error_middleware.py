@@ -0,0 +1,77 @@
+import asyncio
+
+from benchmarks.error_middleware import build_app, call
+from core.exceptions.custom_exceptions import ServiceUnavailableError
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+
+def run(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, timeout=5))
+
+
+class TestErrorHandling:
+    """
+    Tests for the exception handlers and the pure ASGI error middleware.
+    """
+
+    def setup_method(self):
+        self.app = build_app()
+
+    def test_custom_exception_keeps_error_contract(self):
+        """
+        Test that a `CustomAPIException` keeps its status code and JSON body.
+        """
+        start, body = run(call(self.app, "/not-found"))
+
+        assert start["status"] == 404
+        assert body["body"] == b'{"message":"Conctact admin site","code":"404"}'
+
+    def test_service_unavailable_tells_when_to_retry(self):
+        """
+        Test that a `ServiceUnavailableError` is a 503 with `Retry-After`.
+        """
+
+        @self.app.get("/busy")
+        async def busy():
+            raise ServiceUnavailableError("Busy", code="BUSY", retry_after=3)
+
+        start, body = run(call(self.app, "/busy"))
+
+        assert start["status"] == 503
+        assert (b"retry-after", b"3") in start["headers"]
+        assert body["body"] == b'{"message":"Busy","code":"BUSY"}'
+
+    def test_unexpected_exception_is_a_server_error(self):
+        """
+        Test that an unknown exception becomes a JSON 500 response.
+        """
+        start, body = run(call(self.app, "/crash"))
+
+        assert start["status"] == 500
+        assert b"An unexpected error occurred" in body["body"]
+
+    def test_streaming_response_is_not_buffered(self):
+        """
+        Test that each chunk reaches the server before the next is produced.
+        """
+        chunk_sent = asyncio.Event()
+
+        @self.app.get("/stream")
+        async def stream(request: Request):
+            async def chunks():
+                for index in range(3):
+                    yield f"chunk {index}\n".encode()
+                    await chunk_sent.wait()
+                    chunk_sent.clear()
+
+            return StreamingResponse(chunks(), media_type="text/plain")
+
+        def on_send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                chunk_sent.set()
+
+        messages = run(call(self.app, "/stream", on_send=on_send))
+
+        bodies = [message["body"] for message in messages[1:] if message["body"]]
+        assert bodies == [b"chunk 0\n", b"chunk 1\n", b"chunk 2\n"]
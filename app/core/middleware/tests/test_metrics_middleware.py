@@ -0,0 +1,73 @@
+import re
+
+import pytest
+from core.common.test_base import TestBase
+from httpx import Response
+
+
+def sample(text: str, name: str, **labels: str) -> float:
+    """
+    Return the value of a sample in Prometheus text, or 0 if it is missing.
+    """
+    rendered = ",".join(f'{label}="{value}"' for label, value in labels.items())
+    match = re.search(
+        rf"^{re.escape(name)}{{{re.escape(rendered)}}} (\S+)$", text, re.MULTILINE
+    )
+    return float(match.group(1)) if match else 0.0
+
+
+class TestMetricsEndpoint(TestBase):
+    """
+    Tests for the request metrics exposed at /metrics.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self, admin_token: str):
+        """
+        Setup for each test.
+
+        Args:
+            admin_token (str): The admin token for authentication.
+        """
+        self.headers = {"Authorization": f"Bearer {admin_token}"}
+
+    def scrape(self) -> str:
+        response: Response = self.client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        return response.text
+
+    def test_request_is_recorded_with_route_template_and_queries(self):
+        """
+        Test latency, status and SQL statement counts per route template.
+        """
+        route = "/api/v1/session/"
+        before = self.scrape()
+
+        response: Response = self.client.get(route, headers=self.headers)
+        assert response.status_code == 200
+        after = self.scrape()
+
+        labels = {"method": "GET", "route": route}
+        assert sample(after, "http_requests_total", **labels, status="200") == (
+            sample(before, "http_requests_total", **labels, status="200") + 1
+        )
+        assert sample(after, "http_request_duration_seconds_count", **labels) == (
+            sample(before, "http_request_duration_seconds_count", **labels) + 1
+        )
+        statements = sample(after, "http_request_db_statements_sum", **labels) - (
+            sample(before, "http_request_db_statements_sum", **labels)
+        )
+        assert statements >= 1
+        assert "threadpool_threads_total 40" in after
+
+    def test_unknown_paths_share_one_label(self):
+        """
+        Test that unmatched paths do not create a series per path.
+        """
+        self.client.get("/no/such/path/123")
+
+        text = self.scrape()
+
+        assert 'route="unmatched",status="404"' in text
+        assert "/no/such/path/123" not in text
@@ -0,0 +1,51 @@
+"""
+Response cache, load coalescing and snapshots for session and speaker reads.
+"""
+
+from config import settings
+from core.common.cache import ResponseCache, cache_key
+from core.common.single_flight import SingleFlight
+from core.common.snapshot import SnapshotStore
+
+SESSION_NAMESPACE = "session"
+SESSIONS_NAMESPACE = "sessions"
+SPEAKERS_NAMESPACE = "speakers"
+
+session_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    stale_seconds=settings.RESPONSE_CACHE_STALE_SECONDS,
+    max_entry_bytes=settings.RESPONSE_CACHE_MAX_ENTRY_BYTES,
+    max_total_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    enabled=settings.RESPONSE_CACHE_ENABLED,
+)
+
+session_flight = SingleFlight()
+
+session_snapshots = SnapshotStore(max_entries=settings.SNAPSHOT_MAX_ENTRIES)
+
+
+def session_prefix(session_id) -> str:
+    """
+    Return the key prefix covering every cached entry of one session.
+
+    Args:
+        session_id: The ID of the session.
+
+    Returns:
+        str: The key prefix.
+    """
+    return cache_key(SESSION_NAMESPACE, session_id) + ":"
+
+
+def collection_prefix(namespace: str) -> str:
+    """
+    Return the key prefix covering every cached entry of a collection.
+
+    Args:
+        namespace (str): The collection namespace.
+
+    Returns:
+        str: The key prefix.
+    """
+    return namespace + ":"
@@ -80,6 +80,14 @@ class SessionRepository(ABC):
         Assign a speaker to a session.
         """
 
+    @abstractmethod
+    def assign_speakers_to_session(
+        self, session_id: UUID, speaker_ids: List[UUID]
+    ) -> None:
+        """
+        Assign several speakers to a session in one write.
+        """
+
     @abstractmethod
     def list_speakers(self, limit: int, offset: int) -> tuple[int, list[SpeakerOut]]:
         """
@@ -98,3 +106,38 @@ class SessionRepository(ABC):
         """
         Retrieve a speaker by its ID.
         """
+
+    @abstractmethod
+    def get_speakers_by_ids(self, speaker_ids: List[UUID]) -> List[SpeakerOut]:
+        """
+        Retrieve the speakers with the given IDs, skipping unknown IDs.
+        """
+
+    @abstractmethod
+    def get_session_version(self, session_id: UUID) -> Optional[str]:
+        """Return a cheap version marker for a session and its speakers.
+
+        Args:
+            session_id (UUID): The UUID of the session.
+
+        Returns:
+            Optional[str]: A value that changes whenever the session detail
+            changes, or None if the session does not exist.
+        """
+
+    @abstractmethod
+    def get_sessions_version(self) -> str:
+        """Return a cheap version marker for the sessions collection.
+
+        Returns:
+            str: A value that changes whenever a session is created, updated
+            or deleted.
+        """
+
+    @abstractmethod
+    def get_speakers_version(self) -> str:
+        """Return a cheap version marker for the speakers collection.
+
+        Returns:
+            str: A value that changes whenever a speaker is created or updated.
+        """
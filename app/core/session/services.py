@@ -2,7 +2,21 @@
 Session service implementation.
 """
 
+from typing import Callable, Optional, TypeVar
+from uuid import UUID
+
+from core.common.cache import ResponseCache, cache_key
 from core.common.pagination import Paginated, PaginatedResponse, PaginationParams
+from core.common.single_flight import SingleFlight
+from core.common.snapshot import Snapshot, SnapshotStore
+from core.session.cache import (
+    SESSION_NAMESPACE,
+    SESSIONS_NAMESPACE,
+    SPEAKERS_NAMESPACE,
+    session_cache,
+    session_flight,
+    session_snapshots,
+)
 from core.session.ports.session_repository import SessionRepository
 from core.session.schemas import (
     SessionCreate,
@@ -13,17 +27,40 @@ from core.session.schemas import (
     SpeakerOut,
 )
 
+T = TypeVar("T")
+
+
+def _check_session_id(session_id: str) -> None:
+    """Raise `ValueError` unless `session_id` is a UUID, before any query."""
+    try:
+        UUID(str(session_id))
+    except ValueError:
+        raise ValueError(f"Invalid session ID: {session_id}") from None
+
 
 class SessionService:
     """Session service implementation."""
 
-    def __init__(self, session_repository: SessionRepository):
+    def __init__(
+        self,
+        session_repository: SessionRepository,
+        cache: ResponseCache = session_cache,
+        flight: SingleFlight = session_flight,
+        snapshots: SnapshotStore = session_snapshots,
+    ):
         """Initialize the session service with a session repository.
 
         Args:
             session_repository (SessionRepository): The session repository.
+            cache (ResponseCache): The cache placed in front of the read methods.
+            flight (SingleFlight): Coalesces concurrent identical cache misses.
+            snapshots (SnapshotStore): The last good reads, served while the
+                database is unavailable.
         """
         self.session_repository = session_repository
+        self.cache = cache
+        self.flight = flight
+        self.snapshots = snapshots
 
     def create_session(self, session_data: SessionCreate) -> SessionOut:
         """Create a new session and assign speakers if provided.
@@ -34,33 +71,67 @@ class SessionService:
         Returns:
             SessionOut: The created session.
         """
-        new_session = self.session_repository.create_session(session_data)
-
-        if session_data.speakers:
-            for speaker_id in session_data.speakers:
-                speaker = self.session_repository.get_speaker_by_id(speaker_id)
-                if not speaker:
+        speaker_ids = session_data.speakers or []
+        if speaker_ids:
+            found = {
+                speaker.id
+                for speaker in self.session_repository.get_speakers_by_ids(speaker_ids)
+            }
+            for speaker_id in speaker_ids:
+                if str(speaker_id) not in found:
                     raise ValueError(f"Speaker with ID {speaker_id} does not exist.")
-                self.session_repository.assign_speaker_to_session(
-                    new_session.id, speaker_id
-                )
+
+        new_session = self.session_repository.create_session(session_data)
+        if speaker_ids:
+            self.session_repository.assign_speakers_to_session(
+                new_session.id, speaker_ids
+            )
 
         return new_session
 
-    def get_session(self, session_id: str) -> SessionDetail:
+    def get_session(
+        self, session_id: str, version: Optional[str] = None
+    ) -> SessionDetail:
         """Get session details by its ID.
 
         Args:
             session_id (str): The ID of the session.
+            version (Optional[str]): The session's version marker, when the caller
+                already looked it up; otherwise it is read here.
 
         Returns:
             SessionDetail: The session details.
         """
-        session = self.session_repository.get_session_by_id(session_id)
+        _check_session_id(session_id)
+        if version is None and self.cache.enabled:
+            version = self.get_session_version(session_id)
+            if version is None:
+                raise ValueError(f"Session with ID {session_id} not found.")
+
+        key = cache_key(SESSION_NAMESPACE, session_id, version or "")
+        session = self.cache.get_or_load(
+            key,
+            self._coalesced(
+                key, lambda: self.session_repository.get_session_by_id(session_id)
+            ),
+            decode=SessionDetail.model_validate_json,
+        )
         if not session:
             raise ValueError(f"Session with ID {session_id} not found.")
+        self.snapshots.put(cache_key(SESSION_NAMESPACE, session_id), session)
         return session
 
+    def session_snapshot(self, session_id: str) -> Optional[Snapshot]:
+        """Get the last session details read, for when the database is down.
+
+        Args:
+            session_id (str): The ID of the session.
+
+        Returns:
+            Optional[Snapshot]: The snapshot of the `SessionDetail`, if any.
+        """
+        return self.snapshots.get(cache_key(SESSION_NAMESPACE, session_id))
+
     def update_session(
         self, session_id: str, session_data: SessionUpdate
     ) -> SessionOut:
@@ -73,11 +144,14 @@ class SessionService:
         Returns:
             SessionOut: The updated session.
         """
+        _check_session_id(session_id)
         # Exclude unset fields to avoid overwriting with None
         update_data = session_data.model_dump(exclude_unset=True)
         if not update_data:
             raise ValueError("No valid fields provided for update.")
-        return self.session_repository.update_session(session_id, update_data)
+        updated = self.session_repository.update_session(session_id, update_data)
+        self.snapshots.discard(cache_key(SESSION_NAMESPACE, session_id))
+        return updated
 
     def delete_session(self, session_id: str) -> None:
         """Delete a session by its ID.
@@ -85,13 +159,86 @@ class SessionService:
         Args:
             session_id (str): The ID of the session to delete.
         """
+        _check_session_id(session_id)
         self.session_repository.delete_session(session_id)
+        self.snapshots.discard(cache_key(SESSION_NAMESPACE, session_id))
 
     def list_sessions(
-        self, params: PaginationParams
+        self, params: PaginationParams, version: Optional[str] = None
     ) -> PaginatedResponse[SessionListOut]:
         """List sessions with pagination.
 
+        Args:
+            params (PaginationParams): The pagination parameters.
+            version (Optional[str]): The collection's version marker, when the
+                caller already looked it up; otherwise it is read here.
+
+        Returns:
+            PaginatedResponse[SessionListOut]: The paginated response of sessions.
+        """
+        if version is None:
+            version = self.get_sessions_version()
+        key = cache_key(
+            SESSIONS_NAMESPACE,
+            version,
+            page=params.page,
+            limit=params.limit,
+            search=params.search,
+        )
+        sessions = self.cache.get_or_load(
+            key,
+            self._coalesced(key, lambda: self._load_sessions(params)),
+            decode=PaginatedResponse[SessionListOut].model_validate_json,
+        )
+        self.snapshots.put(self._page_key(SESSIONS_NAMESPACE, params), sessions)
+        return sessions
+
+    def sessions_snapshot(self, params: PaginationParams) -> Optional[Snapshot]:
+        """Get the last page of sessions read, for when the database is down.
+
+        Args:
+            params (PaginationParams): The pagination parameters.
+
+        Returns:
+            Optional[Snapshot]: The snapshot of the page, if any.
+        """
+        return self.snapshots.get(self._page_key(SESSIONS_NAMESPACE, params))
+
+    @staticmethod
+    def _page_key(namespace: str, params: PaginationParams) -> str:
+        """Build the snapshot key of a page, which has no version marker.
+
+        Args:
+            namespace (str): The collection namespace.
+            params (PaginationParams): The pagination parameters.
+
+        Returns:
+            str: The snapshot key.
+        """
+        return cache_key(
+            namespace, page=params.page, limit=params.limit, search=params.search
+        )
+
+    def _coalesced(self, key: str, loader: Callable[[], T]) -> Callable[[], T]:
+        """Wrap a loader so concurrent misses on the same key share one load.
+
+        Keys embed the version marker, so callers only ever share a load that
+        started after the version they observed.
+
+        Args:
+            key (str): The cache key of the value.
+            loader (Callable[[], T]): Loads the value from the repository.
+
+        Returns:
+            Callable[[], T]: The coalescing loader.
+        """
+        return lambda: self.flight.do(key, loader)
+
+    def _load_sessions(
+        self, params: PaginationParams
+    ) -> PaginatedResponse[SessionListOut]:
+        """Load a page of sessions from the repository.
+
         Args:
             params (PaginationParams): The pagination parameters.
 
@@ -121,9 +268,50 @@ class SessionService:
             ),
         )
 
-    def list_speakers(self, params: PaginationParams) -> PaginatedResponse[SpeakerOut]:
+    def list_speakers(
+        self, params: PaginationParams, version: Optional[str] = None
+    ) -> PaginatedResponse[SpeakerOut]:
         """List speakers with pagination.
 
+        Args:
+            params (PaginationParams): The pagination parameters.
+            version (Optional[str]): The collection's version marker, when the
+                caller already looked it up; otherwise it is read here.
+
+        Returns:
+            PaginatedResponse[SpeakerOut]: The paginated response of speakers.
+        """
+        if version is None:
+            version = self.get_speakers_version()
+        key = cache_key(
+            SPEAKERS_NAMESPACE,
+            version,
+            page=params.page,
+            limit=params.limit,
+            search=params.search,
+        )
+        speakers = self.cache.get_or_load(
+            key,
+            self._coalesced(key, lambda: self._load_speakers(params)),
+            decode=PaginatedResponse[SpeakerOut].model_validate_json,
+        )
+        self.snapshots.put(self._page_key(SPEAKERS_NAMESPACE, params), speakers)
+        return speakers
+
+    def speakers_snapshot(self, params: PaginationParams) -> Optional[Snapshot]:
+        """Get the last page of speakers read, for when the database is down.
+
+        Args:
+            params (PaginationParams): The pagination parameters.
+
+        Returns:
+            Optional[Snapshot]: The snapshot of the page, if any.
+        """
+        return self.snapshots.get(self._page_key(SPEAKERS_NAMESPACE, params))
+
+    def _load_speakers(self, params: PaginationParams) -> PaginatedResponse[SpeakerOut]:
+        """Load a page of speakers from the repository.
+
         Args:
             params (PaginationParams): The pagination parameters.
 
@@ -160,3 +348,44 @@ class SessionService:
                 ),
             ),
         )
+
+    def get_session_version(self, session_id: str) -> Optional[str]:
+        """Get a cheap version marker for a session.
+
+        Args:
+            session_id (str): The ID of the session.
+
+        Returns:
+            Optional[str]: The version marker, or None if the session does not exist.
+        """
+        _check_session_id(session_id)
+        return self.session_repository.get_session_version(session_id)
+
+    def get_sessions_version(self) -> str:
+        """Get a cheap version marker for the sessions collection.
+
+        Returns:
+            str: The version marker.
+        """
+        return self.session_repository.get_sessions_version()
+
+    def get_speakers_version(self) -> str:
+        """Get a cheap version marker for the speakers collection.
+
+        Returns:
+            str: The version marker.
+        """
+        return self.session_repository.get_speakers_version()
+
+    def cache_stats(self) -> dict[str, float]:
+        """Get hit ratio and memory usage statistics of the read cache.
+
+        Returns:
+            dict[str, float]: The cache statistics, plus the single-flight
+            counters prefixed with `single_flight_`.
+        """
+        flight_stats = {
+            f"single_flight_{name}": value
+            for name, value in self.flight.stats().items()
+        }
+        return {**self.cache.stats(), **flight_stats}
@@ -1,12 +1,15 @@
 from uuid import uuid4
 
 import pytest
+from adapters.database.circuit_breaker import database_breaker
 from adapters.database.models import (  # Asegúrate de importar el modelo Speaker
     ScheduledSession,
     Speaker,
 )
+from adapters.database.repository.session_repository import SessionRepositoryImpl
 from core.common.test_base import TestBase
 from httpx import Response
+from sqlalchemy.exc import OperationalError
 
 
 class TestSessionAPI(TestBase):
@@ -131,3 +134,237 @@ class TestSessionAPI(TestBase):
             self.db_session.query(ScheduledSession).filter_by(id=session_id).first()
         )
         assert deleted_session.deleted_at is not None
+
+    def test_retrieve_session_not_modified(self):
+        """
+        Test that a matching If-None-Match on a session returns 304.
+        """
+        session_id = self.get_seeded_session_id()
+        response: Response = self.client.get(
+            f"{self.base_url}/{session_id}", headers=self.headers
+        )
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            f"{self.base_url}/{session_id}",
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_list_sessions_etag_changes_after_update(self):
+        """
+        Test that the sessions list ETag changes when a session is updated.
+        """
+        params = {"page": 1, "limit": 10}
+        response: Response = self.client.get(
+            f"{self.base_url}/", params=params, headers=self.headers
+        )
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            f"{self.base_url}/",
+            params=params,
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+        session_id = self.get_seeded_session_id()
+        self.client.put(
+            f"{self.base_url}/{session_id}",
+            json={"title": "Renamed Session"},
+            headers=self.headers,
+        )
+        response = self.client.get(
+            f"{self.base_url}/",
+            params=params,
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_cache_stats(self):
+        """
+        Test that repeated reads show up as hits in the cache statistics.
+        """
+        params = {"page": 1, "limit": 10}
+        for _ in range(2):
+            self.client.get(f"{self.base_url}/", params=params, headers=self.headers)
+
+        response: Response = self.client.get(
+            f"{self.base_url}/cache/stats", headers=self.headers
+        )
+        assert response.status_code == 200
+        stats = response.json()
+        assert stats["misses"] == 1
+        assert stats["hits"] == 1
+        assert stats["size_bytes"] > 0
+
+    def test_retrieve_session_etag_changes_after_speaker_assignment(self):
+        """
+        Test that assigning a speaker changes the session ETag.
+        """
+        session_id = self.get_seeded_session_id()
+        response: Response = self.client.get(
+            f"{self.base_url}/{session_id}", headers=self.headers
+        )
+        etag = response.headers["ETag"]
+
+        speaker = Speaker(
+            id=uuid4(), name="New Speaker", email=f"{uuid4().hex}@example.com"
+        )
+        self.db_session.add(speaker)
+        self.db_session.commit()
+        SessionRepositoryImpl(self.db_session).assign_speaker_to_session(
+            session_id, speaker.id
+        )
+
+        response = self.client.get(
+            f"{self.base_url}/{session_id}",
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert "New Speaker" in [item["name"] for item in response.json()["speakers"]]
+
+    def test_list_speakers_not_modified(self):
+        """
+        Test that the speakers list answers 304 until a speaker is added.
+        """
+        params = {"page": 1, "limit": 10}
+        response: Response = self.client.get(
+            f"{self.base_url}/speakers", params=params, headers=self.headers
+        )
+        assert response.status_code == 200
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            f"{self.base_url}/speakers",
+            params=params,
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+        self.db_session.add(
+            Speaker(id=uuid4(), name="Another", email=f"{uuid4().hex}@example.com")
+        )
+        self.db_session.commit()
+
+        response = self.client.get(
+            f"{self.base_url}/speakers",
+            params=params,
+            headers={**self.headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+    def test_query_budgets(self, query_budget):
+        """
+        Test the SQL statements run by the session read endpoints.
+        """
+        session_id = self.get_seeded_session_id()
+
+        with query_budget(max_queries=3):
+            self.client.get(f"{self.base_url}/", headers=self.headers)
+        with query_budget(max_queries=2):
+            self.client.get(f"{self.base_url}/{session_id}", headers=self.headers)
+        with query_budget(max_queries=3):
+            self.client.get(f"{self.base_url}/speakers", headers=self.headers)
+
+    def test_create_session_with_speakers_query_budget(self, query_budget):
+        """
+        Test that speakers are checked and assigned without a query per speaker.
+        """
+        speakers = self.db_session.query(Speaker).all()
+        assert len(speakers) > 1
+        payload = {
+            "title": "Panel",
+            "description": "Everyone on stage",
+            "start_time": "2023-10-01T10:00:00",
+            "end_time": "2023-10-01T12:00:00",
+            "capacity": 100,
+            "speakers": [str(speaker.id) for speaker in speakers],
+        }
+
+        with query_budget(max_queries=4):
+            response: Response = self.client.post(
+                f"{self.base_url}/", json=payload, headers=self.headers
+            )
+
+        assert response.status_code == 201
+
+    def test_database_unavailable_serves_snapshots(self):
+        """
+        Test that reads fall back to stale snapshots and writes fail fast.
+        """
+        session_id = self.get_seeded_session_id()
+        response: Response = self.client.get(
+            f"{self.base_url}/{session_id}", headers=self.headers
+        )
+        assert response.status_code == 200
+        assert "Warning" not in response.headers
+
+        for _ in range(database_breaker.failure_threshold):
+            with pytest.raises(OperationalError):
+                with database_breaker.guard():
+                    raise OperationalError("SELECT 1", {}, Exception("refused"))
+
+        stale: Response = self.client.get(
+            f"{self.base_url}/{session_id}", headers=self.headers
+        )
+        assert stale.status_code == 200
+        assert stale.json() == response.json()
+        assert stale.headers["Warning"] == '110 - "Response is Stale"'
+        assert "Age" in stale.headers
+
+        unread: Response = self.client.get(f"{self.base_url}/", headers=self.headers)
+        assert unread.status_code == 503
+        assert unread.json()["code"] == "DATABASE_UNAVAILABLE"
+        assert "Retry-After" in unread.headers
+
+        write: Response = self.client.put(
+            f"{self.base_url}/{session_id}",
+            json={"title": "Offline"},
+            headers=self.headers,
+        )
+        assert write.status_code == 503
+        assert write.json()["code"] == "DATABASE_UNAVAILABLE"
+
+    def test_errors_keep_their_client_status(self):
+        """
+        Test that the services' not-found and invalid-input errors answer 4xx.
+        """
+        missing = self.client.get(f"{self.base_url}/{uuid4()}", headers=self.headers)
+        assert missing.status_code == 400
+
+        invalid = self.client.get(f"{self.base_url}/not-a-uuid", headers=self.headers)
+        assert invalid.status_code == 400
+
+        payload = {
+            "title": "Unknown speaker",
+            "description": "Description",
+            "start_time": "2024-12-01T10:00:00",
+            "end_time": "2024-12-01T11:00:00",
+            "capacity": 10,
+            "speakers": [str(uuid4())],
+        }
+        unknown_speaker = self.client.post(
+            f"{self.base_url}/", json=payload, headers=self.headers
+        )
+        assert unknown_speaker.status_code == 400
+
+        session_id = self.get_seeded_session_id()
+        self.client.delete(f"{self.base_url}/{session_id}", headers=self.headers)
+        update = self.client.put(
+            f"{self.base_url}/{session_id}",
+            json={"title": "Too late"},
+            headers=self.headers,
+        )
+        assert update.status_code == 404
+        assert update.json()["code"] == "NOT_FOUND"
+        delete = self.client.delete(
+            f"{self.base_url}/{session_id}", headers=self.headers
+        )
+        assert delete.status_code == 404
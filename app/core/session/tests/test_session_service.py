@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+from adapters.memory.session_repository import InMemorySessionRepository
+from core.common.cache import ResponseCache
+from core.common.pagination import PaginationParams
+from core.common.single_flight import SingleFlight
+from core.session.schemas import SessionCreate
+from core.session.services import SessionService
+
+
+class TestSessionService:
+    """
+    Tests for SessionService on the in-memory repository, without a database.
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        """
+        Build a service with its own cache over an empty repository.
+        """
+        self.repository = InMemorySessionRepository(cache=ResponseCache())
+        self.service = SessionService(
+            self.repository, cache=self.repository.cache, flight=SingleFlight()
+        )
+
+    def session_data(self, speakers=None):
+        start = datetime(2030, 1, 1, 9, 0)
+        return SessionCreate(
+            title="Service talk",
+            description=None,
+            start_time=start,
+            end_time=start + timedelta(hours=1),
+            capacity=10,
+            speakers=speakers,
+        )
+
+    def test_create_session_with_unknown_speaker_creates_nothing(self):
+        """
+        Test that speakers are checked before the session is written.
+        """
+        speaker = self.repository.add_speaker("Known", "known@example.com")
+
+        with pytest.raises(ValueError):
+            self.service.create_session(self.session_data([speaker.id, uuid4()]))
+
+        assert self.repository.list_sessions(limit=10, offset=0) == (0, [])
+
+    def test_cached_page_is_refreshed_after_a_write(self):
+        """
+        Test that a write invalidates the cached page of sessions.
+        """
+        params = PaginationParams(page=1, limit=10)
+        self.service.create_session(self.session_data())
+        assert self.service.list_sessions(params).pagination.total_items == 1
+
+        created = self.service.create_session(self.session_data())
+
+        page = self.service.list_sessions(params)
+        assert page.pagination.total_items == 2
+        assert created.id in {item.id for item in page.items}
@@ -7,7 +7,9 @@ from typing import Optional
 import jwt
 from adapters.database.models import User
 from config import settings
+from core.auth.cache import auth_snapshots, user_key
 from core.auth.ports.repository import UserRepository
+from core.exceptions.custom_exceptions import DatabaseUnavailableError
 from dependencies.user_repository import get_user_repository
 from fastapi import Depends, HTTPException, Request
 from fastapi.datastructures import FormData
@@ -21,6 +23,7 @@ async def get_user_authorizer(
     Retrieves the user from the request's authorization token.
     The token must be in the format: Bearer <token>, where <token> is the JWT token.
     Otherwise, it will raise an HTTPException with status code 401.
+    While the database is unavailable, the user as last loaded is returned.
 
     Args:
         request (Request): The incoming request object.
@@ -30,6 +33,8 @@ async def get_user_authorizer(
 
     Raises:
         HTTPException: If the token is expired or invalid, or if the user does not exist.
+        DatabaseUnavailableError: If the database is unavailable and the user
+            was not loaded before.
     """
     auth_header: str = request.headers.get("Authorization", "")
     token: Optional[str] = None
@@ -51,11 +56,18 @@ async def get_user_authorizer(
         token_decode: dict[str, str] = jwt.decode(
             jwt=token, key=settings.SECRET_KEY, algorithms=["HS256"]
         )
-        user: Optional[User] = user_repository.get_user_by_id(
-            user_id=token_decode.get("user_id", "")
-        )
+        user_id = token_decode.get("user_id", "")
+        try:
+            user: Optional[User] = user_repository.get_user_by_id(user_id=user_id)
+        except DatabaseUnavailableError:
+            snapshot = auth_snapshots.get(user_key(user_id))
+            if snapshot is None:
+                raise
+            return snapshot.value
         if not user:
+            auth_snapshots.discard(user_key(user_id))
             raise HTTPException(status_code=404, detail="User does not exist")
+        auth_snapshots.put(user_key(user_id), user)
         return user
     except jwt.ExpiredSignatureError:
         raise HTTPException(status_code=401, detail="Token expired")
@@ -0,0 +1,56 @@
+"""
+Shared cache tier wiring.
+"""
+
+from typing import Optional
+
+from adapters.cache.redis_backend import RedisCacheBackend
+from config import settings
+from core.common.cache_backend import CacheBackend, InMemoryCacheBackend
+from core.session.cache import session_cache
+
+
+def build_cache_backend(
+    backend: str, url: str, key_prefix: str
+) -> Optional[CacheBackend]:
+    """
+    Build the shared cache backend selected by configuration.
+
+    Args:
+        backend (str): `none`, `memory` or `redis`.
+        url (str): Server URL for the `redis` backend.
+        key_prefix (str): Prefix added to every shared key.
+
+    Returns:
+        Optional[CacheBackend]: The backend, or None when the shared tier is disabled.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return InMemoryCacheBackend()
+    if backend == "redis":
+        return RedisCacheBackend(url, key_prefix=key_prefix)
+    raise ValueError(f"Unknown shared cache backend: {backend}")
+
+
+def start_shared_cache() -> None:
+    """
+    Attach the configured shared tier to the session read cache.
+    """
+    backend = build_cache_backend(
+        settings.SHARED_CACHE_BACKEND,
+        settings.SHARED_CACHE_URL,
+        settings.SHARED_CACHE_KEY_PREFIX,
+    )
+    if backend is not None and session_cache.enabled:
+        session_cache.attach_shared(backend, settings.SHARED_CACHE_CHANNEL)
+
+
+def stop_shared_cache() -> None:
+    """
+    Detach and close the shared tier.
+    """
+    session_cache.detach_shared()
@@ -0,0 +1,39 @@
+"""
+Export service dependencies.
+"""
+
+from adapters.api.dependencies import get_db
+from adapters.database.repository.export_repository import ExportRepositoryImpl
+from core.export.services import ExportService
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+
+def get_export_repository(
+    data_base: Session = Depends(get_db),
+) -> ExportRepositoryImpl:
+    """
+    Provides an instance of `ExportRepositoryImpl` with its dependencies injected.
+
+    Args:
+        data_base (Session): The database session.
+
+    Returns:
+        ExportRepositoryImpl: The repository instance.
+    """
+    return ExportRepositoryImpl(data_base)
+
+
+def get_export_service(
+    export_repository: ExportRepositoryImpl = Depends(get_export_repository),
+) -> ExportService:
+    """
+    Provides an instance of `ExportService` with its dependencies injected.
+
+    Args:
+        export_repository (ExportRepositoryImpl): The repository instance.
+
+    Returns:
+        ExportService: The export service instance.
+    """
+    return ExportService(export_repository)
@@ -0,0 +1,152 @@
+"""
+Rate limit dependency.
+"""
+
+import math
+from functools import cache
+from typing import Callable
+
+import jwt
+from adapters.cache.redis_backend import RedisRateLimitBackend
+from config import settings
+from core.common.metrics import Counter
+from core.common.rate_limit import (
+    InMemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimitPolicy,
+)
+from core.exceptions.custom_exceptions import TooManyRequestsError
+from fastapi import Request
+from starlette.concurrency import run_in_threadpool
+
+LOGIN_RATE_LIMIT = RateLimitPolicy(
+    "login",
+    rate=settings.RATE_LIMIT_LOGIN_PER_MINUTE / 60,
+    burst=settings.RATE_LIMIT_LOGIN_BURST,
+    per="ip",
+)
+SESSION_READ_RATE_LIMIT = RateLimitPolicy(
+    "session-read",
+    rate=settings.RATE_LIMIT_SESSION_READS_PER_SECOND,
+    burst=settings.RATE_LIMIT_SESSION_READS_BURST,
+    per="user",
+)
+
+rate_limited_total = Counter(
+    "rate_limited_total", "Requests refused by a rate limit.", ("policy",)
+)
+
+
+def build_rate_limit_backend(backend: str, url: str, max_keys: int) -> RateLimitBackend:
+    """
+    Build the rate limit backend selected by configuration.
+
+    Args:
+        backend (str): `memory` or `redis`.
+        url (str): Server URL for the `redis` backend.
+        max_keys (int): The most buckets kept in memory.
+
+    Returns:
+        RateLimitBackend: The backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend == "memory":
+        return InMemoryRateLimitBackend(max_keys=max_keys)
+    if backend == "redis":
+        return RedisRateLimitBackend(
+            url,
+            key_prefix="ratelimit:",
+            fallback=InMemoryRateLimitBackend(max_keys=max_keys),
+        )
+    raise ValueError(f"Unknown rate limit backend: {backend}")
+
+
+@cache
+def rate_limit_backend() -> RateLimitBackend:
+    """
+    Return the configured rate limit backend, built on first use.
+
+    Returns:
+        RateLimitBackend: The backend.
+    """
+    return build_rate_limit_backend(
+        settings.RATE_LIMIT_BACKEND,
+        settings.RATE_LIMIT_URL,
+        settings.RATE_LIMIT_MAX_KEYS,
+    )
+
+
+def client_key(request: Request, per: str) -> str:
+    """
+    Identify the client a request counts against.
+
+    The user comes from the bearer token's `user_id` claim, checked by its
+    signature only: the database is not queried before the limit applies.
+
+    Args:
+        request (Request): The request.
+        per (str): `user` or `ip`.
+
+    Returns:
+        str: `user:<id>` for an authenticated request under a `user` policy,
+        else `ip:<address>`.
+    """
+    if per == "user":
+        auth_header = request.headers.get("Authorization", "")
+        if auth_header.startswith("Bearer "):
+            try:
+                claims = jwt.decode(
+                    auth_header[len("Bearer ") :],
+                    key=settings.SECRET_KEY,
+                    algorithms=["HS256"],
+                )
+            except jwt.InvalidTokenError:
+                pass
+            else:
+                if claims.get("user_id"):
+                    return f"user:{claims['user_id']}"
+    return f"ip:{request.client.host if request.client else 'unknown'}"
+
+
+def rate_limit(policy: RateLimitPolicy) -> Callable:
+    """
+    Dependency function limiting the rate of a route's requests per client.
+
+    Args:
+        policy (RateLimitPolicy): The limit.
+
+    Returns:
+        Callable: A dependency function to be used in routes.
+
+    Raises:
+        TooManyRequestsError: If the client is over the limit.
+    """
+
+    async def _rate_limit(request: Request) -> None:
+        """
+        Inner function taking a token, on the event loop unless the backend
+        blocks, so a refused request never waits for a thread.
+
+        Args:
+            request (Request): The incoming request.
+
+        Raises:
+            TooManyRequestsError: If the client is over the limit.
+        """
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        backend = rate_limit_backend()
+        key = f"{policy.name}:{client_key(request, policy.per)}"
+        if backend.blocking:
+            wait = await run_in_threadpool(backend.take, key, policy.rate, policy.burst)
+        else:
+            wait = backend.take(key, policy.rate, policy.burst)
+        if wait > 0:
+            rate_limited_total.labels(policy.name).inc()
+            raise TooManyRequestsError(
+                "Too many requests, try again later.", retry_after=math.ceil(wait)
+            )
+
+    return _rate_limit
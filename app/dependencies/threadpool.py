@@ -0,0 +1,33 @@
+"""
+Threadpool wiring.
+"""
+
+from config import settings
+from core.common.threadpool import ThreadpoolLimiter, install_thread_limiter
+
+
+def threadpool_size() -> int:
+    """
+    Return the number of threads running sync endpoints and dependencies.
+
+    Unless `THREADPOOL_SIZE` is set, one per connection the engine's pool may
+    open: more threads would only wait for a connection, holding their request.
+
+    Returns:
+        int: The number of threads.
+    """
+    if settings.THREADPOOL_SIZE > 0:
+        return settings.THREADPOOL_SIZE
+    return settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+
+
+def start_threadpool_limiter() -> None:
+    """
+    Install the configured threadpool limiter in the worker's event loop.
+    """
+    max_wait = settings.THREADPOOL_MAX_WAIT_SECONDS
+    install_thread_limiter(
+        ThreadpoolLimiter(
+            threadpool_size(), max_wait=max_wait if max_wait > 0 else None
+        )
+    )
@@ -5,12 +5,52 @@ Verify permission dependency.
 from typing import Callable
 
 from adapters.api.dependencies import get_db
-from adapters.database.models import Permission, RolePermission, User
+from adapters.database.circuit_breaker import guarded
+from adapters.database.models import Permission, RolePermission, User, UserRole
+from adapters.database.prepared_statements import PreparedQuery
+from core.auth.cache import auth_snapshots, permission_key
+from core.exceptions.custom_exceptions import DatabaseUnavailableError
 from fastapi import Depends, HTTPException
+from sqlalchemy import bindparam, exists, select
 from sqlalchemy.orm import Session
 
 from .authorizer import get_user_authorizer
 
+# Run on every request to a route behind a permission.
+PERMISSION_GRANTED = PreparedQuery(
+    "permission_granted",
+    select(
+        exists().where(
+            RolePermission.permission_id == Permission.id,
+            Permission.name == bindparam("permission_codename"),
+            RolePermission.role_id.in_(
+                select(UserRole.role_id).where(UserRole.user_id == bindparam("user_id"))
+            ),
+        )
+    ),
+)
+
+
+@guarded
+def has_permission(data_base: Session, user: User, permission_codename: str) -> bool:
+    """
+    Check whether any of a user's roles grants a permission.
+
+    The roles are selected by the user's ID, not through `user.roles`, so the
+    user may be one loaded by an earlier request.
+
+    Args:
+        data_base (Session): The database session.
+        user (User): The user.
+        permission_codename (str): The codename of the permission.
+
+    Returns:
+        bool: True if the permission is granted.
+    """
+    return PERMISSION_GRANTED.execute(
+        data_base, user_id=user.id, permission_codename=permission_codename
+    ).scalar()
+
 
 def verify_permission(permission_codename: str) -> Callable:
     """
@@ -24,6 +64,8 @@ def verify_permission(permission_codename: str) -> Callable:
 
     Raises:
         HTTPException: If the user does not have the required permission.
+        DatabaseUnavailableError: If the database is unavailable and the
+            permission was not granted to the user before.
     """
 
     async def _verify_permission(
@@ -40,20 +82,21 @@ def verify_permission(permission_codename: str) -> Callable:
 
         Raises:
             HTTPException: If the user does not have the required permission.
+            DatabaseUnavailableError: If the database is unavailable and the
+                permission was not granted to the user before.
         """
-        # Check if the user has the required permission
-        has_permission = (
-            data_base.query(RolePermission)
-            .join(RolePermission.role)
-            .join(RolePermission.permission)
-            .filter(
-                RolePermission.role_id.in_([role.role_id for role in user.roles]),
-                Permission.name == permission_codename,  # Required permission
-            )
-            .exists()
-        )
+        key = permission_key(user.id, permission_codename)
+        try:
+            granted = has_permission(data_base, user, permission_codename)
+        except DatabaseUnavailableError:
+            if auth_snapshots.get(key) is None:
+                raise
+            return
 
-        if not data_base.query(has_permission).scalar():
+        if granted:
+            auth_snapshots.put(key, True)
+        else:
+            auth_snapshots.discard(key)
             raise HTTPException(
                 status_code=403,
                 detail="User does not have the required permission.",
@@ -2,15 +2,57 @@
 FAST API
 """
 
-import logging
+import time
+from contextlib import contextmanager
+from typing import Iterator
 
 import fastapi
-from adapters.api.endpoints import auth, session, user
-from core.middleware.error_middleware import ErrorHandlingMiddleware
-from fastapi import FastAPI
+from adapters.api.endpoints import auth, diagnostics, export, metrics, session, user
+from adapters.database.query_metrics import instrument_queries
+from adapters.database.statement_timeout import (
+    install_statement_timeouts,
+    statement_timeout,
+    statement_timeout_handler,
+)
+from config import settings
+from core.middleware.admission_middleware import (
+    WRITE_METHODS,
+    AdmissionController,
+    AdmissionMiddleware,
+    Priority,
+    PriorityRule,
+)
+from core.middleware.error_middleware import (
+    ErrorHandlingMiddleware,
+    not_found_handler,
+    register_exception_handlers,
+)
+from core.middleware.metrics_middleware import MetricsMiddleware
+from dependencies.cache import start_shared_cache, stop_shared_cache
+from dependencies.threadpool import start_threadpool_limiter
+from fastapi import Depends, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import NoResultFound, OperationalError
 
-logging.info("This is an info message")
+# Priority classes for admission control, first match wins; unmatched
+# requests are normal. Logins and administration are never shed; anonymous
+# session browsing is shed first when the server is overloaded.
+ADMISSION_PRIORITIES = (
+    PriorityRule("/api/v1/auth", Priority.CRITICAL),
+    PriorityRule("/api/v1/user", Priority.CRITICAL),
+    PriorityRule("/api/v1/diagnostics", Priority.CRITICAL),
+    PriorityRule("/metrics", Priority.CRITICAL),
+    PriorityRule("/api/v1/session", Priority.CRITICAL, methods=WRITE_METHODS),
+    PriorityRule("/api/v1/session", Priority.LOW),
+)
+
+
+@contextmanager
+def _phase(phases: dict[str, float], name: str) -> Iterator[None]:
+    """Record how many seconds a phase of `create_app` takes."""
+    start = time.perf_counter()
+    yield
+    phases[name] = time.perf_counter() - start
 
 
 def create_app() -> fastapi.FastAPI:
@@ -20,33 +62,91 @@ def create_app() -> fastapi.FastAPI:
     This file configures the FastAPI application, including middleware for error handling,
     routes for users, authentication, onboarding, admin, and storage. It also loads environment variables
     and sets up dependency injection for services such as database connections.
+
+    The seconds spent in each phase are kept in `app.state.startup_phases`, for
+    `python -m benchmarks.startup`. The database engine and the password
+    context are created on first use, not here.
     """
-    app = FastAPI()
-
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],  # Allows all origins
-        allow_credentials=True,
-        allow_methods=["*"],  # Allows all methods
-        allow_headers=["*"],  # Allows all headers
-    )
+    phases: dict[str, float] = {}
+    with _phase(phases, "app"):
+        app = FastAPI()
+    app.state.startup_phases = phases
+
+    with _phase(phases, "middleware"):
+        if settings.ADMISSION_CONTROL_ENABLED:
+            # Innermost, so shed requests still get CORS headers and metrics.
+            app.add_middleware(
+                AdmissionMiddleware,
+                rules=ADMISSION_PRIORITIES,
+                controller=AdmissionController(
+                    target_latency=settings.ADMISSION_TARGET_LATENCY_MS / 1000,
+                    interval=settings.ADMISSION_INTERVAL_MS / 1000,
+                    max_in_flight=settings.ADMISSION_MAX_IN_FLIGHT,
+                ),
+                retry_after=settings.ADMISSION_RETRY_AFTER_SECONDS,
+            )
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=["*"],  # Allows all origins
+            allow_credentials=True,
+            allow_methods=["*"],  # Allows all methods
+            allow_headers=["*"],  # Allows all headers
+        )
+
+        app.add_middleware(ErrorHandlingMiddleware)
+        register_exception_handlers(app)
+        app.add_exception_handler(OperationalError, statement_timeout_handler)
+        app.add_exception_handler(NoResultFound, not_found_handler)
+        app.add_middleware(MetricsMiddleware)
+        instrument_queries()
+        install_statement_timeouts()
+
+        app.add_event_handler("startup", start_threadpool_limiter)
+        app.add_event_handler("startup", start_shared_cache)
+        app.add_event_handler("shutdown", stop_shared_cache)
+
+    with _phase(phases, "routers"):
+        _include_routers(app)
+
+    return app
+
 
-    app.add_middleware(ErrorHandlingMiddleware)
+def _include_routers(app: FastAPI) -> None:
+    """
+    Mount the API routers under their prefixes.
 
+    Each router's SQL statements are cancelled past its budget: interactive
+    routes get little time, exports stream whole tables and get more.
+    """
     app.include_router(
         auth.router,
         prefix="/api/v1/auth",
         tags=["auth"],
+        dependencies=[Depends(statement_timeout(2000))],
     )
     app.include_router(
         user.router,
         prefix="/api/v1/user",
         tags=["user"],
+        dependencies=[Depends(statement_timeout(2000))],
     )
     app.include_router(
         session.router,
         prefix="/api/v1/session",
         tags=["session"],
+        dependencies=[Depends(statement_timeout(1000))],
+    )
+    app.include_router(
+        export.router,
+        prefix="/api/v1/export",
+        tags=["export"],
+        dependencies=[Depends(statement_timeout(30000))],
     )
 
-    return app
+    app.include_router(
+        diagnostics.router,
+        prefix="/api/v1/diagnostics",
+        tags=["diagnostics"],
+        dependencies=[Depends(statement_timeout(5000))],
+    )
+    app.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
@@ -0,0 +1,411 @@
+"""
+Production server: a pre-forking master supervising uvicorn workers.
+
+    python -m fast_api.serve --host 0.0.0.0 --port 8001 --workers 4
+
+The master builds the application once, freezes the garbage collector and
+forks the workers, which all accept connections on the socket the master
+bound. `gc.freeze()` moves every object created so far out of the collector's
+reach: a collection in a worker would otherwise write to their headers and
+copy the pages holding them, so the imported code and the application stay
+shared between workers instead of being duplicated in each. After fork, a
+worker drops what it must not share with the master (`reset_after_fork`).
+
+Signals to the master:
+    SIGTERM, SIGINT: stop the workers gracefully, then exit.
+    SIGHUP: rolling restart. One at a time, a new worker is started and,
+        once it serves, an old one is stopped gracefully, so capacity never
+        drops. New workers are forked from the already loaded application:
+        deploying new code means restarting the master.
+
+A worker that exits unexpectedly is replaced; one that does not stop within
+the graceful timeout is killed.
+
+Workers write their metrics to a directory the master creates, every
+`METRICS_FLUSH_SECONDS` and when they stop, so whichever worker answers
+`/metrics` reports the sum over all of them. The rest of the per-process state
+is not shared: with more than one worker, the in-memory rate limiter allows
+each client the limit once per worker, so run `RATE_LIMIT_BACKEND=redis`; the
+circuit breaker, the read cache and single-flight act per worker.
+"""
+
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import random
+import select
+import signal
+import socket
+import tempfile
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+import uvicorn
+from adapters.api.dependencies import dispose_engine
+from config import settings
+from core.common.metrics import registry
+from core.session.cache import session_cache, session_flight
+from fastapi import FastAPI
+
+logger = logging.getLogger(__name__)
+
+# Signals the master handles; workers restore their defaults.
+MASTER_SIGNALS = (signal.SIGTERM, signal.SIGINT, signal.SIGHUP, signal.SIGCHLD)
+# Wait before replacing a worker that exited without ever serving.
+RESPAWN_DELAY_SECONDS = 1.0
+TICK_SECONDS = 1.0
+
+
+def default_workers() -> int:
+    """
+    Return the number of workers to run: `SERVE_WORKERS`, or one per CPU.
+
+    Returns:
+        int: The number of workers.
+    """
+    if settings.SERVE_WORKERS > 0:
+        return settings.SERVE_WORKERS
+    return len(os.sched_getaffinity(0))
+
+
+def reset_after_fork() -> None:
+    """
+    Drop the per-process state a worker inherited from the master.
+
+    Pooled database connections cannot be shared between processes, cached
+    responses, coalescing counters and metrics must start empty, and the random
+    generator is reseeded so workers do not draw the same sequence.
+    """
+    dispose_engine()
+    session_cache.clear()
+    session_flight.reset_stats()
+    registry.reset()
+    random.seed()
+
+
+class _WorkerServer(uvicorn.Server):
+    """
+    uvicorn server that tells the master once it accepts connections.
+    """
+
+    def __init__(self, config: uvicorn.Config, ready_fd: int):
+        """
+        Initialize the server.
+
+        Args:
+            config (uvicorn.Config): The uvicorn configuration.
+            ready_fd (int): The pipe written to once the server is ready.
+        """
+        super().__init__(config)
+        self.ready_fd = ready_fd
+        self._flusher: Optional[asyncio.Future] = None
+
+    async def startup(self, sockets: Optional[list] = None) -> None:
+        """Start serving, then write to the readiness pipe."""
+        await super().startup(sockets=sockets)
+        if not self.should_exit:
+            os.write(self.ready_fd, b"1")
+            if registry.directory is not None:
+                self._flusher = asyncio.ensure_future(_flush_metrics())
+        os.close(self.ready_fd)
+
+    async def shutdown(self, sockets: Optional[list] = None) -> None:
+        """Stop serving, then write the final metrics."""
+        await super().shutdown(sockets=sockets)
+        registry.write_snapshot()
+
+
+async def _flush_metrics() -> None:
+    """Write the worker's metrics to the shared directory periodically.
+
+    Runs on the event loop, where the threadpool gauges can be read.
+    """
+    while True:
+        await asyncio.sleep(settings.METRICS_FLUSH_SECONDS)
+        registry.write_snapshot()
+
+
+@dataclass
+class Worker:
+    """
+    A worker process, as seen by the master.
+
+    Attributes:
+        pid (int): The process id.
+        ready_fd (Optional[int]): The read end of its readiness pipe, until
+            it reports ready.
+        ready (bool): Whether it accepts connections.
+        stopping_since (Optional[float]): When it was asked to stop.
+    """
+
+    pid: int
+    ready_fd: Optional[int]
+    ready: bool = False
+    stopping_since: Optional[float] = None
+
+
+class Master:
+    """
+    Forks and supervises the workers serving a preloaded application.
+    """
+
+    def __init__(
+        self,
+        app: FastAPI,
+        sock: socket.socket,
+        workers: int,
+        graceful_timeout: float = 30.0,
+        log_level: str = "info",
+        metrics_dir: Optional[str] = None,
+    ):
+        """
+        Initialize the master.
+
+        Args:
+            app (FastAPI): The application, built before forking.
+            sock (socket.socket): The listening socket shared by the workers.
+            workers (int): The number of workers to keep running.
+            graceful_timeout (float): Seconds a stopping worker may take to
+                finish its requests before it is killed.
+            log_level (str): The uvicorn log level of the workers.
+            metrics_dir (Optional[str]): The directory the workers share their
+                metrics through, or None to keep them per worker.
+        """
+        self.app = app
+        self.sock = sock
+        self.count = workers
+        self.graceful_timeout = graceful_timeout
+        self.log_level = log_level
+        self.metrics_dir = metrics_dir
+        self.workers: dict[int, Worker] = {}
+        self.replacing: list[int] = []
+        self.stopping = False
+        self._signals: list[int] = []
+        self._respawn_at = 0.0
+
+    def run(self) -> None:
+        """Run the workers until SIGTERM or SIGINT, then stop them."""
+        wakeup_read, wakeup_write = os.pipe()
+        os.set_blocking(wakeup_read, False)
+        os.set_blocking(wakeup_write, False)
+        signal.set_wakeup_fd(wakeup_write)
+        for signum in MASTER_SIGNALS:
+            signal.signal(signum, self._on_signal)
+        try:
+            while not self.stopping or self.workers:
+                self._wait(wakeup_read)
+                self._handle_signals()
+                self._reap()
+                if not self.stopping:
+                    self._maintain()
+                self._enforce_graceful_timeout()
+        finally:
+            signal.set_wakeup_fd(-1)
+            os.close(wakeup_read)
+            os.close(wakeup_write)
+
+    def _on_signal(self, signum: int, frame) -> None:
+        """Queue a signal for the main loop."""
+        self._signals.append(signum)
+
+    def _wait(self, wakeup_fd: int) -> None:
+        """Sleep until a signal, a worker reporting ready, or the next tick."""
+        ready_fds = [
+            w.ready_fd for w in self.workers.values() if w.ready_fd is not None
+        ]
+        readable, _, _ = select.select([wakeup_fd, *ready_fds], [], [], TICK_SECONDS)
+        if wakeup_fd in readable:
+            while True:
+                try:
+                    if not os.read(wakeup_fd, 512):
+                        break
+                except BlockingIOError:
+                    break
+        for worker in self.workers.values():
+            if worker.ready_fd in readable:
+                worker.ready = os.read(worker.ready_fd, 1) == b"1"
+                os.close(worker.ready_fd)
+                worker.ready_fd = None
+
+    def _handle_signals(self) -> None:
+        """Act on the signals received since the last tick."""
+        signals, self._signals = self._signals, []
+        for signum in signals:
+            if signum in (signal.SIGTERM, signal.SIGINT) and not self.stopping:
+                logger.info("Stopping %d workers", len(self.workers))
+                self.stopping = True
+                for pid in list(self.workers):
+                    self._stop(pid)
+            elif signum == signal.SIGHUP and not self.stopping:
+                logger.info("Rolling restart of %d workers", len(self.workers))
+                self.replacing = [
+                    pid
+                    for pid, worker in self.workers.items()
+                    if worker.stopping_since is None
+                ]
+
+    def _reap(self) -> None:
+        """Collect exited workers."""
+        while self.workers:
+            pid, status = os.waitpid(-1, os.WNOHANG)
+            if pid == 0:
+                return
+            worker = self.workers.pop(pid, None)
+            if worker is None:
+                continue
+            if worker.ready_fd is not None:
+                os.close(worker.ready_fd)
+            if pid in self.replacing:
+                self.replacing.remove(pid)
+            if worker.stopping_since is None:
+                logger.warning(
+                    "Worker %d exited with status %d",
+                    pid,
+                    os.waitstatus_to_exitcode(status),
+                )
+                if not worker.ready:
+                    self._respawn_at = time.monotonic() + RESPAWN_DELAY_SECONDS
+
+    def _maintain(self) -> None:
+        """Start missing workers and advance a rolling restart."""
+        active = [w for w in self.workers.values() if w.stopping_since is None]
+        if self.replacing and len(active) > self.count and all(w.ready for w in active):
+            # The extra worker serves: retire the next old one.
+            self._stop(self.replacing.pop(0))
+            active = [w for w in self.workers.values() if w.stopping_since is None]
+        target = self.count + (1 if self.replacing else 0)
+        if len(active) < target and time.monotonic() >= self._respawn_at:
+            for _ in range(target - len(active)):
+                self._spawn()
+
+    def _enforce_graceful_timeout(self) -> None:
+        """Kill the workers that take too long to stop."""
+        deadline = time.monotonic() - self.graceful_timeout
+        for pid, worker in self.workers.items():
+            if worker.stopping_since is not None and worker.stopping_since < deadline:
+                logger.warning("Killing worker %d after the graceful timeout", pid)
+                os.kill(pid, signal.SIGKILL)
+
+    def _stop(self, pid: int) -> None:
+        """Ask a worker to finish its requests and exit."""
+        worker = self.workers[pid]
+        if worker.stopping_since is None:
+            worker.stopping_since = time.monotonic()
+            os.kill(pid, signal.SIGTERM)
+
+    def _spawn(self) -> None:
+        """Fork a worker."""
+        ready_read, ready_write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(ready_read)
+            self._serve(ready_write)
+        os.close(ready_write)
+        self.workers[pid] = Worker(pid=pid, ready_fd=ready_read)
+
+    def _serve(self, ready_fd: int) -> None:
+        """Run a worker in the forked child; never returns."""
+        status = 1
+        try:
+            signal.set_wakeup_fd(-1)
+            for signum in MASTER_SIGNALS:
+                signal.signal(signum, signal.SIG_DFL)
+            gc.enable()
+            reset_after_fork()
+            if self.metrics_dir is not None:
+                registry.share(self.metrics_dir)
+            config = uvicorn.Config(self.app, lifespan="on", log_level=self.log_level)
+            _WorkerServer(config, ready_fd).run(sockets=[self.sock])
+            status = 0
+        except BaseException:
+            logger.exception("Worker %d failed", os.getpid())
+        finally:
+            os._exit(status)
+
+
+def bind(host: str, port: int) -> socket.socket:
+    """
+    Open the listening socket the workers share.
+
+    Args:
+        host (str): The interface to bind.
+        port (int): The port to bind; 0 picks a free one.
+
+    Returns:
+        socket.socket: The bound, listening socket.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(2048)
+    sock.set_inheritable(True)
+    return sock
+
+
+def preload() -> FastAPI:
+    """
+    Build the application and freeze the objects created so far.
+
+    Collection stays disabled while the application is built, so nothing is
+    moved or freed before the freeze; workers enable it after fork.
+
+    Returns:
+        FastAPI: The application.
+    """
+    from fast_api.fast_api_app import create_app
+
+    gc.disable()
+    app = create_app()
+    gc.freeze()
+    return app
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument(
+        "--graceful-timeout", type=float, default=settings.SERVE_GRACEFUL_TIMEOUT
+    )
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level.upper())
+    sock = bind(args.host, args.port)
+    app = preload()
+    logger.info(
+        "Serving on %s:%d with %d workers",
+        args.host,
+        sock.getsockname()[1],
+        args.workers,
+    )
+    if (
+        args.workers > 1
+        and settings.RATE_LIMIT_ENABLED
+        and settings.RATE_LIMIT_BACKEND == "memory"
+    ):
+        logger.warning(
+            "The memory rate limit backend counts per worker: clients get %d "
+            "times the limits; set RATE_LIMIT_BACKEND=redis",
+            args.workers,
+        )
+    with tempfile.TemporaryDirectory(prefix="metrics-") as metrics_dir:
+        Master(
+            app,
+            sock,
+            args.workers,
+            args.graceful_timeout,
+            args.log_level,
+            metrics_dir,
+        ).run()
+    sock.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+from benchmarks.workers import child_pids, free_port, wait_until_serving
+from core.session.cache import session_cache
+from fast_api.serve import reset_after_fork
+
+APP_ROOT = Path(__file__).resolve().parents[2]
+
+
+def wait_for(condition, timeout=30.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.1)
+
+
+class TestServe:
+    """
+    Tests for the pre-forking server.
+    """
+
+    def test_reset_after_fork_empties_the_response_cache(self):
+        """
+        Test that a worker does not start with its parent's cached responses.
+        """
+        session_cache.get_or_load("session:inherited", lambda: {"title": "x"})
+        assert session_cache.stats()["entries"] == 1
+
+        reset_after_fork()
+
+        assert session_cache.stats()["entries"] == 0
+
+    def test_rolling_restart_and_graceful_stop(self):
+        """
+        Test that SIGHUP replaces every worker and SIGTERM stops them all.
+        """
+        port = free_port()
+        master = subprocess.Popen(
+            [sys.executable, "-m", "fast_api.serve", "--port", str(port)]
+            + ["--workers", "2", "--log-level", "warning"],
+            cwd=APP_ROOT,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            wait_until_serving(master, f"http://127.0.0.1:{port}", 2)
+            original = set(child_pids(master.pid))
+
+            master.send_signal(signal.SIGHUP)
+            wait_for(
+                lambda: len(child_pids(master.pid)) == 2
+                and not original & set(child_pids(master.pid))
+            )
+            wait_until_serving(master, f"http://127.0.0.1:{port}", 2)
+        finally:
+            master.send_signal(signal.SIGTERM)
+            _, errors = master.communicate(timeout=30)
+
+        assert master.returncode == 0
+        assert not re.search(r"Worker \d+ (exited|failed)", errors)
+        assert all(not os.path.exists(f"/proc/{pid}") for pid in original)
+
+    def test_metrics_are_summed_over_workers(self):
+        """
+        Test that any worker's /metrics counts the requests of every worker,
+        including workers replaced since.
+        """
+        port = free_port()
+        url = f"http://127.0.0.1:{port}"
+        master = subprocess.Popen(
+            [sys.executable, "-m", "fast_api.serve", "--port", str(port)]
+            + ["--workers", "2", "--log-level", "warning"],
+            cwd=APP_ROOT,
+            env={**os.environ, "METRICS_FLUSH_SECONDS": "0.1"},
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        sample = 'http_requests_total{method="GET",route="unmatched",status="404"} 20'
+
+        def counted() -> bool:
+            return sample in httpx.get(f"{url}/metrics").text.splitlines()
+
+        try:
+            wait_until_serving(master, url, 2)
+            original = set(child_pids(master.pid))
+            for _ in range(20):
+                assert httpx.get(f"{url}/missing").status_code == 404
+            wait_for(counted, timeout=10)
+
+            master.send_signal(signal.SIGHUP)
+            wait_for(
+                lambda: len(child_pids(master.pid)) == 2
+                and not original & set(child_pids(master.pid))
+            )
+            wait_until_serving(master, url, 2)
+            assert counted()
+        finally:
+            master.send_signal(signal.SIGTERM)
+            master.communicate(timeout=30)
@@ -0,0 +1,3 @@
+"""
+Load testing: synthetic data, scenarios and a runner reporting latency as JSON.
+"""
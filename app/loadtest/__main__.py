@@ -0,0 +1,106 @@
+"""
+Load-test the API with synthetic conference data.
+
+Usage:
+    python -m loadtest generate --sessions 100000 --users 1000000
+    python -m loadtest run browse --concurrency 50 --duration 60 --output before.json
+    python -m loadtest compare before.json after.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import time
+from pathlib import Path
+
+from adapters.api.dependencies import get_engine
+from loadtest.data import DataSize, generate
+from loadtest.runner import LoadTest, compare, run
+from loadtest.scenarios import SCENARIOS
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Parse the command-line options.
+
+    Returns:
+        argparse.Namespace: The options.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    data = commands.add_parser("generate", help="Load synthetic data.")
+    data.add_argument("--sessions", type=int, default=DataSize.sessions)
+    data.add_argument("--users", type=int, default=DataSize.users)
+    data.add_argument("--speakers", type=int, default=DataSize.speakers)
+    data.add_argument("--seed", type=int, default=42)
+
+    load = commands.add_parser("run", help="Run a scenario.")
+    load.add_argument("scenario", choices=sorted(SCENARIOS))
+    load.add_argument("--concurrency", type=int, default=10)
+    load.add_argument(
+        "--duration", type=float, default=30.0, help="Seconds to run for."
+    )
+    load.add_argument(
+        "--iterations",
+        type=int,
+        help="Iterations per virtual user, instead of a duration.",
+    )
+    load.add_argument(
+        "--population",
+        type=int,
+        default=0,
+        help="Synthetic users to log in as; 0 logs in as the administrator.",
+    )
+    load.add_argument("--seed", type=int, default=0)
+    load.add_argument("--base-url", help="Test a live server instead of in-process.")
+    load.add_argument("--admin-email", default="admin@example.com")
+    load.add_argument("--admin-password", default="admin123")
+    load.add_argument("--output", type=Path, help="Write the JSON report here.")
+
+    diff = commands.add_parser("compare", help="Compare two reports.")
+    diff.add_argument("before", type=Path)
+    diff.add_argument("after", type=Path)
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the chosen command."""
+    options = parse_args()
+    if options.command == "generate":
+        size = DataSize(
+            sessions=options.sessions, users=options.users, speakers=options.speakers
+        )
+        start = time.perf_counter()
+        with get_engine().begin() as connection:
+            counts = generate(connection, size, seed=options.seed)
+        for table, rows in counts.items():
+            print(f"{table:<20} {rows:>10} rows")
+        print(f"Loaded in {time.perf_counter() - start:.1f} s")
+    elif options.command == "run":
+        logging.disable(logging.ERROR)
+        load_test = LoadTest(
+            scenario=options.scenario,
+            concurrency=options.concurrency,
+            duration=None if options.iterations else options.duration,
+            iterations=options.iterations,
+            population=options.population,
+            seed=options.seed,
+            admin_email=options.admin_email,
+            admin_password=options.admin_password,
+        )
+        report = json.dumps(
+            asyncio.run(run(load_test, base_url=options.base_url)), indent=2
+        )
+        if options.output:
+            options.output.write_text(report + "\n")
+        print(report)
+    else:
+        before = json.loads(options.before.read_text())
+        after = json.loads(options.after.read_text())
+        print("\n".join(compare(before, after)))
+
+
+if __name__ == "__main__":
+    main()
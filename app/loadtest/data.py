@@ -0,0 +1,230 @@
+"""
+Synthetic conference data at load-test scale.
+
+Follows the model of `seed_data.py`: speakers assigned to sessions, plain users
+attending sessions, at up to 100k sessions and 1M users. Rows are streamed to
+Postgres with `COPY`; a full-size data set loads in a few minutes.
+
+Every synthetic user shares one bcrypt hash of `PASSWORD`; their emails are
+`loadtest-user-<n>@example.com`, so the login scenario can pick any of them.
+"""
+
+import csv
+import io
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator, Sequence
+
+from adapters.database.models.base_model import new_id
+from config import settings
+from passlib.hash import bcrypt
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+PASSWORD = "loadtest123"
+COPY_ROWS = 100_000
+_AUDIT_COLUMNS = ("created_at", "updated_at")
+
+
+@dataclass
+class DataSize:
+    """
+    How much synthetic data to generate.
+
+    Attributes:
+        sessions (int): Scheduled sessions.
+        users (int): Attendee users.
+        speakers (int): Speakers, each assigned to several sessions.
+        speakers_per_session (int): Speakers assigned to each session.
+        attendances_per_user (int): Sessions each user attended.
+    """
+
+    sessions: int = 100_000
+    users: int = 1_000_000
+    speakers: int = 2_000
+    speakers_per_session: int = 2
+    attendances_per_user: int = 2
+
+
+def user_email(index: int) -> str:
+    """
+    Return the email of a synthetic user.
+
+    Args:
+        index (int): The user's number, from 0.
+
+    Returns:
+        str: The email.
+    """
+    return f"loadtest-user-{index}@example.com"
+
+
+def generate(connection: Connection, size: DataSize, seed: int = 42) -> dict[str, int]:
+    """
+    Insert synthetic speakers, sessions, users and attendances.
+
+    The rows are written in the connection's transaction; the caller commits.
+
+    Args:
+        connection (Connection): The database connection.
+        size (DataSize): How much data to generate.
+        seed (int): Seed of the random choices, for reproducible data sets.
+
+    Returns:
+        dict[str, int]: Rows inserted per table.
+
+    Raises:
+        RuntimeError: If synthetic users already exist in the database.
+    """
+    existing = connection.execute(
+        text('SELECT count(*) FROM "user" WHERE email = :email'),
+        {"email": user_email(0)},
+    ).scalar()
+    if existing:
+        raise RuntimeError("Synthetic data already loaded; use a fresh database.")
+
+    rng = random.Random(seed)
+    now = datetime.now()
+    cursor = connection.connection.cursor()
+    try:
+        speaker_ids = [new_id() for _ in range(size.speakers)]
+        session_ids = [new_id() for _ in range(size.sessions)]
+        user_ids = [new_id() for _ in range(size.users)]
+        password = bcrypt.using(rounds=settings.BCRYPT_ROUNDS).hash(PASSWORD)
+        counts = {
+            "speaker": _copy(
+                cursor,
+                "speaker",
+                ("id", "name", "email", "biography"),
+                (
+                    (
+                        speaker_id,
+                        f"Speaker {index}",
+                        f"loadtest-speaker-{index}@example.com",
+                        "Synthetic speaker.",
+                    )
+                    for index, speaker_id in enumerate(speaker_ids)
+                ),
+                now,
+            ),
+            "scheduled_sessions": _copy(
+                cursor,
+                "scheduled_sessions",
+                (
+                    "id",
+                    "title",
+                    "description",
+                    "start_time",
+                    "end_time",
+                    "capacity",
+                    "is_active",
+                ),
+                _sessions(session_ids, now, rng),
+                now,
+            ),
+            "speaker_assignment": _copy(
+                cursor,
+                "speaker_assignment",
+                ("id", "session_id", "speaker_id", "role"),
+                (
+                    (new_id(), session_id, speaker_id, "Presenter")
+                    for session_id in session_ids
+                    for speaker_id in rng.sample(
+                        speaker_ids, min(size.speakers_per_session, len(speaker_ids))
+                    )
+                ),
+                now,
+            ),
+            "user": _copy(
+                cursor,
+                '"user"',
+                ("id", "email", "password", "is_active"),
+                (
+                    (user_id, user_email(index), password, True)
+                    for index, user_id in enumerate(user_ids)
+                ),
+                now,
+            ),
+            "session_attendee": _copy(
+                cursor,
+                "session_attendee",
+                ("id", "session_id", "user_id", "attendance_time"),
+                _attendances(
+                    user_ids, session_ids, size.attendances_per_user, now, rng
+                ),
+                now,
+            ),
+        }
+    finally:
+        cursor.close()
+    return counts
+
+
+def _sessions(
+    session_ids: Sequence[uuid.UUID], now: datetime, rng: random.Random
+) -> Iterator[tuple]:
+    """Yield session rows spread over the next year."""
+    for index, session_id in enumerate(session_ids):
+        start = now + timedelta(minutes=rng.randrange(365 * 24 * 4) * 15)
+        yield (
+            session_id,
+            f"Session {index}",
+            "A synthetic talk about scaling conference software.",
+            start,
+            start + timedelta(minutes=rng.choice((30, 45, 60, 90))),
+            rng.randrange(20, 500),
+            True,
+        )
+
+
+def _attendances(
+    user_ids: Sequence[uuid.UUID],
+    session_ids: Sequence[uuid.UUID],
+    per_user: int,
+    now: datetime,
+    rng: random.Random,
+) -> Iterator[tuple]:
+    """Yield attendance rows, some sessions drawing far more users than others."""
+    if not session_ids:
+        return
+    for user_id in user_ids:
+        for _ in range(per_user):
+            # Squared draw: popular sessions at the start of the list.
+            index = int(rng.random() ** 2 * len(session_ids))
+            attended = now - timedelta(minutes=rng.randrange(60 * 24 * 90))
+            yield (new_id(), session_ids[index], user_id, attended)
+
+
+def _copy(
+    cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[tuple],
+    now: datetime,
+) -> int:
+    """Stream rows into a table with `COPY`, `COPY_ROWS` rows at a time."""
+    statement = (
+        f"COPY {table} ({', '.join((*columns, *_AUDIT_COLUMNS))}) "
+        "FROM STDIN WITH (FORMAT csv)"
+    )
+    audit = (now.isoformat(), now.isoformat())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    total = 0
+    for total, row in enumerate(rows, 1):
+        writer.writerow((*row, *audit))
+        if total % COPY_ROWS == 0:
+            _flush(cursor, statement, buffer)
+    if buffer.tell():
+        _flush(cursor, statement, buffer)
+    return total
+
+
+def _flush(cursor, statement: str, buffer: io.StringIO) -> None:
+    """Send the buffered rows and empty the buffer."""
+    buffer.seek(0)
+    cursor.copy_expert(statement, buffer)
+    buffer.seek(0)
+    buffer.truncate()
@@ -0,0 +1,284 @@
+"""
+Load-test runner: virtual users driving a scenario, and the JSON report.
+
+By default requests go in-process to `create_app()` through
+`httpx.ASGITransport`, so no server is needed and the numbers measure the
+application rather than the network; pass a base URL to test a live server.
+"""
+
+import asyncio
+import collections
+import math
+import random
+import subprocess
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Optional
+
+import httpx
+from config import settings
+from fastapi import FastAPI
+from loadtest.scenarios import LOGIN_URL, SCENARIOS, Sample, VirtualUser
+
+IN_PROCESS_URL = "http://loadtest"
+
+
+@dataclass
+class LoadTest:
+    """
+    Settings of one load-test run.
+
+    Attributes:
+        scenario (str): Name of the scenario in `SCENARIOS`.
+        concurrency (int): Virtual users running at the same time.
+        duration (Optional[float]): Seconds to run for.
+        iterations (Optional[int]): Scenario iterations per virtual user, used
+            when no duration is given.
+        population (int): Synthetic users available to log in as.
+        seed (int): Seed of the virtual users' random choices.
+        admin_email (str): Administrator used by the admin scenarios.
+        admin_password (str): The administrator's password.
+    """
+
+    scenario: str
+    concurrency: int = 10
+    duration: Optional[float] = 30.0
+    iterations: Optional[int] = None
+    population: int = 0
+    seed: int = 0
+    admin_email: str = "admin@example.com"
+    admin_password: str = "admin123"
+
+
+async def run(
+    load_test: LoadTest,
+    app: Optional[FastAPI] = None,
+    base_url: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Run a load test and summarize it.
+
+    Args:
+        load_test (LoadTest): What to run.
+        app (Optional[FastAPI]): The application served in-process; ignored
+            when `base_url` is given.
+        base_url (Optional[str]): URL of a live server to test instead.
+
+    Returns:
+        dict[str, Any]: The report, see `summarize`.
+
+    Raises:
+        ValueError: If the scenario is unknown, or neither a duration nor a
+            number of iterations is given.
+        RuntimeError: If the administrator cannot log in.
+    """
+    scenario = SCENARIOS.get(load_test.scenario)
+    if scenario is None:
+        raise ValueError(f"Unknown scenario {load_test.scenario!r}.")
+    if load_test.duration is None and load_test.iterations is None:
+        raise ValueError("Give a duration or a number of iterations.")
+
+    if base_url is None:
+        if app is None:
+            from fast_api.fast_api_app import create_app
+
+            app = create_app()
+        transport = httpx.ASGITransport(app=app)
+        target = "in-process"
+    else:
+        transport = httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_connections=load_test.concurrency)
+        )
+        target = base_url
+
+    # In-process, every virtual user has the same address: rate limits would
+    # throttle the load instead of letting it measure the application.
+    rate_limit_enabled = settings.RATE_LIMIT_ENABLED
+    settings.RATE_LIMIT_ENABLED = rate_limit_enabled and base_url is not None
+    try:
+        async with httpx.AsyncClient(
+            transport=transport, base_url=base_url or IN_PROCESS_URL, timeout=60
+        ) as client:
+            admin_headers = await _admin_headers(client, load_test)
+            samples: list[Sample] = []
+            users = [
+                VirtualUser(
+                    client,
+                    random.Random(f"{load_test.seed}-{index}"),
+                    samples,
+                    admin_headers,
+                    load_test.population,
+                )
+                for index in range(load_test.concurrency)
+            ]
+            started = time.perf_counter()
+            deadline = (
+                None if load_test.duration is None else started + load_test.duration
+            )
+            await asyncio.gather(
+                *(
+                    _drive(user, scenario, deadline, load_test.iterations)
+                    for user in users
+                )
+            )
+            elapsed = time.perf_counter() - started
+    finally:
+        settings.RATE_LIMIT_ENABLED = rate_limit_enabled
+    return summarize(load_test, target, samples, elapsed)
+
+
+async def _admin_headers(
+    client: httpx.AsyncClient, load_test: LoadTest
+) -> dict[str, str]:
+    """Log the administrator in, returning the authorization header."""
+    response = await client.post(
+        LOGIN_URL,
+        json={"email": load_test.admin_email, "password": load_test.admin_password},
+    )
+    if response.status_code != 200:
+        raise RuntimeError(f"Administrator login failed: {response.status_code}.")
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def _drive(
+    user: VirtualUser,
+    scenario,
+    deadline: Optional[float],
+    iterations: Optional[int],
+) -> None:
+    """Run scenario iterations until the deadline or the iteration count."""
+    done = 0
+    while (deadline is None or time.perf_counter() < deadline) and (
+        iterations is None or done < iterations
+    ):
+        await scenario(user)
+        done += 1
+
+
+def summarize(
+    load_test: LoadTest, target: str, samples: list[Sample], elapsed: float
+) -> dict[str, Any]:
+    """
+    Build the JSON report of a run.
+
+    Args:
+        load_test (LoadTest): The settings of the run.
+        target (str): `in-process` or the URL of the server tested.
+        samples (list[Sample]): The timed calls.
+        elapsed (float): Wall-clock duration of the run, in seconds.
+
+    Returns:
+        dict[str, Any]: The run's settings with throughput, error rate, status
+            counts and latency percentiles, overall and per operation; status
+            0 counts calls that got no response.
+    """
+    operations = sorted({sample.operation for sample in samples})
+    return {
+        "scenario": load_test.scenario,
+        "commit": _commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "target": target,
+        "concurrency": load_test.concurrency,
+        "duration_s": round(elapsed, 3),
+        **_statistics(samples, elapsed),
+        "operations": {
+            operation: _statistics(
+                [sample for sample in samples if sample.operation == operation],
+                elapsed,
+            )
+            for operation in operations
+        },
+    }
+
+
+def _statistics(samples: list[Sample], elapsed: float) -> dict[str, Any]:
+    """Summarize a group of calls."""
+    latencies = sorted(sample.seconds * 1000 for sample in samples)
+    errors = sum(sample.failed for sample in samples)
+    statuses = collections.Counter(str(sample.status) for sample in samples)
+    return {
+        "requests": len(samples),
+        "errors": errors,
+        "statuses": dict(sorted(statuses.items())),
+        "error_rate": round(errors / len(samples), 4) if samples else 0.0,
+        "throughput_rps": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": {
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "max": round(latencies[-1], 3) if latencies else None,
+        },
+    }
+
+
+def percentile(ordered: list[float], rank: float) -> Optional[float]:
+    """
+    Return a percentile of sorted values, by the nearest-rank method.
+
+    Args:
+        ordered (list[float]): The values, in ascending order.
+        rank (float): The percentile, from 0 to 100.
+
+    Returns:
+        Optional[float]: The value, or None when there are none.
+    """
+    if not ordered:
+        return None
+    index = max(math.ceil(rank / 100 * len(ordered)) - 1, 0)
+    return round(ordered[index], 3)
+
+
+def compare(before: dict[str, Any], after: dict[str, Any]) -> list[str]:
+    """
+    Describe how two reports of the same scenario differ.
+
+    Args:
+        before (dict[str, Any]): The baseline report.
+        after (dict[str, Any]): The report to compare with it.
+
+    Returns:
+        list[str]: One line per metric, overall and per operation.
+    """
+    lines = [
+        f"{before['scenario']}: {before.get('commit')} -> {after.get('commit')}",
+        *_compare_statistics("total", before, after),
+    ]
+    for operation, statistics in after["operations"].items():
+        baseline = before["operations"].get(operation)
+        if baseline is not None:
+            lines.extend(_compare_statistics(operation, baseline, statistics))
+    return lines
+
+
+def _compare_statistics(
+    name: str, before: dict[str, Any], after: dict[str, Any]
+) -> list[str]:
+    """Compare throughput, error rate and latency percentiles."""
+    metrics = [("throughput_rps", before["throughput_rps"], after["throughput_rps"])]
+    metrics += [
+        (f"{key}_ms", before["latency_ms"][key], after["latency_ms"][key])
+        for key in ("p50", "p95", "p99")
+    ]
+    lines = [
+        f"{name:<16} error_rate {before['error_rate']:.2%} -> {after['error_rate']:.2%}"
+    ]
+    for metric, old, new in metrics:
+        if old is None or new is None:
+            continue
+        change = f"{(new - old) / old:+.1%}" if old else "n/a"
+        lines.append(f"{name:<16} {metric:<14} {old:>10.2f} -> {new:>10.2f} ({change})")
+    return lines
+
+
+def _commit() -> Optional[str]:
+    """Return the commit being tested, if run from a git checkout."""
+    try:
+        return subprocess.check_output(
+            ["git", "rev-parse", "--short", "HEAD"],
+            stderr=subprocess.DEVNULL,
+            text=True,
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
@@ -0,0 +1,206 @@
+"""
+Load-test scenarios: what one virtual user does in one iteration.
+
+Each scenario is an async function taking the `VirtualUser` running it; every
+HTTP call goes through `VirtualUser.request`, which times it under an
+operation name.
+"""
+
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+import httpx
+from loadtest.data import PASSWORD, user_email
+
+SESSIONS_URL = "/api/v1/session/"
+USERS_URL = "/api/v1/user/"
+LOGIN_URL = "/api/v1/auth/login"
+PAGE_SIZE = 20
+
+
+@dataclass
+class Sample:
+    """
+    One timed HTTP call.
+
+    Attributes:
+        operation (str): What the call does, e.g. `list_sessions`.
+        seconds (float): Time until the full response was read.
+        status (int): The response status, or 0 if no response arrived.
+    """
+
+    operation: str
+    seconds: float
+    status: int
+
+    @property
+    def failed(self) -> bool:
+        """Whether the call failed, with no response or an error status."""
+        return self.status == 0 or self.status >= 400
+
+
+class VirtualUser:
+    """
+    One simulated client, running scenario iterations one after another.
+    """
+
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        rng: random.Random,
+        samples: list[Sample],
+        admin_headers: Optional[dict[str, str]] = None,
+        population: int = 0,
+    ):
+        """
+        Initialize the virtual user.
+
+        Args:
+            client (httpx.AsyncClient): The client sending the requests.
+            rng (random.Random): Source of the user's random choices.
+            samples (list[Sample]): Receives the timed calls, shared by all users.
+            admin_headers (Optional[dict[str, str]]): Authorization of the admin
+                scenarios.
+            population (int): Synthetic users available to log in as; the
+                admin logs in when there are none.
+        """
+        self.client = client
+        self.rng = rng
+        self.samples = samples
+        self.admin_headers = admin_headers or {}
+        self.population = population
+        self.pages: dict[str, int] = {}
+
+    async def request(
+        self, operation: str, method: str, url: str, **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        Send a request and record how long it took.
+
+        Args:
+            operation (str): Name the call is recorded under.
+            method (str): The HTTP method.
+            url (str): The URL, relative to the client's base URL.
+            **kwargs: Passed on to `httpx.AsyncClient.request`.
+
+        Returns:
+            Optional[httpx.Response]: The response, or None if the call failed
+                without one.
+        """
+        started = time.perf_counter()
+        try:
+            response = await self.client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.samples.append(Sample(operation, time.perf_counter() - started, 0))
+            return None
+        self.samples.append(
+            Sample(operation, time.perf_counter() - started, response.status_code)
+        )
+        return response
+
+    async def list_page(
+        self, operation: str, url: str, **kwargs
+    ) -> Optional[httpx.Response]:
+        """
+        Fetch a random page of a paginated list.
+
+        The number of pages is learned from the responses, so the first call
+        reads page 1.
+        """
+        page = self.rng.randint(1, self.pages.get(url, 1))
+        response = await self.request(
+            operation,
+            "GET",
+            url,
+            params={"page": page, "limit": PAGE_SIZE},
+            **kwargs,
+        )
+        if response is not None and response.status_code == 200:
+            self.pages[url] = max(response.json()["pagination"]["total_pages"], 1)
+        return response
+
+
+async def browse(user: VirtualUser) -> None:
+    """An attendee lists sessions, then opens one of them."""
+    response = await user.list_page("list_sessions", SESSIONS_URL)
+    if response is None or response.status_code != 200:
+        return
+    items = response.json()["items"]
+    if items:
+        session = user.rng.choice(items)
+        await user.request("get_session", "GET", f"{SESSIONS_URL}{session['id']}")
+
+
+async def login_storm(user: VirtualUser) -> None:
+    """A user logs in, as everyone does when the doors open."""
+    if user.population:
+        credentials = {
+            "email": user_email(user.rng.randrange(user.population)),
+            "password": PASSWORD,
+        }
+    else:
+        credentials = {"email": "admin@example.com", "password": "admin123"}
+    await user.request("login", "POST", LOGIN_URL, json=credentials)
+
+
+async def registration_rush(user: VirtualUser) -> None:
+    """A new attendee account is created."""
+    await user.request(
+        "create_user",
+        "POST",
+        USERS_URL,
+        json={
+            "email": f"loadtest-signup-{uuid.uuid4().hex}@example.com",
+            "password": PASSWORD,
+        },
+        headers=user.admin_headers,
+    )
+
+
+async def admin_users(user: VirtualUser) -> None:
+    """
+    An administrator browses users, then creates, edits and deletes one.
+
+    Only the account created here is modified, so the synthetic users stay
+    valid for the login scenario.
+    """
+    headers = user.admin_headers
+    response = await user.list_page("list_users", USERS_URL, headers=headers)
+    if response is not None and response.status_code == 200:
+        items = response.json()["items"]
+        if items:
+            listed = user.rng.choice(items)
+            await user.request(
+                "get_user", "GET", f"{USERS_URL}{listed['id']}", headers=headers
+            )
+
+    email = f"loadtest-admin-{uuid.uuid4().hex}@example.com"
+    response = await user.request(
+        "create_user",
+        "POST",
+        USERS_URL,
+        json={"email": email, "password": PASSWORD},
+        headers=headers,
+    )
+    if response is None or response.status_code != 201:
+        return
+    user_url = f"{USERS_URL}{response.json()['id']}"
+    await user.request(
+        "update_user",
+        "PUT",
+        user_url,
+        json={"email": email, "password": PASSWORD, "is_active": False},
+        headers=headers,
+    )
+    await user.request("delete_user", "DELETE", user_url, headers=headers)
+
+
+SCENARIOS: dict[str, Callable[[VirtualUser], Awaitable[None]]] = {
+    "browse": browse,
+    "login_storm": login_storm,
+    "registration_rush": registration_rush,
+    "admin_users": admin_users,
+}
@@ -0,0 +1,103 @@
+import asyncio
+
+from adapters.database.models import ScheduledSession, User
+from conftest import app
+from core.common.test_base import TestBase
+from loadtest.data import DataSize, generate, user_email
+from loadtest.runner import LoadTest, compare, percentile, run
+
+
+class TestLoadTest(TestBase):
+    """
+    Tests for the load-testing harness.
+    """
+
+    def generate_small(self):
+        return generate(
+            self.db_session.connection(),
+            DataSize(sessions=30, users=20, speakers=5, attendances_per_user=2),
+        )
+
+    def test_generate_inserts_synthetic_data(self):
+        """
+        Test that the generator loads the requested number of rows.
+        """
+        counts = self.generate_small()
+
+        assert counts == {
+            "speaker": 5,
+            "scheduled_sessions": 30,
+            "speaker_assignment": 60,
+            "user": 20,
+            "session_attendee": 40,
+        }
+        assert self.db_session.query(User).filter(User.email == user_email(19)).one()
+        assert self.db_session.query(ScheduledSession).count() >= 30
+
+    def test_scenarios_report_latency_without_errors(self):
+        """
+        Test that every scenario runs in-process and is summarized.
+        """
+        self.generate_small()
+
+        for scenario, operations in {
+            "browse": {"list_sessions", "get_session"},
+            "login_storm": {"login"},
+            "registration_rush": {"create_user"},
+            "admin_users": {
+                "list_users",
+                "get_user",
+                "create_user",
+                "update_user",
+                "delete_user",
+            },
+        }.items():
+            report = asyncio.run(
+                run(
+                    LoadTest(
+                        scenario,
+                        concurrency=1,
+                        duration=None,
+                        iterations=2,
+                        population=20,
+                    ),
+                    app=app,
+                )
+            )
+
+            assert report["errors"] == 0, report["statuses"]
+            assert set(report["operations"]) == operations
+            assert report["latency_ms"]["p50"] <= report["latency_ms"]["p99"]
+
+    def test_percentile_uses_nearest_rank(self):
+        """
+        Test the percentile of a small sample.
+        """
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([3.0], 95) == 3.0
+        assert percentile([], 95) is None
+
+    def test_compare_reports_relative_change(self):
+        """
+        Test that comparing reports shows the change of each metric.
+        """
+        statistics = {
+            "throughput_rps": 100.0,
+            "error_rate": 0.0,
+            "latency_ms": {"p50": 10.0, "p95": 20.0, "p99": 40.0},
+        }
+        faster = {
+            "throughput_rps": 150.0,
+            "error_rate": 0.0,
+            "latency_ms": {"p50": 5.0, "p95": 10.0, "p99": 20.0},
+        }
+        before = {"scenario": "browse", "commit": "a", **statistics, "operations": {}}
+        after = {"scenario": "browse", "commit": "b", **faster, "operations": {}}
+
+        lines = compare(before, after)
+
+        assert any("throughput_rps" in line and "+50.0%" in line for line in lines)
+        assert any("p95_ms" in line and "-50.0%" in line for line in lines)
@@ -2,7 +2,6 @@
 Seed data script to initialize the database with users, roles, permissions, sessions, and speakers.
 """
 
-import uuid
 from datetime import datetime, timedelta
 
 from adapters.database import Base
@@ -16,6 +15,7 @@ from adapters.database.models import (
     User,
     UserRole,
 )
+from adapters.database.models.base_model import new_id
 from config import settings
 from passlib.hash import bcrypt
 from sqlalchemy import create_engine
@@ -26,9 +26,6 @@ SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
 engine = create_engine(SQLALCHEMY_DATABASE_URL)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-# Ensure the tables are created in the database
-Base.metadata.create_all(bind=engine)
-
 
 def seed_data(data_base: Session):
     """
@@ -48,7 +45,7 @@ def seed_data(data_base: Session):
 
     for perm_data in permissions:
         permission = Permission(
-            id=uuid.uuid4(),
+            id=new_id(),
             name=perm_data["name"],
             description=perm_data["description"],
         )
@@ -58,7 +55,7 @@ def seed_data(data_base: Session):
 
     # Create Admin role
     admin_role = Role(
-        id=uuid.uuid4(),
+        id=new_id(),
         name="Admin",
         description="Administrator role with full permissions",
     )
@@ -69,7 +66,7 @@ def seed_data(data_base: Session):
     all_permissions = data_base.query(Permission).all()
     for perm in all_permissions:
         role_permission = RolePermission(
-            id=uuid.uuid4(),
+            id=new_id(),
             role_id=admin_role.id,
             permission_id=perm.id,
         )
@@ -79,9 +76,9 @@ def seed_data(data_base: Session):
 
     # Create Admin user
     admin_user = User(
-        id=uuid.uuid4(),
+        id=new_id(),
         email="admin@example.com",
-        password=bcrypt.hash("admin123"),  # Use hashed password
+        password=bcrypt.using(rounds=settings.BCRYPT_ROUNDS).hash("admin123"),  # Use hashed password
         is_active=True,
     )
     data_base.add(admin_user)
@@ -89,7 +86,7 @@ def seed_data(data_base: Session):
 
     # Assign Admin role to the user
     user_role = UserRole(
-        id=uuid.uuid4(),
+        id=new_id(),
         user_id=admin_user.id,
         role_id=admin_role.id,
     )
@@ -113,7 +110,7 @@ def seed_data(data_base: Session):
     speakers = []
     for speaker_data in speakers_data:
         speaker = Speaker(
-            id=uuid.uuid4(),
+            id=new_id(),
             name=speaker_data["name"],
             email=speaker_data["email"],
             biography=speaker_data["biography"],
@@ -143,7 +140,7 @@ def seed_data(data_base: Session):
 
     for session_data in sessions_data:
         session = ScheduledSession(
-            id=uuid.uuid4(),
+            id=new_id(),
             title=session_data["title"],
             description=session_data["description"],
             start_time=session_data["start_time"],
@@ -156,7 +153,7 @@ def seed_data(data_base: Session):
         # Assign speakers to the session
         for speaker in speakers:
             speaker_assignment = SpeakerAssignment(
-                id=uuid.uuid4(),
+                id=new_id(),
                 session_id=session.id,
                 speaker_id=speaker.id,
                 role="Presenter",
@@ -169,5 +166,7 @@ def seed_data(data_base: Session):
 
 
 if __name__ == "__main__":
+    # Ensure the tables are created in the database
+    Base.metadata.create_all(bind=engine)
     with SessionLocal() as data_base:
         seed_data(data_base)
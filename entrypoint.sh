@@ -8,11 +8,15 @@ while ! nc -z db 5432; do
 done
 echo "PostgreSQL is ready!"
 
-echo "Applying Alembic migrations..."
-alembic upgrade heads
+# Migrations run once per deployment, from the `migrate` service, rather than
+# on every worker start: `entrypoint.sh migrate`.
+if [ "$1" = "migrate" ]; then
+  echo "Applying Alembic migrations..."
+  exec alembic upgrade heads
+fi
 
 # echo "Running seed_data.py..."
 # python /app/seed_data.py
 
 echo "Starting the application..."
-exec uvicorn fast_api.fast_api_app:create_app --factory --host 0.0.0.0 --port 8001
+exec python -m fast_api.serve --host 0.0.0.0 --port 8001